@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Benchmark LocalZoteroReader.get_items_with_text against the former single-query loader.
+
+Builds a synthetic database with the parts of the Zotero schema the reader
+uses (default: 50,000 regular items, each with attachments, creators, notes
+and tags), then times both loaders on it. Both read the file directly;
+ZOTERO_DB_SNAPSHOT is turned off so the bulk loader does not pay for a
+snapshot copy.
+
+The bulk loader is not much faster: expect roughly 1.1-1.2x at 5,000 and
+50,000 items. What it saves is duplicated text:
+the old query repeats every note once per creator and vice versa, which
+the reported megabytes of notes and creators show.
+
+Usage:
+    python examples/benchmark_local_db.py [--items 50000] [--db /tmp/zotero-bench.sqlite]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+# Time the loaders on the file itself, not on a snapshot copy
+os.environ["ZOTERO_DB_SNAPSHOT"] = "false"
+
+from zotero_mcp.local_db import LocalZoteroReader, ZoteroItem
+
+# The query get_items_with_text used before the bulk loader, kept for comparison
+LEGACY_QUERY = """
+SELECT
+    i.itemID, i.key, i.itemTypeID, it.typeName as item_type, i.dateAdded, i.dateModified,
+    title_val.value as title, abstract_val.value as abstract, extra_val.value as extra,
+    doi_val.value as doi,
+    GROUP_CONCAT(n.note, ' ') as notes,
+    GROUP_CONCAT(
+        CASE
+            WHEN c.firstName IS NOT NULL AND c.lastName IS NOT NULL THEN c.lastName || ', ' || c.firstName
+            WHEN c.lastName IS NOT NULL THEN c.lastName
+            ELSE NULL
+        END, '; '
+    ) as creators
+FROM items i
+JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
+LEFT JOIN itemData title_data ON i.itemID = title_data.itemID AND title_data.fieldID = 1
+LEFT JOIN itemDataValues title_val ON title_data.valueID = title_val.valueID
+LEFT JOIN itemData abstract_data ON i.itemID = abstract_data.itemID AND abstract_data.fieldID = 2
+LEFT JOIN itemDataValues abstract_val ON abstract_data.valueID = abstract_val.valueID
+LEFT JOIN itemData extra_data ON i.itemID = extra_data.itemID AND extra_data.fieldID = 16
+LEFT JOIN itemDataValues extra_val ON extra_data.valueID = extra_val.valueID
+LEFT JOIN fields doi_f ON doi_f.fieldName = 'DOI'
+LEFT JOIN itemData doi_data ON i.itemID = doi_data.itemID AND doi_data.fieldID = doi_f.fieldID
+LEFT JOIN itemDataValues doi_val ON doi_data.valueID = doi_val.valueID
+LEFT JOIN itemNotes n ON i.itemID = n.parentItemID OR i.itemID = n.itemID
+LEFT JOIN itemCreators ic ON i.itemID = ic.itemID
+LEFT JOIN creators c ON ic.creatorID = c.creatorID
+WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')
+GROUP BY i.itemID, i.key, i.itemTypeID, it.typeName, i.dateAdded, i.dateModified,
+         title_val.value, abstract_val.value, extra_val.value
+ORDER BY i.dateModified DESC
+"""
+
+SCHEMA = """
+CREATE TABLE itemTypes (itemTypeID INTEGER PRIMARY KEY, typeName TEXT);
+CREATE TABLE fields (fieldID INTEGER PRIMARY KEY, fieldName TEXT);
+CREATE TABLE baseFieldMappings (itemTypeID INT, baseFieldID INT, fieldID INT,
+    PRIMARY KEY (itemTypeID, baseFieldID, fieldID));
+CREATE TABLE items (itemID INTEGER PRIMARY KEY, itemTypeID INT NOT NULL, dateAdded TEXT,
+    dateModified TEXT, libraryID INT DEFAULT 1, key TEXT NOT NULL UNIQUE);
+CREATE INDEX items_dateModified ON items(dateModified);
+CREATE TABLE itemDataValues (valueID INTEGER PRIMARY KEY, value UNIQUE);
+CREATE TABLE itemData (itemID INT, fieldID INT, valueID INT, PRIMARY KEY (itemID, fieldID));
+CREATE INDEX itemData_fieldID ON itemData(fieldID);
+CREATE TABLE creators (creatorID INTEGER PRIMARY KEY, firstName TEXT, lastName TEXT, fieldMode INT);
+CREATE TABLE itemCreators (itemID INT NOT NULL, creatorID INT NOT NULL, creatorTypeID INT NOT NULL DEFAULT 1,
+    orderIndex INT NOT NULL DEFAULT 0, PRIMARY KEY (itemID, creatorID, creatorTypeID, orderIndex));
+CREATE INDEX itemCreators_creatorTypeID ON itemCreators(creatorTypeID);
+CREATE TABLE itemNotes (itemID INTEGER PRIMARY KEY, parentItemID INT, note TEXT, title TEXT);
+CREATE INDEX itemNotes_parentItemID ON itemNotes(parentItemID);
+CREATE TABLE tags (tagID INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE itemTags (itemID INT NOT NULL, tagID INT NOT NULL, type INT NOT NULL,
+    PRIMARY KEY (itemID, tagID));
+CREATE INDEX itemTags_tagID ON itemTags(tagID);
+"""
+
+WORDS = ("model graph protein learning climate neural survey theory data network "
+         "signal sample quantum policy market cell language vision energy method").split()
+
+
+def build_database(path: str, n_items: int, seed: int = 0) -> None:
+    """Create a synthetic Zotero-like database with `n_items` regular items."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany("INSERT INTO itemTypes VALUES (?, ?)",
+                     [(1, "note"), (2, "book"), (3, "attachment"), (4, "journalArticle"), (5, "case")])
+    conn.executemany("INSERT INTO fields VALUES (?, ?)",
+                     [(1, "title"), (2, "abstractNote"), (16, "extra"), (26, "DOI"), (58, "caseName")])
+    conn.execute("INSERT INTO baseFieldMappings VALUES (5, 1, 58)")
+
+    def text(n: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(n))
+
+    n_creators = max(n_items // 2, 1)
+    conn.executemany("INSERT INTO creators VALUES (?, ?, ?, 0)",
+                     [(i, f"First{i}", f"Last{i}") for i in range(1, n_creators + 1)])
+    conn.executemany("INSERT INTO tags VALUES (?, ?)", [(i, f"tag{i}") for i in range(1, 501)])
+
+    items, values, data, item_creators, notes, item_tags = [], [], [], [], [], []
+    next_id = 1
+    for n in range(n_items):
+        item_id = next_id
+        next_id += 1
+        item_type = rng.choice((2, 4, 4, 5))
+        items.append((item_id, item_type, "2020-01-01 00:00:00",
+                      f"2024-{n % 12 + 1:02d}-{n % 28 + 1:02d} {n % 24:02d}:00:00", f"I{n:07d}"))
+        title_field = 58 if item_type == 5 else 1
+        fields = [(title_field, text(8)), (2, text(120))]
+        if n % 3 == 0:
+            fields.append((16, text(5)))
+        if n % 2 == 0:
+            fields.append((26, f"10.{1000 + n}/bench.{n}"))
+        for field_id, value in fields:
+            values.append((len(values) + 1, f"{value} {n}.{field_id}"))
+            data.append((item_id, field_id, len(values)))
+        for order in range(rng.randint(1, 6)):
+            item_creators.append((item_id, rng.randint(1, n_creators), order))
+        for _ in range(rng.randint(0, 4)):
+            notes.append((next_id, item_id, f"<p>{text(60)}</p>"))
+            items.append((next_id, 1, "2020-01-01 00:00:00", "2020-01-01 00:00:00", f"N{next_id:07d}"))
+            next_id += 1
+        for _ in range(rng.randint(1, 2)):
+            items.append((next_id, 3, "2020-01-01 00:00:00", "2020-01-01 00:00:00", f"A{next_id:07d}"))
+            next_id += 1
+        for tag_id in rng.sample(range(1, 501), rng.randint(0, 5)):
+            item_tags.append((item_id, tag_id))
+
+    conn.executemany("INSERT INTO items (itemID, itemTypeID, dateAdded, dateModified, key) VALUES (?, ?, ?, ?, ?)", items)
+    conn.executemany("INSERT INTO itemDataValues VALUES (?, ?)", values)
+    conn.executemany("INSERT INTO itemData VALUES (?, ?, ?)", data)
+    conn.executemany("INSERT OR IGNORE INTO itemCreators (itemID, creatorID, orderIndex) VALUES (?, ?, ?)", item_creators)
+    conn.executemany("INSERT INTO itemNotes (itemID, parentItemID, note) VALUES (?, ?, ?)", notes)
+    conn.executemany("INSERT INTO itemTags VALUES (?, ?, 0)", item_tags)
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+def run_legacy(path: str) -> list:
+    """Load items the way get_items_with_text did before the bulk loader."""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    try:
+        items = [
+            ZoteroItem(
+                item_id=row["itemID"], key=row["key"], item_type_id=row["itemTypeID"],
+                item_type=row["item_type"], doi=row["doi"], title=row["title"],
+                abstract=row["abstract"], creators=row["creators"], notes=row["notes"],
+                extra=row["extra"], date_added=row["dateAdded"], date_modified=row["dateModified"],
+            )
+            for row in conn.execute(LEGACY_QUERY)
+        ]
+        return items
+    finally:
+        conn.close()
+
+
+def run_bulk(path: str) -> list:
+    with LocalZoteroReader(db_path=path) as reader:
+        return reader.get_items_with_text()
+
+
+def timed(label: str, func, path: str, repeat: int) -> float:
+    """Report the best time of `repeat` runs and how much note/creator text was loaded."""
+    best = float("inf")
+    items = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = func(path)
+        best = min(best, time.perf_counter() - start)
+    text_mb = sum(len(item.notes or "") + len(item.creators or "") for item in items) / 1e6
+    print(f"{label:<24} {best:8.2f}s  ({len(items)} items, {text_mb:.1f} MB of notes and creators)")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=50000, help="Number of regular items to generate")
+    parser.add_argument("--db", help="Database path (default: a temporary file, removed afterwards)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per loader; the best is reported")
+    args = parser.parse_args()
+
+    path = args.db or os.path.join(tempfile.mkdtemp(), "zotero-bench.sqlite")
+    if not os.path.exists(path):
+        print(f"Building synthetic database with {args.items} items at {path}...")
+        build_database(path, args.items)
+
+    try:
+        legacy = timed("single JOIN query", run_legacy, path, args.repeat)
+        bulk = timed("bulk loader", run_bulk, path, args.repeat)
+        print(f"Speedup: {legacy / bulk:.1f}x")
+    finally:
+        if not args.db:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
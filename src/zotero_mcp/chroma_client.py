@@ -5,20 +5,52 @@ This module provides persistent vector database storage and embedding functions
 for semantic search over Zotero libraries.
 """
 
+import copy
 import json
 import os
+import random
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 import logging
 
 import chromadb
 from chromadb import Documents, EmbeddingFunction, Embeddings
 from chromadb.config import Settings
+from chromadb.errors import NotFoundError
+
+from .embedding_cache import EmbeddingCache, get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
+# Gemini accepts up to this many texts in one embed_content request
+GEMINI_MAX_BATCH_SIZE = 100
+
+# OpenAI embedding request limits
+OPENAI_MAX_INPUTS_PER_REQUEST = 2048
+OPENAI_MAX_TOKENS_PER_INPUT = 8191
+# The API allows 300k tokens per request; stay below it to absorb estimation error
+DEFAULT_OPENAI_TOKENS_PER_REQUEST = 250000
+# Used to estimate token counts when tiktoken is not installed (errs on the high side)
+ESTIMATED_CHARS_PER_TOKEN = 3
+
+# Defaults for remote embedding requests, overridable in embedding_config
+DEFAULT_EMBEDDING_CONCURRENCY = 4
+DEFAULT_EMBEDDING_MAX_RETRIES = 5
+
+# Recent query embeddings kept in memory; queries never go to the persistent cache
+QUERY_EMBEDDING_CACHE_SIZE = 256
+
+# Suffixes of the collections used by blue/green rebuilds: the one being
+# filled, and the previous live collection while it is swapped out
+SHADOW_SUFFIX = "__building"
+RETIRED_SUFFIX = "__retired"
+
 
 @contextmanager
 def suppress_stdout():
@@ -32,42 +64,259 @@ def suppress_stdout():
             sys.stdout = old_stdout
 
 
+def _is_retryable_error(error: Exception) -> bool:
+    """Whether an embedding API error is a rate limit or transient server error."""
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    if isinstance(code, int):
+        return code == 429 or code >= 500
+    text = str(error)
+    return any(marker in text for marker in ("429", "RESOURCE_EXHAUSTED", "rate limit", "503", "UNAVAILABLE"))
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Return the delay the server asked for in a Retry-After header, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _call_with_backoff(request, max_retries: int, description: str):
+    """
+    Call `request()`, retrying rate-limited or transient failures.
+    
+    Waits for the server's Retry-After when given, otherwise backs off
+    exponentially with jitter (1s, 2s, 4s, ... capped at 60s).
+    """
+    delay = 1.0
+    for attempt in range(max_retries + 1):
+        try:
+            return request()
+        except Exception as e:
+            if attempt >= max_retries or not _is_retryable_error(e):
+                raise
+            wait = _retry_after_seconds(e) or delay * (1 + random.random())
+            logger.warning(f"{description} failed ({e}); retrying in {wait:.1f}s")
+            time.sleep(wait)
+            delay = min(delay * 2, 60.0)
+
+
+# One finished sub-batch: (positions in the input, vectors or None, error or None)
+BatchResult = Tuple[List[int], Optional[List[Any]], Optional[Exception]]
+
+
+class PartialEmbeddingError(RuntimeError):
+    """
+    Some texts could not be embedded.
+    
+    Attributes:
+        vectors: One entry per input text; None where embedding failed
+        failed: Positions of the texts that failed
+    """
+    
+    def __init__(self, message: str, vectors: List[Any], failed: List[int]):
+        super().__init__(message)
+        self.vectors = vectors
+        self.failed = failed
+
+
+def _collect_batches(results: Iterator[BatchResult], count: int) -> Embeddings:
+    """Assemble sub-batch results in input order; raise PartialEmbeddingError if any failed."""
+    embeddings: List[Any] = [None] * count
+    failed: List[int] = []
+    first_error: Optional[Exception] = None
+    for positions, vectors, error in results:
+        if error is not None:
+            failed.extend(positions)
+            first_error = first_error or error
+            continue
+        for position, vector in zip(positions, vectors):
+            embeddings[position] = vector
+    if failed:
+        raise PartialEmbeddingError(f"{len(failed)} of {count} texts could not be embedded: {first_error}",
+                                    embeddings, sorted(failed))
+    return embeddings
+
+
 class OpenAIEmbeddingFunction(EmbeddingFunction):
-    """Custom OpenAI embedding function for ChromaDB."""
+    """
+    Custom OpenAI embedding function for ChromaDB.
     
-    def __init__(self, model_name: str = "text-embedding-3-small", api_key: Optional[str] = None):
+    Inputs are packed into requests by token budget, and up to
+    `max_concurrency` requests run in parallel. Each request is retried on
+    its own, so one rate-limited sub-batch never re-sends the others, and
+    a sub-batch that still fails only fails its own texts (see
+    embed_batches). Token counts use tiktoken when installed and a
+    conservative characters-per-token estimate otherwise.
+    """
+    
+    def __init__(self,
+                 model_name: str = "text-embedding-3-small",
+                 api_key: Optional[str] = None,
+                 max_tokens_per_request: int = DEFAULT_OPENAI_TOKENS_PER_REQUEST,
+                 max_concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY,
+                 max_retries: int = DEFAULT_EMBEDDING_MAX_RETRIES):
         self.model_name = model_name
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
+        self.max_tokens_per_request = max(OPENAI_MAX_TOKENS_PER_INPUT, int(max_tokens_per_request))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_retries = max(0, int(max_retries))
+        # Bounds in-flight requests across all concurrent callers (indexing and queries)
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "texts": 0, "tokens": 0, "seconds": 0.0, "split_batches": 0}
         
         try:
             import openai
             self.client = openai.OpenAI(api_key=self.api_key)
         except ImportError:
             raise ImportError("openai package is required for OpenAI embeddings")
+        
+        self._encoding = None
+        try:
+            import tiktoken  # type: ignore
+            try:
+                self._encoding = tiktoken.encoding_for_model(model_name)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            logger.info("tiktoken not available; estimating OpenAI token counts from text length")
     
     def name(self) -> str:
         """Return the name of this embedding function."""
         return "openai"
     
+    def _count_tokens(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return len(text) // ESTIMATED_CHARS_PER_TOKEN + 1
+    
+    def _truncate(self, text: str) -> str:
+        """Cut a single input down to the model's per-input token limit."""
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text, disallowed_special=())
+            if len(tokens) > OPENAI_MAX_TOKENS_PER_INPUT:
+                return self._encoding.decode(tokens[:OPENAI_MAX_TOKENS_PER_INPUT])
+            return text
+        return text[:OPENAI_MAX_TOKENS_PER_INPUT * ESTIMATED_CHARS_PER_TOKEN]
+    
+    def _pack(self, token_counts: List[int]) -> List[List[int]]:
+        """Group input indices into requests that respect the token and input-count limits."""
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for index, tokens in enumerate(token_counts):
+            if current and (current_tokens + tokens > self.max_tokens_per_request
+                            or len(current) >= OPENAI_MAX_INPUTS_PER_REQUEST):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+    
     def __call__(self, input: Documents) -> Embeddings:
         """Generate embeddings using OpenAI API."""
-        response = self.client.embeddings.create(
-            model=self.model_name,
-            input=input
+        return _collect_batches(self.embed_batches(input), len(input))
+    
+    def embed_batches(self, input: Documents) -> Iterator[BatchResult]:
+        """
+        Embed texts in packed sub-batches, yielding each as soon as it finishes.
+        
+        Args:
+            input: Texts to embed
+            
+        Yields:
+            Tuples of (positions in `input`, vectors, None) for embedded
+            sub-batches and (positions, None, error) for failed ones
+        """
+        texts = [self._truncate(text) or " " for text in input]
+        if not texts:
+            return
+        batches = self._pack([self._count_tokens(text) for text in texts])
+        
+        start = time.perf_counter()
+        embedded = used_tokens = 0
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as pool:
+            futures = {pool.submit(self._embed_batch, [texts[i] for i in batch]): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    vectors, tokens = future.result()
+                except Exception as e:
+                    logger.error(f"OpenAI embedding request for {len(batch)} texts failed: {e}")
+                    yield batch, None, e
+                    continue
+                embedded += len(batch)
+                used_tokens += tokens
+                yield batch, vectors, None
+        elapsed = time.perf_counter() - start
+        
+        with self._stats_lock:
+            self._stats["texts"] += embedded
+            self._stats["tokens"] += used_tokens
+            self._stats["seconds"] += elapsed
+        logger.info(
+            f"Embedded {embedded} texts ({used_tokens} tokens) in {len(batches)} requests, "
+            f"{used_tokens / elapsed if elapsed else 0:.0f} tokens/s"
         )
-        return [data.embedding for data in response.data]
+    
+    def _embed_batch(self, texts: List[str]) -> Tuple[List[List[float]], int]:
+        """Embed one packed sub-batch; returns the vectors and the tokens used."""
+        def request():
+            return self.client.embeddings.create(model=self.model_name, input=texts)
+        
+        try:
+            with self._semaphore:
+                response = _call_with_backoff(request, self.max_retries, "OpenAI embedding request")
+        except Exception as e:
+            # The token estimate can be off; split an oversized request instead of failing it
+            if len(texts) > 1 and not _is_retryable_error(e) and "token" in str(e).lower():
+                with self._stats_lock:
+                    self._stats["split_batches"] += 1
+                middle = len(texts) // 2
+                left_vectors, left_tokens = self._embed_batch(texts[:middle])
+                right_vectors, right_tokens = self._embed_batch(texts[middle:])
+                return left_vectors + right_vectors, left_tokens + right_tokens
+            raise
+        
+        usage = getattr(response, "usage", None)
+        tokens = getattr(usage, "total_tokens", None) or sum(self._count_tokens(text) for text in texts)
+        with self._stats_lock:
+            self._stats["requests"] += 1
+        return [data.embedding for data in response.data], tokens
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cumulative request, token and throughput counters."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["tokens_per_second"] = stats["tokens"] / stats["seconds"] if stats["seconds"] else 0.0
+        return stats
 
 
 class GeminiEmbeddingFunction(EmbeddingFunction):
     """Custom Gemini embedding function for ChromaDB using google-genai."""
     
-    def __init__(self, model_name: str = "models/text-embedding-004", api_key: Optional[str] = None):
+    def __init__(self,
+                 model_name: str = "models/text-embedding-004",
+                 api_key: Optional[str] = None,
+                 batch_size: int = GEMINI_MAX_BATCH_SIZE,
+                 max_concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY,
+                 max_retries: int = DEFAULT_EMBEDDING_MAX_RETRIES):
         self.model_name = model_name
         self.api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required")
+        self.batch_size = max(1, min(int(batch_size), GEMINI_MAX_BATCH_SIZE))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_retries = max(0, int(max_retries))
+        # Bounds in-flight requests across all concurrent callers (indexing and queries)
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
         
         try:
             from google import genai
@@ -82,19 +331,59 @@ class GeminiEmbeddingFunction(EmbeddingFunction):
         return "gemini"
     
     def __call__(self, input: Documents) -> Embeddings:
-        """Generate embeddings using Gemini API."""
-        embeddings = []
-        for text in input:
-            response = self.client.models.embed_content(
+        """
+        Generate embeddings using Gemini API.
+        
+        Texts are sent in batches of up to `batch_size` per request, with up
+        to `max_concurrency` requests in flight. Rate-limited requests are
+        retried with backoff.
+        """
+        texts = list(input)
+        if len(texts) <= self.batch_size:
+            return self._embed_batch(texts) if texts else []
+        return _collect_batches(self.embed_batches(texts), len(texts))
+    
+    def embed_batches(self, input: Documents) -> Iterator[BatchResult]:
+        """
+        Embed texts in batches of `batch_size`, yielding each as soon as it finishes.
+        
+        Args:
+            input: Texts to embed
+            
+        Yields:
+            Tuples of (positions in `input`, vectors, None) for embedded
+            batches and (positions, None, error) for failed ones
+        """
+        texts = list(input)
+        batches = [list(range(i, min(i + self.batch_size, len(texts))))
+                   for i in range(0, len(texts), self.batch_size)]
+        if not batches:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as pool:
+            futures = {pool.submit(self._embed_batch, [texts[i] for i in batch]): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    yield batch, future.result(), None
+                except Exception as e:
+                    logger.error(f"Gemini embedding request for {len(batch)} texts failed: {e}")
+                    yield batch, None, e
+    
+    def _embed_batch(self, texts: List[str]) -> Embeddings:
+        """Embed one batch of texts in a single request."""
+        def request():
+            return self.client.models.embed_content(
                 model=self.model_name,
-                contents=[text],
+                contents=texts,
                 config=self.types.EmbedContentConfig(
                     task_type="retrieval_document",
                     title="Zotero library document"
                 )
             )
-            embeddings.append(response.embeddings[0].values)
-        return embeddings
+        
+        with self._semaphore:
+            response = _call_with_backoff(request, self.max_retries, "Gemini embedding request")
+        return [embedding.values for embedding in response.embeddings]
 
 
 class ChromaClient:
@@ -158,23 +447,136 @@ class ChromaClient:
                         self.embedding_function = existing_ef
                 
             except Exception:
-                # Collection doesn't exist, create it
-                self.collection = self.client.create_collection(
-                    name=self.collection_name,
-                    embedding_function=self.embedding_function
-                )
+                # A swap interrupted between its two renames leaves only the retired collection
+                if self._recover_interrupted_swap():
+                    self.collection = self.client.get_collection(name=self.collection_name)
+                else:
+                    # Collection doesn't exist, create it
+                    self.collection = self.client.create_collection(
+                        name=self.collection_name,
+                        embedding_function=self.embedding_function
+                    )
+            self._drop_collection(self.collection_name + RETIRED_SUFFIX)
+        
+        # Set on the view returned by begin_rebuild()
+        self.is_shadow = False
+        self._swap_lock = threading.Lock()
+        
+        # Vectors are computed here (through the cache) rather than by the collection
+        self.embedding_cache: Optional[EmbeddingCache] = get_embedding_cache()
+        self._query_vectors: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._query_lock = threading.Lock()
+    
+    @property
+    def embedding_model_id(self) -> str:
+        """Identifier of the embedding model in use, for keying cached vectors."""
+        ef = self.embedding_function
+        name = getattr(ef, "name", None)
+        name = name() if callable(name) else (name or type(ef).__name__)
+        model = getattr(ef, "model_name", None) or getattr(ef, "MODEL_NAME", None) or ""
+        return f"{name}:{model}"
+    
+    def embed(self, texts: List[str]) -> List[Any]:
+        """
+        Embed texts, reusing vectors cached for the same model and text.
+        
+        With an embedding function that reports sub-batches as they finish
+        (embed_batches), each sub-batch is cached as soon as it arrives and
+        a failed request only fails its own texts.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One vector per text, in order
+            
+        Raises:
+            PartialEmbeddingError: Some texts could not be embedded; it
+                carries the vectors of all the others
+        """
+        model = self.embedding_model_id
+        cache = self.embedding_cache
+        vectors: Dict[int, Any] = cache.get_many(model, texts) if cache is not None else {}
+        missing = [i for i in range(len(texts)) if i not in vectors]
+        failed: List[int] = []
+        first_error: Optional[Exception] = None
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            embed_batches = getattr(self.embedding_function, "embed_batches", None)
+            if callable(embed_batches):
+                results = embed_batches(missing_texts)
+            else:
+                results = iter([(list(range(len(missing))), list(self.embedding_function(missing_texts)), None)])
+            for positions, batch_vectors, error in results:
+                if error is not None:
+                    failed.extend(missing[p] for p in positions)
+                    first_error = first_error or error
+                    continue
+                if cache is not None:
+                    cache.put_many(model, [missing_texts[p] for p in positions], batch_vectors)
+                vectors.update((missing[p], vector) for p, vector in zip(positions, batch_vectors))
+        if cache is not None and len(missing) < len(texts):
+            logger.info(f"Reused {len(texts) - len(missing)} of {len(texts)} embeddings from cache")
+        if failed:
+            raise PartialEmbeddingError(f"{len(failed)} of {len(texts)} texts could not be embedded: {first_error}",
+                                        [vectors.get(i) for i in range(len(texts))], sorted(failed))
+        return [vectors[i] for i in range(len(texts))]
+    
+    def embed_query(self, texts: List[str]) -> List[Any]:
+        """
+        Embed search queries, reusing recent ones from a small in-memory LRU.
+        
+        Queries are mostly one-off text, so unlike documents they are not
+        written to the persistent embedding cache.
+        
+        Args:
+            texts: Query texts
+            
+        Returns:
+            One vector per text, in order
+        """
+        model = self.embedding_model_id
+        vectors: Dict[int, Any] = {}
+        with self._query_lock:
+            for i, text in enumerate(texts):
+                if (model, text) in self._query_vectors:
+                    self._query_vectors.move_to_end((model, text))
+                    vectors[i] = self._query_vectors[(model, text)]
+        missing = [i for i in range(len(texts)) if i not in vectors]
+        if missing:
+            computed = list(self.embedding_function([texts[i] for i in missing]))
+            vectors.update(zip(missing, computed))
+            with self._query_lock:
+                for i, vector in zip(missing, computed):
+                    self._query_vectors[(model, texts[i])] = vector
+                while len(self._query_vectors) > QUERY_EMBEDDING_CACHE_SIZE:
+                    self._query_vectors.popitem(last=False)
+        return [vectors[i] for i in range(len(texts))]
     
     def _create_embedding_function(self) -> EmbeddingFunction:
         """Create the appropriate embedding function based on configuration."""
         if self.embedding_model == "openai":
             model_name = self.embedding_config.get("model_name", "text-embedding-3-small")
             api_key = self.embedding_config.get("api_key")
-            return OpenAIEmbeddingFunction(model_name=model_name, api_key=api_key)
+            return OpenAIEmbeddingFunction(
+                model_name=model_name,
+                api_key=api_key,
+                max_tokens_per_request=self.embedding_config.get(
+                    "max_tokens_per_request", DEFAULT_OPENAI_TOKENS_PER_REQUEST),
+                max_concurrency=self.embedding_config.get("max_concurrency", DEFAULT_EMBEDDING_CONCURRENCY),
+                max_retries=self.embedding_config.get("max_retries", DEFAULT_EMBEDDING_MAX_RETRIES),
+            )
         
         elif self.embedding_model == "gemini":
             model_name = self.embedding_config.get("model_name", "models/text-embedding-004")
             api_key = self.embedding_config.get("api_key")
-            return GeminiEmbeddingFunction(model_name=model_name, api_key=api_key)
+            return GeminiEmbeddingFunction(
+                model_name=model_name,
+                api_key=api_key,
+                batch_size=self.embedding_config.get("batch_size", GEMINI_MAX_BATCH_SIZE),
+                max_concurrency=self.embedding_config.get("max_concurrency", DEFAULT_EMBEDDING_CONCURRENCY),
+                max_retries=self.embedding_config.get("max_retries", DEFAULT_EMBEDDING_MAX_RETRIES),
+            )
         
         else:
             # Use ChromaDB's default embedding function (all-MiniLM-L6-v2)
@@ -193,11 +595,13 @@ class ChromaClient:
             ids: List of unique IDs for each document
         """
         try:
-            self.collection.add(
+            embeddings = self.embed(documents)
+            self._on_live_collection(lambda collection: collection.add(
                 documents=documents,
+                embeddings=embeddings,
                 metadatas=metadatas,
                 ids=ids
-            )
+            ))
             logger.info(f"Added {len(documents)} documents to ChromaDB collection")
         except Exception as e:
             logger.error(f"Error adding documents to ChromaDB: {e}")
@@ -206,7 +610,8 @@ class ChromaClient:
     def upsert_documents(self,
                         documents: List[str],
                         metadatas: List[Dict[str, Any]],
-                        ids: List[str]) -> None:
+                        ids: List[str],
+                        embeddings: Optional[List[Any]] = None) -> None:
         """
         Upsert (update or insert) documents to the collection.
         
@@ -214,13 +619,20 @@ class ChromaClient:
             documents: List of document texts to embed
             metadatas: List of metadata dictionaries for each document
             ids: List of unique IDs for each document
+            embeddings: Optional precomputed vectors; computed here if omitted
         """
         try:
-            self.collection.upsert(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids
-            )
+            # Items split into passages can exceed ChromaDB's per-call limit
+            max_batch = getattr(self.client, "get_max_batch_size", lambda: 5000)()
+            for i in range(0, len(ids), max_batch):
+                vectors = (embeddings[i:i + max_batch] if embeddings is not None
+                           else self.embed(documents[i:i + max_batch]))
+                self._on_live_collection(lambda collection: collection.upsert(
+                    documents=documents[i:i + max_batch],
+                    embeddings=vectors,
+                    metadatas=metadatas[i:i + max_batch],
+                    ids=ids[i:i + max_batch]
+                ))
             logger.info(f"Upserted {len(documents)} documents to ChromaDB collection")
         except Exception as e:
             logger.error(f"Error upserting documents to ChromaDB: {e}")
@@ -244,12 +656,13 @@ class ChromaClient:
             Search results from ChromaDB
         """
         try:
-            results = self.collection.query(
-                query_texts=query_texts,
+            query_embeddings = self.embed_query(query_texts)
+            results = self._on_live_collection(lambda collection: collection.query(
+                query_embeddings=query_embeddings,
                 n_results=n_results,
                 where=where,
                 where_document=where_document
-            )
+            ))
             logger.info(f"Semantic search returned {len(results.get('ids', [[]])[0])} results")
             return results
         except Exception as e:
@@ -264,16 +677,35 @@ class ChromaClient:
             ids: List of document IDs to delete
         """
         try:
-            self.collection.delete(ids=ids)
+            self._on_live_collection(lambda collection: collection.delete(ids=ids))
             logger.info(f"Deleted {len(ids)} documents from ChromaDB collection")
         except Exception as e:
             logger.error(f"Error deleting documents from ChromaDB: {e}")
             raise
     
+    def delete_items(self, item_keys: List[str]) -> None:
+        """
+        Delete items together with all of their passage documents.
+        
+        Args:
+            item_keys: Zotero keys of the items to delete
+        """
+        if not item_keys:
+            return
+        try:
+            for i in range(0, len(item_keys), 500):
+                chunk = list(item_keys[i:i + 500])
+                self._on_live_collection(lambda collection: collection.delete(ids=chunk))
+                self._on_live_collection(lambda collection: collection.delete(where={"item_key": {"$in": chunk}}))
+            logger.info(f"Deleted {len(item_keys)} items from ChromaDB collection")
+        except Exception as e:
+            logger.error(f"Error deleting items from ChromaDB: {e}")
+            raise
+    
     def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the collection."""
         try:
-            count = self.collection.count()
+            count = self._on_live_collection(lambda collection: collection.count())
             return {
                 "name": self.collection_name,
                 "count": count,
@@ -291,7 +723,12 @@ class ChromaClient:
             }
     
     def reset_collection(self) -> None:
-        """Reset (clear) the collection."""
+        """
+        Reset (clear) the collection.
+        
+        Searches return nothing until it is filled again; rebuilds use
+        begin_rebuild() and promote() instead.
+        """
         try:
             self.client.delete_collection(name=self.collection_name)
             self.collection = self.client.create_collection(
@@ -303,10 +740,216 @@ class ChromaClient:
             logger.error(f"Error resetting collection: {e}")
             raise
     
+    @property
+    def shadow_collection_name(self) -> str:
+        """Name of the collection a blue/green rebuild writes into."""
+        return self.collection_name + SHADOW_SUFFIX
+    
+    def _collection_exists(self, name: str) -> bool:
+        try:
+            self.client.get_collection(name=name)
+            return True
+        except Exception:
+            return False
+    
+    def _drop_collection(self, name: str) -> None:
+        if self._collection_exists(name):
+            self.client.delete_collection(name=name)
+            logger.info(f"Dropped ChromaDB collection '{name}'")
+    
+    def _recover_interrupted_swap(self) -> bool:
+        """Restore the live collection from its retired copy if a swap stopped halfway."""
+        retired = self.collection_name + RETIRED_SUFFIX
+        if not self._collection_exists(retired):
+            return False
+        self.client.get_collection(name=retired).modify(name=self.collection_name)
+        sys.stderr.write(f"ChromaDB: restored collection '{self.collection_name}' after an interrupted swap\n")
+        return True
+    
+    def has_pending_rebuild(self) -> bool:
+        """Whether an unfinished rebuild left a shadow collection behind."""
+        return self._collection_exists(self.shadow_collection_name)
+    
+    def begin_rebuild(self, resume: bool = False) -> "ChromaClient":
+        """
+        Start a blue/green rebuild in a shadow collection.
+        
+        Searches keep using the live collection until promote() swaps the
+        shadow in.
+        
+        Args:
+            resume: Reopen the shadow left by an interrupted rebuild instead
+                of starting from an empty one
+            
+        Returns:
+            A view of this client whose reads and writes go to the shadow
+        """
+        name = self.shadow_collection_name
+        with suppress_stdout():
+            if resume and self._collection_exists(name):
+                shadow = self.client.get_collection(name=name)
+                logger.info(f"Resuming rebuild in ChromaDB collection '{name}' ({shadow.count()} documents)")
+            else:
+                self._drop_collection(name)
+                shadow = self.client.create_collection(name=name, embedding_function=self.embedding_function)
+                logger.info(f"Rebuilding into ChromaDB collection '{name}'")
+        view = copy.copy(self)
+        view.collection = shadow
+        view.is_shadow = True
+        return view
+    
+    def validate_rebuild(self, shadow: "ChromaClient", expected_keys: Iterable[str]) -> Optional[str]:
+        """
+        Check a shadow collection before it is swapped in.
+        
+        Args:
+            shadow: View returned by begin_rebuild()
+            expected_keys: Keys of every source item the shadow must hold,
+                including those written before an interruption
+            
+        Returns:
+            None if the shadow is usable, otherwise the reason it is not
+        """
+        try:
+            present = {doc_id for doc_id in shadow.get_all_metadata() if "#" not in doc_id}
+            missing = sorted(set(expected_keys) - present)
+            if missing:
+                return (f"shadow is missing {len(missing)} items "
+                        f"(e.g. {', '.join(missing[:5])})")
+            if present:
+                # The stored vectors must match what queries are embedded with
+                sample = shadow.collection.peek(limit=1)
+                probe = self.embed_query(["validation probe"])[0]
+                if len(sample["embeddings"][0]) != len(probe):
+                    return "shadow vectors do not match the embedding model"
+                shadow.collection.query(query_embeddings=[probe], n_results=1)
+        except Exception as e:
+            return f"shadow collection is unusable: {e}"
+        return None
+    
+    def promote(self, shadow: "ChromaClient") -> None:
+        """
+        Swap a rebuilt shadow collection in as the live collection.
+        
+        The live collection is renamed out of the way, the shadow takes its
+        name, and this client switches to it in one step, so concurrent
+        searches see either the old or the new collection in full. The old
+        collection is dropped afterwards.
+        
+        Args:
+            shadow: View returned by begin_rebuild()
+        """
+        retired = self.collection_name + RETIRED_SUFFIX
+        with self._swap_lock, suppress_stdout():
+            self._drop_collection(retired)
+            if self._collection_exists(self.collection_name):
+                self.client.get_collection(name=self.collection_name).modify(name=retired)
+            shadow.collection.modify(name=self.collection_name)
+            self.collection = self.client.get_collection(name=self.collection_name)
+        shadow.collection = self.collection
+        shadow.is_shadow = False
+        logger.info(f"Swapped rebuilt collection in as '{self.collection_name}' ({self.collection.count()} documents)")
+        try:
+            self._drop_collection(retired)
+        except Exception as e:
+            logger.warning(f"Could not drop retired collection '{retired}': {e}")
+    
+    def _on_live_collection(self, operation: Callable[[Any], Any]) -> Any:
+        """
+        Run `operation` on the collection, reopening it once if it was replaced.
+        
+        Another process (an index run from the CLI, say) can promote a
+        rebuild, which leaves this client holding a handle to a collection
+        that no longer exists. The live collection is then looked up by name
+        again and the operation retried.
+        """
+        try:
+            return operation(self.collection)
+        except NotFoundError:
+            if self.is_shadow or not self._reload_collection():
+                raise
+            return operation(self.collection)
+    
+    def _reload_collection(self) -> bool:
+        """Switch to the collection now holding the live name; returns whether it changed."""
+        with self._swap_lock, suppress_stdout():
+            try:
+                collection = self.client.get_collection(name=self.collection_name)
+            except Exception:
+                return False
+            if collection.id == self.collection.id:
+                return False
+            self.collection = collection
+        logger.info(f"Reopened ChromaDB collection '{self.collection_name}' after it was replaced")
+        return True
+    
+    def abandon_rebuild(self) -> None:
+        """Drop the shadow collection of an unfinished rebuild."""
+        self._drop_collection(self.shadow_collection_name)
+    
+    def get_all_metadata(self, page_size: int = 5000) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metadata of every document in the collection.
+        
+        Reads the collection in pages of `page_size`, which is far cheaper
+        than one lookup per document during incremental updates.
+        
+        Args:
+            page_size: Number of documents fetched per request
+            
+        Returns:
+            Dictionary mapping document ID to its metadata
+        """
+        def read_all(collection: Any) -> Dict[str, Dict[str, Any]]:
+            existing: Dict[str, Dict[str, Any]] = {}
+            offset = 0
+            while True:
+                result = collection.get(include=["metadatas"], limit=page_size, offset=offset)
+                ids = result.get("ids", [])
+                metadatas = result.get("metadatas") or [None] * len(ids)
+                for doc_id, metadata in zip(ids, metadatas):
+                    existing[doc_id] = metadata or {}
+                if len(ids) < page_size:
+                    break
+                offset += page_size
+            return existing
+        
+        return self._on_live_collection(read_all)
+    
+    def get_metadata(self, ids: List[str], where: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the metadata of the given documents that exist in the collection.
+        
+        Args:
+            ids: Document IDs to look up
+            where: Optional metadata filter the documents must also match
+            
+        Returns:
+            Dictionary mapping each existing (and matching) document ID to its metadata
+        """
+        if not ids:
+            return {}
+        result = self._on_live_collection(
+            lambda collection: collection.get(ids=list(ids), where=where or None, include=["metadatas"])
+        )
+        found_ids = result.get("ids", [])
+        metadatas = result.get("metadatas") or [None] * len(found_ids)
+        return {doc_id: metadata or {} for doc_id, metadata in zip(found_ids, metadatas)}
+    
+    def has_passages(self) -> bool:
+        """Whether the collection holds fulltext passages, i.e. was built with chunking on."""
+        try:
+            result = self._on_live_collection(
+                lambda collection: collection.get(where={"chunk_index": {"$gte": 1}}, limit=1, include=[])
+            )
+            return len(result["ids"]) > 0
+        except Exception:
+            return False
+    
     def document_exists(self, doc_id: str) -> bool:
         """Check if a document exists in the collection."""
         try:
-            result = self.collection.get(ids=[doc_id])
+            result = self._on_live_collection(lambda collection: collection.get(ids=[doc_id]))
             return len(result['ids']) > 0
         except Exception:
             return False
@@ -348,7 +991,9 @@ def create_chroma_client(config_path: Optional[str] = None) -> ChromaClient:
         openai_api_key = os.getenv("OPENAI_API_KEY")
         openai_model = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
         if openai_api_key:
+            # Keep tuning options (batching, concurrency) from the config file
             config["embedding_config"] = {
+                **config.get("embedding_config", {}),
                 "api_key": openai_api_key,
                 "model_name": openai_model
             }
@@ -357,7 +1002,9 @@ def create_chroma_client(config_path: Optional[str] = None) -> ChromaClient:
         gemini_api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         gemini_model = os.getenv("GEMINI_EMBEDDING_MODEL", "models/text-embedding-004")
         if gemini_api_key:
+            # Keep tuning options (batching, concurrency) from the config file
             config["embedding_config"] = {
+                **config.get("embedding_config", {}),
                 "api_key": gemini_api_key,
                 "model_name": gemini_model
             }
@@ -136,6 +136,8 @@ def main():
                                  help="Limit number of items to process (for testing)")
     update_db_parser.add_argument("--fulltext", action="store_true",
                                  help="Extract fulltext content from local Zotero database (slower but more comprehensive)")
+    update_db_parser.add_argument("--resume", action="store_true",
+                                 help="Continue an interrupted update from its checkpoint, with its original options")
     update_db_parser.add_argument("--config-path", 
                                  help="Path to semantic search configuration file")
     
@@ -311,16 +313,30 @@ def main():
             stats = search.update_database(
                 force_full_rebuild=args.force_rebuild,
                 limit=args.limit,
-                extract_fulltext=args.fulltext
+                extract_fulltext=args.fulltext,
+                resume=args.resume
             )
             
             print(f"\nDatabase update completed:")
+            print(f"- Sync mode: {stats.get('sync_mode', 'full')}")
             print(f"- Total items: {stats.get('total_items', 0)}")
             print(f"- Processed: {stats.get('processed_items', 0)}")
             print(f"- Added: {stats.get('added_items', 0)}")
             print(f"- Updated: {stats.get('updated_items', 0)}")
             print(f"- Skipped: {stats.get('skipped_items', 0)}")
+            print(f"- Deleted: {stats.get('deleted_items', 0)}")
             print(f"- Errors: {stats.get('errors', 0)}")
+            if stats.get('resumed_from'):
+                print(f"- Resumed after: {stats['resumed_from']} items")
+            if stats.get('retried_items'):
+                print(f"- Retried: {stats['retried_items']}")
+            if stats.get('failed_items'):
+                print(f"- Still failing: {stats['failed_items']} (run update-db --resume to retry)")
+            if stats.get('fulltext_sources'):
+                sources = ", ".join(f"{k}: {v}" for k, v in sorted(stats['fulltext_sources'].items()))
+                print(f"- Fulltext sources: {sources}")
+            if stats.get('embedding_tokens'):
+                print(f"- Embedding: {stats['embedding_tokens']} tokens at {stats.get('embedding_tokens_per_second', 0)} tokens/s")
             print(f"- Duration: {stats.get('duration', 'Unknown')}")
             
             if stats.get('error'):
@@ -358,6 +374,8 @@ def main():
             print(f"Document count: {collection_info.get('count', 0)}")
             print(f"Embedding model: {collection_info.get('embedding_model', 'Unknown')}")
             print(f"Database path: {collection_info.get('persist_directory', 'Unknown')}")
+            if status.get("pending_rebuild"):
+                print("Pending rebuild: interrupted; continue it with 'zotero-mcp update-db --resume'")
             
             update_config = status.get("update_config", {})
             print(f"\nUpdate configuration:")
@@ -396,10 +414,13 @@ def main():
                 # Show aggregate stats (merged from former db-stats)
                 meta = col.get(include=["metadatas"])  # type: ignore
                 metas = meta.get("metadatas", [])
+                # Fulltext passages (<item_key>#<n>) belong to their item's entry
+                passage_count = sum(1 for m in metas if "chunk_index" in (m or {}))
+                metas = [m for m in metas if "chunk_index" not in (m or {})]
                 print("=== Semantic DB Inspection (Stats) ===")
                 info = client.get_collection_info()
                 print(f"Collection: {info.get('name')} @ {info.get('persist_directory')}")
-                print(f"Count: {info.get('count')}")
+                print(f"Count: {info.get('count')} ({len(metas)} items, {passage_count} passages)")
 
                 # Item type distribution
                 item_types = [ (m or {}).get("item_type", "") for m in metas ]
@@ -413,18 +434,20 @@ def main():
                 for m in metas:
                     m = m or {}
                     t = m.get("item_type", "") or "(missing)"
-                    cov = coverage.setdefault(t, {"total": 0, "with_fulltext": 0, "pdf": 0, "html": 0})
+                    cov = coverage.setdefault(t, {"total": 0, "with_fulltext": 0, "zotero_index": 0, "pdf": 0, "html": 0})
                     cov["total"] += 1
                     if m.get("has_fulltext"):
                         cov["with_fulltext"] += 1
                         src = (m.get("fulltext_source") or "").lower()
-                        if src == "pdf":
+                        if src == "zotero_index":
+                            cov["zotero_index"] += 1
+                        elif src == "pdf":
                             cov["pdf"] += 1
                         elif src == "html":
                             cov["html"] += 1
                 print("Fulltext coverage (by type):")
                 for t, cov in coverage.items():
-                    print(f"  {t}: {cov['with_fulltext']}/{cov['total']} (pdf:{cov['pdf']}, html:{cov['html']})")
+                    print(f"  {t}: {cov['with_fulltext']}/{cov['total']} (zotero_index:{cov['zotero_index']}, pdf:{cov['pdf']}, html:{cov['html']})")
 
                 # Common titles (may indicate duplicates)
                 titles = [ (m or {}).get("title", "") for m in metas ]
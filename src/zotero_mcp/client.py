@@ -3,19 +3,26 @@ Zotero client wrapper for MCP server.
 """
 
 import os
+import threading
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from dotenv import load_dotenv
 from markitdown import MarkItDown
 from pyzotero import zotero
 
+from zotero_mcp.local_api import LocalReadClient, get_local_library
 from zotero_mcp.utils import format_creators
 
 # Load environment variables
 load_dotenv()
 
+# Idle clients kept per library by the shared client registry
+DEFAULT_CLIENT_POOL_SIZE = 4
+
 
 @dataclass
 class AttachmentDetails:
@@ -27,12 +34,12 @@ class AttachmentDetails:
     content_type: str
 
 
-def get_zotero_client() -> zotero.Zotero:
+def _get_connection_settings() -> Dict[str, Any]:
     """
-    Get authenticated Zotero client using environment variables.
+    Read Zotero connection settings from environment variables.
     
     Returns:
-        A configured Zotero client instance.
+        Dictionary with library_id, library_type, api_key and local flag.
         
     Raises:
         ValueError: If required environment variables are missing.
@@ -53,14 +60,241 @@ def get_zotero_client() -> zotero.Zotero:
             "or use ZOTERO_LOCAL=true for local Zotero instance."
         )
 
+    return {
+        "library_id": library_id,
+        "library_type": library_type,
+        "api_key": api_key,
+        "local": local,
+    }
+
+
+def get_zotero_client(
+    library_id: Optional[str] = None,
+    library_type: Optional[str] = None,
+) -> zotero.Zotero:
+    """
+    Get authenticated Zotero client using environment variables.
+    
+    This always builds a new client. Tools should prefer `zotero_client()`,
+    which hands out pooled clients from the shared registry.
+    
+    Args:
+        library_id: Optional library ID overriding ZOTERO_LIBRARY_ID
+        library_type: Optional library type ('user' or 'group')
+    
+    Returns:
+        A configured Zotero client instance.
+        
+    Raises:
+        ValueError: If required environment variables are missing.
+    """
+    settings = _get_connection_settings()
+
     return zotero.Zotero(
-        library_id=library_id,
-        library_type=library_type,
-        api_key=api_key,
-        local=local,
+        library_id=library_id or settings["library_id"],
+        library_type=library_type or settings["library_type"],
+        api_key=settings["api_key"],
+        local=settings["local"],
     )
 
 
+class ZoteroClientRegistry:
+    """
+    Process-wide registry of pooled Zotero clients.
+    
+    Keeps up to `pool_size` idle clients per library. Each pyzotero client
+    owns its own HTTP session, so handing the same clients out again reuses
+    their keep-alive connections instead of paying a new TCP/TLS handshake
+    on every tool call. When every pooled client is busy an extra one is
+    created rather than blocking, and surplus clients are closed on release.
+    """
+    
+    def __init__(self, pool_size: Optional[int] = None):
+        """
+        Initialize the registry.
+        
+        Args:
+            pool_size: Idle clients kept per library. Defaults to
+                ZOTERO_CLIENT_POOL_SIZE or DEFAULT_CLIENT_POOL_SIZE.
+        """
+        if not pool_size or pool_size <= 0:
+            try:
+                pool_size = int(os.getenv("ZOTERO_CLIENT_POOL_SIZE", DEFAULT_CLIENT_POOL_SIZE))
+            except ValueError:
+                pool_size = DEFAULT_CLIENT_POOL_SIZE
+        self.pool_size = max(1, pool_size)
+        # Parse the environment once instead of on every call
+        self._settings = _get_connection_settings()
+        self._pools: Dict[Tuple[str, str], deque] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "created": 0,
+            "reused": 0,
+            "released": 0,
+            "discarded": 0,
+            "in_use": 0,
+        }
+    
+    def _library_key(self, library_id: Optional[str], library_type: Optional[str]) -> Tuple[str, str]:
+        return (
+            str(library_id or self._settings["library_id"]),
+            library_type or self._settings["library_type"],
+        )
+    
+    def _acquire(self, key: Tuple[str, str]) -> zotero.Zotero:
+        with self._lock:
+            pool = self._pools.setdefault(key, deque())
+            self._stats["in_use"] += 1
+            if pool:
+                self._stats["reused"] += 1
+                return pool.pop()
+            self._stats["created"] += 1
+        
+        try:
+            return zotero.Zotero(
+                library_id=key[0],
+                library_type=key[1],
+                api_key=self._settings["api_key"],
+                local=self._settings["local"],
+            )
+        except Exception:
+            with self._lock:
+                self._stats["in_use"] -= 1
+            raise
+    
+    def _release(self, key: Tuple[str, str], zot: zotero.Zotero) -> None:
+        # Drop per-request state so it does not leak into the next lease
+        zot.url_params = None
+        if hasattr(zot, "links"):
+            zot.links = None
+        
+        with self._lock:
+            self._stats["in_use"] -= 1
+            pool = self._pools.setdefault(key, deque())
+            if len(pool) < self.pool_size:
+                pool.append(zot)
+                self._stats["released"] += 1
+                return
+            self._stats["discarded"] += 1
+        _close_zotero_client(zot)
+    
+    @contextmanager
+    def client(self,
+               library_id: Optional[str] = None,
+               library_type: Optional[str] = None,
+               local_reads: bool = True) -> Iterator[zotero.Zotero]:
+        """
+        Lease a pooled client for the given library.
+        
+        Args:
+            library_id: Optional library ID, defaults to the configured library
+            library_type: Optional library type ('user' or 'group')
+            local_reads: Whether reads may be answered from zotero.sqlite in local mode
+        
+        Yields:
+            A Zotero client that is returned to the pool on exit. In local
+            mode its reads are answered from zotero.sqlite when possible
+            (see zotero_mcp.local_api; disable with ZOTERO_LOCAL_READS=false).
+        """
+        key = self._library_key(library_id, library_type)
+        zot = self._acquire(key)
+        try:
+            library = get_local_library(key[1], key[0]) if self._settings["local"] and local_reads else None
+            yield LocalReadClient(zot, library) if library is not None else zot
+        finally:
+            self._release(key, zot)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool reuse statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pool_size"] = self.pool_size
+            stats["idle"] = sum(len(pool) for pool in self._pools.values())
+            stats["libraries"] = [f"{t}:{i}" for i, t in self._pools]
+        leases = stats["created"] + stats["reused"]
+        stats["reuse_ratio"] = stats["reused"] / leases if leases else 0.0
+        return stats
+    
+    def close(self) -> None:
+        """Close all idle clients."""
+        with self._lock:
+            idle = [zot for pool in self._pools.values() for zot in pool]
+            self._pools.clear()
+        for zot in idle:
+            _close_zotero_client(zot)
+
+
+def _close_zotero_client(zot: zotero.Zotero) -> None:
+    """Close the HTTP session held by a pyzotero client, if any."""
+    session = getattr(zot, "client", None)
+    if session is not None and hasattr(session, "close"):
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+_client_registry: Optional[ZoteroClientRegistry] = None
+_client_registry_lock = threading.Lock()
+
+
+def init_client_registry(pool_size: Optional[int] = None) -> ZoteroClientRegistry:
+    """
+    Create the process-wide client registry, replacing any existing one.
+    
+    Args:
+        pool_size: Idle clients kept per library
+        
+    Returns:
+        The new ZoteroClientRegistry.
+    """
+    global _client_registry
+    with _client_registry_lock:
+        previous = _client_registry
+        _client_registry = ZoteroClientRegistry(pool_size=pool_size)
+    if previous is not None:
+        previous.close()
+    return _client_registry
+
+
+def get_client_registry() -> ZoteroClientRegistry:
+    """Get the process-wide client registry, creating it on first use."""
+    global _client_registry
+    with _client_registry_lock:
+        if _client_registry is None:
+            _client_registry = ZoteroClientRegistry()
+        return _client_registry
+
+
+def close_client_registry() -> None:
+    """Close and discard the process-wide client registry."""
+    global _client_registry
+    with _client_registry_lock:
+        registry = _client_registry
+        _client_registry = None
+    if registry is not None:
+        registry.close()
+
+
+def zotero_client(library_id: Optional[str] = None,
+                  library_type: Optional[str] = None,
+                  local_reads: bool = True):
+    """
+    Lease a pooled Zotero client from the shared registry.
+    
+    Usage:
+        with zotero_client() as zot:
+            zot.items(limit=5)
+    
+    Args:
+        library_id: Optional library ID (e.g. a group library)
+        library_type: Optional library type ('user' or 'group')
+        local_reads: Whether reads may be answered from zotero.sqlite in local mode
+    """
+    return get_client_registry().client(library_id=library_id, library_type=library_type,
+                                        local_reads=local_reads)
+
+
 def format_item_metadata(item: Dict[str, Any], include_abstract: bool = True) -> str:
     """
     Format a Zotero item's metadata as markdown.
@@ -0,0 +1,264 @@
+"""
+Persistent cache of document embeddings.
+
+Vectors are stored in a SQLite file keyed by the embedding model and a hash
+of the embedded text, independently of any ChromaDB collection. Force
+rebuilds, collection resets and renames therefore only call the embedding
+model for text it has not seen before.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default on-disk budget, overridable with ZOTERO_EMBEDDING_CACHE_MB (0 disables)
+DEFAULT_MAX_MB = 1024
+
+# When over budget, evict least recently used entries down to this fraction
+EVICT_TO_FRACTION = 0.9
+
+# Stay well below SQLite's bound-parameter limit
+_LOOKUP_CHUNK = 500
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def text_hash(text: str) -> str:
+    """Hash identifying a document text in the cache."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Size-bounded store of embedding vectors keyed by (model, text hash).
+
+    Vectors are kept as float32 blobs. Entries are evicted least recently
+    used first once their total size exceeds `max_bytes`.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            db_path: Path to the SQLite cache file (default: ~/.config/zotero-mcp/embedding_cache.sqlite)
+            max_bytes: Maximum total size of stored vectors
+        """
+        if db_path is None:
+            config_dir = Path.home() / ".config" / "zotero-mcp"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            db_path = str(config_dir / "embedding_cache.sqlite")
+
+        self.db_path = db_path
+        if max_bytes is None:
+            max_bytes = _env_int("ZOTERO_EMBEDDING_CACHE_MB", DEFAULT_MAX_MB) * 1024 * 1024
+        self.max_bytes = max_bytes
+
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            )
+            """
+        )
+        # Running total of LENGTH(vector), kept in step by every insert and
+        # delete so writes need not scan the table; shared by all processes
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        if self._stored_bytes() is None:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) "
+                "SELECT 'stored_bytes', COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+            )
+        self._conn.commit()
+
+    def _stored_bytes(self) -> Optional[int]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'stored_bytes'").fetchone()
+        return row[0] if row else None
+
+    def _add_stored_bytes(self, delta: int) -> None:
+        if delta:
+            self._conn.execute(
+                "UPDATE meta SET value = value + ? WHERE key = 'stored_bytes'", (delta,)
+            )
+
+    def get_many(self, model: str, texts: Sequence[str]) -> Dict[int, np.ndarray]:
+        """
+        Look up cached vectors for several texts.
+
+        Args:
+            model: Identifier of the embedding model
+            texts: Texts to look up
+
+        Returns:
+            Dictionary mapping the index of each cached text to its vector
+        """
+        hashes = [text_hash(text) for text in texts]
+        vectors: Dict[str, np.ndarray] = {}
+        with self._lock:
+            try:
+                unique = list(dict.fromkeys(hashes))
+                for i in range(0, len(unique), _LOOKUP_CHUNK):
+                    chunk = unique[i:i + _LOOKUP_CHUNK]
+                    rows = self._conn.execute(
+                        f"SELECT text_hash, vector FROM embeddings WHERE model = ? "
+                        f"AND text_hash IN ({', '.join('?' for _ in chunk)})",
+                        [model, *chunk],
+                    ).fetchall()
+                    for hash_, blob in rows:
+                        vectors[hash_] = np.frombuffer(blob, dtype=np.float32)
+                if vectors:
+                    now = time.time()
+                    self._conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+                        [(now, model, hash_) for hash_ in vectors],
+                    )
+                    self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+                vectors = {}
+
+            found = {i: vectors[hash_] for i, hash_ in enumerate(hashes) if hash_ in vectors}
+            self._stats["hits"] += len(found)
+            self._stats["misses"] += len(texts) - len(found)
+        return found
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Any]) -> None:
+        """
+        Store vectors for several texts.
+
+        Args:
+            model: Identifier of the embedding model
+            texts: Embedded texts
+            vectors: Their embeddings, in the same order
+        """
+        if self.max_bytes <= 0 or not texts:
+            return
+        now = time.time()
+        blobs = {
+            text_hash(text): np.asarray(vector, dtype=np.float32).tobytes()
+            for text, vector in zip(texts, vectors)
+        }
+        rows = [(model, hash_, blob, now) for hash_, blob in blobs.items()]
+        with self._lock:
+            try:
+                # Rows being replaced no longer count towards the total
+                replaced = 0
+                hashes = list(blobs)
+                for i in range(0, len(hashes), _LOOKUP_CHUNK):
+                    chunk = hashes[i:i + _LOOKUP_CHUNK]
+                    replaced += self._conn.execute(
+                        f"SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings WHERE model = ? "
+                        f"AND text_hash IN ({', '.join('?' for _ in chunk)})",
+                        [model, *chunk],
+                    ).fetchone()[0]
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, last_used) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._add_stored_bytes(sum(len(blob) for blob in blobs.values()) - replaced)
+                self._stats["stored"] += len(rows)
+                self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+
+    def _evict(self) -> None:
+        total = self._stored_bytes() or 0
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * EVICT_TO_FRACTION
+        victims = []
+        freed = 0
+        for model, hash_, size in self._conn.execute(
+            "SELECT model, text_hash, LENGTH(vector) FROM embeddings ORDER BY last_used"
+        ).fetchall():
+            if total - freed <= target:
+                break
+            victims.append((model, hash_))
+            freed += size
+        self._conn.executemany(
+            "DELETE FROM embeddings WHERE model = ? AND text_hash = ?", victims
+        )
+        self._add_stored_bytes(-freed)
+        self._stats["evicted"] += len(victims)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and on-disk size."""
+        with self._lock:
+            stats = dict(self._stats)
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            stored_bytes = self._stored_bytes() or 0
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        stats["entries"] = entries
+        stats["stored_bytes"] = stored_bytes
+        stats["max_bytes"] = self.max_bytes
+        stats["db_path"] = self.db_path
+        return stats
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get the process-wide embedding cache, creating it on first use.
+
+    Returns None when the cache is disabled (ZOTERO_EMBEDDING_CACHE_MB=0) or
+    cannot be opened.
+    """
+    global _embedding_cache
+    if _env_int("ZOTERO_EMBEDDING_CACHE_MB", DEFAULT_MAX_MB) <= 0:
+        return None
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            try:
+                _embedding_cache = EmbeddingCache()
+            except Exception as e:
+                logger.warning(f"Embedding cache unavailable: {e}")
+                return None
+        return _embedding_cache
+
+
+def close_embedding_cache() -> None:
+    """Close and discard the process-wide embedding cache."""
+    global _embedding_cache
+    with _embedding_cache_lock:
+        cache = _embedding_cache
+        _embedding_cache = None
+    if cache is not None:
+        cache.close()
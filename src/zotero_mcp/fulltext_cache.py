@@ -0,0 +1,259 @@
+"""
+Persistent cache of text extracted from Zotero attachments.
+
+Parsing PDFs is by far the slowest part of `update-db --fulltext`. This cache
+stores the extracted text zlib-compressed in a SQLite file, keyed by the
+attachment key and the extractor settings, and validated against the file's
+size plus its mtime or the MD5 Zotero keeps in itemAttachments.storageHash.
+Unchanged files are never parsed twice, even across force rebuilds.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default on-disk budget, overridable with ZOTERO_FULLTEXT_CACHE_MB (0 disables)
+DEFAULT_MAX_MB = 256
+
+# When over budget, evict least recently used entries down to this fraction
+EVICT_TO_FRACTION = 0.9
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class FulltextCache:
+    """
+    Size-bounded, content-validated store of extracted attachment text.
+
+    An entry is reused when the attachment's size is unchanged and either its
+    mtime or its Zotero storage hash matches what was recorded at extraction
+    time, so files re-downloaded by Zotero sync still hit. Entries are
+    evicted least-recently-used first once the compressed total exceeds
+    `max_bytes`.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize the fulltext cache.
+
+        Args:
+            db_path: Path to the SQLite cache file (default: ~/.config/zotero-mcp/fulltext_cache.sqlite)
+            max_bytes: Maximum total size of compressed text kept on disk
+        """
+        if db_path is None:
+            config_dir = Path.home() / ".config" / "zotero-mcp"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            db_path = str(config_dir / "fulltext_cache.sqlite")
+
+        self.db_path = db_path
+        if max_bytes is None:
+            max_bytes = _env_int("ZOTERO_FULLTEXT_CACHE_MB", DEFAULT_MAX_MB) * 1024 * 1024
+        self.max_bytes = max_bytes
+
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+        # Extraction workers in other processes share this file
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS extractions (
+                attachment_key TEXT NOT NULL,
+                variant TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                storage_hash TEXT,
+                text BLOB NOT NULL,
+                stored_bytes INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (attachment_key, variant)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, attachment_key: str, file_path: Path, variant: str,
+            storage_hash: Optional[str] = None) -> Optional[str]:
+        """
+        Look up previously extracted text for an attachment file.
+
+        Args:
+            attachment_key: Zotero key of the attachment item
+            file_path: Path of the attachment file on disk
+            variant: Extractor settings the text was produced with (e.g. "pdf:10")
+            storage_hash: MD5 Zotero recorded for the file, if any
+
+        Returns:
+            The cached text (possibly empty, for files with no extractable
+            text), or None when there is no valid entry.
+        """
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, storage_hash, text FROM extractions "
+                    "WHERE attachment_key = ? AND variant = ?",
+                    (attachment_key, variant),
+                ).fetchone()
+                if row is None:
+                    self._stats["misses"] += 1
+                    return None
+
+                size, mtime_ns, cached_hash, blob = row
+                same_content = size == st.st_size and (
+                    mtime_ns == st.st_mtime_ns
+                    or (storage_hash is not None and storage_hash == cached_hash)
+                )
+                if not same_content:
+                    self._stats["misses"] += 1
+                    return None
+
+                self._conn.execute(
+                    "UPDATE extractions SET last_used = ? WHERE attachment_key = ? AND variant = ?",
+                    (time.time(), attachment_key, variant),
+                )
+                self._conn.commit()
+                self._stats["hits"] += 1
+                return zlib.decompress(blob).decode("utf-8")
+            except (sqlite3.Error, zlib.error, UnicodeDecodeError) as e:
+                logger.warning(f"Fulltext cache read failed for {attachment_key}: {e}")
+                self._stats["misses"] += 1
+                return None
+
+    def put(self, attachment_key: str, file_path: Path, variant: str, text: str,
+            storage_hash: Optional[str] = None) -> None:
+        """
+        Store extracted text for an attachment file.
+
+        Args:
+            attachment_key: Zotero key of the attachment item
+            file_path: Path of the attachment file on disk
+            variant: Extractor settings the text was produced with
+            text: Extracted text (empty if the file had none)
+            storage_hash: MD5 Zotero recorded for the file, if any
+        """
+        if self.max_bytes <= 0:
+            return
+        try:
+            st = file_path.stat()
+        except OSError:
+            return
+
+        blob = zlib.compress(text.encode("utf-8"), 6)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO extractions "
+                    "(attachment_key, variant, size, mtime_ns, storage_hash, text, stored_bytes, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (attachment_key, variant, st.st_size, st.st_mtime_ns, storage_hash,
+                     blob, len(blob), time.time()),
+                )
+                self._stats["stored"] += 1
+                self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Fulltext cache write failed for {attachment_key}: {e}")
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(stored_bytes), 0) FROM extractions").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * EVICT_TO_FRACTION
+        rows = self._conn.execute(
+            "SELECT attachment_key, variant, stored_bytes FROM extractions ORDER BY last_used"
+        ).fetchall()
+        victims = []
+        for attachment_key, variant, stored_bytes in rows:
+            if total <= target:
+                break
+            victims.append((attachment_key, variant))
+            total -= stored_bytes
+        self._conn.executemany(
+            "DELETE FROM extractions WHERE attachment_key = ? AND variant = ?", victims
+        )
+        self._stats["evicted"] += len(victims)
+
+    def clear(self) -> None:
+        """Remove every cached extraction."""
+        with self._lock:
+            self._conn.execute("DELETE FROM extractions")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and on-disk size."""
+        with self._lock:
+            stats = dict(self._stats)
+            entries, stored_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(stored_bytes), 0) FROM extractions"
+            ).fetchone()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        stats["entries"] = entries
+        stats["stored_bytes"] = stored_bytes
+        stats["max_bytes"] = self.max_bytes
+        stats["db_path"] = self.db_path
+        return stats
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+_fulltext_cache: Optional[FulltextCache] = None
+_fulltext_cache_pid: Optional[int] = None
+_fulltext_cache_lock = threading.Lock()
+
+
+def get_fulltext_cache() -> Optional[FulltextCache]:
+    """
+    Get the process-wide fulltext cache, creating it on first use.
+
+    Returns None when the cache is disabled (ZOTERO_FULLTEXT_CACHE_MB=0) or
+    cannot be opened. Forked extraction workers get their own connection.
+    """
+    global _fulltext_cache, _fulltext_cache_pid
+    if _env_int("ZOTERO_FULLTEXT_CACHE_MB", DEFAULT_MAX_MB) <= 0:
+        return None
+    with _fulltext_cache_lock:
+        if _fulltext_cache is None or _fulltext_cache_pid != os.getpid():
+            try:
+                _fulltext_cache = FulltextCache()
+                _fulltext_cache_pid = os.getpid()
+            except Exception as e:
+                logger.warning(f"Fulltext cache unavailable: {e}")
+                return None
+        return _fulltext_cache
+
+
+def close_fulltext_cache() -> None:
+    """Close and discard the process-wide fulltext cache."""
+    global _fulltext_cache, _fulltext_cache_pid
+    with _fulltext_cache_lock:
+        cache = _fulltext_cache
+        owned = _fulltext_cache_pid == os.getpid()
+        _fulltext_cache = None
+        _fulltext_cache_pid = None
+    if cache is not None and owned:
+        cache.close()
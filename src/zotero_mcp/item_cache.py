@@ -0,0 +1,453 @@
+"""
+Persistent Zotero item cache for the MCP server.
+
+Keeps recently used items in an in-memory LRU backed by a SQLite file, keyed
+by library and item key. Cached items are revalidated against the library
+version with `since=` requests for changed and deleted items, so unchanged
+items cost no round trips.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pyzotero import zotero
+
+logger = logging.getLogger(__name__)
+
+# Defaults, overridable with ZOTERO_ITEM_CACHE_SIZE / ZOTERO_ITEM_CACHE_TTL
+DEFAULT_MEMORY_SIZE = 1000
+DEFAULT_REVALIDATE_SECONDS = 60
+
+# Maximum number of keys the Web API accepts in one itemKey= request
+MAX_KEYS_PER_REQUEST = 50
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def library_id_for(zot: zotero.Zotero) -> str:
+    """Return a stable identifier for the library a client points at."""
+    endpoint = getattr(zot, "endpoint", "")
+    return f"{endpoint}/{zot.library_type}/{zot.library_id}"
+
+
+class ZoteroItemCache:
+    """
+    Two-level (memory LRU + SQLite) cache of Zotero items.
+
+    Each library remembers the library version its cached items were last
+    validated against. At most once per `revalidate_seconds` the cache asks
+    the API which items changed since that version and evicts only those.
+    """
+
+    def __init__(self,
+                 db_path: Optional[str] = None,
+                 memory_size: Optional[int] = None,
+                 revalidate_seconds: Optional[int] = None):
+        """
+        Initialize the item cache.
+
+        Args:
+            db_path: Path to the SQLite cache file (default: ~/.config/zotero-mcp/item_cache.sqlite)
+            memory_size: Maximum number of items kept in memory
+            revalidate_seconds: Minimum interval between library version checks
+        """
+        if db_path is None:
+            config_dir = Path.home() / ".config" / "zotero-mcp"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            db_path = str(config_dir / "item_cache.sqlite")
+
+        self.db_path = db_path
+        self.memory_size = memory_size or _env_int("ZOTERO_ITEM_CACHE_SIZE", DEFAULT_MEMORY_SIZE)
+        if revalidate_seconds is None:
+            revalidate_seconds = _env_int("ZOTERO_ITEM_CACHE_TTL", DEFAULT_REVALIDATE_SECONDS)
+        self.revalidate_seconds = revalidate_seconds
+
+        self._memory: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        # library -> {"version": int | None, "checked_at": float, "generation": int,
+        #             "pending": Event while a check runs}
+        self._libraries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "revalidations": 0,
+            "invalidated": 0,
+        }
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                library TEXT NOT NULL,
+                item_key TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (library, item_key)
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS libraries (
+                library TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _library_state(self, library: str) -> Dict[str, Any]:
+        state = self._libraries.get(library)
+        if state is None:
+            row = self._conn.execute(
+                "SELECT version FROM libraries WHERE library = ?", (library,)
+            ).fetchone()
+            # "generation" counts evictions, so fetches that overlapped one can be discarded
+            state = {"version": row[0] if row else None, "checked_at": 0.0, "generation": 0}
+            self._libraries[library] = state
+        return state
+
+    def _set_library_version(self, library: str, version: Optional[int]) -> None:
+        state = self._library_state(library)
+        state["version"] = version
+        state["checked_at"] = time.monotonic()
+        if version is None:
+            self._conn.execute("DELETE FROM libraries WHERE library = ?", (library,))
+        else:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO libraries (library, version) VALUES (?, ?)",
+                (library, version),
+            )
+        self._conn.commit()
+
+    def _drop_library(self, library: str) -> None:
+        self._library_state(library)["generation"] += 1
+        for cache_key in [k for k in self._memory if k[0] == library]:
+            del self._memory[cache_key]
+        cursor = self._conn.execute("DELETE FROM items WHERE library = ?", (library,))
+        self._stats["invalidated"] += max(cursor.rowcount, 0)
+        self._conn.commit()
+
+    def _drop_keys(self, library: str, item_keys: Iterable[str]) -> None:
+        item_keys = list(item_keys)
+        for item_key in item_keys:
+            self._memory.pop((library, item_key), None)
+        if item_keys:
+            self._library_state(library)["generation"] += 1
+            cursor = self._conn.executemany(
+                "DELETE FROM items WHERE library = ? AND item_key = ?",
+                [(library, k) for k in item_keys],
+            )
+            self._stats["invalidated"] += max(cursor.rowcount, 0)
+            self._conn.commit()
+
+    def revalidate(self, zot: zotero.Zotero, force: bool = False) -> bool:
+        """
+        Evict items that changed or were deleted since the cached library version.
+
+        The lock is not held during the API requests; other threads asking
+        about the same library wait for the check in progress instead of
+        starting their own, and every other cache operation proceeds.
+
+        Args:
+            zot: Zotero client for the library
+            force: Check even if the last check is recent
+
+        Returns:
+            True if the library's cached items can be trusted.
+        """
+        library = library_id_for(zot)
+        with self._lock:
+            state = self._library_state(library)
+            pending = state.get("pending")
+            if pending is None:
+                fresh = time.monotonic() - state["checked_at"] < self.revalidate_seconds
+                if fresh and not force:
+                    # A failed check is not retried until the interval has passed
+                    return state["version"] is not None
+                since = state["version"]
+                pending = state["pending"] = threading.Event()
+                self._stats["revalidations"] += 1
+                checking = True
+            else:
+                checking = False
+
+        if not checking:
+            pending.wait()
+            with self._lock:
+                return state["version"] is not None
+
+        try:
+            removed: List[str] = []
+            if since is None:
+                # Nothing trustworthy cached yet: start from the current version
+                new_version = zot.last_modified_version()
+            else:
+                changed = zot.item_versions(since=since)
+                headers = getattr(getattr(zot, "request", None), "headers", {}) or {}
+                new_version = headers.get("last-modified-version")
+                # Permanently deleted items are only reported here
+                deleted = zot.deleted(since=since)
+                removed = list((changed or {}).keys()) + list((deleted or {}).get("items") or [])
+                new_version = int(new_version) if new_version else zot.last_modified_version()
+        except Exception as e:
+            logger.warning(f"Could not revalidate item cache for {library}: {e}")
+            with self._lock:
+                self._drop_library(library)
+                self._set_library_version(library, None)
+                state.pop("pending", None).set()
+            return False
+
+        with self._lock:
+            if since is None:
+                self._drop_library(library)
+            else:
+                self._drop_keys(library, removed)
+            self._set_library_version(library, new_version)
+            state.pop("pending", None).set()
+        return True
+
+    def get_item(self, zot: zotero.Zotero, item_key: str) -> Dict[str, Any]:
+        """
+        Get an item, serving it from the cache when it is still current.
+
+        Args:
+            zot: Zotero client for the library
+            item_key: Zotero item key
+
+        Returns:
+            The Zotero item dictionary.
+        """
+        library = library_id_for(zot)
+        item_key = item_key.upper()
+        cache_key = (library, item_key)
+
+        trusted = self.revalidate(zot)
+        if trusted:
+            with self._lock:
+                if cache_key in self._memory:
+                    self._memory.move_to_end(cache_key)
+                    self._stats["memory_hits"] += 1
+                    return self._memory[cache_key]
+
+                row = self._conn.execute(
+                    "SELECT data FROM items WHERE library = ? AND item_key = ?",
+                    cache_key,
+                ).fetchone()
+                if row:
+                    item = json.loads(row[0])
+                    self._remember(cache_key, item)
+                    self._stats["disk_hits"] += 1
+                    return item
+
+        with self._lock:
+            self._stats["misses"] += 1
+            generation = self._library_state(library)["generation"]
+        item = zot.item(item_key)
+        if trusted and isinstance(item, dict) and item.get("key"):
+            self.put(zot, item, generation)
+        return item
+
+    def get_items(self, zot: zotero.Zotero, item_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several items, fetching all cache misses in multi-key requests.
+
+        Args:
+            zot: Zotero client for the library
+            item_keys: Zotero item keys
+
+        Returns:
+            Dictionary mapping item key to item for every item found.
+        """
+        library = library_id_for(zot)
+        item_keys = [k.upper() for k in item_keys]
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+
+        trusted = self.revalidate(zot)
+        with self._lock:
+            for item_key in item_keys:
+                cache_key = (library, item_key)
+                if not trusted:
+                    missing.append(item_key)
+                elif cache_key in self._memory:
+                    self._memory.move_to_end(cache_key)
+                    self._stats["memory_hits"] += 1
+                    found[item_key] = self._memory[cache_key]
+                else:
+                    row = self._conn.execute(
+                        "SELECT data FROM items WHERE library = ? AND item_key = ?",
+                        cache_key,
+                    ).fetchone()
+                    if row:
+                        found[item_key] = json.loads(row[0])
+                        self._remember(cache_key, found[item_key])
+                        self._stats["disk_hits"] += 1
+                    else:
+                        missing.append(item_key)
+            self._stats["misses"] += len(missing)
+            generation = self._library_state(library)["generation"]
+
+        # The API accepts up to MAX_KEYS_PER_REQUEST comma-separated keys
+        for i in range(0, len(missing), MAX_KEYS_PER_REQUEST):
+            chunk = missing[i:i + MAX_KEYS_PER_REQUEST]
+            for item in zot.items(itemKey=",".join(chunk), limit=len(chunk)) or []:
+                if not isinstance(item, dict) or not item.get("key"):
+                    continue
+                found[item["key"]] = item
+                if trusted:
+                    self.put(zot, item, generation)
+
+        return found
+
+    def put(self, zot: zotero.Zotero, item: Dict[str, Any], generation: Optional[int] = None) -> None:
+        """
+        Store an item fetched from the library.
+
+        Args:
+            zot: Zotero client for the library
+            item: The Zotero item dictionary
+            generation: The library's eviction generation when the fetch
+                started; the item is not stored if anything was evicted
+                since, as it may predate a change the eviction accounted for
+        """
+        library = library_id_for(zot)
+        cache_key = (library, item["key"])
+        version = int(item.get("version", 0) or 0)
+        with self._lock:
+            if generation is not None and self._library_state(library)["generation"] != generation:
+                return
+            cached = self._memory.get(cache_key)
+            if cached is not None:
+                cached_version = int(cached.get("version", 0) or 0)
+            else:
+                row = self._conn.execute(
+                    "SELECT version FROM items WHERE library = ? AND item_key = ?",
+                    cache_key,
+                ).fetchone()
+                cached_version = row[0] if row else None
+            if cached_version is not None and cached_version > version:
+                return
+            self._remember(cache_key, item)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO items (library, item_key, version, data) VALUES (?, ?, ?, ?)",
+                (library, item["key"], version, json.dumps(item)),
+            )
+            self._conn.commit()
+
+    def _remember(self, cache_key: Tuple[str, str], item: Dict[str, Any]) -> None:
+        self._memory[cache_key] = item
+        self._memory.move_to_end(cache_key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def invalidate(self, zot: zotero.Zotero, item_key: str) -> None:
+        """Evict a single item, e.g. after it was modified through this server."""
+        with self._lock:
+            self._drop_keys(library_id_for(zot), [item_key.upper()])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_items"] = len(self._memory)
+            stats["disk_items"] = self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_ratio"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        stats["db_path"] = self.db_path
+        return stats
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+_item_cache: Optional[ZoteroItemCache] = None
+_item_cache_lock = threading.Lock()
+
+
+def get_item_cache() -> ZoteroItemCache:
+    """Get the process-wide item cache, creating it on first use."""
+    global _item_cache
+    with _item_cache_lock:
+        if _item_cache is None:
+            _item_cache = ZoteroItemCache()
+        return _item_cache
+
+
+def close_item_cache() -> None:
+    """Close and discard the process-wide item cache."""
+    global _item_cache
+    with _item_cache_lock:
+        cache = _item_cache
+        _item_cache = None
+    if cache is not None:
+        cache.close()
+
+
+def get_cached_item(zot: zotero.Zotero, item_key: str) -> Dict[str, Any]:
+    """
+    Fetch an item through the shared item cache.
+
+    Falls back to a direct API call if the cache cannot be opened.
+
+    Args:
+        zot: Zotero client for the library
+        item_key: Zotero item key
+
+    Returns:
+        The Zotero item dictionary.
+    """
+    if getattr(zot, "serves_local_reads", False):
+        # Reads from zotero.sqlite are already local and always current
+        return zot.item(item_key)
+    try:
+        cache = get_item_cache()
+    except Exception as e:
+        logger.warning(f"Item cache unavailable, fetching directly: {e}")
+        return zot.item(item_key)
+    return cache.get_item(zot, item_key)
+
+
+def get_cached_items(zot: zotero.Zotero, item_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch several items through the shared item cache.
+
+    Args:
+        zot: Zotero client for the library
+        item_keys: Zotero item keys
+
+    Returns:
+        Dictionary mapping item key to item for every item found.
+    """
+    cache = None
+    if not getattr(zot, "serves_local_reads", False):
+        try:
+            cache = get_item_cache()
+        except Exception as e:
+            logger.warning(f"Item cache unavailable, fetching directly: {e}")
+    if cache is None:
+        found = {}
+        for i in range(0, len(item_keys), MAX_KEYS_PER_REQUEST):
+            chunk = item_keys[i:i + MAX_KEYS_PER_REQUEST]
+            for item in zot.items(itemKey=",".join(chunk), limit=len(chunk)) or []:
+                found[item["key"]] = item
+        return found
+    return cache.get_items(zot, item_keys)
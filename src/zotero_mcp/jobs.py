@@ -0,0 +1,231 @@
+"""
+Background jobs for long-running index builds.
+
+Building the semantic search index can take far longer than an MCP client
+waits for a tool call. Index builds are therefore submitted as jobs that
+run in a worker thread; tools return a job id at once and clients poll,
+wait on, or cancel the job. Only one index build runs at a time, and
+submitting a build while another is queued or running returns the
+existing job.
+"""
+
+import logging
+import threading
+import time
+import traceback
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept for status queries
+MAX_FINISHED_JOBS = 20
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+# A job's work: called with (report progress(done, total, message), cancel event)
+JobFunction = Callable[[Callable[[int, int, Optional[str]], None], threading.Event], Dict[str, Any]]
+
+
+@dataclass
+class Job:
+    """State of one background job."""
+    job_id: str
+    kind: str
+    description: str
+    state: str = QUEUED
+    progress: int = 0
+    total: int = 0
+    message: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    done_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the job has been running (or ran)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-data view of the job, e.g. for status output."""
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "description": self.description,
+            "state": self.state,
+            "progress": self.progress,
+            "total": self.total,
+            "message": self.message,
+            "result": self.result,
+            "error": self.error,
+            "cancel_requested": self.cancel_event.is_set(),
+            "elapsed": round(self.elapsed, 1),
+        }
+
+
+class JobManager:
+    """Runs jobs one at a time per kind, each in its own worker thread."""
+
+    def __init__(self):
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        # One lock per job kind serializes e.g. index builds
+        self._kind_locks: Dict[str, threading.Lock] = {}
+
+    def submit(self, kind: str, description: str, func: JobFunction) -> Job:
+        """
+        Start a job, unless one of the same kind is already queued or running.
+
+        Args:
+            kind: Job kind; jobs of the same kind never run concurrently
+            description: Human-readable summary of what the job does
+            func: Work to run; receives a progress callback and the cancel event
+
+        Returns:
+            The new job, or the active job of the same kind
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job.kind == kind and not job.finished:
+                    return job
+            job = Job(job_id=uuid.uuid4().hex[:12], kind=kind, description=description)
+            self._jobs[job.job_id] = job
+            kind_lock = self._kind_locks.setdefault(kind, threading.Lock())
+            self._prune()
+
+        thread = threading.Thread(target=self._run, args=(job, func, kind_lock),
+                                  name=f"zotero-job-{job.job_id}", daemon=True)
+        thread.start()
+        logger.info(f"Started {kind} job {job.job_id}: {description}")
+        return job
+
+    def _run(self, job: Job, func: JobFunction, kind_lock: threading.Lock) -> None:
+        with kind_lock:
+            if job.cancel_event.is_set():
+                self._finish(job, CANCELLED)
+                return
+            job.state = RUNNING
+            job.started_at = time.time()
+
+            def report(done: int, total: int, message: Optional[str] = None) -> None:
+                job.progress, job.total = done, total
+                if message is not None:
+                    job.message = message
+
+            try:
+                job.result = func(report, job.cancel_event)
+                if job.result and job.result.get("error"):
+                    job.error = job.result["error"]
+                    self._finish(job, FAILED)
+                elif job.cancel_event.is_set():
+                    self._finish(job, CANCELLED)
+                else:
+                    self._finish(job, COMPLETED)
+            except Exception as e:
+                job.error = str(e)
+                logger.error(f"Job {job.job_id} failed: {e}\n{traceback.format_exc()}")
+                self._finish(job, FAILED)
+
+    def _finish(self, job: Job, state: str) -> None:
+        job.state = state
+        job.finished_at = time.time()
+        job.done_event.set()
+        logger.info(f"Job {job.job_id} {state} after {job.elapsed:.1f}s")
+
+    def _prune(self) -> None:
+        finished = sorted((job for job in self._jobs.values() if job.finished),
+                          key=lambda job: job.finished_at or 0)
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, kind: Optional[str] = None) -> List[Job]:
+        """Known jobs, newest first, optionally of one kind."""
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if kind is None or job.kind == kind]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def active(self, kind: Optional[str] = None) -> Optional[Job]:
+        """The queued or running job (of a kind), if any."""
+        for job in self.list(kind):
+            if not job.finished:
+                return job
+        return None
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Ask a job to stop. Running jobs stop at their next cancellation point.
+
+        Returns:
+            The job, or None if the id is unknown
+        """
+        job = self.get(job_id)
+        if job is not None and not job.finished:
+            job.cancel_event.set()
+            logger.info(f"Cancellation requested for job {job_id}")
+        return job
+
+    def shutdown(self, timeout: float = 5.0) -> bool:
+        """
+        Cancel unfinished jobs and wait briefly for them to stop.
+
+        Returns:
+            True if every job stopped within the timeout
+        """
+        jobs = [job for job in self.list() if not job.finished]
+        for job in jobs:
+            job.cancel_event.set()
+        deadline = time.time() + timeout
+        stopped = True
+        for job in jobs:
+            if not job.done_event.wait(max(0.0, deadline - time.time())):
+                logger.warning(f"Job {job.job_id} did not stop within {timeout:.0f}s")
+                stopped = False
+        return stopped
+
+
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Get the process-wide job manager, creating it on first use."""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager()
+        return _job_manager
+
+
+def close_job_manager() -> bool:
+    """
+    Cancel running jobs and discard the process-wide job manager.
+
+    Returns:
+        True if no job is still running, i.e. the resources jobs use can be closed
+    """
+    global _job_manager
+    with _job_manager_lock:
+        manager, _job_manager = _job_manager, None
+    return manager.shutdown() if manager is not None else True
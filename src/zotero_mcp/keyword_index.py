@@ -0,0 +1,419 @@
+"""
+Persistent keyword index of Zotero items.
+
+A SQLite FTS5 mirror of item titles, creators, dates, abstracts, tags,
+notes, annotations and extracted fulltext, ranked with BM25. Items, notes
+and annotations are indexed as separate documents so note searches can
+return individual notes. Each document records the version it was built
+from so the index can be refreshed incrementally instead of rebuilt.
+
+The index is fed either from the local zotero.sqlite
+(LocalZoteroReader.sync_keyword_index) or from API items during
+`update-db`; the `source` meta value records which.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Stored but not indexed columns, first in FTS5 column order
+STORED_COLUMNS = ("key", "kind", "parent_key", "item_type")
+
+# Indexed columns and their BM25 weights
+COLUMN_WEIGHTS = {
+    "title": 10.0,
+    "creators": 5.0,
+    "date": 1.0,
+    "abstract": 3.0,
+    "tags": 4.0,
+    "notes": 2.0,
+    "annotations": 2.0,
+    "fulltext": 1.0,
+}
+COLUMNS = tuple(COLUMN_WEIGHTS)
+
+# Columns searched by the Zotero API's titleCreatorYear query mode
+TITLE_CREATOR_YEAR_COLUMNS = ("title", "creators", "date")
+
+# Document kinds
+KIND_ITEM = "item"
+KIND_NOTE = "note"
+KIND_ANNOTATION = "annotation"
+
+# Extracted fulltext indexed per item
+MAX_FULLTEXT_CHARS = 100000
+
+# Bump when the columns or the tokenizer change; the index is then rebuilt
+SCHEMA_VERSION = "2"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def fts5_available() -> bool:
+    """Whether the linked SQLite library was built with FTS5."""
+    try:
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute("CREATE VIRTUAL TABLE probe USING fts5(body)")
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def to_match_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every word must occur (implicit AND); the last word also matches as a
+    prefix so partially typed terms still find results. Quoting each term
+    keeps user input from being parsed as FTS5 syntax.
+
+    Args:
+        query: Search text as entered by the user
+
+    Returns:
+        MATCH expression, or an empty string if the query has no words
+    """
+    terms = _TOKEN_RE.findall(query)
+    if not terms:
+        return ""
+    parts = [f'"{term}"' for term in terms]
+    parts[-1] += "*"
+    return " ".join(parts)
+
+
+def strip_html(text: Optional[str]) -> str:
+    """Remove markup from note HTML."""
+    return _SPACE_RE.sub(" ", _TAG_RE.sub(" ", text)).strip() if text else ""
+
+
+def display_date(value: Optional[str]) -> str:
+    """Drop the 'YYYY-MM-DD ' prefix Zotero stores before the original date string."""
+    if not value:
+        return ""
+    if len(value) > 11 and value[10] == " " and value[4] == "-" and value[7] == "-":
+        return value[11:]
+    return value
+
+
+class KeywordIndex:
+    """
+    BM25-ranked full-text index of items, notes and annotations.
+
+    Documents are dictionaries with a `key`, a `version` identifying the
+    state they were built from, a `kind` (item, note or annotation), an
+    optional `parent_key` and `item_type`, and any of the COLUMNS as text.
+    Tags are stored one per line.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the keyword index.
+
+        Args:
+            db_path: Path to the SQLite index file (default: ~/.config/zotero-mcp/keyword_index.sqlite);
+                ":memory:" keeps it in memory
+        """
+        if db_path is None:
+            config_dir = Path.home() / ".config" / "zotero-mcp"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            db_path = str(config_dir / "keyword_index.sqlite")
+
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        if self.get_meta("schema_version") != SCHEMA_VERSION:
+            self._create_tables()
+
+    def _create_tables(self) -> None:
+        with self._lock:
+            self._conn.execute("DROP TABLE IF EXISTS documents")
+            self._conn.execute("DROP TABLE IF EXISTS versions")
+            self._conn.execute("DELETE FROM meta")
+            stored = ", ".join(f"{column} UNINDEXED" for column in STORED_COLUMNS)
+            self._conn.execute(
+                f"CREATE VIRTUAL TABLE documents USING fts5({stored}, {', '.join(COLUMNS)}, "
+                f"tokenize = 'unicode61 remove_diacritics 2')"
+            )
+            self._conn.execute(
+                "CREATE TABLE versions (key TEXT PRIMARY KEY, doc_rowid INTEGER NOT NULL, version TEXT)"
+            )
+            self._conn.execute(
+                "INSERT INTO meta (name, value) VALUES ('schema_version', ?)", (SCHEMA_VERSION,)
+            )
+            self._conn.commit()
+
+    def get_meta(self, name: str) -> Optional[str]:
+        """Read a bookkeeping value stored with the index."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: Optional[str]) -> None:
+        """Store a bookkeeping value with the index."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value)
+            )
+            self._conn.commit()
+
+    def get_versions(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Optional[str]]:
+        """
+        Get the version each indexed document was built from.
+
+        Args:
+            keys: Only look up these keys (default: every document)
+
+        Returns:
+            Dictionary mapping key to version
+        """
+        with self._lock:
+            if keys is None:
+                return dict(self._conn.execute("SELECT key, version FROM versions").fetchall())
+            keys = list(keys)
+            versions: Dict[str, Optional[str]] = {}
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                versions.update(self._conn.execute(
+                    f"SELECT key, version FROM versions WHERE key IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall())
+            return versions
+
+    def upsert(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add or replace documents.
+
+        Args:
+            documents: Dictionaries with `key`, `version` and text columns
+
+        Returns:
+            Number of documents written
+        """
+        written = 0
+        with self._lock:
+            try:
+                for doc in documents:
+                    key = doc["key"]
+                    self._delete_key(key)
+                    columns = STORED_COLUMNS + COLUMNS
+                    values = [doc.get(column) or "" for column in columns]
+                    values[1] = doc.get("kind") or KIND_ITEM
+                    cursor = self._conn.execute(
+                        f"INSERT INTO documents ({', '.join(columns)}) "
+                        f"VALUES ({', '.join('?' for _ in columns)})",
+                        values,
+                    )
+                    self._conn.execute(
+                        "INSERT INTO versions (key, doc_rowid, version) VALUES (?, ?, ?)",
+                        (key, cursor.lastrowid, None if doc.get("version") is None else str(doc["version"])),
+                    )
+                    written += 1
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+        return written
+
+    def set_fulltext(self, texts: Dict[str, str]) -> int:
+        """
+        Replace the fulltext of indexed items, keeping their other columns and version.
+
+        Args:
+            texts: Fulltext by item key; keys not in the index are ignored
+
+        Returns:
+            Number of documents changed
+        """
+        changed = 0
+        with self._lock:
+            for key, text in texts.items():
+                row = self._conn.execute("SELECT doc_rowid FROM versions WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    continue
+                self._conn.execute(
+                    "UPDATE documents SET fulltext = ? WHERE rowid = ?",
+                    ((text or "")[:MAX_FULLTEXT_CHARS], row[0]),
+                )
+                changed += 1
+            self._conn.commit()
+        return changed
+
+    def delete(self, keys: Iterable[str]) -> int:
+        """
+        Remove documents.
+
+        Args:
+            keys: Item keys to remove
+
+        Returns:
+            Number of documents removed
+        """
+        removed = 0
+        with self._lock:
+            for key in keys:
+                removed += self._delete_key(key)
+            self._conn.commit()
+        return removed
+
+    def _delete_key(self, key: str) -> int:
+        row = self._conn.execute("SELECT doc_rowid FROM versions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return 0
+        self._conn.execute("DELETE FROM documents WHERE rowid = ?", (row[0],))
+        self._conn.execute("DELETE FROM versions WHERE key = ?", (key,))
+        return 1
+
+    def clear(self) -> None:
+        """Remove every document and bookkeeping value."""
+        self._create_tables()
+
+    def search(self,
+               query: str,
+               limit: int = 50,
+               kinds: Sequence[str] = (KIND_ITEM,),
+               columns: Optional[Sequence[str]] = None,
+               item_types: Optional[Sequence[str]] = None,
+               exclude_item_types: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Find documents matching all words of a query, best first.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            kinds: Document kinds to return
+            columns: Restrict matching to these COLUMNS (default: all)
+            item_types: Only return documents of these item types
+            exclude_item_types: Never return documents of these item types
+
+        Returns:
+            List of dictionaries with the stored columns, `title`, `creators`,
+            `date`, `abstract`, `tags` (a list), a highlighted `snippet` of
+            the best matching text and a `score` (higher is better)
+        """
+        match = to_match_query(query)
+        if not match:
+            return []
+        if columns:
+            match = f"{{{' '.join(columns)}}} : ({match})"
+
+        conditions = ["documents MATCH ?"]
+        params: List[Any] = [match]
+        for column, values, operator in (("kind", kinds, "IN"),
+                                         ("item_type", item_types, "IN"),
+                                         ("item_type", exclude_item_types, "NOT IN")):
+            if values:
+                conditions.append(f"{column} {operator} ({', '.join('?' for _ in values)})")
+                params.extend(values)
+        params.append(limit)
+
+        weights = ", ".join(["0"] * len(STORED_COLUMNS) + [str(w) for w in COLUMN_WEIGHTS.values()])
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT key, kind, parent_key, item_type, title, creators, date, abstract, tags,
+                       snippet(documents, -1, '**', '**', '...', 24),
+                       bm25(documents, {weights}) AS rank
+                FROM documents
+                WHERE {' AND '.join(conditions)}
+                ORDER BY rank
+                LIMIT ?
+                """,
+                params,
+            ).fetchall()
+        # FTS5's bm25() is negative, lower meaning more relevant
+        return [
+            {
+                "key": key, "kind": kind, "parent_key": parent_key or None, "item_type": item_type,
+                "title": title, "creators": creators, "date": date, "abstract": abstract,
+                "tags": [tag for tag in tags.split("\n") if tag], "snippet": snippet, "score": -rank,
+            }
+            for key, kind, parent_key, item_type, title, creators, date, abstract, tags, snippet, rank in rows
+        ]
+
+    def get_titles(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Get the indexed titles of documents, e.g. the parents of matching notes."""
+        keys = list(dict.fromkeys(keys))
+        titles: Dict[str, str] = {}
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                titles.update(self._conn.execute(
+                    f"SELECT d.key, d.title FROM versions v JOIN documents d ON d.rowid = v.doc_rowid "
+                    f"WHERE v.key IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall())
+        return titles
+
+    def get_parent_keys(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Get the parent keys recorded for indexed notes and annotations."""
+        keys = list(dict.fromkeys(keys))
+        parents: Dict[str, str] = {}
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                parents.update(self._conn.execute(
+                    f"SELECT d.key, d.parent_key FROM versions v JOIN documents d ON d.rowid = v.doc_rowid "
+                    f"WHERE v.key IN ({', '.join('?' for _ in chunk)}) AND d.parent_key != ''",
+                    chunk,
+                ).fetchall())
+        return parents
+
+    def count(self) -> int:
+        """Number of indexed documents."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM versions").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+_keyword_index: Optional[KeywordIndex] = None
+_keyword_index_lock = threading.Lock()
+
+
+def get_keyword_index() -> Optional[KeywordIndex]:
+    """
+    Get the process-wide keyword index, creating it on first use.
+
+    Returns None when SQLite lacks FTS5 or the index cannot be opened.
+    """
+    global _keyword_index
+    with _keyword_index_lock:
+        if _keyword_index is None:
+            if not fts5_available():
+                logger.warning("SQLite was built without FTS5; keyword index unavailable")
+                return None
+            try:
+                _keyword_index = KeywordIndex()
+            except Exception as e:
+                logger.warning(f"Keyword index unavailable: {e}")
+                return None
+        return _keyword_index
+
+
+def close_keyword_index() -> None:
+    """Close and discard the process-wide keyword index."""
+    global _keyword_index
+    with _keyword_index_lock:
+        index = _keyword_index
+        _keyword_index = None
+    if index is not None:
+        index.close()
@@ -0,0 +1,777 @@
+"""
+Zotero Web API reads answered from the local zotero.sqlite.
+
+In local mode every read otherwise travels through pyzotero to Zotero's
+local HTTP server: a JSON round trip per call, subject to the API's paging.
+`LocalLibrary` answers the same reads with direct SQL and builds the
+dictionaries the API would return (key, version, library, meta, data).
+`LocalReadClient` wraps a pyzotero client so tools keep calling
+`zot.items()`, `zot.children()`, `zot.collections()`, ... unchanged: reads
+are served from SQLite, and writes, unsupported parameters and anything
+not found locally go to the HTTP API.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .keyword_index import display_date
+from .local_db import LocalZoteroReader
+
+logger = logging.getLogger(__name__)
+
+# Results returned when no limit is given, as with the web API
+DEFAULT_LIMIT = 25
+
+# Stay below SQLite's bound-parameter limit
+_IN_CHUNK = 500
+
+# Parameters of items()/children()/collection_items() answered locally;
+# any other parameter (format, content, since, ...) goes to the HTTP API
+SUPPORTED_PARAMS = {
+    "q", "qmode", "itemType", "tag", "itemKey", "parentItem", "limit", "start",
+    "sort", "direction", "includeTrashed",
+}
+
+# itemAttachments.linkMode -> API linkMode
+LINK_MODES = {0: "imported_file", 1: "imported_url", 2: "linked_file", 3: "linked_url", 4: "embedded_image"}
+
+# itemAnnotations.type -> API annotationType
+ANNOTATION_TYPES = {1: "highlight", 2: "note", 3: "image", 4: "ink", 5: "underline", 6: "text"}
+
+# Sorts whose default direction is descending, as with the web API
+_DESCENDING_SORTS = {"dateAdded", "dateModified", "date", "accessDate"}
+
+
+def _iso(timestamp: Optional[str]) -> Optional[str]:
+    """SQL UTC timestamp ('YYYY-MM-DD HH:MM:SS') as the API's ISO 8601 form."""
+    if not timestamp:
+        return timestamp
+    return timestamp.replace(" ", "T", 1) + ("Z" if not timestamp.endswith("Z") else "")
+
+
+def _parsed_date(value: Optional[str]) -> Optional[str]:
+    """The API's meta.parsedDate ('2020', '2020-03', '2020-03-15') of a stored multipart date."""
+    if not value or len(value) < 10 or value[4] != "-" or value[7] != "-":
+        return None
+    year, month, day = value[:4], value[5:7], value[8:10]
+    if year == "0000":
+        return None
+    if month == "00":
+        return year
+    if day == "00":
+        return f"{year}-{month}"
+    return f"{year}-{month}-{day}"
+
+
+def _creator_summary(creators: List[Dict[str, Any]]) -> str:
+    """The API's meta.creatorSummary: 'Smith', 'Smith and Jones' or 'Smith et al.'."""
+    # Authors (the primary creator type) are preferred, as in Zotero
+    names = [c.get("lastName") or c.get("name") or "" for c in creators if c.get("creatorType") == "author"]
+    if not names:
+        names = [c.get("lastName") or c.get("name") or "" for c in creators]
+    names = [name for name in names if name]
+    if not names:
+        return ""
+    if len(names) == 1:
+        return names[0]
+    if len(names) == 2:
+        return f"{names[0]} and {names[1]}"
+    return f"{names[0]} et al."
+
+
+def _split_condition(value: Any) -> Tuple[List[str], List[str]]:
+    """Split an API condition like "a || b" or "-a" into (any of, none of)."""
+    include: List[str] = []
+    exclude: List[str] = []
+    for part in str(value or "").split("||"):
+        part = part.strip()
+        if part.startswith("-"):
+            exclude.append(part[1:].strip())
+        elif part:
+            include.append(part)
+    return include, exclude
+
+
+def _chunks(values: Sequence[Any]) -> Iterable[Sequence[Any]]:
+    for i in range(0, len(values), _IN_CHUNK):
+        yield values[i:i + _IN_CHUNK]
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+class LocalLibrary:
+    """
+    API-shaped read access to one library in zotero.sqlite.
+
+    Each thread gets its own read-only LocalZoteroReader connection.
+    """
+
+    def __init__(self, library_type: str = "user", library_id: str = "0", db_path: Optional[str] = None):
+        """
+        Initialize the library view.
+
+        Args:
+            library_type: 'user' or 'group'
+            library_id: Web API library id (the group id for groups; ignored for the local user library)
+            db_path: Optional path to zotero.sqlite. If None, auto-detect.
+
+        Raises:
+            FileNotFoundError: If the database cannot be located.
+        """
+        self.library_type = library_type
+        self.library_id = str(library_id)
+        self.db_path = db_path or LocalZoteroReader().db_path
+        self._local = threading.local()
+        self._readers: List[LocalZoteroReader] = []
+        self._lock = threading.Lock()
+        self._schema: Optional[Dict[str, Any]] = None
+        self._library_row_id: Optional[int] = None
+
+    # -- connection and schema -------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        reader = getattr(self._local, "reader", None)
+        if reader is None:
+            reader = LocalZoteroReader(db_path=self.db_path)
+            self._local.reader = reader
+            with self._lock:
+                self._readers.append(reader)
+        elif reader.is_stale():
+            # Zotero wrote since this thread connected; move to the new snapshot
+            reader.close()
+        return reader._get_connection()
+
+    def _table_exists(self, name: str) -> bool:
+        return name in self._get_schema()["tables"]
+
+    def _get_schema(self) -> Dict[str, Any]:
+        """Type, field and creator-type names, resolved once."""
+        if self._schema is not None:
+            return self._schema
+        conn = self._conn()
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        item_types = dict(conn.execute("SELECT itemTypeID, typeName FROM itemTypes").fetchall())
+        fields = dict(conn.execute("SELECT fieldID, fieldName FROM fields").fetchall())
+        creator_types = (dict(conn.execute("SELECT creatorTypeID, creatorType FROM creatorTypes").fetchall())
+                         if "creatorTypes" in tables else {})
+        base_of: Dict[int, str] = {}
+        if "baseFieldMappings" in tables:
+            for base_id, field_id in conn.execute("SELECT baseFieldID, fieldID FROM baseFieldMappings"):
+                base_of[field_id] = fields.get(base_id, "")
+        title_ids = [fid for fid, name in fields.items() if name == "title" or base_of.get(fid) == "title"]
+        date_ids = [fid for fid, name in fields.items() if name == "date" or base_of.get(fid) == "date"]
+        self._schema = {
+            "tables": tables,
+            "item_types": item_types,
+            "fields": fields,
+            "creator_types": creator_types,
+            "title_ids": title_ids,
+            "date_ids": set(date_ids),
+        }
+        return self._schema
+
+    def _library_row(self) -> int:
+        """libraries.libraryID of this library."""
+        if self._library_row_id is not None:
+            return self._library_row_id
+        conn = self._conn()
+        row = None
+        if self.library_type == "group":
+            if "groups" in self._get_schema()["tables"]:
+                row = conn.execute("SELECT libraryID FROM groups WHERE groupID = ?", (self.library_id,)).fetchone()
+        elif "libraries" in self._get_schema()["tables"]:
+            row = conn.execute("SELECT libraryID FROM libraries WHERE type = 'user' ORDER BY libraryID LIMIT 1").fetchone()
+        else:
+            row = (1,)
+        if row is None:
+            raise LookupError(f"Library {self.library_type}:{self.library_id} is not in the local database")
+        self._library_row_id = row[0]
+        return self._library_row_id
+
+    def _library_info(self) -> Dict[str, Any]:
+        return {"type": self.library_type, "id": int(self.library_id) if self.library_id.isdigit() else self.library_id}
+
+    # -- item selection --------------------------------------------------------
+
+    def _not_trashed(self, alias: str = "i") -> str:
+        if not self._table_exists("deletedItems"):
+            return "1"
+        return f"{alias}.itemID NOT IN (SELECT itemID FROM deletedItems)"
+
+    def _children_of(self) -> str:
+        """SQL selecting the child item IDs of the item bound to `?` (three bindings)."""
+        parts = ["SELECT itemID FROM itemNotes WHERE parentItemID = ?",
+                 "SELECT itemID FROM itemAttachments WHERE parentItemID = ?"]
+        if self._table_exists("itemAnnotations"):
+            parts.append("SELECT itemID FROM itemAnnotations WHERE parentItemID = ?")
+        else:
+            parts.append("SELECT NULL WHERE ? IS NULL")
+        return " UNION ALL ".join(parts)
+
+    def _top_level(self) -> str:
+        conditions = [
+            "i.itemID NOT IN (SELECT itemID FROM itemNotes WHERE parentItemID IS NOT NULL)",
+            "i.itemID NOT IN (SELECT itemID FROM itemAttachments WHERE parentItemID IS NOT NULL)",
+        ]
+        if self._table_exists("itemAnnotations"):
+            conditions.append("i.itemID NOT IN (SELECT itemID FROM itemAnnotations)")
+        return " AND ".join(conditions)
+
+    def _word_condition(self, word: str, everything: bool) -> Tuple[str, List[Any]]:
+        """SQL matching items where one search word appears (quick search semantics)."""
+        schema = self._get_schema()
+        like = f"%{word}%"
+        clauses = []
+        params: List[Any] = []
+        if everything:
+            clauses.append("i.itemID IN (SELECT d.itemID FROM itemData d JOIN itemDataValues v "
+                           "ON v.valueID = d.valueID WHERE v.value LIKE ?)")
+            params.append(like)
+        elif schema["title_ids"]:
+            clauses.append(f"i.itemID IN (SELECT d.itemID FROM itemData d JOIN itemDataValues v "
+                           f"ON v.valueID = d.valueID WHERE d.fieldID IN ({_placeholders(schema['title_ids'])}) "
+                           f"AND v.value LIKE ?)")
+            params.extend(schema["title_ids"])
+            params.append(like)
+        clauses.append("i.itemID IN (SELECT ic.itemID FROM itemCreators ic JOIN creators c "
+                       "ON c.creatorID = ic.creatorID WHERE c.lastName LIKE ? OR c.firstName LIKE ?)")
+        params.extend([like, like])
+        if word.isdigit() and len(word) == 4 and schema["date_ids"]:
+            date_ids = sorted(schema["date_ids"])
+            clauses.append(f"i.itemID IN (SELECT d.itemID FROM itemData d JOIN itemDataValues v "
+                           f"ON v.valueID = d.valueID WHERE d.fieldID IN ({_placeholders(date_ids)}) "
+                           f"AND SUBSTR(v.value, 1, 4) = ?)")
+            params.extend(date_ids)
+            params.append(word)
+        # Notes match on their title in both modes, on their text in 'everything'
+        clauses.append(f"i.itemID IN (SELECT itemID FROM itemNotes WHERE {'note' if everything else 'title'} LIKE ?)")
+        params.append(like)
+        if everything:
+            clauses.append("i.itemID IN (SELECT it.itemID FROM itemTags it JOIN tags t "
+                           "ON t.tagID = it.tagID WHERE t.name LIKE ?)")
+            params.append(like)
+            if self._table_exists("itemAnnotations"):
+                clauses.append("i.itemID IN (SELECT itemID FROM itemAnnotations WHERE text LIKE ? OR comment LIKE ?)")
+                params.extend([like, like])
+            if self._table_exists("fulltextItemWords"):
+                # Attachments whose indexed text has the word, and their parents
+                clauses.append(
+                    "i.itemID IN (SELECT fiw.itemID FROM fulltextItemWords fiw JOIN fulltextWords fw "
+                    "ON fw.wordID = fiw.wordID WHERE fw.word = ? "
+                    "UNION SELECT a.parentItemID FROM itemAttachments a JOIN fulltextItemWords fiw "
+                    "ON fiw.itemID = a.itemID JOIN fulltextWords fw ON fw.wordID = fiw.wordID WHERE fw.word = ?)")
+                params.extend([word.lower(), word.lower()])
+        return "(" + " OR ".join(clauses) + ")", params
+
+    def _sort_expression(self, sort: Optional[str]) -> str:
+        schema = self._get_schema()
+        if sort == "dateAdded":
+            return "i.dateAdded"
+        if sort == "title" and schema["title_ids"]:
+            return (f"(SELECT v.value FROM itemData d JOIN itemDataValues v ON v.valueID = d.valueID "
+                    f"WHERE d.itemID = i.itemID AND d.fieldID IN ({', '.join(map(str, schema['title_ids']))}) "
+                    f"LIMIT 1) COLLATE NOCASE")
+        if sort == "creator":
+            return ("(SELECT COALESCE(c.lastName, c.firstName) FROM itemCreators ic JOIN creators c "
+                    "ON c.creatorID = ic.creatorID WHERE ic.itemID = i.itemID ORDER BY ic.orderIndex LIMIT 1) COLLATE NOCASE")
+        if sort == "itemType":
+            return "(SELECT typeName FROM itemTypes WHERE itemTypeID = i.itemTypeID)"
+        if sort == "date" and schema["date_ids"]:
+            return (f"(SELECT SUBSTR(v.value, 1, 10) FROM itemData d JOIN itemDataValues v ON v.valueID = d.valueID "
+                    f"WHERE d.itemID = i.itemID AND d.fieldID IN ({', '.join(map(str, sorted(schema['date_ids'])))}) "
+                    f"LIMIT 1)")
+        return "i.dateModified"
+
+    def _select_item_ids(self, params: Dict[str, Any], scope: Optional[Tuple[str, List[Any]]] = None,
+                         top: bool = False) -> List[int]:
+        """
+        Item IDs matching API-style parameters, sorted and paged.
+
+        Args:
+            params: items() parameters (q, qmode, itemType, tag, itemKey, parentItem, limit, start, sort, direction)
+            scope: Extra (SQL condition, bindings) restricting the items, e.g. a collection
+            top: Only items without a parent
+        """
+        conditions = ["i.libraryID = ?"]
+        bindings: List[Any] = [self._library_row()]
+        if not params.get("includeTrashed"):
+            conditions.append(self._not_trashed())
+        if scope is not None:
+            conditions.append(scope[0])
+            bindings.extend(scope[1])
+        if top:
+            conditions.append(self._top_level())
+
+        include, exclude = _split_condition(params.get("itemType"))
+        if include:
+            conditions.append(f"i.itemTypeID IN (SELECT itemTypeID FROM itemTypes WHERE typeName IN ({_placeholders(include)}))")
+            bindings.extend(include)
+        if exclude:
+            conditions.append(f"i.itemTypeID NOT IN (SELECT itemTypeID FROM itemTypes WHERE typeName IN ({_placeholders(exclude)}))")
+            bindings.extend(exclude)
+
+        if params.get("itemKey"):
+            keys = [key.strip() for key in str(params["itemKey"]).split(",") if key.strip()]
+            conditions.append(f"i.key IN ({_placeholders(keys)})")
+            bindings.extend(keys)
+
+        if params.get("parentItem"):
+            conditions.append(f"i.itemID IN ({self._children_of()})")
+            parent = f"(SELECT itemID FROM items WHERE libraryID = {self._library_row()} AND key = ?)"
+            conditions[-1] = conditions[-1].replace("parentItemID = ?", f"parentItemID = {parent}")
+            bindings.extend([params["parentItem"]] * 3)
+
+        tags = params.get("tag")
+        for condition in (tags if isinstance(tags, (list, tuple)) else [tags] if tags else []):
+            any_of, none_of = _split_condition(condition)
+            tag_sql = "SELECT it.itemID FROM itemTags it JOIN tags t ON t.tagID = it.tagID WHERE t.name IN ({})"
+            if any_of:
+                conditions.append(f"i.itemID IN ({tag_sql.format(_placeholders(any_of))})")
+                bindings.extend(any_of)
+            if none_of:
+                conditions.append(f"i.itemID NOT IN ({tag_sql.format(_placeholders(none_of))})")
+                bindings.extend(none_of)
+
+        everything = params.get("qmode") == "everything"
+        for word in str(params.get("q") or "").split():
+            sql, word_bindings = self._word_condition(word.strip('"'), everything)
+            conditions.append(sql)
+            bindings.extend(word_bindings)
+
+        sort = params.get("sort") or "dateModified"
+        direction = (params.get("direction") or ("desc" if sort in _DESCENDING_SORTS else "asc")).lower()
+        direction = "DESC" if direction == "desc" else "ASC"
+        sql = (f"SELECT i.itemID FROM items i WHERE {' AND '.join(conditions)} "
+               f"ORDER BY {self._sort_expression(sort)} {direction}, i.itemID {direction}")
+
+        limit = params.get("limit")
+        limit = DEFAULT_LIMIT if limit is None else int(limit)
+        if limit >= 0:
+            sql += " LIMIT ? OFFSET ?"
+            bindings.extend([limit, int(params.get("start") or 0)])
+        elif params.get("start"):
+            sql += " LIMIT -1 OFFSET ?"
+            bindings.append(int(params["start"]))
+        return [row[0] for row in self._conn().execute(sql, bindings)]
+
+    # -- item building ---------------------------------------------------------
+
+    def _fetch_rows(self, sql: str, ids: Sequence[int]) -> List[Tuple]:
+        """Run `sql` (containing one '{ids}' placeholder list) over `ids` in chunks."""
+        conn = self._conn()
+        rows: List[Tuple] = []
+        for chunk in _chunks(list(ids)):
+            rows.extend(conn.execute(sql.format(ids=_placeholders(chunk)), chunk).fetchall())
+        return rows
+
+    def build_items(self, item_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """
+        Build API item dictionaries with a fixed number of set-based queries.
+
+        Args:
+            item_ids: itemIDs, in the order the items are returned
+
+        Returns:
+            One dictionary per item found, in the order of `item_ids`
+        """
+        if not item_ids:
+            return []
+        schema = self._get_schema()
+        fields = schema["fields"]
+        base = {}
+        for item_id, key, version, item_type_id, added, modified in self._fetch_rows(
+                "SELECT itemID, key, version, itemTypeID, dateAdded, dateModified FROM items "
+                "WHERE itemID IN ({ids})", item_ids):
+            item_type = schema["item_types"].get(item_type_id, "unknown")
+            data: Dict[str, Any] = {"key": key, "version": version, "itemType": item_type}
+            if item_type not in ("note", "attachment", "annotation"):
+                data["creators"] = []
+            base[item_id] = {
+                "key": key,
+                "version": version,
+                "library": self._library_info(),
+                "meta": {},
+                "data": data,
+                "_extra": {"dateAdded": _iso(added), "dateModified": _iso(modified)},
+            }
+        if not base:
+            return []
+        ids = list(base)
+
+        for item_id, field_id, value in self._fetch_rows(
+                "SELECT d.itemID, d.fieldID, v.value FROM itemData d JOIN itemDataValues v "
+                "ON v.valueID = d.valueID WHERE d.itemID IN ({ids})", ids):
+            name = fields.get(field_id)
+            if not name:
+                continue
+            item = base[item_id]
+            if field_id in schema["date_ids"]:
+                item["data"][name] = display_date(value)
+                if "parsedDate" not in item["meta"] and (parsed := _parsed_date(value)):
+                    item["meta"]["parsedDate"] = parsed
+            elif name == "accessDate":
+                item["data"][name] = _iso(value)
+            else:
+                item["data"][name] = value
+
+        creator_rows = self._fetch_rows(
+            "SELECT ic.itemID, ic.orderIndex, ic.creatorTypeID, c.firstName, c.lastName, c.fieldMode "
+            "FROM itemCreators ic JOIN creators c ON c.creatorID = ic.creatorID WHERE ic.itemID IN ({ids})", ids)
+        for item_id, _, creator_type_id, first, last, field_mode in sorted(creator_rows, key=lambda r: (r[0], r[1])):
+            creator = {"creatorType": schema["creator_types"].get(creator_type_id, "author")}
+            if field_mode == 1:
+                creator["name"] = last or ""
+            else:
+                creator["firstName"] = first or ""
+                creator["lastName"] = last or ""
+            base[item_id]["data"].setdefault("creators", []).append(creator)
+
+        tags: Dict[int, List[Dict[str, Any]]] = {}
+        for item_id, name, tag_type in self._fetch_rows(
+                "SELECT it.itemID, t.name, it.type FROM itemTags it JOIN tags t ON t.tagID = it.tagID "
+                "WHERE it.itemID IN ({ids})", ids):
+            tag = {"tag": name}
+            if tag_type:
+                tag["type"] = tag_type
+            tags.setdefault(item_id, []).append(tag)
+
+        collections: Dict[int, List[str]] = {}
+        for item_id, key in self._fetch_rows(
+                "SELECT ci.itemID, c.key FROM collectionItems ci JOIN collections c "
+                "ON c.collectionID = ci.collectionID WHERE ci.itemID IN ({ids})", ids):
+            collections.setdefault(item_id, []).append(key)
+
+        relations: Dict[int, Dict[str, Any]] = {}
+        if self._table_exists("itemRelations") and self._table_exists("relationPredicates"):
+            for item_id, predicate, obj in self._fetch_rows(
+                    "SELECT r.itemID, p.predicate, r.object FROM itemRelations r JOIN relationPredicates p "
+                    "ON p.predicateID = r.predicateID WHERE r.itemID IN ({ids})", ids):
+                existing = relations.setdefault(item_id, {}).get(predicate)
+                if existing is None:
+                    relations[item_id][predicate] = obj
+                else:
+                    relations[item_id][predicate] = (existing if isinstance(existing, list) else [existing]) + [obj]
+
+        for item_id, note, parent_key in self._fetch_rows(
+                "SELECT n.itemID, n.note, p.key FROM itemNotes n LEFT JOIN items p ON p.itemID = n.parentItemID "
+                "WHERE n.itemID IN ({ids})", ids):
+            # Attachments keep their note in itemNotes too
+            data = base[item_id]["data"]
+            data["note"] = note or ""
+            if parent_key:
+                data["parentItem"] = parent_key
+
+        charset_join = ("LEFT JOIN charsets cs ON cs.charsetID = a.charsetID" if self._table_exists("charsets") else "")
+        charset_col = "cs.charset" if charset_join else "NULL"
+        for item_id, parent_key, link_mode, content_type, charset, path, mtime, md5 in self._fetch_rows(
+                f"SELECT a.itemID, p.key, a.linkMode, a.contentType, {charset_col}, a.path, a.storageModTime, "
+                f"a.storageHash FROM itemAttachments a LEFT JOIN items p ON p.itemID = a.parentItemID "
+                f"{charset_join} WHERE a.itemID IN ({{ids}})", ids):
+            data = base[item_id]["data"]
+            if parent_key:
+                data["parentItem"] = parent_key
+            data["linkMode"] = LINK_MODES.get(link_mode, str(link_mode))
+            data["contentType"] = content_type or ""
+            data["charset"] = charset or ""
+            if path and path.startswith("storage:"):
+                data["filename"] = path[len("storage:"):]
+                data["md5"] = md5
+                data["mtime"] = mtime
+            elif path:
+                data["path"] = path
+            data.setdefault("note", "")
+
+        if self._table_exists("itemAnnotations"):
+            for (item_id, parent_key, ann_type, author, text, comment, color, page_label, sort_index,
+                 position) in self._fetch_rows(
+                    "SELECT a.itemID, p.key, a.type, a.authorName, a.text, a.comment, a.color, a.pageLabel, "
+                    "a.sortIndex, a.position FROM itemAnnotations a LEFT JOIN items p ON p.itemID = a.parentItemID "
+                    "WHERE a.itemID IN ({ids})", ids):
+                data = base[item_id]["data"]
+                data["parentItem"] = parent_key
+                data["annotationType"] = ANNOTATION_TYPES.get(ann_type, str(ann_type))
+                data["annotationText"] = text or ""
+                data["annotationComment"] = comment or ""
+                data["annotationColor"] = color or ""
+                data["annotationPageLabel"] = page_label or ""
+                data["annotationSortIndex"] = sort_index or ""
+                data["annotationPosition"] = position or ""
+                if author:
+                    data["annotationAuthorName"] = author
+
+        num_children: Dict[int, int] = {}
+        not_trashed = self._not_trashed("c")
+        for parent_id, count in self._fetch_rows(
+                f"SELECT parentItemID, COUNT(*) FROM (SELECT itemID, parentItemID FROM itemNotes "
+                f"UNION SELECT itemID, parentItemID FROM itemAttachments) c "
+                f"WHERE c.parentItemID IN ({{ids}}) AND {not_trashed} GROUP BY parentItemID", ids):
+            num_children[parent_id] = count
+
+        results = []
+        for item_id in item_ids:
+            item = base.get(item_id)
+            if item is None:
+                continue
+            data = item["data"]
+            extra = item.pop("_extra")
+            data["tags"] = tags.get(item_id, [])
+            if data["itemType"] != "annotation":
+                data["collections"] = collections.get(item_id, [])
+            data["relations"] = relations.get(item_id, {})
+            data["dateAdded"] = extra["dateAdded"]
+            data["dateModified"] = extra["dateModified"]
+            if "creators" in data:
+                item["meta"]["creatorSummary"] = _creator_summary(data["creators"])
+                item["meta"]["numChildren"] = num_children.get(item_id, 0)
+            elif data["itemType"] == "attachment":
+                item["meta"]["numChildren"] = num_children.get(item_id, 0)
+            results.append(item)
+        return results
+
+    # -- API-style reads ---------------------------------------------------------
+
+    def _item_id(self, key: str) -> Optional[int]:
+        row = self._conn().execute(
+            "SELECT itemID FROM items WHERE libraryID = ? AND key = ?", (self._library_row(), key)
+        ).fetchone()
+        return row[0] if row else None
+
+    def items(self, params: Dict[str, Any], top: bool = False) -> List[Dict[str, Any]]:
+        """Equivalent of GET /items (or /items/top) with the given parameters."""
+        return self.build_items(self._select_item_ids(params, top=top))
+
+    def item(self, key: str) -> Optional[Dict[str, Any]]:
+        """Equivalent of GET /items/<key>, or None if the item is not in the database."""
+        item_id = self._item_id(key)
+        items = self.build_items([item_id]) if item_id is not None else []
+        return items[0] if items else None
+
+    def children(self, key: str, params: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Equivalent of GET /items/<key>/children, or None if the parent is not in the database."""
+        item_id = self._item_id(key)
+        if item_id is None:
+            return None
+        params = dict(params)
+        params.setdefault("limit", -1)
+        # Children come back in the order Zotero lists them, oldest first
+        params.setdefault("sort", "dateAdded")
+        params.setdefault("direction", "asc")
+        scope = (f"i.itemID IN ({self._children_of()})", [item_id] * 3)
+        return self.build_items(self._select_item_ids(params, scope=scope))
+
+    def _collection_rows(self, where: str, bindings: List[Any], limit: Optional[int],
+                         start: int = 0) -> List[Dict[str, Any]]:
+        conditions = ["c.libraryID = ?", where]
+        if self._table_exists("deletedCollections"):
+            conditions.append("c.collectionID NOT IN (SELECT collectionID FROM deletedCollections)")
+        not_trashed = self._not_trashed("ci")
+        sql = (
+            "SELECT c.key, c.version, c.collectionName, p.key, "
+            "(SELECT COUNT(*) FROM collections s WHERE s.parentCollectionID = c.collectionID), "
+            f"(SELECT COUNT(*) FROM collectionItems ci WHERE ci.collectionID = c.collectionID AND {not_trashed}) "
+            "FROM collections c LEFT JOIN collections p ON p.collectionID = c.parentCollectionID "
+            f"WHERE {' AND '.join(conditions)} ORDER BY c.collectionName COLLATE NOCASE, c.collectionID"
+        )
+        bindings = [self._library_row(), *bindings]
+        limit = DEFAULT_LIMIT if limit is None else int(limit)
+        if limit >= 0:
+            sql += " LIMIT ? OFFSET ?"
+            bindings.extend([limit, start])
+        return [
+            {
+                "key": key,
+                "version": version,
+                "library": self._library_info(),
+                "meta": {"numCollections": num_collections, "numItems": num_items},
+                "data": {
+                    "key": key,
+                    "version": version,
+                    "name": name,
+                    "parentCollection": parent_key or False,
+                    "relations": {},
+                },
+            }
+            for key, version, name, parent_key, num_collections, num_items in self._conn().execute(sql, bindings)
+        ]
+
+    def collections(self, params: Dict[str, Any], top: bool = False) -> List[Dict[str, Any]]:
+        """Equivalent of GET /collections (or /collections/top)."""
+        where = "c.parentCollectionID IS NULL" if top else "1"
+        return self._collection_rows(where, [], params.get("limit"), int(params.get("start") or 0))
+
+    def collection(self, key: str) -> Optional[Dict[str, Any]]:
+        """Equivalent of GET /collections/<key>, or None if it is not in the database."""
+        rows = self._collection_rows("c.key = ?", [key], 1)
+        return rows[0] if rows else None
+
+    def collection_items(self, key: str, params: Dict[str, Any], top: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Equivalent of GET /collections/<key>/items, or None if the collection is not in the database."""
+        row = self._conn().execute(
+            "SELECT collectionID FROM collections WHERE libraryID = ? AND key = ?", (self._library_row(), key)
+        ).fetchone()
+        if row is None:
+            return None
+        scope = ("i.itemID IN (SELECT itemID FROM collectionItems WHERE collectionID = ?)", [row[0]])
+        return self.build_items(self._select_item_ids(params, scope=scope, top=top))
+
+    def tags(self, params: Dict[str, Any]) -> List[str]:
+        """Tag names in the library, like pyzotero's tags()."""
+        sql = ("SELECT DISTINCT t.name FROM tags t JOIN itemTags it ON it.tagID = t.tagID "
+               f"JOIN items i ON i.itemID = it.itemID WHERE i.libraryID = ? AND {self._not_trashed()} "
+               "ORDER BY t.name COLLATE NOCASE")
+        bindings: List[Any] = [self._library_row()]
+        limit = params.get("limit")
+        limit = DEFAULT_LIMIT if limit is None else int(limit)
+        if limit >= 0:
+            sql += " LIMIT ? OFFSET ?"
+            bindings.extend([limit, int(params.get("start") or 0)])
+        return [row[0] for row in self._conn().execute(sql, bindings)]
+
+    def close(self) -> None:
+        """Close the connections opened by every thread."""
+        with self._lock:
+            readers, self._readers = self._readers, []
+        for reader in readers:
+            reader.close()
+        self._local = threading.local()
+
+
+class LocalReadClient:
+    """
+    pyzotero client whose reads are answered by a LocalLibrary.
+
+    Supports the read calls the tools make (items, top, item, children,
+    collections, collections_top, collection, collection_items, tags,
+    everything, add_parameters). Everything else, including all writes,
+    is delegated to the wrapped pyzotero client, as are reads with
+    parameters the local backend does not implement, keys not found in
+    the database, and reads that fail locally.
+    """
+
+    serves_local_reads = True
+
+    def __init__(self, zot: Any, library: LocalLibrary):
+        self._zot = zot
+        self._library = library
+        self._params: Dict[str, Any] = {}
+        # The last local read, so everything() can repeat it without a limit
+        self._last_read: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self._last_params: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._zot, name)
+
+    def add_parameters(self, **params: Any) -> None:
+        """Parameters for the next read, as with pyzotero."""
+        self._params = {k: v for k, v in params.items() if v is not None}
+
+    def _take_params(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        params = {**self._params, **{k: v for k, v in kwargs.items() if v is not None}}
+        self._params = {}
+        return params
+
+    def _read(self, name: str, local: Callable[[Dict[str, Any]], Any], params: Dict[str, Any],
+              *args: Any) -> Any:
+        """Answer a read locally, or with the wrapped client when that is not possible."""
+        if set(params) <= SUPPORTED_PARAMS:
+            try:
+                result = local(params)
+                if result is not None:
+                    self._last_read, self._last_params = local, params
+                    return result
+            except (sqlite3.Error, LookupError, ValueError) as e:
+                logger.warning(f"Local read {name} failed, using the Zotero API: {e}")
+        self._last_read = None
+        remote = getattr(self._zot, name)
+        return remote(*args, **params)
+
+    def items(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self._read("items", self._library.items, self._take_params(kwargs))
+
+    def top(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self._read("top", lambda p: self._library.items(p, top=True), self._take_params(kwargs))
+
+    def item(self, item_key: str, **kwargs: Any) -> Dict[str, Any]:
+        return self._read("item", lambda p: self._library.item(item_key), self._take_params(kwargs), item_key)
+
+    def children(self, item_key: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self._read("children", lambda p: self._library.children(item_key, p),
+                          self._take_params(kwargs), item_key)
+
+    def collections(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self._read("collections", self._library.collections, self._take_params(kwargs))
+
+    def collections_top(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self._read("collections_top", lambda p: self._library.collections(p, top=True),
+                          self._take_params(kwargs))
+
+    def collection(self, collection_key: str, **kwargs: Any) -> Dict[str, Any]:
+        return self._read("collection", lambda p: self._library.collection(collection_key),
+                          self._take_params(kwargs), collection_key)
+
+    def collection_items(self, collection_key: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        # Saved searches share this endpoint and are left to the API
+        return self._read("collection_items", lambda p: self._library.collection_items(collection_key, p),
+                          self._take_params(kwargs), collection_key)
+
+    def collection_items_top(self, collection_key: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self._read("collection_items_top",
+                          lambda p: self._library.collection_items(collection_key, p, top=True),
+                          self._take_params(kwargs), collection_key)
+
+    def tags(self, **kwargs: Any) -> List[str]:
+        return self._read("tags", self._library.tags, self._take_params(kwargs))
+
+    def everything(self, query: Any) -> Any:
+        """All results of the last read, like pyzotero's everything()."""
+        if self._last_read is None:
+            return self._zot.everything(query)
+        params = {k: v for k, v in self._last_params.items() if k not in ("limit", "start")}
+        params["limit"] = -1
+        return self._last_read(params)
+
+
+_libraries: Dict[Tuple[str, str], Optional[LocalLibrary]] = {}
+_libraries_lock = threading.Lock()
+
+
+def local_reads_enabled() -> bool:
+    """Whether local mode reads should come from zotero.sqlite (ZOTERO_LOCAL_READS, default on)."""
+    return os.getenv("ZOTERO_LOCAL_READS", "true").lower() not in ("false", "no", "0")
+
+
+def get_local_library(library_type: str, library_id: str) -> Optional[LocalLibrary]:
+    """
+    Get the process-wide LocalLibrary for a library.
+
+    Returns None when local reads are disabled, the database cannot be
+    found or the library is not in it.
+    """
+    if not local_reads_enabled():
+        return None
+    key = (library_type, str(library_id))
+    with _libraries_lock:
+        if key not in _libraries:
+            try:
+                library = LocalLibrary(library_type, str(library_id))
+                library._library_row()
+                _libraries[key] = library
+                logger.info(f"Serving {library_type}:{library_id} reads from {library.db_path}")
+            except (FileNotFoundError, LookupError, sqlite3.Error) as e:
+                logger.info(f"Local reads unavailable for {library_type}:{library_id}: {e}")
+                _libraries[key] = None
+        return _libraries[key]
+
+
+def close_local_libraries() -> None:
+    """Close and forget every LocalLibrary."""
+    with _libraries_lock:
+        libraries = [library for library in _libraries.values() if library is not None]
+        _libraries.clear()
+    for library in libraries:
+        library.close()
@@ -5,16 +5,63 @@ Provides direct SQLite access to Zotero's local database for faster semantic sea
 when running in local mode.
 """
 
+import hashlib
+import json
 import os
+import signal
 import sqlite3
+import sys
 import platform
 import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
+from .fulltext_cache import get_fulltext_cache
+from .jobs import Job, get_job_manager
+from .keyword_index import (
+    KIND_ANNOTATION,
+    KIND_ITEM,
+    KIND_NOTE,
+    MAX_FULLTEXT_CHARS,
+    KeywordIndex,
+    display_date,
+    get_keyword_index,
+    strip_html,
+)
 from .utils import is_local_mode
 
+logger = logging.getLogger(__name__)
+
+# Fulltext is truncated to this many characters unless the caller asks for more
+DEFAULT_FULLTEXT_MAX_CHARS = 10000
+
+# Memory-mapped I/O and page cache per connection, in MB
+DEFAULT_DB_MMAP_MB = 256
+DEFAULT_DB_CACHE_MB = 64
+
+# Minimum seconds between checks of zotero.sqlite for changes
+DEFAULT_SNAPSHOT_INTERVAL = 5.0
+
+# Snapshot lock and partial files older than this were abandoned by a crashed process
+STALE_SNAPSHOT_SECONDS = 3600
+
+# Job kind of background keyword index syncs
+KEYWORD_INDEX_JOB = "keyword_index"
+
+# Zotero fields loaded for each item, mapped to ZoteroItem attributes
+LOADED_FIELDS = {
+    "title": "title",
+    "abstractNote": "abstract",
+    "extra": "extra",
+    "DOI": "doi",
+    "date": "date",
+}
+
 
 @dataclass
 class ZoteroItem:
@@ -25,11 +72,13 @@ class ZoteroItem:
     item_type: Optional[str] = None
     doi: Optional[str] = None
     title: Optional[str] = None
+    date: Optional[str] = None
     abstract: Optional[str] = None
     creators: Optional[str] = None
     fulltext: Optional[str] = None
-    fulltext_source: Optional[str] = None  # 'pdf' or 'html'
+    fulltext_source: Optional[str] = None  # 'zotero_index', 'pdf' or 'html'
     notes: Optional[str] = None
+    tags: Optional[List[str]] = None
     extra: Optional[str] = None
     date_added: Optional[str] = None
     date_modified: Optional[str] = None
@@ -48,6 +97,9 @@ class ZoteroItem:
         
         if self.creators:
             parts.append(f"Authors: {self.creators}")
+        
+        if self.tags:
+            parts.append(f"Tags: {', '.join(self.tags)}")
             
         if self.abstract:
             parts.append(f"Abstract: {self.abstract}")
@@ -66,6 +118,257 @@ class ZoteroItem:
         return "\n\n".join(parts)
 
 
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _file_signature(db_path: str) -> Optional[str]:
+    """Size and mtime of a database and its WAL; changes whenever Zotero writes."""
+    parts = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            st = os.stat(path)
+            parts.append(f"{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            parts.append("-")
+    return "/".join(parts) if parts[0] != "-" else None
+
+
+def snapshots_enabled() -> bool:
+    """Whether readers use a snapshot of zotero.sqlite (ZOTERO_DB_SNAPSHOT, default off)."""
+    return os.getenv("ZOTERO_DB_SNAPSHOT", "false").lower() in ("true", "yes", "1")
+
+
+class DatabaseSnapshot:
+    """
+    Private copy of zotero.sqlite that readers query instead of the live file.
+
+    A running Zotero holds locks and a journal on its database, so long
+    scans of the live file can stall or fail with "database is locked".
+    The snapshot is taken with SQLite's online backup API (falling back to
+    an immutable=1 read when Zotero holds an exclusive lock). When the size
+    or mtime of the database or its WAL changes, a new copy is made in a
+    background thread while readers keep using the previous one; until the
+    first copy exists they read the live file. Copies cost as much disk as
+    zotero.sqlite itself.
+
+    Each refresh writes a new file, so connections still open on the
+    previous one keep a consistent view. The current file and the source
+    signature it was taken at are recorded next to it, so processes share
+    the same snapshot; a lock file keeps them from copying concurrently,
+    and superseded or abandoned files are removed by whichever process
+    refreshes next.
+    """
+
+    def __init__(self, source_path: str, snapshot_dir: Optional[str] = None,
+                 check_interval: Optional[float] = None):
+        """
+        Initialize the snapshot without copying anything yet.
+
+        Args:
+            source_path: Path to zotero.sqlite
+            snapshot_dir: Directory for snapshot files (default: ~/.config/zotero-mcp/snapshots)
+            check_interval: Minimum seconds between change checks
+                (default: ZOTERO_DB_SNAPSHOT_INTERVAL or 5)
+        """
+        self.source_path = source_path
+        if snapshot_dir is None:
+            snapshot_dir = str(Path.home() / ".config" / "zotero-mcp" / "snapshots")
+        Path(snapshot_dir).mkdir(parents=True, exist_ok=True)
+        # One set of files per source database
+        digest = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()[:12]
+        self._base = os.path.join(snapshot_dir, f"zotero-{digest}")
+        self._state_path = self._base + ".json"
+        self._lock_path = self._base + ".lock"
+        self.check_interval = (check_interval if check_interval is not None
+                               else _env_number("ZOTERO_DB_SNAPSHOT_INTERVAL", DEFAULT_SNAPSHOT_INTERVAL))
+
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._current: Optional[str] = None
+        self._signature: Optional[str] = None
+        self._refresher: Optional[threading.Thread] = None
+        self._stats = {"refreshes": 0, "immutable_fallbacks": 0, "last_refresh_ms": 0.0, "last_error": None}
+
+    def _load_state(self) -> None:
+        """Adopt the snapshot recorded by this or another process, if its file exists."""
+        try:
+            with open(self._state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            path = os.path.join(os.path.dirname(self._base), state["file"])
+            if os.path.exists(path):
+                self._current, self._signature = path, state["signature"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def path(self) -> Optional[str]:
+        """
+        Path of the latest snapshot, or None if none has been taken yet.
+
+        Never copies in the caller's thread: when zotero.sqlite changed
+        (looked for at most once per check interval), a refresh starts in
+        the background and the previous snapshot is returned meanwhile.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._checked_at < self.check_interval:
+                return self._current
+            self._checked_at = now
+            signature = _file_signature(self.source_path)
+            if signature is None:
+                return self._current
+            if self._signature != signature:
+                self._load_state()
+            if self._signature != signature and self._refresher is None:
+                self._refresher = threading.Thread(target=self._refresh, args=(signature,),
+                                                   name="zotero-db-snapshot", daemon=True)
+                self._refresher.start()
+            return self._current
+
+    def _copy(self, target: str, uri: str) -> None:
+        source = sqlite3.connect(uri, uri=True, timeout=0.5)
+        try:
+            # Take the read lock up front: backup() itself retries forever
+            # while the source is busy instead of failing
+            source.execute("BEGIN")
+            source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            dest = sqlite3.connect(target)
+            try:
+                source.backup(dest)
+                # The copy has no WAL of its own; it is only ever read
+                dest.execute("PRAGMA journal_mode = DELETE")
+                dest.commit()
+            finally:
+                dest.close()
+        finally:
+            source.close()
+
+    def _acquire_file_lock(self) -> bool:
+        """Claim the right to copy across processes; a lock older than an hour is abandoned."""
+        for _ in range(2):
+            try:
+                os.close(os.open(self._lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self._lock_path) < STALE_SNAPSHOT_SECONDS:
+                        return False
+                    os.remove(self._lock_path)
+                except OSError:
+                    return False
+        return False
+
+    def _refresh(self, signature: str) -> None:
+        try:
+            if self._acquire_file_lock():
+                try:
+                    self._take(signature)
+                finally:
+                    try:
+                        os.remove(self._lock_path)
+                    except OSError:
+                        pass
+        except Exception as e:
+            self._stats["last_error"] = str(e)
+            logger.warning(f"Could not snapshot {self.source_path}: {e}")
+        finally:
+            with self._lock:
+                self._refresher = None
+                # Look again at the next read rather than waiting out the interval
+                self._checked_at = 0.0
+
+    def _take(self, signature: str) -> None:
+        start = time.perf_counter()
+        target = f"{self._base}-{time.time_ns()}-{os.getpid()}.sqlite"
+        # Copied under a name cleanup leaves alone until it is complete
+        partial = target + ".partial"
+        try:
+            try:
+                self._copy(partial, f"file:{self.source_path}?mode=ro")
+            except sqlite3.OperationalError as e:
+                # Zotero holds an exclusive lock: read the file without locking
+                # and check the copy, since a write could overlap the read
+                logger.debug(f"Locked backup of {self.source_path} failed ({e}), copying immutably")
+                self._stats["immutable_fallbacks"] += 1
+                if os.path.exists(partial):
+                    os.remove(partial)
+                self._copy(partial, f"file:{self.source_path}?mode=ro&immutable=1")
+                check = sqlite3.connect(partial)
+                try:
+                    result = check.execute("PRAGMA quick_check").fetchone()[0]
+                finally:
+                    check.close()
+                if result != "ok":
+                    raise sqlite3.DatabaseError(f"Snapshot failed integrity check: {result}")
+            os.replace(partial, target)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+
+        # The signature is the one seen before copying, so writes made
+        # during the copy trigger another refresh at the next check
+        state_tmp = f"{self._state_path}.{os.getpid()}.tmp"
+        with open(state_tmp, "w", encoding="utf-8") as f:
+            json.dump({"file": os.path.basename(target), "signature": signature}, f)
+        os.replace(state_tmp, self._state_path)
+        with self._lock:
+            self._current, self._signature = target, signature
+        self._stats["refreshes"] += 1
+        self._stats["last_refresh_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(f"Snapshot of {self.source_path} refreshed in {self._stats['last_refresh_ms']:.0f} ms")
+        self._remove_superseded()
+
+    def _remove_superseded(self) -> None:
+        """
+        Delete snapshot files other than the current one, from any process.
+
+        Partial copies are only removed once abandoned (another process may
+        still be writing them). Files still open elsewhere cannot be removed
+        on Windows and are left for the next refresh.
+        """
+        directory = os.path.dirname(self._base)
+        prefix = os.path.basename(self._base) + "-"
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if not name.startswith(prefix) or path == self._current:
+                continue
+            try:
+                if name.endswith(".partial"):
+                    if time.time() - os.path.getmtime(path) < STALE_SNAPSHOT_SECONDS:
+                        continue
+                elif not name.endswith(".sqlite"):
+                    continue
+                os.remove(path)
+            except OSError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current snapshot file and refresh counters."""
+        stats = dict(self._stats)
+        stats["path"] = self._current
+        stats["source_signature"] = self._signature
+        stats["refreshing"] = self._refresher is not None
+        return stats
+
+
+_snapshots: Dict[str, DatabaseSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def get_database_snapshot(source_path: str) -> DatabaseSnapshot:
+    """Get the process-wide snapshot of a Zotero database, creating it on first use."""
+    with _snapshots_lock:
+        snapshot = _snapshots.get(source_path)
+        if snapshot is None:
+            snapshot = DatabaseSnapshot(source_path)
+            _snapshots[source_path] = snapshot
+        return snapshot
+
+
 class LocalZoteroReader:
     """
     Direct SQLite reader for Zotero's local database.
@@ -74,16 +377,25 @@ class LocalZoteroReader:
     without going through the Zotero API.
     """
     
-    def __init__(self, db_path: Optional[str] = None, pdf_max_pages: Optional[int] = None):
+    def __init__(self, db_path: Optional[str] = None, pdf_max_pages: Optional[int] = None,
+                 fulltext_max_chars: Optional[int] = None):
         """
         Initialize the local database reader.
         
         Args:
             db_path: Optional path to zotero.sqlite. If None, auto-detect.
+            pdf_max_pages: Optional page cap for PDF extraction.
+            fulltext_max_chars: Optional cap on returned fulltext length
+                (default: DEFAULT_FULLTEXT_MAX_CHARS).
         """
         self.db_path = db_path or self._find_zotero_db()
         self._connection: Optional[sqlite3.Connection] = None
+        # Snapshot file the open connection reads, if any
+        self._snapshot_path: Optional[str] = None
         self.pdf_max_pages: Optional[int] = pdf_max_pages
+        self.fulltext_max_chars: int = fulltext_max_chars or DEFAULT_FULLTEXT_MAX_CHARS
+        # fieldID -> field name, resolved on first use
+        self._field_ids: Optional[Dict[int, str]] = None
         # Reduce noise from pdfminer warnings
         try:
             logging.getLogger("pdfminer").setLevel(logging.ERROR)
@@ -122,21 +434,54 @@ class LocalZoteroReader:
         return str(db_path)
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection, creating if needed."""
+        """
+        Get database connection, creating if needed.
+
+        The live file is opened read-only. With ZOTERO_DB_SNAPSHOT=true,
+        reads go to a snapshot of zotero.sqlite instead (see
+        DatabaseSnapshot) once one exists, so they never contend with a
+        running Zotero. A connection keeps its snapshot until closed, so a
+        scan sees one consistent state.
+        """
         if self._connection is None:
             # Open in read-only mode for safety
             uri = f"file:{self.db_path}?mode=ro"
-            self._connection = sqlite3.connect(uri, uri=True)
+            self._snapshot_path = None
+            if snapshots_enabled():
+                try:
+                    self._snapshot_path = get_database_snapshot(self.db_path).path()
+                except OSError as e:
+                    logger.warning(f"Database snapshot unavailable, reading {self.db_path} directly: {e}")
+                if self._snapshot_path is not None:
+                    # Nothing ever writes to a snapshot file, so it needs no locking
+                    uri = f"file:{self._snapshot_path}?mode=ro&immutable=1"
+            # Streaming readers are handed between pipeline threads (one user at a time)
+            self._connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
             self._connection.row_factory = sqlite3.Row
+            mmap_mb = _env_number("ZOTERO_DB_MMAP_MB", DEFAULT_DB_MMAP_MB)
+            cache_mb = _env_number("ZOTERO_DB_CACHE_MB", DEFAULT_DB_CACHE_MB)
+            self._connection.execute(f"PRAGMA mmap_size = {int(mmap_mb * 1024 * 1024)}")
+            # A negative cache_size is in KiB rather than pages
+            self._connection.execute(f"PRAGMA cache_size = -{int(cache_mb * 1024)}")
         return self._connection
 
+    def is_stale(self) -> bool:
+        """Whether a newer snapshot exists than the one (or the live file) the connection reads."""
+        if self._connection is None or not snapshots_enabled():
+            return False
+        try:
+            current = get_database_snapshot(self.db_path).path()
+        except OSError:
+            return False
+        return current is not None and current != self._snapshot_path
+
     def _get_storage_dir(self) -> Path:
         """Return the Zotero storage directory path."""
         # Default Zotero data dir on macOS/Linux is ~/Zotero
         return Path.home() / "Zotero" / "storage"
 
     def _iter_parent_attachments(self, parent_item_id: int):
-        """Yield tuples (attachment_key, path, content_type) for a parent item."""
+        """Yield tuples (attachment_key, path, content_type, storage_hash, zotero_indexed) for a parent item."""
         conn = self._get_connection()
         query = (
             """
@@ -144,14 +489,18 @@ class LocalZoteroReader:
                    ia.parentItemID as parentItemID,
                    ia.path as path,
                    ia.contentType as contentType,
-                   att.key as attachmentKey
+                   ia.storageHash as storageHash,
+                   att.key as attachmentKey,
+                   fi.itemID IS NOT NULL as zoteroIndexed
             FROM itemAttachments ia
             JOIN items att ON att.itemID = ia.itemID
+            LEFT JOIN fulltextItems fi ON fi.itemID = ia.itemID
             WHERE ia.parentItemID = ?
             """
         )
         for row in conn.execute(query, (parent_item_id,)):
-            yield row["attachmentKey"], row["path"], row["contentType"]
+            yield (row["attachmentKey"], row["path"], row["contentType"],
+                   row["storageHash"], bool(row["zoteroIndexed"]))
 
     def _resolve_attachment_path(self, attachment_key: str, zotero_path: str) -> Optional[Path]:
         """Resolve a Zotero attachment path like 'storage:filename.pdf' to a filesystem path."""
@@ -166,20 +515,21 @@ class LocalZoteroReader:
         # External links not supported in first pass
         return None
 
+    def _pdf_page_cap(self) -> int:
+        """Page cap for PDF extraction: config value > env > default (10)."""
+        if isinstance(self.pdf_max_pages, int) and self.pdf_max_pages > 0:
+            return self.pdf_max_pages
+        max_pages_env = os.getenv("ZOTERO_PDF_MAXPAGES")
+        try:
+            return int(max_pages_env) if max_pages_env else 10
+        except ValueError:
+            return 10
+
     def _extract_text_from_pdf(self, file_path: Path) -> str:
         """Extract text from a PDF using pdfminer with a page cap to avoid stalls."""
         try:
             from pdfminer.high_level import extract_text  # type: ignore
-            # Determine page cap: config value > env > default (10)
-            if isinstance(self.pdf_max_pages, int) and self.pdf_max_pages > 0:
-                maxpages = self.pdf_max_pages
-            else:
-                max_pages_env = os.getenv("ZOTERO_PDF_MAXPAGES")
-                try:
-                    maxpages = int(max_pages_env) if max_pages_env else 10
-                except ValueError:
-                    maxpages = 10
-            text = extract_text(str(file_path), maxpages=maxpages)
+            text = extract_text(str(file_path), maxpages=self._pdf_page_cap())
             return text or ""
         except Exception:
             return ""
@@ -215,38 +565,96 @@ class LocalZoteroReader:
         except Exception:
             return ""
 
-    def _extract_fulltext_for_item(self, item_id: int) -> Optional[tuple[str, str]]:
+    def _read_zotero_ft_cache(self, attachment_key: str) -> str:
+        """Read the text Zotero's own indexer stored in storage/<KEY>/.zotero-ft-cache."""
+        cache_file = self._get_storage_dir() / attachment_key / ".zotero-ft-cache"
+        try:
+            return cache_file.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return ""
+
+    def _extraction_variant(self, file_path: Path) -> str:
+        """Identify the extractor settings that produce a file's text, for caching."""
+        suffix = file_path.suffix.lower()
+        if suffix == ".pdf":
+            return f"pdf:{self._pdf_page_cap()}"
+        if suffix in {".html", ".htm"}:
+            return "html"
+        return "file"
+
+    def _extract_text_cached(self, attachment_key: str, file_path: Path,
+                             storage_hash: Optional[str] = None, parse: bool = True) -> str:
+        """Extract text from an attachment file, reusing a previous extraction if unchanged.
+        
+        With parse=False only a previous extraction is returned ("" if none).
+        """
+        cache = get_fulltext_cache()
+        if cache is None:
+            return self._extract_text_from_file(file_path) if parse else ""
+        variant = self._extraction_variant(file_path)
+        text = cache.get(attachment_key, file_path, variant, storage_hash)
+        if text is None and not parse:
+            return ""
+        if text is None:
+            text = self._extract_text_from_file(file_path)
+            cache.put(attachment_key, file_path, variant, text, storage_hash)
+        return text
+
+    def _extract_fulltext_for_item(self, item_id: int, max_chars: Optional[int] = None,
+                                   parse: bool = True) -> Optional[tuple[str, str]]:
         """Attempt to extract fulltext and source from the item's best attachment.
 
         Preference: use PDF when available; fall back to HTML when no PDF exists.
-        Returns (text, source) where source is 'pdf' or 'html'.
+        Text Zotero already indexed (fulltextItems + .zotero-ft-cache) is used
+        as-is; only attachments Zotero has not indexed are parsed locally, and
+        with parse=False not even those (previous extractions are still used).
+        Text is cut to max_chars (default: fulltext_max_chars).
+        Returns (text, source) where source is 'zotero_index', 'pdf' or 'html'.
         """
+        max_chars = max_chars or self.fulltext_max_chars
         best_pdf = None
         best_html = None
-        for key, path, ctype in self._iter_parent_attachments(item_id):
+        for key, path, ctype, storage_hash, zotero_indexed in self._iter_parent_attachments(item_id):
+            is_pdf = ctype == "application/pdf"
+            is_html = (ctype or "").startswith("text/html")
+            if not (is_pdf or is_html):
+                continue
             resolved = self._resolve_attachment_path(key, path or "")
             if not resolved or not resolved.exists():
-                continue
-            if ctype == "application/pdf" and best_pdf is None:
-                best_pdf = resolved
-            elif (ctype or "").startswith("text/html") and best_html is None:
-                best_html = resolved
+                # Zotero's index may still have the text of files not present locally
+                if not zotero_indexed:
+                    continue
+                resolved = None
+            candidate = (key, resolved, storage_hash, zotero_indexed)
+            if is_pdf and best_pdf is None:
+                best_pdf = candidate
+            elif is_html and best_html is None:
+                best_html = candidate
         # Prefer PDF, otherwise fall back to HTML
-        target = best_pdf or best_html
-        if not target:
-            return None
-        text = self._extract_text_from_file(target)
-        if not text:
-            return None
-        # Truncate to keep embeddings reasonable
-        source = "pdf" if target.suffix.lower() == ".pdf" else ("html" if target.suffix.lower() in {".html", ".htm"} else "file")
-        return (text[:10000], source)
+        for candidate in (best_pdf, best_html):
+            if candidate is None:
+                continue
+            attachment_key, target, storage_hash, zotero_indexed = candidate
+            if zotero_indexed:
+                text = self._read_zotero_ft_cache(attachment_key)
+                if text.strip():
+                    return (text[:max_chars], "zotero_index")
+            if target is None:
+                continue
+            text = self._extract_text_cached(attachment_key, target, storage_hash, parse=parse)
+            if not text:
+                continue
+            # Truncate to keep embeddings reasonable
+            source = "pdf" if target.suffix.lower() == ".pdf" else ("html" if target.suffix.lower() in {".html", ".htm"} else "file")
+            return (text[:max_chars], source)
+        return None
     
     def close(self):
         """Close database connection."""
         if self._connection:
             self._connection.close()
             self._connection = None
+            self._snapshot_path = None
     
     def __enter__(self):
         return self
@@ -272,107 +680,203 @@ class LocalZoteroReader:
         )
         return cursor.fetchone()[0]
     
-    def get_items_with_text(self, limit: Optional[int] = None, include_fulltext: bool = False) -> List[ZoteroItem]:
+    def _resolve_field_ids(self) -> Dict[int, str]:
+        """
+        Map the fieldIDs holding title, abstract, extra and DOI to field names.
+        
+        IDs are looked up by name in the `fields` table, and type-specific
+        fields mapped onto a base field (e.g. caseName -> title) are
+        included via `baseFieldMappings`.
+        
+        Returns:
+            Dictionary mapping fieldID to one of LOADED_FIELDS.
+        """
+        if self._field_ids is not None:
+            return self._field_ids
+        conn = self._get_connection()
+        names = list(LOADED_FIELDS)
+        placeholders = ", ".join("?" for _ in names)
+        field_ids = {
+            row["fieldID"]: row["fieldName"]
+            for row in conn.execute(
+                f"SELECT fieldID, fieldName FROM fields WHERE fieldName IN ({placeholders})", names
+            )
+        }
+        try:
+            for row in conn.execute(
+                f"""
+                SELECT DISTINCT bfm.fieldID, f.fieldName
+                FROM baseFieldMappings bfm
+                JOIN fields f ON f.fieldID = bfm.baseFieldID
+                WHERE f.fieldName IN ({placeholders})
+                """,
+                names,
+            ):
+                field_ids.setdefault(row["fieldID"], row["fieldName"])
+        except sqlite3.Error:
+            # Older schemas without base field mappings
+            pass
+        self._field_ids = field_ids
+        return field_ids
+    
+    def get_items_with_text(self, limit: Optional[int] = None, include_fulltext: bool = False,
+                            keys: Optional[List[str]] = None) -> List[ZoteroItem]:
         """
         Get all items with their text content for semantic search.
         
+        Items are selected once, then their fields, creators, notes and tags
+        are loaded by separate set-based queries keyed by itemID and
+        assembled here, so no query multiplies rows across those tables.
+        
         Args:
             limit: Optional limit on number of items to return.
+            include_fulltext: Whether to extract fulltext from attachments.
+            keys: Optional list of item keys to restrict the query to.
             
         Returns:
-            List of ZoteroItem objects with text content.
+            List of ZoteroItem objects with text content, most recently
+            modified first.
         """
-        conn = self._get_connection()
+        # Plain tuples: sqlite3.Row lookups dominate on large libraries
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
         
-        # Query to get items with their text content (simplified for now)
-        query = """
-        SELECT 
-            i.itemID,
-            i.key,
-            i.itemTypeID,
-            it.typeName as item_type,
-            i.dateAdded,
-            i.dateModified,
-            title_val.value as title,
-            abstract_val.value as abstract,
-            extra_val.value as extra,
-            doi_val.value as doi,
-            GROUP_CONCAT(n.note, ' ') as notes,
-            GROUP_CONCAT(
-                CASE 
-                    WHEN c.firstName IS NOT NULL AND c.lastName IS NOT NULL 
-                    THEN c.lastName || ', ' || c.firstName
-                    WHEN c.lastName IS NOT NULL 
-                    THEN c.lastName
-                    ELSE NULL
-                END, '; '
-            ) as creators
+        params: List[Any] = []
+        filters = ""
+        if keys:
+            params = list(keys)
+            filters = f"AND i.key IN ({', '.join('?' for _ in params)})"
+        selection = f"""
         FROM items i
         JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
+        WHERE it.typeName NOT IN ('attachment', 'note', 'annotation') {filters}
+        ORDER BY i.dateModified DESC
+        """
+        if limit:
+            selection += f" LIMIT {int(limit)}"
         
-        -- Get title
-        LEFT JOIN itemData title_data ON i.itemID = title_data.itemID AND title_data.fieldID = 1
-        LEFT JOIN itemDataValues title_val ON title_data.valueID = title_val.valueID
-        
-        -- Get abstract  
-        LEFT JOIN itemData abstract_data ON i.itemID = abstract_data.itemID AND abstract_data.fieldID = 2
-        LEFT JOIN itemDataValues abstract_val ON abstract_data.valueID = abstract_val.valueID
+        items: Dict[int, ZoteroItem] = {}
+        for item_id, key, item_type_id, item_type, date_added, date_modified in cursor.execute(
+            f"SELECT i.itemID, i.key, i.itemTypeID, it.typeName, i.dateAdded, i.dateModified {selection}",
+            params,
+        ):
+            items[item_id] = ZoteroItem(
+                item_id=item_id,
+                key=key,
+                item_type_id=item_type_id,
+                item_type=item_type,
+                date_added=date_added,
+                date_modified=date_modified,
+            )
+        if not items:
+            return []
         
-        -- Get extra field
-        LEFT JOIN itemData extra_data ON i.itemID = extra_data.itemID AND extra_data.fieldID = 16
-        LEFT JOIN itemDataValues extra_val ON extra_data.valueID = extra_val.valueID
-
-        -- Get DOI field via fields table
-        LEFT JOIN fields doi_f ON doi_f.fieldName = 'DOI'
-        LEFT JOIN itemData doi_data ON i.itemID = doi_data.itemID AND doi_data.fieldID = doi_f.fieldID
-        LEFT JOIN itemDataValues doi_val ON doi_data.valueID = doi_val.valueID
+        # A whole-library load reads each table in one sequential pass and
+        # drops rows of other items here; subsets are looked up by itemID
+        if keys or limit:
+            def scoped(column: str) -> str:
+                return f"AND {column} IN (SELECT i.itemID {selection})"
+        else:
+            params = []
+            
+            def scoped(column: str) -> str:
+                return ""
         
-        -- Get notes
-        LEFT JOIN itemNotes n ON i.itemID = n.parentItemID OR i.itemID = n.itemID
+        # Field values, pivoted from (itemID, fieldID, value) rows
+        field_ids = self._resolve_field_ids()
+        if field_ids:
+            field_filter = ", ".join(str(field_id) for field_id in field_ids)
+            attributes = {field_id: LOADED_FIELDS[name] for field_id, name in field_ids.items()}
+            for item_id, field_id, value in cursor.execute(
+                f"""
+                SELECT id.itemID, id.fieldID, v.value
+                FROM itemData id
+                JOIN itemDataValues v ON v.valueID = id.valueID
+                WHERE id.fieldID IN ({field_filter}) {scoped("id.itemID")}
+                """,
+                params,
+            ):
+                item = items.get(item_id)
+                if item is not None:
+                    setattr(item, attributes[field_id], value)
         
-        -- Get creators
-        LEFT JOIN itemCreators ic ON i.itemID = ic.itemID
-        LEFT JOIN creators c ON ic.creatorID = c.creatorID
+        creators: Dict[int, List[Tuple[int, str]]] = {}
+        for item_id, order_index, first_name, last_name in cursor.execute(
+            f"""
+            SELECT ic.itemID, ic.orderIndex, c.firstName, c.lastName
+            FROM itemCreators ic
+            JOIN creators c ON c.creatorID = ic.creatorID
+            WHERE c.lastName IS NOT NULL {scoped("ic.itemID")}
+            """,
+            params,
+        ):
+            if item_id in items:
+                name = f"{last_name}, {first_name}" if first_name is not None else last_name
+                creators.setdefault(item_id, []).append((order_index, name))
         
-        WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')
+        # Notes come back in itemID (creation) order within each parent
+        notes: Dict[int, List[str]] = {}
+        for item_id, note in cursor.execute(
+            f"""
+            SELECT n.parentItemID, n.note
+            FROM itemNotes n
+            WHERE n.note IS NOT NULL {scoped("n.parentItemID")}
+            """,
+            params,
+        ):
+            if item_id in items:
+                notes.setdefault(item_id, []).append(note)
         
-        GROUP BY i.itemID, i.key, i.itemTypeID, it.typeName, i.dateAdded, i.dateModified,
-                 title_val.value, abstract_val.value, extra_val.value
+        tags: Dict[int, List[str]] = {}
+        for item_id, tag in cursor.execute(
+            f"""
+            SELECT itg.itemID, t.name
+            FROM itemTags itg
+            JOIN tags t ON t.tagID = itg.tagID
+            WHERE 1 {scoped("itg.itemID")}
+            """,
+            params,
+        ):
+            if item_id in items:
+                tags.setdefault(item_id, []).append(tag)
         
-        ORDER BY i.dateModified DESC
-        """
+        for item_id, item in items.items():
+            if item_id in creators:
+                item.creators = "; ".join(name for _, name in sorted(creators[item_id]))
+            if item_id in notes:
+                item.notes = " ".join(notes[item_id])
+            if item_id in tags:
+                item.tags = sorted(tags[item_id])
+            if include_fulltext:
+                res = self._extract_fulltext_for_item(item_id)
+                if res:
+                    item.fulltext, item.fulltext_source = res
         
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        cursor = conn.execute(query)
-        items = []
-        
-        for row in cursor:
-            item = ZoteroItem(
-                item_id=row['itemID'],
-                key=row['key'],
-                item_type_id=row['itemTypeID'],
-                item_type=row['item_type'],
-                doi=row['doi'],
-                title=row['title'],
-                abstract=row['abstract'],
-                creators=row['creators'],
-                fulltext=(res := (self._extract_fulltext_for_item(row['itemID']) if include_fulltext else None)) and res[0],
-                fulltext_source=res[1] if include_fulltext and res else None,
-                notes=row['notes'],
-                extra=row['extra'],
-                date_added=row['dateAdded'],
-                date_modified=row['dateModified']
-            )
-            items.append(item)
-            
-        return items
+        return list(items.values())
 
     # Public helper to extract fulltext on demand for a specific item
     def extract_fulltext_for_item(self, item_id: int) -> Optional[tuple[str, str]]:
         return self._extract_fulltext_for_item(item_id)
     
+    def get_items_by_keys(self, keys: List[str]) -> Dict[str, ZoteroItem]:
+        """
+        Get several items by their Zotero keys in one query.
+        
+        Args:
+            keys: Zotero item keys.
+            
+        Returns:
+            Dictionary mapping item key to ZoteroItem for every item found.
+        """
+        if not keys:
+            return {}
+        found: Dict[str, ZoteroItem] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            for item in self.get_items_with_text(keys=keys[i:i + 500]):
+                found[item.key] = item
+        return found
+    
     def get_item_by_key(self, key: str) -> Optional[ZoteroItem]:
         """
         Get a specific item by its Zotero key.
@@ -383,23 +887,435 @@ class LocalZoteroReader:
         Returns:
             ZoteroItem if found, None otherwise.
         """
-        items = self.get_items_with_text()
+        items = self.get_items_with_text(keys=[key])
+        return items[0] if items else None
+    
+    def _source_signature(self) -> Optional[str]:
+        """Size and mtime of the database and its WAL; changes whenever Zotero writes."""
+        return _file_signature(self.db_path)
+    
+    def _table_exists(self, name: str) -> bool:
+        """Whether the database has a table (older schemas lack e.g. itemAnnotations)."""
+        row = self._get_connection().execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone()
+        return row is not None
+    
+    def _get_document_versions(self, keys: Optional[List[str]] = None) -> Dict[str, Tuple[str, str]]:
+        """
+        Get the kind and a change marker of keyword index documents.
+        
+        Editing a child note or annotation does not touch the parent item, so
+        an item's marker is the latest dateModified among the item and its
+        children, plus a summary of Zotero's fulltext index of its attachments.
+        
+        Args:
+            keys: Only these item, note and annotation keys (default: all).
+        
+        Returns:
+            Dictionary mapping item, note and annotation keys to (kind, marker).
+        """
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        has_attachments = self._table_exists("itemAttachments")
+        has_annotations = has_attachments and self._table_exists("itemAnnotations")
+        
+        child_dates = [
+            "COALESCE((SELECT MAX(c.dateModified) FROM itemNotes n JOIN items c ON c.itemID = n.itemID "
+            "WHERE n.parentItemID = i.itemID), '')"
+        ]
+        if has_attachments:
+            child_dates.append(
+                "COALESCE((SELECT MAX(c.dateModified) FROM itemAttachments a JOIN items c ON c.itemID = a.itemID "
+                "WHERE a.parentItemID = i.itemID), '')"
+            )
+        if has_annotations:
+            child_dates.append(
+                "COALESCE((SELECT MAX(c.dateModified) FROM itemAttachments a "
+                "JOIN itemAnnotations an ON an.parentItemID = a.itemID JOIN items c ON c.itemID = an.itemID "
+                "WHERE a.parentItemID = i.itemID), '')"
+            )
+        fulltext_marker = "''"
+        if has_attachments and self._table_exists("fulltextItems"):
+            fulltext_marker = (
+                "(SELECT COUNT(*) || ':' || COALESCE(SUM(fi.indexedPages), 0) || ':' || COALESCE(SUM(fi.indexedChars), 0) "
+                "FROM itemAttachments a JOIN fulltextItems fi ON fi.itemID = a.itemID WHERE a.parentItemID = i.itemID)"
+            )
+        
+        queries = [(
+            KIND_ITEM, "i.key",
+            f"""
+            SELECT i.key, MAX(i.dateModified, {', '.join(child_dates)}) || '|' || {fulltext_marker}
+            FROM items i
+            JOIN itemTypes it ON i.itemTypeID = it.itemTypeID
+            WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')
+            """,
+        ), (
+            KIND_NOTE, "ni.key",
+            "SELECT ni.key, ni.dateModified FROM itemNotes n JOIN items ni ON ni.itemID = n.itemID WHERE 1",
+        )]
+        if has_annotations:
+            queries.append((
+                KIND_ANNOTATION, "ai.key",
+                "SELECT ai.key, ai.dateModified FROM itemAnnotations an JOIN items ai ON ai.itemID = an.itemID WHERE 1",
+            ))
+        
+        chunks = [None] if keys is None else [keys[k:k + 500] for k in range(0, len(keys), 500)]
+        versions: Dict[str, Tuple[str, str]] = {}
+        for kind, key_column, query in queries:
+            for chunk in chunks:
+                sql, params = query, []
+                if chunk is not None:
+                    sql += f" AND {key_column} IN ({', '.join('?' for _ in chunk)})"
+                    params = chunk
+                for key, marker in cursor.execute(sql, params):
+                    versions[key] = (kind, marker)
+        return versions
+    
+    def _get_document_kinds(self) -> Dict[str, str]:
+        """Get the kind of every keyword index document, without computing change markers."""
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        kinds = {key: KIND_ITEM for (key,) in cursor.execute(
+            "SELECT i.key FROM items i JOIN itemTypes it ON i.itemTypeID = it.itemTypeID "
+            "WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')"
+        )}
+        kinds.update((key, KIND_NOTE) for (key,) in cursor.execute(
+            "SELECT ni.key FROM itemNotes n JOIN items ni ON ni.itemID = n.itemID"
+        ))
+        if self._table_exists("itemAnnotations"):
+            kinds.update((key, KIND_ANNOTATION) for (key,) in cursor.execute(
+                "SELECT ai.key FROM itemAnnotations an JOIN items ai ON ai.itemID = an.itemID"
+            ))
+        return kinds
+    
+    def _change_columns(self) -> Tuple[str, Optional[str]]:
+        """The items columns Zotero bumps on every change: a modification date and the sync version."""
+        columns = {row[1] for row in self._get_connection().execute("PRAGMA table_info(items)")}
+        date_column = "clientDateModified" if "clientDateModified" in columns else "dateModified"
+        return date_column, "version" if "version" in columns else None
+    
+    def _change_watermark(self) -> str:
+        """The latest modification date and sync version in the database, as 'date|version'."""
+        date_column, version_column = self._change_columns()
+        row = self._get_connection().execute(
+            f"SELECT MAX({date_column}), {f'MAX({version_column})' if version_column else 'NULL'} FROM items"
+        ).fetchone()
+        return f"{row[0] or ''}|{'' if row[1] is None else row[1]}"
+    
+    def _get_changed_document_keys(self, watermark: str) -> set:
+        """
+        Get the keys of documents that may have changed since a watermark.
+        
+        Items modified locally get a newer modification date and items
+        changed by a sync a higher version, so only rows past the watermark
+        are read. A changed note, attachment or annotation also marks the
+        top-level item it belongs to.
+        
+        Args:
+            watermark: Value of _change_watermark() at the previous sync.
+            
+        Returns:
+            Set of item, note and annotation keys (may include keys that are
+            not documents, e.g. attachments).
+        """
+        date_column, version_column = self._change_columns()
+        since_date, _, since_version = watermark.partition("|")
+        conditions, params = [f"i.{date_column} >= ?"], [since_date]
+        if version_column and since_version:
+            conditions.append(f"i.{version_column} > ?")
+            params.append(int(since_version))
+        
+        parents = ["pn.key"]
+        joins = "LEFT JOIN itemNotes n ON n.itemID = i.itemID LEFT JOIN items pn ON pn.itemID = n.parentItemID"
+        if self._table_exists("itemAttachments"):
+            parents.append("pa.key")
+            joins += (" LEFT JOIN itemAttachments a ON a.itemID = i.itemID"
+                      " LEFT JOIN items pa ON pa.itemID = a.parentItemID")
+            if self._table_exists("itemAnnotations"):
+                parents.append("pan.key")
+                joins += (" LEFT JOIN itemAnnotations an ON an.itemID = i.itemID"
+                          " LEFT JOIN itemAttachments aa ON aa.itemID = an.parentItemID"
+                          " LEFT JOIN items pan ON pan.itemID = aa.parentItemID")
+        
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        keys = set()
+        for row in cursor.execute(
+            f"SELECT i.key, {', '.join(parents)} FROM items i {joins} WHERE {' OR '.join(conditions)}", params
+        ):
+            keys.update(key for key in row if key)
+        return keys
+    
+    def _get_fulltext_markers(self) -> Dict[str, str]:
+        """Summaries of Zotero's fulltext index by top-level item key, as in _get_document_versions."""
+        if not (self._table_exists("itemAttachments") and self._table_exists("fulltextItems")):
+            return {}
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        return {key: f"{count}:{pages or 0}:{chars or 0}" for key, count, pages, chars in cursor.execute(
+            """
+            SELECT p.key, COUNT(*), SUM(fi.indexedPages), SUM(fi.indexedChars)
+            FROM fulltextItems fi
+            JOIN itemAttachments a ON a.itemID = fi.itemID
+            JOIN items p ON p.itemID = a.parentItemID
+            GROUP BY a.parentItemID
+            """
+        )}
+    
+    def _get_tags_by_key(self, keys: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """Get the tags of items by key (all items when keys is None)."""
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        tags: Dict[str, List[str]] = {}
+        query = "SELECT i.key, t.name FROM itemTags itg JOIN tags t ON t.tagID = itg.tagID JOIN items i ON i.itemID = itg.itemID"
+        chunks = [None] if keys is None else [keys[k:k + 500] for k in range(0, len(keys), 500)]
+        for chunk in chunks:
+            sql, params = query, []
+            if chunk is not None:
+                sql += f" WHERE i.key IN ({', '.join('?' for _ in chunk)})"
+                params = chunk
+            for key, tag in cursor.execute(sql, params):
+                tags.setdefault(key, []).append(tag)
+        return tags
+    
+    def _get_annotation_rows(self, keys: Optional[List[str]] = None,
+                             parent_item_ids: Optional[List[int]] = None) -> List[Tuple]:
+        """
+        Get annotations as (key, top-level item ID, top-level item key, text, comment) rows.
+        
+        Args:
+            keys: Only these annotation keys.
+            parent_item_ids: Only annotations on attachments of these items.
+        """
+        if not (self._table_exists("itemAnnotations") and self._table_exists("itemAttachments")):
+            return []
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        query = """
+        SELECT ai.key, COALESCE(ia.parentItemID, att.itemID), COALESCE(parent.key, att.key), an.text, an.comment
+        FROM itemAnnotations an
+        JOIN items ai ON ai.itemID = an.itemID
+        JOIN items att ON att.itemID = an.parentItemID
+        LEFT JOIN itemAttachments ia ON ia.itemID = an.parentItemID
+        LEFT JOIN items parent ON parent.itemID = ia.parentItemID
+        """
+        if keys is None and parent_item_ids is None:
+            return cursor.execute(query).fetchall()
+        column, values = ("ai.key", keys) if keys is not None else ("ia.parentItemID", parent_item_ids)
+        rows: List[Tuple] = []
+        for k in range(0, len(values), 500):
+            chunk = values[k:k + 500]
+            rows.extend(cursor.execute(f"{query} WHERE {column} IN ({', '.join('?' for _ in chunk)})", chunk))
+        return rows
+    
+    def _iter_item_documents(self, keys: List[str], versions: Dict[str, Tuple[str, str]],
+                             library_size: int) -> Iterator[Dict[str, Any]]:
+        """Build keyword index documents for regular items, with their notes, annotations and cached fulltext."""
+        wanted = set(keys)
+        if len(keys) > library_size // 2:
+            # Mostly a first build: one whole-library load beats keyed lookups
+            items = [item for item in self.get_items_with_text() if item.key in wanted]
+            annotation_rows = self._get_annotation_rows()
+        else:
+            items = list(self.get_items_by_keys(keys).values())
+            annotation_rows = self._get_annotation_rows(parent_item_ids=[item.item_id for item in items])
+        annotations: Dict[int, List[str]] = {}
+        for _, item_id, _, text, comment in annotation_rows:
+            annotations.setdefault(item_id, []).extend(part for part in (text, comment) if part)
+        has_attachments = self._table_exists("itemAttachments")
+        
         for item in items:
-            if item.key == key:
-                return item
-        return None
+            fulltext = None
+            if has_attachments:
+                # Text Zotero or `update-db --fulltext` already extracted; never parse here
+                res = self._extract_fulltext_for_item(item.item_id, max_chars=MAX_FULLTEXT_CHARS, parse=False)
+                fulltext = res[0] if res else None
+            yield {
+                "key": item.key,
+                "version": versions[item.key][1],
+                "kind": KIND_ITEM,
+                "item_type": item.item_type,
+                "title": item.title,
+                "creators": item.creators,
+                "date": display_date(item.date),
+                "abstract": item.abstract,
+                "tags": "\n".join(item.tags or []),
+                "notes": strip_html(item.notes),
+                "annotations": "\n".join(annotations.get(item.item_id, [])),
+                "fulltext": fulltext,
+            }
+    
+    def _iter_note_documents(self, keys: List[str], versions: Dict[str, Tuple[str, str]]) -> Iterator[Dict[str, Any]]:
+        """Build keyword index documents for notes."""
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = None
+        tags = self._get_tags_by_key(keys)
+        for k in range(0, len(keys), 500):
+            chunk = keys[k:k + 500]
+            for key, title, note, parent_key in cursor.execute(
+                f"""
+                SELECT ni.key, n.title, n.note, p.key
+                FROM itemNotes n
+                JOIN items ni ON ni.itemID = n.itemID
+                LEFT JOIN items p ON p.itemID = n.parentItemID
+                WHERE ni.key IN ({', '.join('?' for _ in chunk)})
+                """,
+                chunk,
+            ):
+                yield {
+                    "key": key,
+                    "version": versions[key][1],
+                    "kind": KIND_NOTE,
+                    "parent_key": parent_key,
+                    "item_type": "note",
+                    "title": title,
+                    "tags": "\n".join(tags.get(key, [])),
+                    "notes": strip_html(note),
+                }
+    
+    def _iter_annotation_documents(self, keys: List[str], versions: Dict[str, Tuple[str, str]]) -> Iterator[Dict[str, Any]]:
+        """Build keyword index documents for annotations."""
+        tags = self._get_tags_by_key(keys)
+        for key, _, parent_key, text, comment in self._get_annotation_rows(keys=keys):
+            yield {
+                "key": key,
+                "version": versions[key][1],
+                "kind": KIND_ANNOTATION,
+                "parent_key": parent_key,
+                "item_type": "annotation",
+                "tags": "\n".join(tags.get(key, [])),
+                "annotations": "\n".join(part for part in (text, comment) if part),
+            }
+    
+    def sync_keyword_index(self, index: KeywordIndex,
+                           cancel: Optional[threading.Event] = None) -> Dict[str, int]:
+        """
+        Bring a keyword index up to date with this database.
+        
+        Nothing is read while the database files are unchanged since the
+        last sync. Otherwise only rows whose modification date or sync
+        version passed the watermark of the last sync are looked at, plus
+        items whose fulltext index changed and parents of deleted notes and
+        annotations; of those, documents whose change marker differs from
+        the indexed one are re-read. Fulltext comes from Zotero's own index
+        or the extraction cache; attachments are never parsed here.
+        
+        This reads the whole library on the first build, so it runs as a
+        background job (start_keyword_index_sync) rather than in a search.
+        
+        Args:
+            index: Keyword index to update.
+            cancel: Stops the sync between documents when set; the next
+                sync picks up where it stopped.
+            
+        Returns:
+            Dictionary with the number of documents updated and removed.
+        """
+        stats = {"updated": 0, "removed": 0}
+        signature = self._source_signature()
+        if index.get_meta("source") != self.db_path:
+            index.clear()
+            index.set_meta("source", self.db_path)
+        elif signature is not None and index.get_meta("source_signature") == signature:
+            return stats
+        
+        # Read before the rows, so changes made meanwhile are seen next time
+        watermark = self._change_watermark()
+        previous = index.get_meta("source_watermark")
+        indexed = index.get_versions()
+        forced = set()
+        if previous is None or not indexed:
+            versions = self._get_document_versions()
+            kinds = {key: kind for key, (kind, _) in versions.items()}
+        else:
+            kinds = self._get_document_kinds()
+            candidates = self._get_changed_document_keys(previous)
+            candidates.update(key for key in kinds if key not in indexed)
+            # Deleting a note or annotation changes its parent's text but not its marker
+            forced = set(index.get_parent_keys(key for key in indexed if key not in kinds).values())
+            candidates.update(forced)
+            no_fulltext = "0:0:0" if self._table_exists("fulltextItems") else ""
+            markers = self._get_fulltext_markers()
+            for key, kind in kinds.items():
+                if kind == KIND_ITEM and key in indexed:
+                    if (indexed[key] or "").rpartition("|")[2] != markers.get(key, no_fulltext):
+                        candidates.add(key)
+            versions = self._get_document_versions(sorted(key for key in candidates if key in kinds))
+        
+        changed: Dict[str, List[str]] = {KIND_ITEM: [], KIND_NOTE: [], KIND_ANNOTATION: []}
+        for key, (kind, version) in versions.items():
+            if key in forced or indexed.get(key) != version:
+                changed[kind].append(key)
+        removed = [key for key in indexed if key not in kinds]
+        
+        def until_cancelled(documents: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for doc in documents:
+                if cancel is not None and cancel.is_set():
+                    return
+                yield doc
+        
+        item_versions = {key: value for key, value in versions.items() if value[0] == KIND_ITEM}
+        if changed[KIND_ITEM]:
+            stats["updated"] += index.upsert(until_cancelled(
+                self._iter_item_documents(changed[KIND_ITEM], item_versions, len(kinds))))
+        if changed[KIND_NOTE]:
+            stats["updated"] += index.upsert(until_cancelled(self._iter_note_documents(changed[KIND_NOTE], versions)))
+        if changed[KIND_ANNOTATION]:
+            stats["updated"] += index.upsert(until_cancelled(
+                self._iter_annotation_documents(changed[KIND_ANNOTATION], versions)))
+        if cancel is not None and cancel.is_set():
+            logger.info(f"Keyword index sync cancelled after {stats['updated']} documents")
+            return stats
+        if removed:
+            stats["removed"] = index.delete(removed)
+        index.set_meta("source_watermark", watermark)
+        index.set_meta("source_signature", signature)
+        if stats["updated"] or stats["removed"]:
+            logger.info(f"Keyword index synced: {stats['updated']} updated, {stats['removed']} removed")
+        return stats
+    
+    def keyword_index_state(self, index: KeywordIndex) -> Tuple[bool, bool]:
+        """
+        Check a keyword index against this database without reading it.
+        
+        Returns:
+            Tuple of (ready: a sync from this database completed, so the index
+            can be searched; current: nothing changed since that sync).
+        """
+        ready = (index.get_meta("source") == self.db_path
+                 and index.get_meta("source_watermark") is not None)
+        signature = self._source_signature()
+        return ready, ready and signature is not None and index.get_meta("source_signature") == signature
     
     def search_items_by_text(self, query: str, limit: int = 50) -> List[ZoteroItem]:
         """
-        Simple text search through item content.
+        Keyword search through item content.
+        
+        Uses the FTS5 keyword index and ranks by BM25; a sync is started in
+        the background when the database changed. Falls back to a substring
+        scan when FTS5 is unavailable or the index is still being built.
         
         Args:
             query: Search query string.
             limit: Maximum number of results.
             
         Returns:
-            List of matching ZoteroItem objects.
+            List of matching ZoteroItem objects, best match first.
         """
+        index = get_keyword_index()
+        if index is not None:
+            try:
+                ready, current = self.keyword_index_state(index)
+                if not current:
+                    start_keyword_index_sync()
+                if ready:
+                    hits = index.search(query, limit, kinds=(KIND_ITEM,))
+                    found = self.get_items_by_keys([hit["key"] for hit in hits])
+                    return [found[hit["key"]] for hit in hits if hit["key"] in found]
+            except sqlite3.Error as e:
+                logger.warning(f"Keyword index search failed, scanning instead: {e}")
+        
         items = self.get_items_with_text()
         matching_items = []
         
@@ -415,6 +1331,141 @@ class LocalZoteroReader:
         return matching_items
 
 
+# Reader owned by each extraction worker process
+_worker_reader: Optional[LocalZoteroReader] = None
+
+
+def _init_extraction_worker(db_path: str, pdf_max_pages: Optional[int], max_memory_mb: Optional[int],
+                            fulltext_max_chars: Optional[int] = None) -> None:
+    """Set up an extraction worker process: memory cap, quiet stdout, own reader."""
+    global _worker_reader
+    if max_memory_mb:
+        try:
+            import resource
+            limit = int(max_memory_mb) * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            # Not supported on this platform (e.g. Windows)
+            pass
+    # pdfminer can be chatty; keep stdout clean for the MCP stdio transport
+    sys.stdout = open(os.devnull, "w")
+    _worker_reader = LocalZoteroReader(db_path=db_path, pdf_max_pages=pdf_max_pages,
+                                       fulltext_max_chars=fulltext_max_chars)
+
+
+def _raise_extraction_timeout(signum, frame):
+    raise TimeoutError("Fulltext extraction timed out")
+
+
+def _extract_fulltext_in_worker(item_id: int, timeout: Optional[int]) -> Optional[Tuple[str, str]]:
+    """Extract fulltext for one item inside a worker process, bounded by `timeout` seconds."""
+    use_alarm = bool(timeout) and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_extraction_timeout)
+        signal.alarm(int(timeout))
+    try:
+        return _worker_reader.extract_fulltext_for_item(item_id)
+    except (TimeoutError, MemoryError):
+        return None
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+
+
+def iter_fulltext_parallel(db_path: str,
+                           item_ids: Iterable[int],
+                           workers: int,
+                           timeout: Optional[int] = None,
+                           max_memory_mb: Optional[int] = None,
+                           pdf_max_pages: Optional[int] = None,
+                           fulltext_max_chars: Optional[int] = None,
+                           cancel: Optional[threading.Event] = None) -> Iterator[Tuple[int, Optional[Tuple[str, str]]]]:
+    """
+    Extract fulltext for many items in a pool of worker processes.
+    
+    Results are yielded as soon as each extraction finishes (not in input
+    order), so callers can start embedding while other files are parsed.
+    At most 2 x `workers` items are in flight at a time. If a worker dies
+    (e.g. killed for exceeding its memory cap), the items it had in flight
+    are reported as failed and a fresh pool continues with the rest.
+    
+    When `cancel` is set or the generator is closed early, queued items
+    are dropped and the pool shuts down without waiting for the items
+    being parsed.
+    
+    Args:
+        db_path: Path to zotero.sqlite
+        item_ids: Item IDs to extract fulltext for
+        workers: Number of worker processes
+        timeout: Per-item time limit in seconds (enforced with SIGALRM where available)
+        max_memory_mb: Address-space cap per worker in MB (Unix only)
+        pdf_max_pages: Page cap passed to each worker's reader
+        fulltext_max_chars: Fulltext length cap passed to each worker's reader
+        cancel: Stops the extraction when set
+        
+    Yields:
+        Tuples of (item_id, (text, source) or None)
+    """
+    pending_ids = iter(item_ids)
+    # Item taken from pending_ids but not accepted by a broken pool
+    carried: List[int] = []
+    exhausted = False
+    
+    while not exhausted:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_extraction_worker,
+            initargs=(db_path, pdf_max_pages, max_memory_mb, fulltext_max_chars),
+        )
+        finished = False
+        try:
+            in_flight: Dict[Any, int] = {}
+            broken = False
+            
+            def submit_next() -> bool:
+                nonlocal broken
+                item_id = carried.pop() if carried else next(pending_ids, None)
+                if item_id is None:
+                    return False
+                try:
+                    in_flight[pool.submit(_extract_fulltext_in_worker, item_id, timeout)] = item_id
+                except BrokenProcessPool:
+                    carried.append(item_id)
+                    broken = True
+                    return False
+                return True
+            
+            for _ in range(workers * 2):
+                if not submit_next():
+                    break
+            
+            while in_flight:
+                if cancel is not None and cancel.is_set():
+                    return
+                done, _ = wait(list(in_flight), timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item_id = in_flight.pop(future)
+                    try:
+                        yield item_id, future.result()
+                    except BrokenProcessPool:
+                        broken = True
+                        yield item_id, None
+                    except Exception as e:
+                        logger.warning(f"Fulltext extraction failed for item {item_id}: {e}")
+                        yield item_id, None
+                    if not broken:
+                        submit_next()
+            
+            if broken:
+                logger.warning("Extraction worker crashed; restarting the pool")
+            else:
+                exhausted = True
+            finished = True
+        finally:
+            # Stopped early: do not wait for the items still being parsed
+            pool.shutdown(wait=finished, cancel_futures=not finished)
+
+
 def get_local_zotero_reader() -> Optional[LocalZoteroReader]:
     """
     Get a LocalZoteroReader instance if in local mode.
@@ -432,6 +1483,62 @@ def get_local_zotero_reader() -> Optional[LocalZoteroReader]:
         return None
 
 
+def _sync_keyword_index_job(report: Any, cancel: threading.Event) -> Dict[str, Any]:
+    """Job function: sync the keyword index from the local Zotero database."""
+    index = get_keyword_index()
+    reader = get_local_zotero_reader()
+    if index is None or reader is None:
+        return {}
+    report(0, 0, "Syncing keyword index")
+    with reader:
+        return reader.sync_keyword_index(index, cancel=cancel)
+
+
+def start_keyword_index_sync() -> Optional[Job]:
+    """
+    Sync the keyword index from the local Zotero database in the background.
+    
+    Returns:
+        The sync job (an already running one is reused), or None when not
+        in local mode.
+    """
+    if not is_local_mode():
+        return None
+    return get_job_manager().submit(KEYWORD_INDEX_JOB, "Sync keyword index from zotero.sqlite",
+                                    _sync_keyword_index_job)
+
+
+def search_local_keyword_index(query: str, limit: int = 10, **filters: Any) -> Optional[List[Dict[str, Any]]]:
+    """
+    Search the keyword index kept in sync with the local Zotero database.
+    
+    Searching never syncs: when the database changed, a background sync is
+    started and the index is searched as of the last completed sync.
+    
+    Args:
+        query: Free-text query.
+        limit: Maximum number of results.
+        **filters: Passed to KeywordIndex.search (kinds, columns, item_types, ...).
+        
+    Returns:
+        Ranked, highlighted hits, or None when the local database or FTS5
+        is unavailable or the index is still being built.
+    """
+    index = get_keyword_index()
+    if index is None:
+        return None
+    reader = get_local_zotero_reader()
+    if reader is None:
+        return None
+    with reader:
+        ready, current = reader.keyword_index_state(index)
+    if not current:
+        start_keyword_index_sync()
+    if not ready:
+        return None
+    return index.search(query, limit, **filters)
+
+
 def is_local_db_available() -> bool:
     """
     Check if local Zotero database is available.
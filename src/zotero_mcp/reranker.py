@@ -0,0 +1,182 @@
+"""
+Cross-encoder reranking of semantic search candidates.
+
+A cross-encoder reads the query and a passage together, which ranks far
+more precisely than comparing independently computed embeddings but costs
+one model call per candidate. Search therefore over-fetches candidates
+from ChromaDB and lets a small CPU cross-encoder reorder them, within a
+latency budget: reranking is skipped when the expected cost would exceed
+the budget, or abandoned when scoring runs over it.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+# Weight of the latest measurement in the per-pair cost estimate
+COST_SMOOTHING = 0.3
+
+
+class CrossEncoderReranker:
+    """
+    Lazily loaded sentence-transformers CrossEncoder with cost tracking.
+
+    The model is loaded once, in a background thread, and shared by all
+    searches. Scoring is serialized because CrossEncoder.predict is not
+    documented as thread safe.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, batch_size: int = 32, max_chars: int = 2000):
+        """
+        Initialize the reranker without loading the model.
+
+        Args:
+            model_name: sentence-transformers cross-encoder model name or path
+            batch_size: Query-passage pairs scored per forward pass
+            max_chars: Passages are truncated to this many characters
+        """
+        self.model_name = model_name
+        self.batch_size = max(1, int(batch_size))
+        self.max_chars = max(100, int(max_chars))
+
+        self._model = None
+        self._load_error: Optional[str] = None
+        self._loaded = threading.Event()
+        self._load_lock = threading.Lock()
+        self._loader: Optional[threading.Thread] = None
+        self._predict_lock = threading.Lock()
+
+        # Exponentially smoothed milliseconds per query-passage pair
+        self.ms_per_pair: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the model is loaded and usable."""
+        return self._loaded.is_set() and self._model is not None
+
+    @property
+    def load_error(self) -> Optional[str]:
+        """Why loading the model failed, if it did."""
+        return self._load_error
+
+    def load_async(self) -> None:
+        """Start loading the model in a background thread, once."""
+        with self._load_lock:
+            if self._loader is not None:
+                return
+            self._loader = threading.Thread(target=self._load, name="reranker-load", daemon=True)
+            self._loader.start()
+
+    def wait_ready(self, timeout: Optional[float]) -> bool:
+        """
+        Start loading if needed and wait for the model.
+
+        Args:
+            timeout: Seconds to wait at most (None waits indefinitely)
+
+        Returns:
+            True if the model is ready to score
+        """
+        self.load_async()
+        self._loaded.wait(timeout)
+        return self.ready
+
+    def _load(self) -> None:
+        start = time.perf_counter()
+        try:
+            from sentence_transformers import CrossEncoder
+
+            self._model = CrossEncoder(self.model_name, device="cpu")
+            logger.info(f"Cross-encoder {self.model_name} loaded in {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            self._load_error = str(e)
+            logger.warning(f"Cross-encoder {self.model_name} unavailable: {e}")
+        finally:
+            self._loaded.set()
+
+    def estimate_ms(self, n_pairs: int) -> Optional[float]:
+        """Expected time to score `n_pairs` pairs, or None before the first measurement."""
+        if self.ms_per_pair is None:
+            return None
+        return self.ms_per_pair * n_pairs
+
+    def score(self, query: str, passages: Sequence[str],
+              deadline: Optional[float] = None) -> Optional[List[float]]:
+        """
+        Score passages against a query.
+
+        Args:
+            query: Search query
+            passages: Candidate passages
+            deadline: time.perf_counter() value after which scoring is abandoned
+
+        Returns:
+            One relevance score per passage (higher is better), or None when
+            the model is unavailable or the deadline passed
+        """
+        if not self.ready:
+            return None
+        if not passages:
+            return []
+
+        pairs = [(query, (passage or "")[:self.max_chars]) for passage in passages]
+        scores: List[float] = []
+        start = time.perf_counter()
+        with self._predict_lock:
+            for i in range(0, len(pairs), self.batch_size):
+                if deadline is not None and i and time.perf_counter() > deadline:
+                    self._record_cost(start, i)
+                    return None
+                batch = pairs[i:i + self.batch_size]
+                scores.extend(float(s) for s in self._model.predict(batch, batch_size=len(batch),
+                                                                    show_progress_bar=False))
+        self._record_cost(start, len(pairs))
+        return scores
+
+    def _record_cost(self, start: float, n_pairs: int) -> None:
+        if not n_pairs:
+            return
+        measured = (time.perf_counter() - start) * 1000 / n_pairs
+        if self.ms_per_pair is None:
+            self.ms_per_pair = measured
+        else:
+            self.ms_per_pair += COST_SMOOTHING * (measured - self.ms_per_pair)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the model name, load state and current cost estimate."""
+        return {
+            "model": self.model_name,
+            "ready": self.ready,
+            "load_error": self._load_error,
+            "ms_per_pair": self.ms_per_pair,
+        }
+
+
+_rerankers: Dict[str, CrossEncoderReranker] = {}
+_rerankers_lock = threading.Lock()
+
+
+def get_reranker(model_name: str = DEFAULT_MODEL, batch_size: int = 32,
+                 max_chars: int = 2000) -> CrossEncoderReranker:
+    """
+    Get the process-wide reranker for a model, creating it on first use.
+
+    The model itself is only loaded by load_async() or wait_ready().
+    """
+    with _rerankers_lock:
+        reranker = _rerankers.get(model_name)
+        if reranker is None:
+            reranker = CrossEncoderReranker(model_name, batch_size=batch_size, max_chars=max_chars)
+            _rerankers[model_name] = reranker
+        return reranker
+
+
+def close_rerankers() -> None:
+    """Discard the process-wide rerankers and their models."""
+    with _rerankers_lock:
+        _rerankers.clear()
@@ -6,21 +6,36 @@ with the existing Zotero client to enable vector-based similarity search
 over research libraries.
 """
 
+import copy
+import functools
 import json
 import os
+import queue
 import sys
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timedelta
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Any, Set, Tuple
 import logging
 
 from pyzotero import zotero
 
-from .chroma_client import ChromaClient, create_chroma_client
-from .client import get_zotero_client
+from .chroma_client import ChromaClient, PartialEmbeddingError, create_chroma_client
+from .client import zotero_client
+from .item_cache import MAX_KEYS_PER_REQUEST, get_cached_items, library_id_for
+from .keyword_index import KIND_ITEM, get_keyword_index, strip_html
 from .utils import format_creators, is_local_mode
-from .local_db import LocalZoteroReader, get_local_zotero_reader
+from .local_db import (
+    LocalZoteroReader,
+    ZoteroItem as LocalZoteroItem,
+    get_local_zotero_reader,
+    iter_fulltext_parallel,
+    search_local_keyword_index,
+)
+from .reranker import DEFAULT_MODEL as DEFAULT_RERANK_MODEL, get_reranker
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +52,27 @@ def suppress_stdout():
             sys.stdout = old_stdout
 
 
+def _with_zotero_client(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Run a ZoteroSemanticSearch method with a Zotero client of its own.
+    
+    pyzotero clients keep per-request state (parameters, the last response
+    and its headers), so searches and index jobs running at the same time
+    must not share one. The method runs on a shallow copy of the shared
+    instance holding a client leased from the pool for the whole call;
+    reads always go to the API, as they did before local reads existed.
+    """
+    @functools.wraps(method)
+    def wrapper(self: "ZoteroSemanticSearch", *args: Any, **kwargs: Any) -> Any:
+        if self.zotero_client is not None:
+            return method(self, *args, **kwargs)
+        with zotero_client(local_reads=False) as zot:
+            view = copy.copy(self)
+            view.zotero_client = zot
+            return method(view, *args, **kwargs)
+    return wrapper
+
+
 class ZoteroSemanticSearch:
     """Semantic search interface for Zotero libraries using ChromaDB."""
     
@@ -51,11 +87,27 @@ class ZoteroSemanticSearch:
             config_path: Path to configuration file
         """
         self.chroma_client = chroma_client or create_chroma_client(config_path)
-        self.zotero_client = get_zotero_client()
+        # Leased from the client pool for each update or search (see _with_zotero_client)
+        self.zotero_client: Optional[zotero.Zotero] = None
         self.config_path = config_path
+        # Modification time of the config file this instance was built from
+        self.config_mtime = _get_mtime(config_path)
         
         # Load update configuration
         self.update_config = self._load_update_config()
+        
+        # How search hits are resolved to items: 'auto' (local DB or batched
+        # API requests) or 'metadata' (ChromaDB metadata only, no requests)
+        self.enrichment_mode = self._load_search_setting("enrichment", "auto")
+        
+        # How fulltext is split into passages and how passage hits are scored
+        self.chunking = self._load_chunking_config()
+        
+        # Default search mode and how keyword and vector rankings are fused
+        self.hybrid = self._load_hybrid_config()
+        
+        # Optional cross-encoder second stage
+        self.rerank = self._load_rerank_config()
     
     def _load_update_config(self) -> Dict[str, Any]:
         """Load update configuration from file or use defaults."""
@@ -76,6 +128,128 @@ class ZoteroSemanticSearch:
         
         return config
     
+    def _load_search_setting(self, name: str, default: Any) -> Any:
+        """Read a single setting from the semantic_search section of the config file."""
+        if self.config_path and os.path.exists(self.config_path):
+            try:
+                with open(self.config_path, 'r') as f:
+                    return json.load(f).get("semantic_search", {}).get(name, default)
+            except Exception as e:
+                logger.warning(f"Error loading setting '{name}': {e}")
+        return default
+    
+    def _load_chunking_config(self) -> Dict[str, Any]:
+        """
+        Load passage chunking settings from the semantic_search.chunking config section.
+        
+        Chunking is off unless enabled there, since it changes the index
+        layout (one document per passage, ids KEY#n).
+        
+        Returns:
+            Dictionary with enabled, chunk_size, overlap (characters),
+            max_chunks per item, aggregation ('max' or 'sum') and overfetch
+            (passage hits requested per result)
+        """
+        config = {
+            "enabled": False,
+            "chunk_size": 2000,
+            "overlap": 200,
+            "max_chunks": 100,
+            "aggregation": "max",
+            "overfetch": 5,
+        }
+        file_config = self._load_search_setting("chunking", {})
+        if isinstance(file_config, dict):
+            config.update({k: v for k, v in file_config.items() if v is not None})
+        
+        if config["aggregation"] not in ("max", "sum"):
+            logger.warning(f"Unknown chunk aggregation '{config['aggregation']}', using 'max'")
+            config["aggregation"] = "max"
+        config["chunk_size"] = max(100, int(config["chunk_size"]))
+        config["overlap"] = min(max(0, int(config["overlap"])), config["chunk_size"] // 2)
+        return config
+    
+    def _chunking_layout(self) -> Dict[str, Any]:
+        """The chunking settings that determine which documents an item is indexed as."""
+        if not self.chunking["enabled"]:
+            return {"enabled": False}
+        return {key: self.chunking[key] for key in ("enabled", "chunk_size", "overlap", "max_chunks")}
+    
+    def _chunking_layout_changed(self) -> bool:
+        """
+        Whether the index was built with other chunking settings than the current ones.
+        
+        Unchanged items are never re-embedded, so such an index mixes
+        layouts until it is rebuilt. Indexes built before the layout was
+        recorded are only checked for whether they contain passages.
+        """
+        if self.chroma_client.get_collection_info().get("count", 0) == 0:
+            return False
+        indexed = self.update_config.get("chunking_layout")
+        if indexed is None:
+            indexed = {"enabled": self.chroma_client.has_passages()}
+        current = self._chunking_layout()
+        return any(current.get(key) != value for key, value in indexed.items())
+    
+    def _load_hybrid_config(self) -> Dict[str, Any]:
+        """
+        Load retrieval settings from the semantic_search.hybrid config section.
+        
+        Returns:
+            Dictionary with the default search mode, rrf_k (rank offset of
+            reciprocal rank fusion), vector_weight, keyword_weight and
+            candidates (results taken from each retriever before fusion)
+        """
+        config = {
+            "mode": "vector",
+            "rrf_k": 60,
+            "vector_weight": 1.0,
+            "keyword_weight": 1.0,
+            "candidates": 50,
+        }
+        file_config = self._load_search_setting("hybrid", {})
+        if isinstance(file_config, dict):
+            config.update({k: v for k, v in file_config.items() if v is not None})
+        
+        if config["mode"] not in SEARCH_MODES:
+            logger.warning(f"Unknown search mode '{config['mode']}', using 'vector'")
+            config["mode"] = "vector"
+        return config
+    
+    def _load_rerank_config(self) -> Dict[str, Any]:
+        """
+        Load cross-encoder reranking settings from the semantic_search.rerank config section.
+        
+        Returns:
+            Dictionary with enabled, model (sentence-transformers cross-encoder),
+            overfetch (candidates scored per returned result), batch_size,
+            max_chars (passage truncation) and budget_ms (latency budget of
+            the stage; 0 for none)
+        """
+        config = {
+            "enabled": False,
+            "model": DEFAULT_RERANK_MODEL,
+            "overfetch": 5,
+            "batch_size": 32,
+            "max_chars": 2000,
+            "budget_ms": 500,
+        }
+        file_config = self._load_search_setting("rerank", {})
+        if isinstance(file_config, dict):
+            config.update({k: v for k, v in file_config.items() if v is not None})
+        return config
+    
+    def _fulltext_max_chars(self) -> int:
+        """
+        Fulltext length to extract: enough for max_chunks passages.
+        
+        Applies with chunking off too, where the text becomes the item's
+        document and keyword index entry; the reader's own default would cut
+        it to DEFAULT_FULLTEXT_MAX_CHARS.
+        """
+        step = self.chunking["chunk_size"] - self.chunking["overlap"]
+        return step * self.chunking["max_chunks"] + self.chunking["overlap"]
+    
     def _save_update_config(self) -> None:
         """Save update configuration to file."""
         if not self.config_path:
@@ -102,9 +276,30 @@ class ZoteroSemanticSearch:
         try:
             with open(self.config_path, 'w') as f:
                 json.dump(full_config, f, indent=2)
+            # Our own write should not trigger a hot reload
+            self.config_mtime = _get_mtime(self.config_path)
         except Exception as e:
             logger.error(f"Error saving update config: {e}")
     
+    def warm_up(self) -> None:
+        """
+        Load the embedding model ahead of the first query.
+        
+        Runs one dummy embedding for local models so the ONNX/sentence
+        transformer weights are loaded before a user is waiting. Remote
+        backends have nothing to load and are skipped. The reranking
+        cross-encoder, when enabled, starts loading in the background.
+        """
+        if self.rerank["enabled"]:
+            get_reranker(self.rerank["model"], batch_size=self.rerank["batch_size"],
+                         max_chars=self.rerank["max_chars"]).load_async()
+        if self.chroma_client.embedding_model != "default":
+            return
+        start = time.perf_counter()
+        with suppress_stdout():
+            self.chroma_client.embedding_function(["warm-up"])
+        logger.info(f"Embedding model warmed up in {time.perf_counter() - start:.2f}s")
+    
     def _create_document_text(self, item: Dict[str, Any]) -> str:
         """
         Create searchable text from a Zotero item.
@@ -162,6 +357,7 @@ class ZoteroSemanticSearch:
         
         metadata = {
             "item_key": item.get("key", ""),
+            "version": int(item.get("version", 0) or 0),
             "item_type": data.get("itemType", ""),
             "title": data.get("title", ""),
             "date": data.get("date", ""),
@@ -195,6 +391,36 @@ class ZoteroSemanticSearch:
         
         return metadata
     
+    def _needs_reindex(self, item: Dict[str, Any], indexed: Optional[Dict[str, Any]]) -> bool:
+        """
+        Decide whether an item must be (re-)embedded.
+        
+        Args:
+            item: Zotero item from the API or local database
+            indexed: Metadata stored in ChromaDB for this item, or None if absent
+            
+        Returns:
+            True if the item is new or changed since it was indexed
+        """
+        if indexed is None:
+            return True
+        
+        data = item.get("data", {})
+        version = int(item.get("version", 0) or 0)
+        indexed_version = int(indexed.get("version", 0) or 0)
+        if version and indexed_version:
+            if version != indexed_version:
+                return True
+        # Local database items carry no version; fall back to dateModified.
+        # The API uses "2024-01-02T03:04:05Z", zotero.sqlite "2024-01-02 03:04:05".
+        elif (_normalize_timestamp(data.get("dateModified"))
+                != _normalize_timestamp(indexed.get("date_modified"))):
+            return True
+        # Fulltext became available since the item was indexed
+        if data.get("fulltext") and not indexed.get("has_fulltext"):
+            return True
+        return False
+    
     def should_update_database(self) -> bool:
         """Check if the database should be updated based on configuration."""
         if not self.update_config.get("auto_update", False):
@@ -227,6 +453,39 @@ class ZoteroSemanticSearch:
         
         return False
     
+    def _load_extraction_config(self) -> Dict[str, Any]:
+        """
+        Load fulltext extraction settings.
+        
+        Reads the `semantic_search.extraction` section of the config file;
+        ZOTERO_EXTRACTION_WORKERS, ZOTERO_EXTRACTION_TIMEOUT and
+        ZOTERO_EXTRACTION_MAX_MEMORY_MB override it.
+        
+        Returns:
+            Dictionary with pdf_max_pages, workers, timeout and max_memory_mb
+        """
+        config = {
+            "pdf_max_pages": None,
+            "workers": max(1, min(4, (os.cpu_count() or 2) - 1)),
+            "timeout": 120,
+            "max_memory_mb": None,
+        }
+        file_config = self._load_search_setting("extraction", {})
+        if isinstance(file_config, dict):
+            config.update({k: v for k, v in file_config.items() if v is not None})
+        
+        for key, env_var in (("workers", "ZOTERO_EXTRACTION_WORKERS"),
+                             ("timeout", "ZOTERO_EXTRACTION_TIMEOUT"),
+                             ("max_memory_mb", "ZOTERO_EXTRACTION_MAX_MEMORY_MB")):
+            if value := os.getenv(env_var):
+                try:
+                    config[key] = int(value)
+                except ValueError:
+                    logger.warning(f"Ignoring invalid {env_var}={value!r}")
+        
+        config["workers"] = max(1, int(config["workers"] or 1))
+        return config
+    
     def _get_items_from_source(self, limit: Optional[int] = None, extract_fulltext: bool = False) -> List[Dict[str, Any]]:
         """
         Get items from either local database or API.
@@ -241,10 +500,49 @@ class ZoteroSemanticSearch:
         Returns:
             List of items in API-compatible format
         """
+        _, items = self._stream_items_from_source(limit, extract_fulltext)
+        return list(items)
+    
+    def _stream_items_from_source(self,
+                                  limit: Optional[int] = None,
+                                  extract_fulltext: bool = False,
+                                  should_extract: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                                  done: Optional[Set[str]] = None,
+                                  cancel: Optional[threading.Event] = None,
+                                  planned_keys: Optional[List[str]] = None,
+                                  record_plan: Optional[Callable[[List[str]], None]] = None
+                                  ) -> Tuple[int, Iterator[Dict[str, Any]]]:
+        """
+        Stream items from either local database or API.
+        
+        Same source selection as _get_items_from_source, but items are yielded
+        as soon as they are ready so indexing can overlap fulltext extraction.
+        
+        Args:
+            limit: Optional limit on number of items
+            extract_fulltext: Whether to extract fulltext content
+            should_extract: Optional predicate; items for which it returns
+                False are yielded without running fulltext extraction
+            done: Keys of items already written by an interrupted run (when resuming)
+            cancel: Stops fulltext extraction when set
+            planned_keys: Item set of the interrupted limited run (when resuming);
+                only these items are streamed
+            record_plan: Called with the keys of a limited run's item set
+                before any item is yielded, so a resume can reuse the set
+            
+        Returns:
+            Tuple of (number of items, iterator of API-compatible items)
+        """
         if extract_fulltext and is_local_mode():
-            return self._get_items_from_local_db(limit, extract_fulltext=extract_fulltext)
-        else:
-            return self._get_items_from_api(limit)
+            try:
+                return self._stream_items_from_local_db(limit, extract_fulltext, should_extract, done, cancel,
+                                                        planned_keys, record_plan)
+            except Exception as e:
+                logger.error(f"Error reading from local database: {e}")
+                logger.info("Falling back to API...")
+        if done or planned_keys is not None:
+            return self._stream_remaining_items_from_api(limit, done or set(), planned_keys)
+        return self._stream_items_from_api(limit, record_plan=record_plan)
     
     def _get_items_from_local_db(self, limit: Optional[int] = None, extract_fulltext: bool = False) -> List[Dict[str, Any]]:
         """
@@ -257,147 +555,268 @@ class ZoteroSemanticSearch:
         Returns:
             List of items in API-compatible format
         """
-        logger.info("Fetching items from local Zotero database...")
+        try:
+            _, items = self._stream_items_from_local_db(limit, extract_fulltext)
+            api_items = list(items)
+            logger.info(f"Retrieved {len(api_items)} items from local database")
+            return api_items
+        except Exception as e:
+            logger.error(f"Error reading from local database: {e}")
+            logger.info("Falling back to API...")
+            return self._get_items_from_api(limit)
+    
+    def _stream_items_from_local_db(self,
+                                    limit: Optional[int] = None,
+                                    extract_fulltext: bool = False,
+                                    should_extract: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                                    done: Optional[Set[str]] = None,
+                                    cancel: Optional[threading.Event] = None,
+                                    planned_keys: Optional[List[str]] = None,
+                                    record_plan: Optional[Callable[[List[str]], None]] = None
+                                    ) -> Tuple[int, Iterator[Dict[str, Any]]]:
+        """
+        Scan the local Zotero database and stream items with extracted fulltext.
+        
+        The metadata scan runs eagerly (so errors surface here and the caller
+        can fall back to the API); fulltext extraction runs lazily as the
+        returned iterator is consumed, in a process pool when more than one
+        extraction worker is configured.
         
+        Args:
+            limit: Optional limit on number of items
+            extract_fulltext: Whether to extract fulltext content
+            should_extract: Optional predicate deciding per item whether
+                fulltext extraction is needed
+            done: Keys of items already written by an interrupted run (when resuming)
+            cancel: Stops fulltext extraction when set
+            planned_keys: Item set of the interrupted limited run (when resuming)
+            record_plan: Called with the keys of a limited run's item set
+            
+        Returns:
+            Tuple of (number of items, iterator of API-compatible items)
+        """
+        logger.info("Fetching items from local Zotero database...")
+        extraction = self._load_extraction_config()
+        reader = LocalZoteroReader(pdf_max_pages=extraction["pdf_max_pages"],
+                                   fulltext_max_chars=self._fulltext_max_chars())
         try:
-            # Load per-run config, including extraction limits if provided
-            pdf_max_pages = None
-            # If semantic_search config file exists, prefer its setting
-            try:
-                if self.config_path and os.path.exists(self.config_path):
-                    with open(self.config_path, 'r') as _f:
-                        _cfg = json.load(_f)
-                        pdf_max_pages = _cfg.get('semantic_search', {}).get('extraction', {}).get('pdf_max_pages')
-            except Exception:
-                pass
-
-            with suppress_stdout(), LocalZoteroReader(pdf_max_pages=pdf_max_pages) as reader:
+            with suppress_stdout():
                 # Phase 1: fetch metadata only (fast)
                 sys.stderr.write("Scanning local Zotero database for items...\n")
-                local_items = reader.get_items_with_text(limit=limit, include_fulltext=False)
-                candidate_count = len(local_items)
-                sys.stderr.write(f"Found {candidate_count} candidate items.\n")
-
-                # Optional deduplication: if preprint and journalArticle share a DOI/title, keep journalArticle
-                # Build index by (normalized DOI or normalized title)
-                def norm(s: Optional[str]) -> Optional[str]:
-                    if not s:
-                        return None
-                    return "".join(s.lower().split())
-
-                key_to_best = {}
-                for it in local_items:
-                    doi_key = ("doi", norm(getattr(it, "doi", None))) if getattr(it, "doi", None) else None
-                    title_key = ("title", norm(getattr(it, "title", None))) if getattr(it, "title", None) else None
-
-                    def consider(k):
-                        if not k:
-                            return
-                        cur = key_to_best.get(k)
-                        # Prefer journalArticle over preprint; otherwise keep first
-                        if cur is None:
-                            key_to_best[k] = it
-                        else:
-                            prefer_types = {"journalArticle": 2, "preprint": 1}
-                            cur_score = prefer_types.get(getattr(cur, "item_type", ""), 0)
-                            new_score = prefer_types.get(getattr(it, "item_type", ""), 0)
-                            if new_score > cur_score:
-                                key_to_best[k] = it
-
-                    consider(doi_key)
-                    consider(title_key)
-
-                # If a preprint loses against a journal article for same DOI/title, drop it
-                filtered_items = []
+                # A resumed limited run takes its original items, wherever they now sort
+                local_items = reader.get_items_with_text(limit=None if planned_keys is not None else limit,
+                                                         include_fulltext=False)
+        except Exception:
+            reader.close()
+            raise
+        
+        if planned_keys is not None:
+            planned = set(planned_keys)
+            local_items = [it for it in local_items if it.key in planned]
+        candidate_count = len(local_items)
+        sys.stderr.write(f"Found {candidate_count} candidate items.\n")
+        
+        local_items = self._deduplicate_local_items(local_items)
+        if limit and planned_keys is None and record_plan is not None:
+            record_plan([it.key for it in local_items])
+        if done:
+            # Already indexed by the interrupted run: skip before any extraction.
+            # Matched by key, since scan and extraction order are not stable.
+            before = len(local_items)
+            local_items = [it for it in local_items if it.key not in done]
+            sys.stderr.write(f"Skipping {before - len(local_items)} items indexed before the interruption.\n")
+        total_to_extract = len(local_items)
+        try:
+            if total_to_extract != candidate_count:
+                sys.stderr.write(f"After filtering/dedup: {total_to_extract} items to process. Extracting content...\n")
+            else:
+                sys.stderr.write("Extracting content...\n")
+        except Exception:
+            pass
+        
+        return total_to_extract, self._iter_local_items(reader, local_items, extract_fulltext,
+                                                        extraction, should_extract, cancel)
+    
+    def _iter_local_items(self,
+                          reader: LocalZoteroReader,
+                          local_items: List[LocalZoteroItem],
+                          extract_fulltext: bool,
+                          extraction: Dict[str, Any],
+                          should_extract: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                          cancel: Optional[threading.Event] = None
+                          ) -> Iterator[Dict[str, Any]]:
+        """
+        Phase 2 of the local scan: extract fulltext and yield API-compatible items.
+        
+        Items that need no extraction are yielded first; the rest are yielded
+        in completion order as their extraction finishes. Stops when `cancel`
+        is set. Closes `reader` and shuts down the extraction pool when
+        exhausted, cancelled or closed.
+        """
+        results: Iterator[Tuple[int, Any]] = iter(())
+        try:
+            if not extract_fulltext:
+                # Skip fulltext extraction for faster processing
                 for it in local_items:
-                    # If there is a journalArticle alternative for same DOI or title, and this is preprint, drop
-                    if getattr(it, "item_type", None) == "preprint":
-                        k_doi = ("doi", norm(getattr(it, "doi", None))) if getattr(it, "doi", None) else None
-                        k_title = ("title", norm(getattr(it, "title", None))) if getattr(it, "title", None) else None
-                        drop = False
-                        for k in (k_doi, k_title):
-                            if not k:
-                                continue
-                            best = key_to_best.get(k)
-                            if best is not None and best is not it and getattr(best, "item_type", None) == "journalArticle":
-                                drop = True
-                                break
-                        if drop:
-                            continue
-                    filtered_items.append(it)
-
-                local_items = filtered_items
-                total_to_extract = len(local_items)
-                if total_to_extract != candidate_count:
-                    try:
-                        sys.stderr.write(f"After filtering/dedup: {total_to_extract} items to process. Extracting content...\n")
-                    except Exception:
-                        pass
+                    it.fulltext = None
+                    it.fulltext_source = None
+                    yield self._local_item_to_api(it)
+                return
+            
+            to_extract: Dict[int, LocalZoteroItem] = {}
+            for it in local_items:
+                if getattr(it, "fulltext", None) or (
+                        should_extract and not should_extract(self._local_item_to_api(it, True))):
+                    yield self._local_item_to_api(it, True)
                 else:
+                    to_extract[it.item_id] = it
+            
+            # Phase 2: selectively extract fulltext only for items that need it
+            workers = extraction["workers"]
+            if workers > 1 and len(to_extract) > 1:
+                sys.stderr.write(f"Extracting content for {len(to_extract)} items with {workers} workers...\n")
+                results = iter_fulltext_parallel(
+                    reader.db_path,
+                    list(to_extract),
+                    workers=workers,
+                    timeout=extraction["timeout"],
+                    max_memory_mb=extraction["max_memory_mb"],
+                    pdf_max_pages=extraction["pdf_max_pages"],
+                    fulltext_max_chars=reader.fulltext_max_chars,
+                    cancel=cancel,
+                )
+            else:
+                results = ((item_id, self._extract_fulltext_quietly(reader, item_id))
+                           for item_id in to_extract)
+            
+            extracted = 0
+            total_to_extract = len(to_extract)
+            for item_id, text in results:
+                if cancel is not None and cancel.is_set():
+                    return
+                it = to_extract.pop(item_id)
+                if text:
+                    # Support new (text, source) return format
+                    if isinstance(text, tuple) and len(text) == 2:
+                        it.fulltext, it.fulltext_source = text[0], text[1]
+                    else:
+                        it.fulltext = text
+                extracted += 1
+                if extracted % 25 == 0:
                     try:
-                        sys.stderr.write("Extracting content...\n")
+                        sys.stderr.write(f"Extracted content for {extracted}/{total_to_extract} items...\n")
                     except Exception:
                         pass
-
-                # Phase 2: selectively extract fulltext only when requested
-                if extract_fulltext:
-                    extracted = 0
-                    for it in local_items:
-                        if not getattr(it, "fulltext", None):
-                            text = reader.extract_fulltext_for_item(it.item_id)
-                            if text:
-                                # Support new (text, source) return format
-                                if isinstance(text, tuple) and len(text) == 2:
-                                    it.fulltext, it.fulltext_source = text[0], text[1]
-                                else:
-                                    it.fulltext = text
-                        extracted += 1
-                        if extracted % 25 == 0 and total_to_extract:
-                            try:
-                                sys.stderr.write(f"Extracted content for {extracted}/{total_to_extract} items...\n")
-                            except Exception:
-                                pass
-                else:
-                    # Skip fulltext extraction for faster processing
-                    for it in local_items:
-                        it.fulltext = None
-                        it.fulltext_source = None
-                
-                # Convert to API-compatible format
-                api_items = []
-                for item in local_items:
-                    # Create API-compatible item structure
-                    api_item = {
-                        "key": item.key,
-                        "version": 0,  # Local items don't have versions
-                        "data": {
-                            "key": item.key,
-                            "itemType": getattr(item, 'item_type', None) or "journalArticle",
-                            "title": item.title or "",
-                            "abstractNote": item.abstract or "",
-                            "extra": item.extra or "",
-                            # Include fulltext only when extracted
-                            "fulltext": getattr(item, 'fulltext', None) or "" if extract_fulltext else "",
-                            "fulltextSource": getattr(item, 'fulltext_source', None) or "" if extract_fulltext else "",
-                            "dateAdded": item.date_added,
-                            "dateModified": item.date_modified,
-                            "creators": self._parse_creators_string(item.creators) if item.creators else []
-                        }
-                    }
-                    
-                    # Add notes if available
-                    if item.notes:
-                        api_item["data"]["notes"] = item.notes
-                    
-                    api_items.append(api_item)
-                
-                logger.info(f"Retrieved {len(api_items)} items from local database")
-                return api_items
-                
+                api_item = self._local_item_to_api(it, True)
+                # Do not keep every document's text alive until the scan ends
+                it.fulltext = None
+                yield api_item
+        finally:
+            _close_quietly(results)
+            reader.close()
+    
+    def _extract_fulltext_quietly(self, reader: LocalZoteroReader, item_id: int) -> Optional[Tuple[str, str]]:
+        """Extract fulltext in-process, keeping extractor output off stdout."""
+        try:
+            with suppress_stdout():
+                return reader.extract_fulltext_for_item(item_id)
         except Exception as e:
-            logger.error(f"Error reading from local database: {e}")
-            logger.info("Falling back to API...")
-            return self._get_items_from_api(limit)
+            logger.warning(f"Fulltext extraction failed for item {item_id}: {e}")
+            return None
+    
+    def _deduplicate_local_items(self, local_items: List[LocalZoteroItem]) -> List[LocalZoteroItem]:
+        """
+        Drop preprints that have a journal article with the same DOI or title.
+        
+        Args:
+            local_items: Items read from the local database
+            
+        Returns:
+            Filtered list of items
+        """
+        # Build index by (normalized DOI or normalized title)
+        def norm(s: Optional[str]) -> Optional[str]:
+            if not s:
+                return None
+            return "".join(s.lower().split())
+        
+        key_to_best = {}
+        for it in local_items:
+            doi_key = ("doi", norm(getattr(it, "doi", None))) if getattr(it, "doi", None) else None
+            title_key = ("title", norm(getattr(it, "title", None))) if getattr(it, "title", None) else None
+            
+            def consider(k):
+                if not k:
+                    return
+                cur = key_to_best.get(k)
+                # Prefer journalArticle over preprint; otherwise keep first
+                if cur is None:
+                    key_to_best[k] = it
+                else:
+                    prefer_types = {"journalArticle": 2, "preprint": 1}
+                    cur_score = prefer_types.get(getattr(cur, "item_type", ""), 0)
+                    new_score = prefer_types.get(getattr(it, "item_type", ""), 0)
+                    if new_score > cur_score:
+                        key_to_best[k] = it
+            
+            consider(doi_key)
+            consider(title_key)
+        
+        # If a preprint loses against a journal article for same DOI/title, drop it
+        filtered_items = []
+        for it in local_items:
+            if getattr(it, "item_type", None) == "preprint":
+                k_doi = ("doi", norm(getattr(it, "doi", None))) if getattr(it, "doi", None) else None
+                k_title = ("title", norm(getattr(it, "title", None))) if getattr(it, "title", None) else None
+                drop = False
+                for k in (k_doi, k_title):
+                    if not k:
+                        continue
+                    best = key_to_best.get(k)
+                    if best is not None and best is not it and getattr(best, "item_type", None) == "journalArticle":
+                        drop = True
+                        break
+                if drop:
+                    continue
+            filtered_items.append(it)
+        
+        return filtered_items
+    
+    def _local_item_to_api(self, item: LocalZoteroItem, extract_fulltext: bool = False) -> Dict[str, Any]:
+        """
+        Convert a local database item into an API-compatible item dictionary.
+        
+        Args:
+            item: Item read by LocalZoteroReader
+            extract_fulltext: Whether extracted fulltext should be included
+            
+        Returns:
+            Item in API-compatible format
+        """
+        api_item = {
+            "key": item.key,
+            "version": 0,  # Local items don't have versions
+            "data": {
+                "key": item.key,
+                "itemType": getattr(item, 'item_type', None) or "journalArticle",
+                "title": item.title or "",
+                "abstractNote": item.abstract or "",
+                "extra": item.extra or "",
+                # Include fulltext only when extracted
+                "fulltext": getattr(item, 'fulltext', None) or "" if extract_fulltext else "",
+                "fulltextSource": getattr(item, 'fulltext_source', None) or "" if extract_fulltext else "",
+                "dateAdded": item.date_added,
+                "dateModified": item.date_modified,
+                "creators": self._parse_creators_string(item.creators) if item.creators else [],
+                "tags": [{"tag": tag} for tag in item.tags or []]
+            }
+        }
+        
+        # Add notes if available
+        if item.notes:
+            api_item["data"]["notes"] = item.notes
+        
+        return api_item
     
     def _parse_creators_string(self, creators_str: str) -> List[Dict[str, str]]:
         """
@@ -433,26 +852,112 @@ class ZoteroSemanticSearch:
         
         return creators
     
-    def _get_items_from_api(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def _get_items_from_api(self, limit: Optional[int] = None, since: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get items from Zotero API (original implementation).
         
         Args:
             limit: Optional limit on number of items
+            since: Only return items modified after this library version
             
         Returns:
             List of items from API
         """
+        _, items = self._stream_items_from_api(limit, since)
+        all_items = list(items)
+        logger.info(f"Retrieved {len(all_items)} items from API")
+        return all_items
+    
+    def _stream_items_from_api(self,
+                               limit: Optional[int] = None,
+                               since: Optional[int] = None,
+                               record_plan: Optional[Callable[[List[str]], None]] = None
+                               ) -> Tuple[int, Iterator[Dict[str, Any]]]:
+        """
+        Stream items from the Zotero API one page at a time.
+        
+        The first page is fetched eagerly so connection errors surface here.
+        
+        Args:
+            limit: Optional limit on number of items
+            since: Only return items modified after this library version
+            record_plan: Called with the keys of a limited run's item set;
+                the (bounded) set is then fetched before returning
+            
+        Returns:
+            Tuple of (estimated number of items, iterator of items)
+        """
         logger.info("Fetching items from Zotero API...")
+        pages = self._iter_api_pages(limit, since)
+        first_page = next(pages, [])
+        
+        # Total-Results counts attachments and notes too, so it is only an estimate
+        headers = getattr(getattr(self.zotero_client, "request", None), "headers", {}) or {}
+        try:
+            total = int(headers.get("Total-Results", 0)) or len(first_page)
+        except (TypeError, ValueError):
+            total = len(first_page)
+        if limit:
+            total = min(total, limit)
+        if limit and record_plan is not None:
+            items = list(chain(first_page, chain.from_iterable(pages)))
+            record_plan([item["key"] for item in items])
+            return len(items), iter(items)
+        return total, chain(first_page, chain.from_iterable(pages))
+    
+    def _stream_remaining_items_from_api(self, limit: Optional[int],
+                                         done: Set[str],
+                                         planned_keys: Optional[List[str]] = None
+                                         ) -> Tuple[int, Iterator[Dict[str, Any]]]:
+        """
+        Stream the items an interrupted full scan had not written yet.
+        
+        The keys of all regular items are listed in one versions request,
+        so only the remaining items are fetched instead of paging through
+        everything again.
+        
+        Args:
+            limit: Optional limit on number of items (of the original run)
+            done: Keys of items already written
+            planned_keys: Item set of the original run, if it was limited
+            
+        Returns:
+            Tuple of (number of items, iterator of items)
+        """
+        if planned_keys is not None:
+            keys = list(planned_keys)
+        else:
+            logger.info("Listing library items to resume from the Zotero API...")
+            # Notes are listed too (one negation per request); they are dropped after fetching
+            versions = self.zotero_client.item_versions(itemType="-attachment") or {}
+            keys = sorted(versions)
+            if limit:
+                # Checkpoints written before planned_keys existed
+                keys = keys[:limit]
+        remaining = [key for key in keys if key not in done]
+        sys.stderr.write(f"Skipping {len(keys) - len(remaining)} items indexed before the interruption.\n")
+        
+        def pages() -> Iterator[Dict[str, Any]]:
+            for i in range(0, len(remaining), MAX_KEYS_PER_REQUEST):
+                chunk = remaining[i:i + MAX_KEYS_PER_REQUEST]
+                for item in self.zotero_client.items(itemKey=",".join(chunk), limit=len(chunk)) or []:
+                    if item.get("data", {}).get("itemType") not in ["attachment", "note"]:
+                        yield item
         
+        return len(remaining), pages()
+    
+    def _iter_api_pages(self, limit: Optional[int] = None, since: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of regular items (no attachments or notes) from the Zotero API."""
         # Fetch items in batches to handle large libraries
         batch_size = 100
         start = 0
-        all_items = []
+        returned = 0
         
         while True:
             batch_params = {"start": start, "limit": batch_size}
-            if limit and len(all_items) >= limit:
+            if since is not None:
+                batch_params["since"] = since
+            if limit and returned >= limit:
                 break
             
             try:
@@ -476,30 +981,66 @@ class ZoteroSemanticSearch:
                 item for item in items 
                 if item.get("data", {}).get("itemType") not in ["attachment", "note"]
             ]
+            if limit:
+                filtered_items = filtered_items[:limit - returned]
             
-            all_items.extend(filtered_items)
+            returned += len(filtered_items)
+            yield filtered_items
             start += batch_size
             
             if len(items) < batch_size:
                 break
+    
+    def _get_changes_from_api(self, since: int) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Get the items changed and deleted since a library version.
         
-        if limit:
-            all_items = all_items[:limit]
+        Args:
+            since: Library version the index was last synced to
+            
+        Returns:
+            Tuple of (changed items, deleted item keys)
+        """
+        logger.info(f"Fetching changes since library version {since}...")
+        changed = self._get_items_from_api(since=since)
         
-        logger.info(f"Retrieved {len(all_items)} items from API")
-        return all_items
+        deleted = self.zotero_client.deleted(since=since) or {}
+        deleted_keys = list(deleted.get("items", []))
+        
+        # Items moved to the trash come back as changed items
+        live_items = []
+        for item in changed:
+            if item.get("data", {}).get("deleted"):
+                deleted_keys.append(item.get("key", ""))
+            else:
+                live_items.append(item)
+        
+        return live_items, [key for key in deleted_keys if key]
     
+    @_with_zotero_client
     def update_database(self, 
                        force_full_rebuild: bool = False,
                        limit: Optional[int] = None,
-                       extract_fulltext: bool = False) -> Dict[str, Any]:
+                       extract_fulltext: bool = False,
+                       resume: bool = False,
+                       progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+                       cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
         """
         Update the semantic search database with Zotero items.
         
+        Full scans keep a checkpoint journal (keys of the items written so
+        far and of those that failed) so an interrupted run can be continued
+        with resume=True.
+        
         Args:
             force_full_rebuild: Whether to rebuild the entire database
             limit: Limit number of items to process (for testing)
             extract_fulltext: Whether to extract fulltext content from local database
+            resume: Continue the interrupted run recorded in the checkpoint,
+                with its original options, instead of starting over
+            progress: Called after each batch with (items seen, total items, stats)
+            cancel: When set, the update stops after the current batch; a
+                full scan keeps its checkpoint so it can be resumed
             
         Returns:
             Update statistics
@@ -513,22 +1054,121 @@ class ZoteroSemanticSearch:
             "added_items": 0,
             "updated_items": 0,
             "skipped_items": 0,
+            "deleted_items": 0,
             "errors": 0,
+            # Where extracted fulltext came from: zotero_index, pdf, html, ...
+            "fulltext_sources": {},
             "start_time": start_time.isoformat(),
             "duration": None
         }
         
         try:
-            # Reset collection if force rebuild
-            if force_full_rebuild:
+            library = library_id_for(self.zotero_client)
+            library_versions = self.update_config.setdefault("library_versions", {})
+            last_version = library_versions.get(library)
+            
+            checkpoint = self._load_checkpoint() if resume else None
+            if resume and (checkpoint is None or checkpoint.get("library") != library):
+                logger.info("No interrupted update to resume; running a normal update")
+                checkpoint = None
+            done: Set[str] = set()
+            planned_keys: Optional[List[str]] = None
+            if checkpoint is not None:
+                # Continue with the interrupted run's options; its collection reset already happened
+                limit = checkpoint.get("limit")
+                planned_keys = checkpoint.get("planned_keys")
+                extract_fulltext = checkpoint.get("extract_fulltext", False)
+                force_full_rebuild = False
+                done = self._load_checkpoint_keys()
+                stats["resumed_from"] = len(done)
+                sys.stderr.write(f"Resuming interrupted update after {stats['resumed_from']} items...\n")
+            
+            if checkpoint is None and not force_full_rebuild and self._chunking_layout_changed():
+                message = "Chunking settings changed since the index was built; rebuilding the index"
+                logger.warning(message)
+                sys.stderr.write(message + "\n")
+                force_full_rebuild = True
+                stats["rebuild_reason"] = "chunking settings changed"
+            
+            # A rebuild fills a shadow collection; searches keep using the live
+            # one until the shadow is complete and swapped in
+            rebuilding = force_full_rebuild or bool(
+                checkpoint and checkpoint.get("force_full_rebuild") and checkpoint.get("shadow"))
+            writer = self.chroma_client
+            if rebuilding:
                 logger.info("Force rebuilding database...")
-                self.chroma_client.reset_collection()
+                writer = self.chroma_client.begin_rebuild(resume=checkpoint is not None)
+            
+            # Record the library version before reading so nothing changed
+            # during this run is missed by the next delta sync
+            current_version = None
+            if checkpoint is not None:
+                current_version = checkpoint.get("library_version")
+            else:
+                try:
+                    current_version = self.zotero_client.last_modified_version()
+                except Exception as e:
+                    logger.warning(f"Could not read library version: {e}")
+            stats["library_version"] = current_version
             
-            # Get all items from either local DB or API
-            # Get all items from either local DB or API
-            all_items = self._get_items_from_source(limit=limit, extract_fulltext=extract_fulltext)
+            all_items = None
+            deleted_keys: List[str] = []
+            use_api = not (extract_fulltext and is_local_mode())
+            if (use_api and not force_full_rebuild and not limit and checkpoint is None
+                    and last_version is not None and current_version is not None
+                    and self.chroma_client.get_collection_info().get("count", 0) > 0):
+                try:
+                    all_items, deleted_keys = self._get_changes_from_api(last_version)
+                    stats["sync_mode"] = "delta"
+                except Exception as e:
+                    logger.warning(f"Delta sync failed, falling back to a full scan: {e}")
+                    all_items = None
+            
+            journal: Optional[Dict[str, Any]] = None
+            if all_items is None:
+                stats["sync_mode"] = "full"
+                if checkpoint is None:
+                    self._clear_checkpoint()
+                journal = {
+                    "library": library,
+                    "library_version": current_version,
+                    "force_full_rebuild": checkpoint.get("force_full_rebuild", False) if checkpoint else force_full_rebuild,
+                    "extract_fulltext": extract_fulltext,
+                    "limit": limit,
+                    # Item set of a limited run, recorded once the source has chosen it
+                    "planned_keys": planned_keys,
+                    "failed_keys": list(checkpoint.get("failed_keys", [])) if checkpoint else [],
+                    "empty_keys": list(checkpoint.get("empty_keys", [])) if checkpoint else [],
+                    "started_at": checkpoint.get("started_at") if checkpoint else start_time.isoformat(),
+                    "shadow": rebuilding,
+                }
+                self._save_checkpoint(journal)
+                # Load what is already indexed in one pass instead of one lookup per item
+                indexed = {} if force_full_rebuild else {
+                    doc_id: metadata
+                    for doc_id, metadata in writer.get_all_metadata().items()
+                    if "#" not in doc_id  # passages are tracked through their item
+                }
+                
+                def should_extract(item: Dict[str, Any]) -> bool:
+                    # Only parse attachments of items that will actually be re-embedded
+                    indexed_item = indexed.get(item.get("key", ""))
+                    return (force_full_rebuild
+                            or self._needs_reindex(item, indexed_item)
+                            or not indexed_item.get("has_fulltext"))
+                
+                def record_plan(keys: List[str]) -> None:
+                    journal["planned_keys"] = keys
+                    self._save_checkpoint(journal)
+                
+                # Stream items from either local DB or API
+                stats["total_items"], item_stream = self._stream_items_from_source(
+                    limit=limit, extract_fulltext=extract_fulltext, should_extract=should_extract, done=done,
+                    cancel=cancel, planned_keys=planned_keys, record_plan=record_plan)
+            else:
+                indexed = self.chroma_client.get_metadata([item.get("key", "") for item in all_items])
+                stats["total_items"], item_stream = len(all_items), iter(all_items)
             
-            stats["total_items"] = len(all_items)
             logger.info(f"Found {stats['total_items']} items to process")
             # Immediate progress line so users see counts up-front
             try:
@@ -538,20 +1178,35 @@ class ZoteroSemanticSearch:
             
             # Process items in batches
             batch_size = 50
+            embedding_before = self._embedding_stats()
             # Track next milestone for progress printing (every 10 items)
             next_milestone = 10 if stats["total_items"] >= 10 else stats["total_items"]
             # Count of items seen (including skipped), used for progress milestones
             seen_items = 0
-            for i in range(0, len(all_items), batch_size):
-                batch = all_items[i:i + batch_size]
-                batch_stats = self._process_item_batch(batch, force_full_rebuild)
+            current_keys = set()
+            # Fetch -> build -> embed run in their own threads; this thread writes.
+            # Bounded queues between the stages keep memory flat.
+            batches = _threaded_map(lambda batch: batch, _iter_batches(item_stream, batch_size), "fetch")
+            prepared = _threaded_map(
+                lambda batch: self._prepare_item_batch(batch, force_full_rebuild, indexed), batches, "build")
+            embedded = _threaded_map(self._embed_item_batch, prepared, "embed")
+            for batch in embedded:
+                current_keys.update(batch["keys"])
+                for source, count in batch["fulltext_sources"].items():
+                    stats["fulltext_sources"][source] = stats["fulltext_sources"].get(source, 0) + count
+                batch_stats = self._write_item_batch(batch, writer)
+                if journal is not None:
+                    self._append_checkpoint_keys(batch["keys"])
+                    journal["failed_keys"].extend(batch["failed_keys"])
+                    journal["empty_keys"].extend(batch["empty_keys"])
+                    self._save_checkpoint(journal)
                 
                 stats["processed_items"] += batch_stats["processed"]
                 stats["added_items"] += batch_stats["added"]
                 stats["updated_items"] += batch_stats["updated"]
                 stats["skipped_items"] += batch_stats["skipped"]
                 stats["errors"] += batch_stats["errors"]
-                seen_items += len(batch)
+                seen_items += batch["size"]
                 
                 logger.info(f"Processed {seen_items}/{stats['total_items']} items (added: {stats['added_items']}, skipped: {stats['skipped_items']})")
                 # Print progress every 10 seen items (even if all are skipped)
@@ -564,7 +1219,94 @@ class ZoteroSemanticSearch:
                             break
                 except Exception:
                     pass
+                
+                if progress is not None:
+                    try:
+                        progress(seen_items, stats["total_items"], stats)
+                    except Exception as e:
+                        logger.debug(f"Progress callback failed: {e}")
+                if cancel is not None and cancel.is_set():
+                    embedded.close()
+                    break
             
+            if cancel is not None and cancel.is_set():
+                # Closing the stages reaches the item stream only once each has
+                # finished its current batch; stop the extraction pool now
+                _close_quietly(item_stream)
+                stats["cancelled"] = True
+                stats["processed_items_before_cancel"] = seen_items
+                logger.info(f"Database update cancelled after {seen_items} items")
+                sys.stderr.write(f"Database update cancelled after {seen_items} items\n")
+                end_time = datetime.now()
+                stats["duration"] = str(end_time - start_time)
+                stats["end_time"] = end_time.isoformat()
+                return stats
+            
+            # The up-front count is an estimate for API sources
+            stats["total_items"] = seen_items
+            
+            embedding_after = self._embedding_stats()
+            if embedding_before and embedding_after:
+                tokens = embedding_after["tokens"] - embedding_before["tokens"]
+                seconds = embedding_after["seconds"] - embedding_before["seconds"]
+                stats["embedding_tokens"] = tokens
+                stats["embedding_tokens_per_second"] = round(tokens / seconds, 1) if seconds else 0.0
+            
+            # Retry items that failed, separately and in small batches
+            if journal is not None and journal["failed_keys"]:
+                retried, journal["failed_keys"] = self._retry_failed_items(
+                    journal["failed_keys"], extract_fulltext, writer)
+                stats["retried_items"] = retried
+                self._save_checkpoint(journal)
+            stats["failed_items"] = len(journal["failed_keys"]) if journal is not None else stats["errors"]
+            
+            # Remove items that no longer exist in the library
+            vanished: List[str] = []
+            if stats["sync_mode"] == "delta":
+                vanished = list(self.chroma_client.get_metadata(deleted_keys))
+            elif indexed and not limit and not done:
+                # Only a full, unlimited scan tells us what has disappeared
+                vanished = [key for key in indexed if key not in current_keys]
+            if vanished:
+                writer.delete_items(vanished)
+                self._delete_from_keyword_index(vanished)
+                stats["deleted_items"] = len(vanished)
+                logger.info(f"Removed {len(vanished)} items no longer in the library")
+            
+            # Advance the synced library version only after a complete, error-free pass.
+            # A resumed scan did not see the skipped items, so it cannot have found
+            # deletions among them unless the collection was rebuilt from scratch.
+            complete = not done or (journal is not None and journal["force_full_rebuild"])
+            
+            if writer.is_shadow:
+                # Every item the source listed, in this run or before an
+                # interruption, must be in the shadow unless it still fails
+                # or has no text to embed
+                expected = (current_keys | done) - set(journal["failed_keys"]) - set(journal["empty_keys"])
+                problem = self.chroma_client.validate_rebuild(writer, expected)
+                if problem:
+                    # Keep the shadow and checkpoint so the rebuild can be resumed
+                    raise RuntimeError(f"Rebuilt collection failed validation ({problem}); "
+                                       f"the previous index is still in use")
+                self.chroma_client.promote(writer)
+                stats["swapped_collection"] = True
+                sys.stderr.write("Rebuilt index swapped in\n")
+                if journal is not None:
+                    # Items still failing are retried against the live collection
+                    journal["shadow"] = False
+                    self._save_checkpoint(journal)
+            if current_version is not None and not limit and not stats["failed_items"] and complete:
+                library_versions[library] = current_version
+            
+            if journal is not None and not journal["failed_keys"]:
+                self._clear_checkpoint()
+            elif journal is not None:
+                logger.warning(f"{len(journal['failed_keys'])} items failed; run update-db --resume to retry them")
+            
+            # Record the layout once every indexed item has it
+            rebuilt = journal is not None and journal["force_full_rebuild"] and complete
+            if not limit and (rebuilt or not self._chunking_layout_changed()):
+                self.update_config["chunking_layout"] = self._chunking_layout()
             # Update last update time
             self.update_config["last_update"] = datetime.now().isoformat()
             self._save_update_config()
@@ -583,13 +1325,67 @@ class ZoteroSemanticSearch:
             stats["duration"] = str(end_time - start_time)
             return stats
     
-    def _process_item_batch(self, items: List[Dict[str, Any]], force_rebuild: bool = False) -> Dict[str, int]:
-        """Process a batch of items."""
-        stats = {"processed": 0, "added": 0, "updated": 0, "skipped": 0, "errors": 0}
+    def _embedding_stats(self) -> Optional[Dict[str, Any]]:
+        """Cumulative token counters of the embedding function, if it keeps any."""
+        get_stats = getattr(self.chroma_client.embedding_function, "get_stats", None)
+        return get_stats() if callable(get_stats) else None
+    
+    def _process_item_batch(self,
+                            items: List[Dict[str, Any]],
+                            force_rebuild: bool = False,
+                            indexed: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, int]:
+        """
+        Process a batch of items.
+        
+        Runs the build, embed and write stages back to back; update_database
+        runs the same stages as a pipeline instead.
+        
+        Args:
+            items: Items to index
+            force_rebuild: Re-embed every item regardless of its indexed state
+            indexed: Metadata of already indexed items keyed by item key
+            
+        Returns:
+            Batch statistics
+        """
+        batch = self._prepare_item_batch(items, force_rebuild, indexed)
+        return self._write_item_batch(self._embed_item_batch(batch))
+    
+    def _prepare_item_batch(self,
+                            items: List[Dict[str, Any]],
+                            force_rebuild: bool = False,
+                            indexed: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Build stage: turn items that need (re-)indexing into documents and metadata.
         
-        documents = []
-        metadatas = []
-        ids = []
+        Args:
+            items: Items to index
+            force_rebuild: Re-embed every item regardless of its indexed state
+            indexed: Metadata of already indexed items keyed by item key
+            
+        Returns:
+            Prepared batch with documents, metadatas, ids, stale passage ids,
+            the keys of all items seen and partial statistics
+        """
+        stats = {"processed": 0, "added": 0, "updated": 0, "skipped": 0, "errors": 0}
+        indexed = indexed or {}
+        batch: Dict[str, Any] = {
+            "size": len(items),
+            "keys": [],
+            "documents": [],
+            "metadatas": [],
+            "ids": [],
+            # Passages left over from a longer, previously indexed version of an item
+            "stale_ids": [],
+            # Items being re-embedded that are already in the collection
+            "existing_keys": [],
+            "failed_keys": [],
+            # Items with no text to embed, which are never written
+            "empty_keys": [],
+            "fulltext_sources": {},
+            "keyword_documents": [],
+            "stats": stats,
+        }
         
         for item in items:
             try:
@@ -597,48 +1393,328 @@ class ZoteroSemanticSearch:
                 if not item_key:
                     stats["skipped"] += 1
                     continue
+                batch["keys"].append(item_key)
+                batch["keyword_documents"].append(self._create_keyword_document(item))
                 
-                # Check if item exists and needs update
-                if not force_rebuild and self.chroma_client.document_exists(item_key):
-                    # For now, skip existing items (could implement update logic here)
+                # Create document text and metadata
+                fulltext = item.get("data", {}).get("fulltext", "")
+                if fulltext:
+                    source = item["data"].get("fulltextSource") or "unknown"
+                    batch["fulltext_sources"][source] = batch["fulltext_sources"].get(source, 0) + 1
+                
+                # Skip items whose indexed version is current
+                if not force_rebuild and not self._needs_reindex(item, indexed.get(item_key)):
                     stats["skipped"] += 1
                     continue
                 
-                # Create document text and metadata
-                # Prefer fulltext if available, else fall back to structured fields
-                fulltext = item.get("data", {}).get("fulltext", "")
-                doc_text = fulltext if fulltext.strip() else self._create_document_text(item)
                 metadata = self._create_metadata(item)
+                passages: List[str] = []
+                if self.chunking["enabled"] and fulltext.strip():
+                    # The item document holds the metadata text; fulltext goes into passages
+                    passages = _chunk_text(fulltext, self.chunking["chunk_size"],
+                                           self.chunking["overlap"], self.chunking["max_chunks"])
+                    doc_text = self._create_document_text(item) or passages[0]
+                else:
+                    # Prefer fulltext if available, else fall back to structured fields
+                    doc_text = fulltext if fulltext.strip() else self._create_document_text(item)
                 
                 if not doc_text.strip():
                     stats["skipped"] += 1
+                    batch["empty_keys"].append(item_key)
                     continue
                 
-                documents.append(doc_text)
-                metadatas.append(metadata)
-                ids.append(item_key)
+                metadata["chunk_count"] = len(passages)
+                batch["documents"].append(doc_text)
+                batch["metadatas"].append(metadata)
+                batch["ids"].append(item_key)
+                for n, passage in enumerate(passages, 1):
+                    batch["documents"].append(passage)
+                    batch["metadatas"].append({**metadata, "chunk_index": n})
+                    batch["ids"].append(f"{item_key}#{n}")
+                
+                if item_key in indexed:
+                    batch["existing_keys"].append(item_key)
+                    previous_chunks = int(indexed[item_key].get("chunk_count", 0) or 0)
+                    batch["stale_ids"].extend(
+                        f"{item_key}#{n}" for n in range(len(passages) + 1, previous_chunks + 1)
+                    )
                 
                 stats["processed"] += 1
                 
             except Exception as e:
                 logger.error(f"Error processing item {item.get('key', 'unknown')}: {e}")
                 stats["errors"] += 1
+                if item.get("key"):
+                    batch["failed_keys"].append(item["key"])
         
-        # Add documents to ChromaDB if any
-        if documents:
+        return batch
+    
+    def _embed_item_batch(self, batch: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Embed stage: compute vectors for a prepared batch (through the embedding cache).
+        
+        When only some documents fail to embed, the items they belong to are
+        dropped from the batch and marked failed; the rest are written.
+        """
+        batch["embeddings"] = None
+        if batch["documents"]:
             try:
-                self.chroma_client.upsert_documents(documents, metadatas, ids)
-                stats["added"] += len(documents)
+                batch["embeddings"] = self.chroma_client.embed(batch["documents"])
+            except PartialEmbeddingError as e:
+                failed = {batch["ids"][i].split("#", 1)[0] for i in e.failed}
+                logger.error(f"Error embedding documents of {len(failed)} items: {e}")
+                keep = [i for i, doc_id in enumerate(batch["ids"]) if doc_id.split("#", 1)[0] not in failed]
+                for field in ("documents", "metadatas", "ids"):
+                    batch[field] = [batch[field][i] for i in keep]
+                batch["embeddings"] = [e.vectors[i] for i in keep]
+                batch["stale_ids"] = [doc_id for doc_id in batch["stale_ids"]
+                                      if doc_id.split("#", 1)[0] not in failed]
+                batch["existing_keys"] = [key for key in batch["existing_keys"] if key not in failed]
+                batch["keyword_documents"] = [doc for doc in batch["keyword_documents"]
+                                              if doc["key"] not in failed]
+                batch["stats"]["processed"] -= len(failed)
+                batch["stats"]["errors"] += len(failed)
+                batch["failed_keys"].extend(sorted(failed))
             except Exception as e:
-                logger.error(f"Error adding documents to ChromaDB: {e}")
-                stats["errors"] += len(documents)
+                logger.error(f"Error embedding documents: {e}")
+                batch["error"] = str(e)
+        return batch
+    
+    def _write_item_batch(self, batch: Dict[str, Any], writer: Optional[ChromaClient] = None) -> Dict[str, int]:
+        """Write stage: upsert an embedded batch into ChromaDB and drop stale passages."""
+        stats = batch["stats"]
+        item_keys = [doc_id for doc_id in batch["ids"] if "#" not in doc_id]
+        if not batch["documents"]:
+            self._update_keyword_index(batch["keyword_documents"], item_keys)
+            return stats
+        if batch.get("error"):
+            stats["errors"] += stats["processed"]
+            batch["failed_keys"].extend(item_keys)
+            return stats
         
+        # Add documents to ChromaDB
+        try:
+            writer = writer or self.chroma_client
+            writer.upsert_documents(batch["documents"], batch["metadatas"], batch["ids"],
+                                    embeddings=batch["embeddings"])
+            if batch["stale_ids"]:
+                writer.delete_documents(batch["stale_ids"])
+            stats["added"] += stats["processed"] - len(batch["existing_keys"])
+            stats["updated"] += len(batch["existing_keys"])
+        except Exception as e:
+            logger.error(f"Error adding documents to ChromaDB: {e}")
+            stats["errors"] += stats["processed"]
+            batch["failed_keys"].extend(item_keys)
+            return stats
+        self._update_keyword_index(batch["keyword_documents"], item_keys)
         return stats
     
+    def _create_keyword_document(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a keyword index document from an API-shaped item."""
+        data = item.get("data", {})
+        creators = data.get("creators") or []
+        return {
+            "key": item["key"],
+            "version": item.get("version"),
+            "kind": KIND_ITEM,
+            "item_type": data.get("itemType"),
+            "title": data.get("title"),
+            "creators": format_creators(creators) if creators else "",
+            "date": data.get("date"),
+            "abstract": data.get("abstractNote"),
+            "tags": "\n".join(tag.get("tag", "") for tag in data.get("tags") or []),
+            "notes": strip_html(data.get("notes") or data.get("note")),
+            "fulltext": data.get("fulltext"),
+        }
+    
+    def _update_keyword_index(self, documents: List[Dict[str, Any]], written_keys: List[str]) -> None:
+        """
+        Feed a batch of items to the keyword index.
+        
+        In local mode LocalZoteroReader.sync_keyword_index maintains the
+        index from zotero.sqlite, so only the fulltext of items just written
+        is added; otherwise every item whose version differs from the
+        indexed one is indexed as it came from the API.
+        
+        Args:
+            documents: Keyword documents of all items in the batch
+            written_keys: Keys of the items written to ChromaDB
+        """
+        if not documents:
+            return
+        index = get_keyword_index()
+        if index is None:
+            return
+        try:
+            if is_local_mode():
+                written = set(written_keys)
+                index.set_fulltext({doc["key"]: doc["fulltext"] for doc in documents
+                                    if doc["key"] in written and doc.get("fulltext")})
+                return
+            source = f"api:{library_id_for(self.zotero_client)}"
+            if index.get_meta("source") != source:
+                index.clear()
+                index.set_meta("source", source)
+            versions = index.get_versions([doc["key"] for doc in documents])
+            index.upsert(doc for doc in documents
+                         if doc["version"] is None or versions.get(doc["key"]) != str(doc["version"]))
+        except Exception as e:
+            logger.warning(f"Could not update keyword index: {e}")
+    
+    def _delete_from_keyword_index(self, item_keys: List[str]) -> None:
+        """Remove deleted items from an API-fed keyword index."""
+        if is_local_mode():
+            return
+        index = get_keyword_index()
+        if index is None:
+            return
+        try:
+            if index.get_meta("source") == f"api:{library_id_for(self.zotero_client)}":
+                index.delete(item_keys)
+        except Exception as e:
+            logger.warning(f"Could not update keyword index: {e}")
+    
+    def _retry_failed_items(self, item_keys: List[str], extract_fulltext: bool,
+                            writer: Optional[ChromaClient] = None) -> Tuple[int, List[str]]:
+        """
+        Re-fetch and re-index items that failed, a few at a time.
+        
+        Small batches keep one bad document from failing its neighbours again.
+        Items that no longer exist are dropped.
+        
+        Args:
+            item_keys: Keys of the items to retry
+            extract_fulltext: Whether to extract fulltext content from local database
+            writer: Client whose collection receives the items (default: the live one)
+            
+        Returns:
+            Tuple of (number of items indexed, keys that still failed)
+        """
+        writer = writer or self.chroma_client
+        item_keys = list(dict.fromkeys(item_keys))
+        logger.info(f"Retrying {len(item_keys)} failed items...")
+        try:
+            items = self._fetch_items_by_keys(item_keys, extract_fulltext)
+        except Exception as e:
+            logger.error(f"Could not fetch failed items for retry: {e}")
+            return 0, item_keys
+        
+        retried = 0
+        still_failed: List[str] = []
+        keys = [key for key in item_keys if key in items]
+        for i in range(0, len(keys), RETRY_BATCH_SIZE):
+            chunk = keys[i:i + RETRY_BATCH_SIZE]
+            indexed = writer.get_metadata(chunk)
+            batch = self._embed_item_batch(
+                self._prepare_item_batch([items[key] for key in chunk], True, indexed))
+            batch_stats = self._write_item_batch(batch, writer)
+            retried += batch_stats["added"] + batch_stats["updated"]
+            still_failed.extend(batch["failed_keys"])
+        return retried, still_failed
+    
+    def _fetch_items_by_keys(self, item_keys: List[str], extract_fulltext: bool) -> Dict[str, Dict[str, Any]]:
+        """Fetch specific items from the same source a full scan would use."""
+        if extract_fulltext and is_local_mode():
+            try:
+                extraction = self._load_extraction_config()
+                with LocalZoteroReader(pdf_max_pages=extraction["pdf_max_pages"],
+                                       fulltext_max_chars=self._fulltext_max_chars()) as reader:
+                    items = {}
+                    for key, local_item in reader.get_items_by_keys(item_keys).items():
+                        text = self._extract_fulltext_quietly(reader, local_item.item_id)
+                        if text:
+                            local_item.fulltext, local_item.fulltext_source = text
+                        items[key] = self._local_item_to_api(local_item, True)
+                    return items
+            except Exception as e:
+                logger.error(f"Error reading from local database: {e}")
+                logger.info("Falling back to API...")
+        
+        items = {}
+        for i in range(0, len(item_keys), MAX_KEYS_PER_REQUEST):
+            chunk = item_keys[i:i + MAX_KEYS_PER_REQUEST]
+            for item in self.zotero_client.items(itemKey=",".join(chunk), limit=len(chunk)) or []:
+                if item.get("data", {}).get("itemType") not in ["attachment", "note"]:
+                    items[item["key"]] = item
+        return items
+    
+    def _checkpoint_path(self) -> Path:
+        """Location of the checkpoint journal, next to the config file."""
+        if self.config_path:
+            return Path(self.config_path).parent / "index_checkpoint.json"
+        return Path.home() / ".config" / "zotero-mcp" / "index_checkpoint.json"
+    
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load the checkpoint journal of an interrupted update, if any."""
+        path = self._checkpoint_path()
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+    
+    def _checkpoint_keys_path(self) -> Path:
+        """Append-only list of the keys written by the checkpointed run, one per line."""
+        return self._checkpoint_path().with_suffix(".keys")
+    
+    def _load_checkpoint_keys(self) -> Set[str]:
+        """Keys of the items the interrupted run already wrote."""
+        try:
+            with open(self._checkpoint_keys_path(), 'r') as f:
+                return {line.strip() for line in f if line.strip()}
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint keys: {e}")
+            return set()
+    
+    def _append_checkpoint_keys(self, keys: List[str]) -> None:
+        """Record items as written; appending keeps each batch O(batch) rather than O(library)."""
+        if not keys:
+            return
+        try:
+            path = self._checkpoint_keys_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a') as f:
+                f.write("".join(f"{key}\n" for key in keys))
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            logger.warning(f"Could not write checkpoint keys: {e}")
+    
+    def _save_checkpoint(self, journal: Dict[str, Any]) -> None:
+        """Atomically write the checkpoint journal."""
+        path = self._checkpoint_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            journal["updated_at"] = datetime.now().isoformat()
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(journal, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write checkpoint: {e}")
+    
+    def _clear_checkpoint(self) -> None:
+        """Remove the checkpoint journal after a complete run."""
+        for path in (self._checkpoint_path(), self._checkpoint_keys_path()):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not remove checkpoint: {e}")
+    
+    @_with_zotero_client
     def search(self, 
                query: str, 
                limit: int = 10,
-               filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+               filters: Optional[Dict[str, Any]] = None,
+               mode: Optional[str] = None,
+               rerank: Optional[bool] = None) -> Dict[str, Any]:
         """
         Perform semantic search over the Zotero library.
         
@@ -646,42 +1722,315 @@ class ZoteroSemanticSearch:
             query: Search query text
             limit: Maximum number of results to return
             filters: Optional metadata filters
+            mode: 'vector' (embeddings), 'keyword' (BM25 over the keyword
+                index) or 'hybrid' (both, fused with reciprocal rank fusion);
+                default from the semantic_search.hybrid config section
+            rerank: Rerank over-fetched candidates with the cross-encoder;
+                default from the semantic_search.rerank config section
             
         Returns:
-            Search results with Zotero item details
+            Search results with Zotero item details and per-stage timings
         """
+        mode = mode or self.hybrid["mode"]
+        rerank = self.rerank["enabled"] if rerank is None else rerank
+        response: Dict[str, Any] = {
+            "query": query,
+            "limit": limit,
+            "filters": filters,
+            "mode": mode,
+            "results": [],
+            "total_found": 0,
+            "timings": {},
+        }
+        if mode not in SEARCH_MODES:
+            response["error"] = f"Unknown search mode '{mode}' (expected one of: {', '.join(SEARCH_MODES)})"
+            return response
+        timings = response["timings"]
+        
         try:
-            # Perform semantic search
-            results = self.chroma_client.search(
-                query_texts=[query],
-                n_results=limit,
-                where=filters
-            )
+            # Reranking needs a deeper candidate pool than it returns
+            pool = limit * max(1, int(self.rerank["overfetch"])) if rerank else limit
+            # Hybrid mode fuses deeper candidate lists than it returns
+            depth = pool if mode != "hybrid" else max(pool, int(self.hybrid["candidates"]))
+            vector_results = keyword_results = None
+            
+            if mode in ("vector", "hybrid"):
+                started = time.perf_counter()
+                vector_results = self._vector_search(query, depth, filters)
+                timings["vector_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            
+            if mode in ("keyword", "hybrid"):
+                started = time.perf_counter()
+                keyword_results = self._keyword_search(query, depth, filters)
+                timings["keyword_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                if keyword_results is None:
+                    if mode == "keyword":
+                        raise RuntimeError("Keyword index unavailable or still building; "
+                                           "run update-db or use local mode")
+                    response["warning"] = "Keyword index unavailable or still building; showing vector results only"
+            
+            if mode == "vector":
+                results = vector_results
+            elif mode == "keyword":
+                results = keyword_results
+            else:
+                started = time.perf_counter()
+                results = self._fuse_results([
+                    ("vector", vector_results, float(self.hybrid["vector_weight"])),
+                    ("keyword", keyword_results, float(self.hybrid["keyword_weight"])),
+                ], pool)
+                timings["fusion_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            
+            if rerank:
+                started = time.perf_counter()
+                results, response["rerank"] = self._rerank_results(query, results, limit)
+                timings["rerank_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            results = self._truncate_results(results, limit)
             
             # Enrich results with full Zotero item data
+            started = time.perf_counter()
             enriched_results = self._enrich_search_results(results, query)
+            timings["enrich_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            for result, ranks in zip(enriched_results, (results.get("ranks") or [[]])[0]):
+                result["ranks"] = ranks
+            for result, score in zip(enriched_results, (results.get("rerank_scores") or [[]])[0]):
+                result["rerank_score"] = score
             
-            return {
-                "query": query,
-                "limit": limit,
-                "filters": filters,
-                "results": enriched_results,
-                "total_found": len(enriched_results)
-            }
+            response["results"] = enriched_results
+            response["total_found"] = len(enriched_results)
+            return response
             
         except Exception as e:
             logger.error(f"Error performing semantic search: {e}")
-            return {
-                "query": query,
-                "limit": limit,
-                "filters": filters,
-                "results": [],
-                "total_found": 0,
-                "error": str(e)
-            }
+            response["error"] = str(e)
+            return response
+    
+    def _vector_search(self, query: str, limit: int, filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Query ChromaDB and collapse passage hits to at most `limit` items."""
+        # Over-fetch so items matched by several passages still fill `limit` results
+        n_results = limit
+        if self.chunking["enabled"]:
+            n_results = limit * max(1, int(self.chunking["overfetch"]))
+        
+        results = self.chroma_client.search(
+            query_texts=[query],
+            n_results=n_results,
+            where=filters
+        )
+        return self._aggregate_passage_hits(results, limit)
+    
+    def _keyword_search(self, query: str, limit: int,
+                        filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Rank items with the BM25 keyword index.
+        
+        In local mode the index kept in sync with zotero.sqlite by a
+        background job is used; otherwise the index filled by
+        update_database. Metadata filters are evaluated by ChromaDB on the
+        matching items.
+        
+        Returns:
+            ChromaDB-shaped results (similarity = BM25 score, document =
+            highlighted snippet), or None when no keyword index is available
+            or it is still being built
+        """
+        # Filters are applied after ranking, so look further down the list
+        depth = limit * 3 if filters else limit
+        hits = None
+        if is_local_mode():
+            hits = search_local_keyword_index(query, depth, kinds=(KIND_ITEM,))
+        if hits is None:
+            index = get_keyword_index()
+            if index is None or index.get_meta("source") != f"api:{library_id_for(self.zotero_client)}":
+                return None
+            hits = index.search(query, depth, kinds=(KIND_ITEM,))
+        
+        metadata = self.chroma_client.get_metadata([hit["key"] for hit in hits], where=filters)
+        if filters:
+            hits = [hit for hit in hits if hit["key"] in metadata]
+        hits = hits[:limit]
+        return {
+            "ids": [[hit["key"] for hit in hits]],
+            "distances": [[1 - hit["score"] for hit in hits]],
+            "documents": [[hit["snippet"] or "" for hit in hits]],
+            "metadatas": [[metadata.get(hit["key"], {}) for hit in hits]],
+        }
+    
+    def _rerank_results(self, query: str, results: Dict[str, Any],
+                        limit: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Reorder candidates by cross-encoder relevance within the latency budget.
+        
+        Each candidate is scored on its title plus matched passage. Reranking
+        is skipped, leaving the retrieval order, when the model is not loaded
+        within the budget, when the expected scoring time exceeds what is
+        left of it, or when scoring overruns it.
+        
+        Args:
+            query: Search query
+            results: ChromaDB-shaped candidates in retrieval order
+            limit: Number of results that will be returned
+            
+        Returns:
+            Tuple of (results, reranked when applied and with a parallel
+            `rerank_scores` entry; report with applied, reason and candidates)
+        """
+        ids = (results.get("ids") or [[]])[0]
+        report: Dict[str, Any] = {"applied": False, "candidates": len(ids), "reason": None}
+        if len(ids) < 2:
+            report["reason"] = "too few candidates"
+            return results, report
+        
+        reranker = get_reranker(self.rerank["model"], batch_size=self.rerank["batch_size"],
+                                max_chars=self.rerank["max_chars"])
+        budget_ms = float(self.rerank["budget_ms"])
+        started = time.perf_counter()
+        deadline = started + budget_ms / 1000 if budget_ms > 0 else None
+        
+        if not reranker.wait_ready(max(0.0, deadline - started) if deadline else None):
+            report["reason"] = reranker.load_error or "model still loading"
+            return results, report
+        
+        estimate = reranker.estimate_ms(len(ids))
+        remaining_ms = (deadline - time.perf_counter()) * 1000 if deadline else None
+        if estimate is not None and remaining_ms is not None and estimate > remaining_ms:
+            report["reason"] = f"estimated {estimate:.0f} ms exceeds the budget"
+            return results, report
+        
+        documents = (results.get("documents") or [[]])[0]
+        metadatas = (results.get("metadatas") or [[]])[0]
+        passages = []
+        for i in range(len(ids)):
+            title = ((metadatas[i] if i < len(metadatas) else None) or {}).get("title") or ""
+            document = (documents[i] if i < len(documents) else None) or ""
+            passages.append(f"{title}\n{document}".strip())
+        
+        scores = reranker.score(query, passages, deadline=deadline)
+        if scores is None:
+            report["reason"] = reranker.load_error or "scoring exceeded the budget"
+            return results, report
+        
+        order = sorted(range(len(ids)), key=lambda i: scores[i], reverse=True)
+        reranked = {
+            name: [[values[0][i] for i in order if i < len(values[0])]]
+            for name, values in results.items()
+            if isinstance(values, list) and values and isinstance(values[0], list)
+        }
+        reranked["rerank_scores"] = [[scores[i] for i in order]]
+        report["applied"] = True
+        return reranked, report
+    
+    @staticmethod
+    def _truncate_results(results: Dict[str, Any], limit: int) -> Dict[str, Any]:
+        """Keep the first `limit` entries of every per-result list in ChromaDB-shaped results."""
+        return {
+            name: [values[0][:limit]] if isinstance(values, list) and values and isinstance(values[0], list) else values
+            for name, values in results.items()
+        }
+    
+    def _fuse_results(self, ranked: List[Tuple[str, Optional[Dict[str, Any]], float]],
+                      limit: int) -> Dict[str, Any]:
+        """
+        Merge ranked result lists with weighted reciprocal rank fusion.
+        
+        Each item scores sum(weight / (rrf_k + rank)) over the lists it
+        appears in; the first list supplying an item provides its document
+        and metadata.
+        
+        Args:
+            ranked: (name, ChromaDB-shaped results or None, weight) per retriever
+            limit: Maximum number of items to keep
+            
+        Returns:
+            ChromaDB-shaped results (similarity = fused score) with an extra
+            `ranks` entry giving each item's rank per retriever
+        """
+        k = float(self.hybrid["rrf_k"])
+        fused: Dict[str, Dict[str, Any]] = {}
+        for name, results, weight in ranked:
+            if not results or not results.get("ids") or not results["ids"][0]:
+                continue
+            documents = results.get("documents", [[]])[0]
+            metadatas = results.get("metadatas", [[]])[0]
+            for rank, key in enumerate(results["ids"][0], 1):
+                entry = fused.setdefault(key, {"score": 0.0, "ranks": {}, "document": "", "metadata": {}})
+                entry["score"] += weight / (k + rank)
+                entry["ranks"][name] = rank
+                if not entry["document"] and rank <= len(documents):
+                    entry["document"] = documents[rank - 1] or ""
+                if not entry["metadata"] and rank <= len(metadatas):
+                    entry["metadata"] = metadatas[rank - 1] or {}
+        
+        best = sorted(fused.items(), key=lambda kv: kv[1]["score"], reverse=True)[:limit]
+        return {
+            "ids": [[key for key, _ in best]],
+            "distances": [[1 - entry["score"] for _, entry in best]],
+            "documents": [[entry["document"] for _, entry in best]],
+            "metadatas": [[entry["metadata"] for _, entry in best]],
+            "ranks": [[entry["ranks"] for _, entry in best]],
+        }
+    
+    def _aggregate_passage_hits(self, chroma_results: Dict[str, Any], limit: int) -> Dict[str, Any]:
+        """
+        Collapse passage hits (`<item_key>#<n>`) into one hit per item.
+        
+        Items are scored by their best hit ('max' aggregation) or by the sum
+        of the similarities of all their hits ('sum'). The best-matching
+        passage becomes the item's document, so it is shown as the snippet.
+        
+        Args:
+            chroma_results: Raw ChromaDB query results
+            limit: Maximum number of items to keep
+            
+        Returns:
+            ChromaDB-shaped results with one entry per item, best first
+        """
+        if not chroma_results.get("ids") or not chroma_results["ids"][0]:
+            return chroma_results
+        
+        ids = chroma_results["ids"][0]
+        distances = chroma_results.get("distances", [[]])[0]
+        documents = chroma_results.get("documents", [[]])[0]
+        metadatas = chroma_results.get("metadatas", [[]])[0]
+        use_sum = self.chunking["aggregation"] == "sum"
+        
+        hits: Dict[str, Dict[str, Any]] = {}
+        for i, doc_id in enumerate(ids):
+            metadata = (metadatas[i] if i < len(metadatas) else None) or {}
+            item_key = metadata.get("item_key") or doc_id.split("#", 1)[0]
+            similarity = 1 - distances[i] if i < len(distances) else 0
+            hit = hits.get(item_key)
+            if hit is None:
+                hit = hits[item_key] = {"score": 0.0 if use_sum else similarity, "best": similarity,
+                                        "document": documents[i] if i < len(documents) else "",
+                                        "metadata": metadata}
+            elif similarity > hit["best"]:
+                hit["best"] = similarity
+                hit["document"] = documents[i] if i < len(documents) else ""
+            hit["score"] = hit["score"] + similarity if use_sum else max(hit["score"], similarity)
+            if "chunk_index" in hit["metadata"] and "chunk_index" not in metadata:
+                # Prefer the item document's metadata over a passage's copy
+                hit["metadata"] = metadata
+        
+        ranked = sorted(hits.items(), key=lambda kv: kv[1]["score"], reverse=True)[:limit]
+        return {
+            "ids": [[item_key for item_key, _ in ranked]],
+            "distances": [[1 - hit["score"] for _, hit in ranked]],
+            "documents": [[hit["document"] for _, hit in ranked]],
+            "metadatas": [[{k: v for k, v in hit["metadata"].items() if k != "chunk_index"}
+                           for _, hit in ranked]],
+        }
     
     def _enrich_search_results(self, chroma_results: Dict[str, Any], query: str) -> List[Dict[str, Any]]:
-        """Enrich ChromaDB results with full Zotero item data."""
+        """
+        Enrich ChromaDB results with full Zotero item data.
+        
+        All hits are resolved together: from Chroma metadata alone when the
+        configured enrichment mode is 'metadata', from the local SQLite
+        database in local mode, otherwise through the item cache with
+        multi-key API requests. Hits that cannot be resolved fall back to
+        an item rebuilt from their Chroma metadata.
+        """
         enriched = []
         
         if not chroma_results.get("ids") or not chroma_results["ids"][0]:
@@ -692,35 +2041,102 @@ class ZoteroSemanticSearch:
         documents = chroma_results.get("documents", [[]])[0]
         metadatas = chroma_results.get("metadatas", [[]])[0]
         
+        zotero_items, fetch_error = self._fetch_items_for_results(ids, metadatas)
+        
         for i, item_key in enumerate(ids):
+            metadata = (metadatas[i] if i < len(metadatas) else None) or {}
+            result = {
+                "item_key": item_key,
+                "similarity_score": 1 - distances[i] if i < len(distances) else 0,
+                "matched_text": documents[i] if i < len(documents) else "",
+                "metadata": metadata,
+                "query": query
+            }
+            
+            zotero_item = zotero_items.get(item_key.upper())
+            if zotero_item is None and metadata:
+                zotero_item = self._item_from_metadata(item_key, metadata)
+            
+            if zotero_item is not None:
+                result["zotero_item"] = zotero_item
+            else:
+                # Include basic result even if enrichment fails
+                result["error"] = f"Could not fetch full item data: {fetch_error or 'item not found'}"
+            
+            enriched.append(result)
+        
+        return enriched
+    
+    def _fetch_items_for_results(self,
+                                 item_keys: List[str],
+                                 metadatas: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+        """
+        Resolve search hits to Zotero items in one batch.
+        
+        Args:
+            item_keys: Item keys returned by ChromaDB
+            metadatas: ChromaDB metadata for the same hits
+            
+        Returns:
+            Tuple of (items keyed by upper-case item key, error message or None)
+        """
+        if self.enrichment_mode == "metadata":
+            return {}, None
+        
+        if is_local_mode():
             try:
-                # Get full item data from Zotero
-                zotero_item = self.zotero_client.item(item_key)
-                
-                enriched_result = {
-                    "item_key": item_key,
-                    "similarity_score": 1 - distances[i] if i < len(distances) else 0,
-                    "matched_text": documents[i] if i < len(documents) else "",
-                    "metadata": metadatas[i] if i < len(metadatas) else {},
-                    "zotero_item": zotero_item,
-                    "query": query
+                with LocalZoteroReader() as reader:
+                    local_items = reader.get_items_by_keys(list(item_keys))
+                metadata_by_key = {
+                    key: (metadatas[i] if i < len(metadatas) else None) or {}
+                    for i, key in enumerate(item_keys)
                 }
-                
-                enriched.append(enriched_result)
-                
+                items = {}
+                for key, local_item in local_items.items():
+                    api_item = self._local_item_to_api(local_item)
+                    # The local reader does not load date or publication; take them from Chroma
+                    from_metadata = self._item_from_metadata(key, metadata_by_key.get(key, {}))["data"]
+                    for field, value in from_metadata.items():
+                        if value and not api_item["data"].get(field):
+                            api_item["data"][field] = value
+                    items[key.upper()] = api_item
+                return items, None
             except Exception as e:
-                logger.error(f"Error enriching result for item {item_key}: {e}")
-                # Include basic result even if enrichment fails
-                enriched.append({
-                    "item_key": item_key,
-                    "similarity_score": 1 - distances[i] if i < len(distances) else 0,
-                    "matched_text": documents[i] if i < len(documents) else "",
-                    "metadata": metadatas[i] if i < len(metadatas) else {},
-                    "query": query,
-                    "error": f"Could not fetch full item data: {e}"
-                })
+                logger.warning(f"Local database enrichment failed, using API: {e}")
         
-        return enriched
+        try:
+            return get_cached_items(self.zotero_client, list(item_keys)), None
+        except Exception as e:
+            logger.error(f"Error enriching search results: {e}")
+            return {}, str(e)
+    
+    def _item_from_metadata(self, item_key: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build a minimal API-shaped item from the metadata stored in ChromaDB.
+        
+        Args:
+            item_key: Zotero item key
+            metadata: ChromaDB metadata created by _create_metadata
+            
+        Returns:
+            Item dictionary with the fields used to render search results
+        """
+        return {
+            "key": item_key,
+            "data": {
+                "key": item_key,
+                "itemType": metadata.get("item_type", ""),
+                "title": metadata.get("title", ""),
+                "date": metadata.get("date", ""),
+                "dateAdded": metadata.get("date_added", ""),
+                "dateModified": metadata.get("date_modified", ""),
+                "creators": self._parse_creators_string(metadata.get("creators", "")),
+                "publicationTitle": metadata.get("publication", ""),
+                "url": metadata.get("url", ""),
+                "DOI": metadata.get("doi", ""),
+                "tags": [{"tag": tag} for tag in (metadata.get("tags") or "").split()],
+            }
+        }
     
     def get_database_status(self) -> Dict[str, Any]:
         """Get status information about the semantic search database."""
@@ -731,12 +2147,14 @@ class ZoteroSemanticSearch:
             "update_config": self.update_config,
             "should_update": self.should_update_database(),
             "last_update": self.update_config.get("last_update"),
+            # An interrupted force rebuild, resumable with resume=True
+            "pending_rebuild": self.chroma_client.has_pending_rebuild(),
         }
     
     def delete_item(self, item_key: str) -> bool:
         """Delete an item from the semantic search database."""
         try:
-            self.chroma_client.delete_documents([item_key])
+            self.chroma_client.delete_items([item_key])
             return True
         except Exception as e:
             logger.error(f"Error deleting item {item_key}: {e}")
@@ -753,4 +2171,162 @@ def create_semantic_search(config_path: Optional[str] = None) -> ZoteroSemanticS
     Returns:
         Configured ZoteroSemanticSearch instance
     """
-    return ZoteroSemanticSearch(config_path=config_path)
\ No newline at end of file
+    return ZoteroSemanticSearch(config_path=config_path)
+
+
+def _normalize_timestamp(value: Optional[str]) -> str:
+    """Normalize API and SQLite timestamps to a comparable form."""
+    return (value or "").replace("T", " ").rstrip("Z")
+
+
+def _chunk_text(text: str, chunk_size: int, overlap: int, max_chunks: int) -> List[str]:
+    """
+    Split text into overlapping passages of about `chunk_size` characters.
+    
+    Passage ends are moved back to the nearest whitespace so words are not
+    cut, and at most `max_chunks` passages are returned.
+    """
+    text = " ".join(text.split())
+    passages: List[str] = []
+    start = 0
+    while start < len(text) and len(passages) < max_chunks:
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            space = text.rfind(" ", start + chunk_size // 2, end)
+            if space != -1:
+                end = space
+        passages.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+        # Start the next passage on a word boundary
+        if text[start - 1] != " ":
+            space = text.find(" ", start, end)
+            if space != -1:
+                start = space + 1
+    return [p for p in passages if p]
+
+
+# Retrieval modes of ZoteroSemanticSearch.search
+SEARCH_MODES = ("vector", "keyword", "hybrid")
+
+# Items per batch when retrying failed items
+RETRY_BATCH_SIZE = 5
+
+# Batches buffered between two pipeline stages
+PIPELINE_QUEUE_SIZE = 2
+
+_STAGE_DONE = object()
+
+
+def _threaded_map(func: Callable[[Any], Any], source: Iterator[Any], name: str,
+                  maxsize: int = PIPELINE_QUEUE_SIZE) -> Iterator[Any]:
+    """
+    Apply `func` to each element of `source` in a background thread.
+    
+    Results are handed over through a queue of at most `maxsize` entries, so
+    a slow consumer throttles the stage instead of letting it run ahead.
+    Exceptions raised by the stage are re-raised in the consumer. Closing
+    the returned generator stops the stage and closes `source`.
+    """
+    results: "queue.Queue[Tuple[bool, Any]]" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    
+    def put(entry: Tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def run() -> None:
+        try:
+            for element in source:
+                if not put((True, func(element))):
+                    return
+            put((True, _STAGE_DONE))
+        except BaseException as e:
+            put((False, e))
+        finally:
+            close = getattr(source, "close", None)
+            if callable(close):
+                close()
+    
+    worker = threading.Thread(target=run, name=f"zotero-index-{name}", daemon=True)
+    worker.start()
+    try:
+        while True:
+            ok, value = results.get()
+            if not ok:
+                raise value
+            if value is _STAGE_DONE:
+                return
+            yield value
+    finally:
+        stop.set()
+
+
+def _close_quietly(stream: Iterator[Any]) -> None:
+    """Close a generator, unless another thread is running it (that thread then closes it)."""
+    close = getattr(stream, "close", None)
+    if callable(close):
+        try:
+            close()
+        except ValueError:
+            pass
+
+
+def _iter_batches(items: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group an item stream into lists of at most `size` items; closing this closes `items`."""
+    try:
+        while batch := list(islice(items, size)):
+            yield batch
+    finally:
+        _close_quietly(items)
+
+
+def _get_mtime(path: Optional[str]) -> Optional[float]:
+    """Return the modification time of a file, or None if it does not exist."""
+    try:
+        return os.path.getmtime(path) if path else None
+    except OSError:
+        return None
+
+
+_shared_search: Optional[ZoteroSemanticSearch] = None
+_shared_search_lock = threading.Lock()
+
+
+def get_semantic_search(config_path: Optional[str] = None) -> ZoteroSemanticSearch:
+    """
+    Get the process-wide ZoteroSemanticSearch instance.
+    
+    The instance (and its ChromaDB client and embedding model) is reused
+    across calls and rebuilt only when the config path changes or the
+    config file's modification time differs from the one it was built from.
+    
+    Args:
+        config_path: Path to configuration file
+        
+    Returns:
+        Shared ZoteroSemanticSearch instance
+    """
+    global _shared_search
+    with _shared_search_lock:
+        search = _shared_search
+        if (search is None
+                or search.config_path != config_path
+                or search.config_mtime != _get_mtime(config_path)):
+            if search is not None:
+                logger.info("Semantic search configuration changed, reloading...")
+            _shared_search = create_semantic_search(config_path)
+        return _shared_search
+
+
+def reset_semantic_search() -> None:
+    """Discard the process-wide ZoteroSemanticSearch instance."""
+    global _shared_search
+    with _shared_search_lock:
+        _shared_search = None
@@ -8,6 +8,7 @@ import os
 import sys
 import uuid
 import tempfile
+import time
 import asyncio
 import json
 from contextlib import asynccontextmanager
@@ -35,13 +36,32 @@ logging.info("Zotero MCP server script started.")
 
 from zotero_mcp.client import (
     AttachmentDetails,
+    close_client_registry,
     convert_to_markdown,
     format_item_metadata,
     generate_bibtex,
     get_attachment_details,
-    get_zotero_client,
+    get_client_registry,
+    init_client_registry,
+    zotero_client,
 )
-from zotero_mcp.utils import format_creators
+from zotero_mcp.embedding_cache import close_embedding_cache, get_embedding_cache
+from zotero_mcp.fulltext_cache import close_fulltext_cache, get_fulltext_cache
+from zotero_mcp.keyword_index import (
+    KIND_ANNOTATION,
+    KIND_ITEM,
+    KIND_NOTE,
+    TITLE_CREATOR_YEAR_COLUMNS,
+    close_keyword_index,
+    get_keyword_index,
+)
+from zotero_mcp.item_cache import close_item_cache, get_cached_item, get_item_cache
+from zotero_mcp.jobs import Job, close_job_manager, get_job_manager
+from zotero_mcp.local_api import close_local_libraries
+from zotero_mcp.local_db import search_local_keyword_index, start_keyword_index_sync
+from zotero_mcp.reranker import close_rerankers
+from zotero_mcp.tool_executor import close_tool_executor, get_tool_executor, offloaded
+from zotero_mcp.utils import format_creators, is_local_mode
 
 
 @asynccontextmanager
@@ -50,40 +70,89 @@ async def server_lifespan(server: FastMCP):
     logging.info("Server lifespan starting...")
     sys.stderr.write("Starting Zotero MCP server...\n")
     
-    # Check for semantic search auto-update on startup
+    # Create the shared, pooled Zotero client registry
+    client_registry = None
+    try:
+        client_registry = init_client_registry()
+        logging.info(f"Zotero client pool ready (pool size: {client_registry.pool_size})")
+    except Exception as e:
+        sys.stderr.write(f"Warning: Could not initialize Zotero client pool: {e}\n")
+        logging.warning(f"Could not initialize Zotero client pool: {e}")
+    
+    # Bring the local keyword index up to date in the background; until the
+    # first build completes, searches use the API or vector results
+    if is_local_mode():
+        try:
+            job = start_keyword_index_sync()
+            logging.info(f"Keyword index sync running as job {job.job_id}")
+        except Exception as e:
+            logging.warning(f"Could not start keyword index sync: {e}")
+    
+    # Build the shared semantic search engine once and check for auto-update on startup
+    warm_up_task = None
     try:
-        from zotero_mcp.semantic_search import create_semantic_search
+        from zotero_mcp.semantic_search import get_semantic_search
         
         config_path = Path.home() / ".config" / "zotero-mcp" / "config.json"
         
         if config_path.exists():
-            search = create_semantic_search(str(config_path))
+            search = get_semantic_search(str(config_path))
+            
+            # Load the embedding model in the background so the first query is fast
+            async def warm_up():
+                try:
+                    await asyncio.to_thread(search.warm_up)
+                except Exception as e:
+                    logging.warning(f"Semantic search warm-up failed: {e}")
+            
+            warm_up_task = asyncio.create_task(warm_up())
             
             if search.should_update_database():
                 sys.stderr.write("Auto-updating semantic search database...\n")
                 logging.info("Auto-updating semantic search database...")
                 
-                # Run update in background to avoid blocking server startup
-                async def background_update():
-                    try:
-                        stats = search.update_database(extract_fulltext=False)
-                        sys.stderr.write(f"Database update completed: {stats.get('processed_items', 0)} items processed\n")
-                        logging.info(f"Database update completed: {stats.get('processed_items', 0)} items processed")
-                    except Exception as e:
-                        sys.stderr.write(f"Background database update failed: {e}\n")
-                        logging.error(f"Background database update failed: {e}")
-                
-                # Start background task
-                asyncio.create_task(background_update())
+                # Run the update as a background job so it never blocks the event loop
+                job = _start_index_job(search, extract_fulltext=False)
+                sys.stderr.write(f"Database update running as job {job.job_id}\n")
+                logging.info(f"Database update running as job {job.job_id}")
     
     except Exception as e:
         sys.stderr.write(f"Warning: Could not check semantic search auto-update: {e}\n")
         logging.warning(f"Could not check semantic search auto-update: {e}")
     
-    yield {}
-    
-    logging.info("Server lifespan shutting down...")
-    sys.stderr.write("Shutting down Zotero MCP server...\n")
+    try:
+        yield {"client_registry": client_registry}
+    finally:
+        logging.info("Server lifespan shutting down...")
+        sys.stderr.write("Shutting down Zotero MCP server...\n")
+        if client_registry is not None:
+            logging.info(f"Zotero client pool stats: {client_registry.get_stats()}")
+        # The model load thread itself runs to completion; only the task waiting on it stops
+        if warm_up_task is not None and not warm_up_task.done():
+            warm_up_task.cancel()
+            try:
+                await warm_up_task
+            except asyncio.CancelledError:
+                pass
+        # Stop index builds before the caches and clients they use go away.
+        # A job that outlived the timeout keeps using them, so leave them open
+        # and let process exit release them.
+        if close_job_manager():
+            close_client_registry()
+            close_local_libraries()
+            close_item_cache()
+            close_fulltext_cache()
+            close_embedding_cache()
+            close_keyword_index()
+            try:
+                from zotero_mcp.semantic_search import reset_semantic_search
+                reset_semantic_search()
+            except Exception:
+                pass
+        else:
+            logging.warning("Background jobs still running; leaving caches and clients open")
+        close_rerankers()
+        close_tool_executor()
 
 
 # Create an MCP server with appropriate dependencies
@@ -94,11 +163,143 @@ mcp = FastMCP(
 )
 logging.info("FastMCP instance created.")
 
+# Kind of the background jobs that build the semantic search index
+INDEX_JOB = "index"
+
+# Seconds between progress reports while a tool follows a job
+JOB_PROGRESS_INTERVAL = 1.0
+
+
+def _parse_item_type_filter(item_type: Optional[str]) -> tuple[List[str], List[str]]:
+    """Split an API itemType condition like "book || journalArticle" or "-attachment" into (include, exclude)."""
+    include: List[str] = []
+    exclude: List[str] = []
+    for part in (item_type or "").replace("&&", "||").split("||"):
+        part = part.strip()
+        if part.startswith("-"):
+            exclude.append(part[1:].strip())
+        elif part:
+            include.append(part)
+    return include, exclude
+
+
+def _tags_match(tags: List[str], conditions: List[str]) -> bool:
+    """Apply API tag conditions: all must hold, each may use `||` and `-`."""
+    tag_set = set(tags)
+    for condition in conditions:
+        alternatives = [alt.strip() for alt in condition.split("||") if alt.strip()]
+        if not any(
+            alt[1:] not in tag_set if alt.startswith("-") else alt in tag_set
+            for alt in alternatives
+        ):
+            return False
+    return True
+
+
+def _search_items_locally(
+    query: str,
+    qmode: str,
+    item_type: str,
+    limit: Optional[int],
+    tag: List[str],
+    tag_condition_str: str,
+) -> Optional[str]:
+    """
+    Search items with the local keyword index.
+    
+    Returns:
+        Markdown-formatted results, or None when not in local mode or the
+        index cannot be used (the caller then queries the API)
+    """
+    if not is_local_mode():
+        return None
+    limit = limit or 10
+    include, exclude = _parse_item_type_filter(item_type)
+    try:
+        hits = search_local_keyword_index(
+            query,
+            # Tag conditions are applied afterwards, so look further down the ranking
+            limit * 5 if tag else limit,
+            kinds=(KIND_ITEM,),
+            columns=TITLE_CREATOR_YEAR_COLUMNS if qmode == "titleCreatorYear" else None,
+            item_types=include,
+            exclude_item_types=exclude,
+        )
+    except Exception as e:
+        logging.warning(f"Local keyword search failed, using the API: {e}")
+        return None
+    if hits is None:
+        return None
+    if tag:
+        hits = [hit for hit in hits if _tags_match(hit["tags"], tag)]
+    hits = hits[:limit]
+    if not hits:
+        logging.warning(f"No items found matching query: '{query}'{tag_condition_str}")
+        return f"No items found matching query: '{query}'{tag_condition_str}"
+    
+    output = [f"# Search Results for '{query}'", f"{tag_condition_str}", ""]
+    for i, hit in enumerate(hits, 1):
+        output.append(f"## {i}. {hit['title'] or 'Untitled'}")
+        output.append(f"**Type:** {hit['item_type'] or 'unknown'}")
+        output.append(f"**Item Key:** {hit['key']}")
+        output.append(f"**Date:** {hit['date'] or 'No date'}")
+        output.append(f"**Authors:** {hit['creators'] or 'No authors listed'}")
+        if abstract := hit["abstract"]:
+            abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
+            output.append(f"**Abstract:** {abstract_snippet}")
+        if hit["snippet"]:
+            output.append(f"**Match:** {hit['snippet']}")
+        if hit["tags"]:
+            output.append(f"**Tags:** {' '.join(f'`{t}`' for t in hit['tags'])}")
+        output.append("")
+    return "\n".join(output)
+
+
+def _search_notes_locally(query: str, limit: Optional[int]) -> Optional[str]:
+    """
+    Search notes and annotations with the local keyword index.
+    
+    Returns:
+        Markdown-formatted results, or None when not in local mode or the
+        index cannot be used (the caller then queries the API)
+    """
+    if not is_local_mode():
+        return None
+    try:
+        hits = search_local_keyword_index(query, limit or 20, kinds=(KIND_NOTE, KIND_ANNOTATION))
+    except Exception as e:
+        logging.warning(f"Local keyword search failed, using the API: {e}")
+        return None
+    if hits is None:
+        return None
+    if not hits:
+        return f"No results found for '{query}'"
+    
+    index = get_keyword_index()
+    parent_titles = index.get_titles(hit["parent_key"] for hit in hits if hit["parent_key"]) if index else {}
+    output = [f"# Search Results for '{query}'", ""]
+    for i, hit in enumerate(hits, 1):
+        parent_info = ""
+        if parent_key := hit["parent_key"]:
+            if parent_titles.get(parent_key):
+                parent_info = f" (from \"{parent_titles[parent_key]}\")"
+            else:
+                parent_info = f" (parent key: {parent_key})"
+        label = "Annotation" if hit["kind"] == KIND_ANNOTATION else "Note"
+        output.append(f"## {label} {i}{parent_info}")
+        output.append(f"**Key:** {hit['key']}")
+        if hit["tags"]:
+            output.append(f"**Tags:** {' '.join(f'`{t}`' for t in hit['tags'])}")
+        output.append(f"**Content:**\n{hit['snippet']}")
+        output.append("")
+    return "\n".join(output)
+
 
 @mcp.tool(
     name="zotero_search_items",
     description="Search for items in your Zotero library, given a query string."
 )
+@offloaded("zotero_search_items")
 def search_items(
     query: str,
     qmode: Literal["titleCreatorYear", "everything"] = "titleCreatorYear",
@@ -136,55 +337,60 @@ def search_items(
 
         ctx.info(f"Searching Zotero for '{query}'{tag_condition_str}")
         logging.info(f"Searching Zotero for '{query}'{tag_condition_str}")
-        zot = get_zotero_client()
-        
         if isinstance(limit, str):
             limit = int(limit)
         
-        # Search using the query parameters
-        zot.add_parameters(q=query, qmode=qmode, itemType=item_type, limit=limit, tag=tag)
-        results = zot.items()
+        # In local mode, answer from the keyword index without the HTTP server
+        local_output = _search_items_locally(query, qmode, item_type, limit, tag, tag_condition_str)
+        if local_output is not None:
+            return local_output
+        
+        with zotero_client() as zot:
+        
+            # Search using the query parameters
+            zot.add_parameters(q=query, qmode=qmode, itemType=item_type, limit=limit, tag=tag)
+            results = zot.items()
 
-        if not results:
-            logging.warning(f"No items found matching query: '{query}'{tag_condition_str}")
-            return f"No items found matching query: '{query}'{tag_condition_str}"
+            if not results:
+                logging.warning(f"No items found matching query: '{query}'{tag_condition_str}")
+                return f"No items found matching query: '{query}'{tag_condition_str}"
         
-        # Format results as markdown
-        output = [f"# Search Results for '{query}'", f"{tag_condition_str}", ""]
-        
-        for i, item in enumerate(results, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-            
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-            
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-            
-            # Add abstract snippet if present
-            if abstract := data.get("abstractNote"):
-                # Limit abstract length for search results
-                abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
-                output.append(f"**Abstract:** {abstract_snippet}")
-            
-            # Add tags if present
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
-            
-            output.append("")  # Empty line between items
+            # Format results as markdown
+            output = [f"# Search Results for '{query}'", f"{tag_condition_str}", ""]
         
-        return "\n".join(output)
+            for i, item in enumerate(results, 1):
+                data = item.get("data", {})
+                title = data.get("title", "Untitled")
+                item_type = data.get("itemType", "unknown")
+                date = data.get("date", "No date")
+                key = item.get("key", "")
+            
+                # Format creators
+                creators = data.get("creators", [])
+                creators_str = format_creators(creators)
+            
+                # Build the formatted entry
+                output.append(f"## {i}. {title}")
+                output.append(f"**Type:** {item_type}")
+                output.append(f"**Item Key:** {key}")
+                output.append(f"**Date:** {date}")
+                output.append(f"**Authors:** {creators_str}")
+            
+                # Add abstract snippet if present
+                if abstract := data.get("abstractNote"):
+                    # Limit abstract length for search results
+                    abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
+                    output.append(f"**Abstract:** {abstract_snippet}")
+            
+                # Add tags if present
+                if tags := data.get("tags"):
+                    tag_list = [f"`{tag['tag']}`" for tag in tags]
+                    if tag_list:
+                        output.append(f"**Tags:** {' '.join(tag_list)}")
+            
+                output.append("")  # Empty line between items
+        
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error searching Zotero: {str(e)}")
@@ -196,6 +402,7 @@ def search_items(
     description="Search for items in your Zotero library by tag. " \
     "Conditions are ANDed, each term supports disjunction`||` and exclusion`-`."
 )
+@offloaded("zotero_search_by_tag")
 def search_by_tag(
     tag: List[str],
     item_type: str = "-attachment",
@@ -232,55 +439,55 @@ def search_by_tag(
 
         ctx.info(f"Searching Zotero for tag '{tag}'")
         logging.info(f"Searching Zotero for tag '{tag}'")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        if isinstance(limit, str):
-            limit = int(limit)
+            if isinstance(limit, str):
+                limit = int(limit)
         
-        # Search using the query parameters
-        zot.add_parameters(q="", tag=tag, itemType=item_type, limit=limit)
-        results = zot.items()
+            # Search using the query parameters
+            zot.add_parameters(q="", tag=tag, itemType=item_type, limit=limit)
+            results = zot.items()
         
-        if not results:
-            logging.warning(f"No items found with tag: '{tag}'")
-            return f"No items found with tag: '{tag}'"
+            if not results:
+                logging.warning(f"No items found with tag: '{tag}'")
+                return f"No items found with tag: '{tag}'"
         
-        # Format results as markdown
-        output = [f"# Search Results for Tag: '{tag}'", ""]
-        
-        for i, item in enumerate(results, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-            
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-            
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-            
-            # Add abstract snippet if present
-            if abstract := data.get("abstractNote"):
-                # Limit abstract length for search results
-                abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
-                output.append(f"**Abstract:** {abstract_snippet}")
-            
-            # Add tags if present
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
-            
-            output.append("")  # Empty line between items
+            # Format results as markdown
+            output = [f"# Search Results for Tag: '{tag}'", ""]
         
-        return "\n".join(output)
+            for i, item in enumerate(results, 1):
+                data = item.get("data", {})
+                title = data.get("title", "Untitled")
+                item_type = data.get("itemType", "unknown")
+                date = data.get("date", "No date")
+                key = item.get("key", "")
+            
+                # Format creators
+                creators = data.get("creators", [])
+                creators_str = format_creators(creators)
+            
+                # Build the formatted entry
+                output.append(f"## {i}. {title}")
+                output.append(f"**Type:** {item_type}")
+                output.append(f"**Item Key:** {key}")
+                output.append(f"**Date:** {date}")
+                output.append(f"**Authors:** {creators_str}")
+            
+                # Add abstract snippet if present
+                if abstract := data.get("abstractNote"):
+                    # Limit abstract length for search results
+                    abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
+                    output.append(f"**Abstract:** {abstract_snippet}")
+            
+                # Add tags if present
+                if tags := data.get("tags"):
+                    tag_list = [f"`{tag['tag']}`" for tag in tags]
+                    if tag_list:
+                        output.append(f"**Tags:** {' '.join(tag_list)}")
+            
+                output.append("")  # Empty line between items
+        
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error searching Zotero: {str(e)}")
@@ -291,6 +498,7 @@ def search_by_tag(
     name="zotero_get_item_metadata",
     description="Get detailed metadata for a specific Zotero item by its key."
 )
+@offloaded("zotero_get_item_metadata")
 def get_item_metadata(
     item_key: str,
     include_abstract: bool = True,
@@ -314,17 +522,17 @@ def get_item_metadata(
     try:
         ctx.info(f"Fetching metadata for item {item_key} in {format} format")
         logging.info(f"Fetching metadata for item {item_key} in {format} format")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        item = zot.item(item_key)
-        if not item:
-            logging.warning(f"No item found with key: {item_key}")
-            return f"No item found with key: {item_key}"
+            item = get_cached_item(zot, item_key)
+            if not item:
+                logging.warning(f"No item found with key: {item_key}")
+                return f"No item found with key: {item_key}"
         
-        if format == "bibtex":
-            return generate_bibtex(item)
-        else:
-            return format_item_metadata(item, include_abstract)
+            if format == "bibtex":
+                return generate_bibtex(item)
+            else:
+                return format_item_metadata(item, include_abstract)
     
     except Exception as e:
         ctx.error(f"Error fetching item metadata: {str(e)}")
@@ -336,6 +544,7 @@ def get_item_metadata(
     name="zotero_get_item_fulltext",
     description="Get the full text content of a Zotero item by its key."
 )
+@offloaded("zotero_get_item_fulltext", limit=2)
 def get_item_fulltext(
     item_key: str,
     *,
@@ -355,62 +564,62 @@ def get_item_fulltext(
     try:
         ctx.info(f"Fetching full text for item {item_key}")
         logging.info(f"Fetching full text for item {item_key}")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        # First get the item metadata
-        item = zot.item(item_key)
-        if not item:
-            logging.warning(f"No item found with key: {item_key}")
-            return f"No item found with key: {item_key}"
+            # First get the item metadata
+            item = get_cached_item(zot, item_key)
+            if not item:
+                logging.warning(f"No item found with key: {item_key}")
+                return f"No item found with key: {item_key}"
         
-        # Get item metadata in markdown format
-        metadata = format_item_metadata(item, include_abstract=True)
+            # Get item metadata in markdown format
+            metadata = format_item_metadata(item, include_abstract=True)
         
-        # Try to get attachment details
-        attachment = get_attachment_details(zot, item)
-        if not attachment:
-            logging.warning(f"No suitable attachment found for this item: {item_key}")
-            return f"{metadata}\n\n---\n\nNo suitable attachment found for this item."
+            # Try to get attachment details
+            attachment = get_attachment_details(zot, item)
+            if not attachment:
+                logging.warning(f"No suitable attachment found for this item: {item_key}")
+                return f"{metadata}\n\n---\n\nNo suitable attachment found for this item."
         
-        ctx.info(f"Found attachment: {attachment.key} ({attachment.content_type})")
-        logging.info(f"Found attachment: {attachment.key} ({attachment.content_type})")
+            ctx.info(f"Found attachment: {attachment.key} ({attachment.content_type})")
+            logging.info(f"Found attachment: {attachment.key} ({attachment.content_type})")
         
-        # Try fetching full text from Zotero's full text index first
-        try:
-            full_text_data = zot.fulltext_item(attachment.key)
-            if full_text_data and "content" in full_text_data and full_text_data["content"]:
-                ctx.info(f"Successfully retrieved full text from Zotero's index")
-                logging.info(f"Successfully retrieved full text from Zotero's index")
-                return f"{metadata}\n\n---\n\n## Full Text\n\n{full_text_data['content']}"
-        except Exception as fulltext_error:
-            ctx.info(f"Couldn't retrieve indexed full text: {str(fulltext_error)}")
-            logging.warning(f"Couldn't retrieve indexed full text: {str(fulltext_error)}")
-        
-        # If we couldn't get indexed full text, try to download and convert the file
-        try:
-            ctx.info(f"Attempting to download and convert attachment {attachment.key}")
-            logging.info(f"Attempting to download and convert attachment {attachment.key}")
+            # Try fetching full text from Zotero's full text index first
+            try:
+                full_text_data = zot.fulltext_item(attachment.key)
+                if full_text_data and "content" in full_text_data and full_text_data["content"]:
+                    ctx.info(f"Successfully retrieved full text from Zotero's index")
+                    logging.info(f"Successfully retrieved full text from Zotero's index")
+                    return f"{metadata}\n\n---\n\n## Full Text\n\n{full_text_data['content']}"
+            except Exception as fulltext_error:
+                ctx.info(f"Couldn't retrieve indexed full text: {str(fulltext_error)}")
+                logging.warning(f"Couldn't retrieve indexed full text: {str(fulltext_error)}")
+        
+            # If we couldn't get indexed full text, try to download and convert the file
+            try:
+                ctx.info(f"Attempting to download and convert attachment {attachment.key}")
+                logging.info(f"Attempting to download and convert attachment {attachment.key}")
             
-            # Download the file to a temporary location
-            import tempfile
-            import os
+                # Download the file to a temporary location
+                import tempfile
+                import os
             
-            with tempfile.TemporaryDirectory() as tmpdir:
-                file_path = os.path.join(tmpdir, attachment.filename or f"{attachment.key}.pdf")
-                zot.dump(attachment.key, filename=os.path.basename(file_path), path=tmpdir)
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    file_path = os.path.join(tmpdir, attachment.filename or f"{attachment.key}.pdf")
+                    zot.dump(attachment.key, filename=os.path.basename(file_path), path=tmpdir)
                 
-                if os.path.exists(file_path):
-                    ctx.info(f"Downloaded file to {file_path}, converting to markdown")
-                    logging.info(f"Downloaded file to {file_path}, converting to markdown")
-                    converted_text = convert_to_markdown(file_path)
-                    return f"{metadata}\n\n---\n\n## Full Text\n\n{converted_text}"
-                else:
-                    logging.warning(f"File download failed for attachment {attachment.key}")
-                    return f"{metadata}\n\n---\n\nFile download failed."
-        except Exception as download_error:
-            ctx.error(f"Error downloading/converting file: {str(download_error)}")
-            logging.error(f"Error downloading/converting file: {str(download_error)}")
-            return f"{metadata}\n\n---\n\nError accessing attachment: {str(download_error)}"
+                    if os.path.exists(file_path):
+                        ctx.info(f"Downloaded file to {file_path}, converting to markdown")
+                        logging.info(f"Downloaded file to {file_path}, converting to markdown")
+                        converted_text = convert_to_markdown(file_path)
+                        return f"{metadata}\n\n---\n\n## Full Text\n\n{converted_text}"
+                    else:
+                        logging.warning(f"File download failed for attachment {attachment.key}")
+                        return f"{metadata}\n\n---\n\nFile download failed."
+            except Exception as download_error:
+                ctx.error(f"Error downloading/converting file: {str(download_error)}")
+                logging.error(f"Error downloading/converting file: {str(download_error)}")
+                return f"{metadata}\n\n---\n\nError accessing attachment: {str(download_error)}"
         
     except Exception as e:
         ctx.error(f"Error fetching item full text: {str(e)}")
@@ -422,6 +631,7 @@ def get_item_fulltext(
     name="zotero_get_collections",
     description="List all collections in your Zotero library."
 )
+@offloaded("zotero_get_collections")
 def get_collections(
     limit: Optional[Union[int, str]] = None,
     *,
@@ -441,75 +651,75 @@ def get_collections(
     try:
         ctx.info("Fetching collections")
         logging.info("Fetching collections")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        if isinstance(limit, str):
-            limit = int(limit)
+            if isinstance(limit, str):
+                limit = int(limit)
         
-        collections = zot.collections(limit=limit)
+            collections = zot.collections(limit=limit)
         
-        # Always return the header, even if empty
-        output = ["# Zotero Collections", ""]
+            # Always return the header, even if empty
+            output = ["# Zotero Collections", ""]
         
-        if not collections:
-            output.append("No collections found in your Zotero library.")
-            logging.warning("No collections found in your Zotero library.")
-            return "\n".join(output)
+            if not collections:
+                output.append("No collections found in your Zotero library.")
+                logging.warning("No collections found in your Zotero library.")
+                return "\n".join(output)
+        
+            # Create a mapping of collection IDs to their data
+            collection_map = {c["key"]: c for c in collections}
         
-        # Create a mapping of collection IDs to their data
-        collection_map = {c["key"]: c for c in collections}
-        
-        # Create a mapping of parent to child collections
-        # Only add entries for collections that actually exist
-        hierarchy = {}
-        for coll in collections:
-            parent_key = coll["data"].get("parentCollection")
-            # Handle various representations of "no parent"
-            if parent_key in ["", None] or not parent_key:
-                parent_key = None  # Normalize to None
-            
-            if parent_key not in hierarchy:
-                hierarchy[parent_key] = []
-            hierarchy[parent_key].append(coll["key"])
-        
-        # Function to recursively format collections
-        def format_collection(key, level=0):
-            if key not in collection_map:
-                return []
-            
-            coll = collection_map[key]
-            name = coll["data"].get("name", "Unnamed Collection")
-            
-            # Create indentation for hierarchy
-            indent = "  " * level
-            lines = [f"{indent}- **{name}** (Key: {key})"]
-            
-            # Add children if they exist
-            child_keys = hierarchy.get(key, [])
-            for child_key in sorted(child_keys):  # Sort for consistent output
-                lines.extend(format_collection(child_key, level + 1))
-            
-            return lines
-        
-        # Start with top-level collections (those with None as parent)
-        top_level_keys = hierarchy.get(None, [])
-        
-        if not top_level_keys:
-            # If no clear hierarchy, just list all collections
-            output.append("Collections (flat list):")
-            logging.info("Collections (flat list):")
-            for coll in sorted(collections, key=lambda x: x["data"].get("name", "")):
+            # Create a mapping of parent to child collections
+            # Only add entries for collections that actually exist
+            hierarchy = {}
+            for coll in collections:
+                parent_key = coll["data"].get("parentCollection")
+                # Handle various representations of "no parent"
+                if parent_key in ["", None] or not parent_key:
+                    parent_key = None  # Normalize to None
+            
+                if parent_key not in hierarchy:
+                    hierarchy[parent_key] = []
+                hierarchy[parent_key].append(coll["key"])
+        
+            # Function to recursively format collections
+            def format_collection(key, level=0):
+                if key not in collection_map:
+                    return []
+            
+                coll = collection_map[key]
                 name = coll["data"].get("name", "Unnamed Collection")
-                key = coll["key"]
-                output.append(f"- **{name}** (Key: {key})")
-                logging.info(f"- **{name}** (Key: {key})")
-        else:
-            # Display hierarchical structure
-            for key in sorted(top_level_keys):
-                output.extend(format_collection(key))
-                logging.info(f"Displaying hierarchical structure for parent key: {key}")
+            
+                # Create indentation for hierarchy
+                indent = "  " * level
+                lines = [f"{indent}- **{name}** (Key: {key})"]
+            
+                # Add children if they exist
+                child_keys = hierarchy.get(key, [])
+                for child_key in sorted(child_keys):  # Sort for consistent output
+                    lines.extend(format_collection(child_key, level + 1))
+            
+                return lines
+        
+            # Start with top-level collections (those with None as parent)
+            top_level_keys = hierarchy.get(None, [])
+        
+            if not top_level_keys:
+                # If no clear hierarchy, just list all collections
+                output.append("Collections (flat list):")
+                logging.info("Collections (flat list):")
+                for coll in sorted(collections, key=lambda x: x["data"].get("name", "")):
+                    name = coll["data"].get("name", "Unnamed Collection")
+                    key = coll["key"]
+                    output.append(f"- **{name}** (Key: {key})")
+                    logging.info(f"- **{name}** (Key: {key})")
+            else:
+                # Display hierarchical structure
+                for key in sorted(top_level_keys):
+                    output.extend(format_collection(key))
+                    logging.info(f"Displaying hierarchical structure for parent key: {key}")
         
-        return "\n".join(output)
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error fetching collections: {str(e)}")
@@ -522,6 +732,7 @@ def get_collections(
     name="zotero_get_collection_items",
     description="Get all items in a specific Zotero collection."
 )
+@offloaded("zotero_get_collection_items")
 def get_collection_items(
     collection_key: str,
     limit: Optional[Union[int, str]] = 50,
@@ -543,48 +754,48 @@ def get_collection_items(
     try:
         ctx.info(f"Fetching items for collection {collection_key}")
         logging.info(f"Fetching items for collection {collection_key}")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        # First get the collection details
-        try:
-            collection = zot.collection(collection_key)
-            collection_name = collection["data"].get("name", "Unnamed Collection")
-        except Exception:
-            collection_name = f"Collection {collection_key}"
+            # First get the collection details
+            try:
+                collection = zot.collection(collection_key)
+                collection_name = collection["data"].get("name", "Unnamed Collection")
+            except Exception:
+                collection_name = f"Collection {collection_key}"
         
-        if isinstance(limit, str):
-            limit = int(limit)
+            if isinstance(limit, str):
+                limit = int(limit)
         
-        # Then get the items
-        items = zot.collection_items(collection_key, limit=limit)
-        if not items:
-            logging.warning(f"No items found in collection: {collection_name} (Key: {collection_key})")
-            return f"No items found in collection: {collection_name} (Key: {collection_key})"
+            # Then get the items
+            items = zot.collection_items(collection_key, limit=limit)
+            if not items:
+                logging.warning(f"No items found in collection: {collection_name} (Key: {collection_key})")
+                return f"No items found in collection: {collection_name} (Key: {collection_key})"
         
-        # Format items as markdown
-        output = [f"# Items in Collection: {collection_name}", ""]
+            # Format items as markdown
+            output = [f"# Items in Collection: {collection_name}", ""]
         
-        for i, item in enumerate(items, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
+            for i, item in enumerate(items, 1):
+                data = item.get("data", {})
+                title = data.get("title", "Untitled")
+                item_type = data.get("itemType", "unknown")
+                date = data.get("date", "No date")
+                key = item.get("key", "")
             
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
+                # Format creators
+                creators = data.get("creators", [])
+                creators_str = format_creators(creators)
             
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
+                # Build the formatted entry
+                output.append(f"## {i}. {title}")
+                output.append(f"**Type:** {item_type}")
+                output.append(f"**Item Key:** {key}")
+                output.append(f"**Date:** {date}")
+                output.append(f"**Authors:** {creators_str}")
             
-            output.append("")  # Empty line between items
+                output.append("")  # Empty line between items
         
-        return "\n".join(output)
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error fetching collection items: {str(e)}")
@@ -596,6 +807,7 @@ def get_collection_items(
     name="zotero_get_item_children",
     description="Get all child items (attachments, notes) for a specific Zotero item."
 )
+@offloaded("zotero_get_item_children")
 def get_item_children(
     item_key: str,
     *,
@@ -615,100 +827,100 @@ def get_item_children(
     try:
         ctx.info(f"Fetching children for item {item_key}")
         logging.info(f"Fetching children for item {item_key}")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        # First get the parent item details
-        try:
-            parent = zot.item(item_key)
-            parent_title = parent["data"].get("title", "Untitled Item")
-        except Exception:
-            parent_title = f"Item {item_key}"
-        
-        # Then get the children
-        children = zot.children(item_key)
-        if not children:
-            logging.warning(f"No child items found for: {parent_title} (Key: {item_key})")
-            return f"No child items found for: {parent_title} (Key: {item_key})"
-        
-        # Format children as markdown
-        output = [f"# Child Items for: {parent_title}", ""]
-        
-        # Group children by type
-        attachments = []
-        notes = []
-        others = []
-        
-        for child in children:
-            data = child.get("data", {})
-            item_type = data.get("itemType", "unknown")
-            
-            if item_type == "attachment":
-                attachments.append(child)
-            elif item_type == "note":
-                notes.append(child)
-            else:
-                others.append(child)
-        
-        # Format attachments
-        if attachments:
-            output.append("## Attachments")
-            logging.info("Formatting attachments...")
-            for i, att in enumerate(attachments, 1):
-                data = att.get("data", {})
-                title = data.get("title", "Untitled")
-                key = att.get("key", "")
-                content_type = data.get("contentType", "Unknown")
-                filename = data.get("filename", "")
-                
-                output.append(f"{i}. **{title}**")
-                output.append(f"   - Key: {key}")
-                output.append(f"   - Type: {content_type}")
-                if filename:
-                    output.append(f"   - Filename: {filename}")
-                output.append("")
-                logging.info(f"Formatted attachment: {title} (Key: {key})")
+            # First get the parent item details
+            try:
+                parent = get_cached_item(zot, item_key)
+                parent_title = parent["data"].get("title", "Untitled Item")
+            except Exception:
+                parent_title = f"Item {item_key}"
         
-        # Format notes
-        if notes:
-            output.append("## Notes")
-            logging.info("Formatting notes...")
-            for i, note in enumerate(notes, 1):
-                data = note.get("data", {})
-                title = data.get("title", "Untitled Note")
-                key = note.get("key", "")
-                note_text = data.get("note", "")
+            # Then get the children
+            children = zot.children(item_key)
+            if not children:
+                logging.warning(f"No child items found for: {parent_title} (Key: {item_key})")
+                return f"No child items found for: {parent_title} (Key: {item_key})"
+        
+            # Format children as markdown
+            output = [f"# Child Items for: {parent_title}", ""]
+        
+            # Group children by type
+            attachments = []
+            notes = []
+            others = []
+        
+            for child in children:
+                data = child.get("data", {})
+                item_type = data.get("itemType", "unknown")
+            
+                if item_type == "attachment":
+                    attachments.append(child)
+                elif item_type == "note":
+                    notes.append(child)
+                else:
+                    others.append(child)
+        
+            # Format attachments
+            if attachments:
+                output.append("## Attachments")
+                logging.info("Formatting attachments...")
+                for i, att in enumerate(attachments, 1):
+                    data = att.get("data", {})
+                    title = data.get("title", "Untitled")
+                    key = att.get("key", "")
+                    content_type = data.get("contentType", "Unknown")
+                    filename = data.get("filename", "")
                 
-                # Clean up HTML in notes
-                note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
-                note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
+                    output.append(f"{i}. **{title}**")
+                    output.append(f"   - Key: {key}")
+                    output.append(f"   - Type: {content_type}")
+                    if filename:
+                        output.append(f"   - Filename: {filename}")
+                    output.append("")
+                    logging.info(f"Formatted attachment: {title} (Key: {key})")
+        
+            # Format notes
+            if notes:
+                output.append("## Notes")
+                logging.info("Formatting notes...")
+                for i, note in enumerate(notes, 1):
+                    data = note.get("data", {})
+                    title = data.get("title", "Untitled Note")
+                    key = note.get("key", "")
+                    note_text = data.get("note", "")
                 
-                # Limit note length for display
-                if len(note_text) > 500:
-                    note_text = note_text[:500] + "...\n\n(Note truncated)"
+                    # Clean up HTML in notes
+                    note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
+                    note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
                 
-                output.append(f"{i}. **{title}**")
-                output.append(f"   - Key: {key}")
-                output.append(f"   - Content:\n```\n{note_text}\n```")
-                output.append("")
-                logging.info(f"Formatted note: {title} (Key: {key})")
-        
-        # Format other item types
-        if others:
-            output.append("## Other Items")
-            logging.info("Formatting other item types...")
-            for i, other in enumerate(others, 1):
-                data = other.get("data", {})
-                title = data.get("title", "Untitled")
-                key = other.get("key", "")
-                item_type = data.get("itemType", "unknown")
+                    # Limit note length for display
+                    if len(note_text) > 500:
+                        note_text = note_text[:500] + "...\n\n(Note truncated)"
                 
-                output.append(f"{i}. **{title}**")
-                output.append(f"   - Key: {key}")
-                output.append(f"   - Type: {item_type}")
-                output.append("")
-                logging.info(f"Formatted other item: {title} (Key: {key})")
+                    output.append(f"{i}. **{title}**")
+                    output.append(f"   - Key: {key}")
+                    output.append(f"   - Content:\n```\n{note_text}\n```")
+                    output.append("")
+                    logging.info(f"Formatted note: {title} (Key: {key})")
+        
+            # Format other item types
+            if others:
+                output.append("## Other Items")
+                logging.info("Formatting other item types...")
+                for i, other in enumerate(others, 1):
+                    data = other.get("data", {})
+                    title = data.get("title", "Untitled")
+                    key = other.get("key", "")
+                    item_type = data.get("itemType", "unknown")
+                
+                    output.append(f"{i}. **{title}**")
+                    output.append(f"   - Key: {key}")
+                    output.append(f"   - Type: {item_type}")
+                    output.append("")
+                    logging.info(f"Formatted other item: {title} (Key: {key})")
         
-        return "\n".join(output)
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error fetching item children: {str(e)}")
@@ -720,6 +932,7 @@ def get_item_children(
     name="zotero_get_tags",
     description="Get all tags used in your Zotero library."
 )
+@offloaded("zotero_get_tags")
 def get_tags(
     limit: Optional[Union[int, str]] = None,
     *,
@@ -739,36 +952,36 @@ def get_tags(
     try:
         ctx.info("Fetching tags")
         logging.info("Fetching tags")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        if isinstance(limit, str):
-            limit = int(limit)
+            if isinstance(limit, str):
+                limit = int(limit)
         
-        tags = zot.tags(limit=limit)
-        if not tags:
-            logging.warning("No tags found in your Zotero library.")
-            return "No tags found in your Zotero library."
+            tags = zot.tags(limit=limit)
+            if not tags:
+                logging.warning("No tags found in your Zotero library.")
+                return "No tags found in your Zotero library."
         
-        # Format tags as markdown
-        output = ["# Zotero Tags", ""]
+            # Format tags as markdown
+            output = ["# Zotero Tags", ""]
         
-        # Sort tags alphabetically
-        sorted_tags = sorted(tags)
+            # Sort tags alphabetically
+            sorted_tags = sorted(tags)
         
-        # Group tags alphabetically
-        current_letter = None
-        for tag in sorted_tags:
-            first_letter = tag[0].upper() if tag else "#"
+            # Group tags alphabetically
+            current_letter = None
+            for tag in sorted_tags:
+                first_letter = tag[0].upper() if tag else "#"
             
-            if first_letter != current_letter:
-                current_letter = first_letter
-                output.append(f"## {current_letter}")
-                logging.info(f"Grouping tags by letter: {current_letter}")
+                if first_letter != current_letter:
+                    current_letter = first_letter
+                    output.append(f"## {current_letter}")
+                    logging.info(f"Grouping tags by letter: {current_letter}")
             
-            output.append(f"- `{tag}`")
-            logging.info(f"- `{tag}`")
+                output.append(f"- `{tag}`")
+                logging.info(f"- `{tag}`")
         
-        return "\n".join(output)
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error fetching tags: {str(e)}")
@@ -780,6 +993,7 @@ def get_tags(
     name="zotero_get_recent",
     description="Get recently added items to your Zotero library."
 )
+@offloaded("zotero_get_recent")
 def get_recent(
     limit: Union[int, str] = 10,
     *,
@@ -799,49 +1013,49 @@ def get_recent(
     try:
         ctx.info(f"Fetching {limit} recent items")
         logging.info(f"Fetching {limit} recent items")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        if isinstance(limit, str):
-            limit = int(limit)
+            if isinstance(limit, str):
+                limit = int(limit)
         
-        # Ensure limit is a reasonable number
-        if limit <= 0:
-            limit = 10
-        elif limit > 100:
-            limit = 100
-        
-        # Get recent items
-        items = zot.items(limit=limit, sort="dateAdded", direction="desc")
-        if not items:
-            logging.warning(f"No items found in your Zotero library.")
-            return "No items found in your Zotero library."
-        
-        # Format items as markdown
-        output = [f"# {limit} Most Recently Added Items", ""]
-        
-        for i, item in enumerate(items, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-            date_added = data.get("dateAdded", "Unknown")
-            
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-            
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Added:** {date_added}")
-            output.append(f"**Authors:** {creators_str}")
-            
-            output.append("")  # Empty line between items
+            # Ensure limit is a reasonable number
+            if limit <= 0:
+                limit = 10
+            elif limit > 100:
+                limit = 100
         
-        return "\n".join(output)
+            # Get recent items
+            items = zot.items(limit=limit, sort="dateAdded", direction="desc")
+            if not items:
+                logging.warning(f"No items found in your Zotero library.")
+                return "No items found in your Zotero library."
+        
+            # Format items as markdown
+            output = [f"# {limit} Most Recently Added Items", ""]
+        
+            for i, item in enumerate(items, 1):
+                data = item.get("data", {})
+                title = data.get("title", "Untitled")
+                item_type = data.get("itemType", "unknown")
+                date = data.get("date", "No date")
+                key = item.get("key", "")
+                date_added = data.get("dateAdded", "Unknown")
+            
+                # Format creators
+                creators = data.get("creators", [])
+                creators_str = format_creators(creators)
+            
+                # Build the formatted entry
+                output.append(f"## {i}. {title}")
+                output.append(f"**Type:** {item_type}")
+                output.append(f"**Item Key:** {key}")
+                output.append(f"**Date:** {date}")
+                output.append(f"**Added:** {date_added}")
+                output.append(f"**Authors:** {creators_str}")
+            
+                output.append("")  # Empty line between items
+        
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error fetching recent items: {str(e)}")
@@ -853,6 +1067,7 @@ def get_recent(
     name="zotero_batch_update_tags",
     description="Batch update tags across multiple items matching a search query."
 )
+@offloaded("zotero_batch_update_tags", limit=2)
 def batch_update_tags(
     query: str,
     add_tags: Optional[Union[List[str], str]] = None,
@@ -912,100 +1127,101 @@ def batch_update_tags(
         
         ctx.info(f"Batch updating tags for items matching '{query}'")
         logging.info(f"Batch updating tags for items matching '{query}'")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        if isinstance(limit, str):
-            limit = int(limit)
+            if isinstance(limit, str):
+                limit = int(limit)
         
-        # Search for items matching the query
-        zot.add_parameters(q=query, limit=limit)
-        items = zot.items()
-        
-        if not items:
-            logging.warning(f"No items found matching query: '{query}'")
-            return f"No items found matching query: '{query}'"
-        
-        # Initialize counters
-        updated_count = 0
-        skipped_count = 0
-        added_tag_counts = {tag: 0 for tag in (add_tags or [])}
-        removed_tag_counts = {tag: 0 for tag in (remove_tags or [])}
-        
-        # Process each item
-        for item in items:
-            # Skip attachments if they were included in the results
-            if item["data"].get("itemType") == "attachment":
-                skipped_count += 1
-                continue
+            # Search for items matching the query
+            zot.add_parameters(q=query, limit=limit)
+            items = zot.items()
+        
+            if not items:
+                logging.warning(f"No items found matching query: '{query}'")
+                return f"No items found matching query: '{query}'"
+        
+            # Initialize counters
+            updated_count = 0
+            skipped_count = 0
+            added_tag_counts = {tag: 0 for tag in (add_tags or [])}
+            removed_tag_counts = {tag: 0 for tag in (remove_tags or [])}
+        
+            # Process each item
+            for item in items:
+                # Skip attachments if they were included in the results
+                if item["data"].get("itemType") == "attachment":
+                    skipped_count += 1
+                    continue
                 
-            # Get current tags
-            current_tags = item["data"].get("tags", [])
-            current_tag_values = {t["tag"] for t in current_tags}
-            
-            # Track if this item needs to be updated
-            needs_update = False
-            
-            # Process tags to remove
-            if remove_tags:
-                new_tags = []
-                for tag_obj in current_tags:
-                    tag = tag_obj["tag"]
-                    if tag in remove_tags:
-                        removed_tag_counts[tag] += 1
-                        needs_update = True
-                    else:
-                        new_tags.append(tag_obj)
-                current_tags = new_tags
-            
-            # Process tags to add
-            if add_tags:
-                for tag in add_tags:
-                    if tag and tag not in current_tag_values:
-                        current_tags.append({"tag": tag})
-                        added_tag_counts[tag] += 1
-                        needs_update = True
-            
-            # Update the item if needed
-            # Since we are logging errors we might as well log the update.
-            if needs_update:
-                try:
-                    item["data"]["tags"] = current_tags
-                    ctx.info(f"Updating item {item.get('key', 'unknown')} with tags: {current_tags}")
-                    logging.info(f"Updating item {item.get('key', 'unknown')} with tags: {current_tags}")
-                    result = zot.update_item(item)
-                    ctx.info(f"Update result: {result}")
-                    logging.info(f"Update result: {result}")
-                    updated_count += 1
-                except Exception as e:
-                    ctx.error(f"Failed to update item {item.get('key', 'unknown')}: {str(e)}")
-                    logging.error(f"Failed to update item {item.get('key', 'unknown')}: {str(e)}")
-                    # Continue with other items instead of failing completely
+                # Get current tags
+                current_tags = item["data"].get("tags", [])
+                current_tag_values = {t["tag"] for t in current_tags}
+            
+                # Track if this item needs to be updated
+                needs_update = False
+            
+                # Process tags to remove
+                if remove_tags:
+                    new_tags = []
+                    for tag_obj in current_tags:
+                        tag = tag_obj["tag"]
+                        if tag in remove_tags:
+                            removed_tag_counts[tag] += 1
+                            needs_update = True
+                        else:
+                            new_tags.append(tag_obj)
+                    current_tags = new_tags
+            
+                # Process tags to add
+                if add_tags:
+                    for tag in add_tags:
+                        if tag and tag not in current_tag_values:
+                            current_tags.append({"tag": tag})
+                            added_tag_counts[tag] += 1
+                            needs_update = True
+            
+                # Update the item if needed
+                # Since we are logging errors we might as well log the update.
+                if needs_update:
+                    try:
+                        item["data"]["tags"] = current_tags
+                        ctx.info(f"Updating item {item.get('key', 'unknown')} with tags: {current_tags}")
+                        logging.info(f"Updating item {item.get('key', 'unknown')} with tags: {current_tags}")
+                        result = zot.update_item(item)
+                        get_item_cache().invalidate(zot, item["key"])
+                        ctx.info(f"Update result: {result}")
+                        logging.info(f"Update result: {result}")
+                        updated_count += 1
+                    except Exception as e:
+                        ctx.error(f"Failed to update item {item.get('key', 'unknown')}: {str(e)}")
+                        logging.error(f"Failed to update item {item.get('key', 'unknown')}: {str(e)}")
+                        # Continue with other items instead of failing completely
+                        skipped_count += 1
+                else:
                     skipped_count += 1
-            else:
-                skipped_count += 1
-        
-        # Format the response
-        response = ["# Batch Tag Update Results", ""]
-        response.append(f"Query: '{query}'")
-        response.append(f"Items processed: {len(items)}")
-        response.append(f"Items updated: {updated_count}")
-        response.append(f"Items skipped: {skipped_count}")
-        
-        if add_tags:
-            response.append("\n## Tags Added")
-            logging.info("Formatting tags added...")
-            for tag, count in added_tag_counts.items():
-                response.append(f"- `{tag}`: {count} items")
-                logging.info(f"- `{tag}`: {count} items")
-        
-        if remove_tags:
-            response.append("\n## Tags Removed")
-            logging.info("Formatting tags removed...")
-            for tag, count in removed_tag_counts.items():
-                response.append(f"- `{tag}`: {count} items")
-                logging.info(f"- `{tag}`: {count} items")
-        
-        return "\n".join(response)
+        
+            # Format the response
+            response = ["# Batch Tag Update Results", ""]
+            response.append(f"Query: '{query}'")
+            response.append(f"Items processed: {len(items)}")
+            response.append(f"Items updated: {updated_count}")
+            response.append(f"Items skipped: {skipped_count}")
+        
+            if add_tags:
+                response.append("\n## Tags Added")
+                logging.info("Formatting tags added...")
+                for tag, count in added_tag_counts.items():
+                    response.append(f"- `{tag}`: {count} items")
+                    logging.info(f"- `{tag}`: {count} items")
+        
+            if remove_tags:
+                response.append("\n## Tags Removed")
+                logging.info("Formatting tags removed...")
+                for tag, count in removed_tag_counts.items():
+                    response.append(f"- `{tag}`: {count} items")
+                    logging.info(f"- `{tag}`: {count} items")
+        
+            return "\n".join(response)
     
     except Exception as e:
         ctx.error(f"Error in batch tag update: {str(e)}")
@@ -1017,6 +1233,7 @@ def batch_update_tags(
     name="zotero_advanced_search",
     description="Perform an advanced search with multiple criteria."
 )
+@offloaded("zotero_advanced_search", limit=4)
 def advanced_search(
     conditions: List[Dict[str, str]],
     join_mode: Literal["all", "any"] = "all",
@@ -1051,134 +1268,134 @@ def advanced_search(
         
         ctx.info(f"Performing advanced search with {len(conditions)} conditions")
         logging.info(f"Performing advanced search with {len(conditions)} conditions")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        # Prepare search parameters
-        params = {}
+            # Prepare search parameters
+            params = {}
         
-        # Add sorting parameters if specified
-        if sort_by:
-            params["sort"] = sort_by
-            params["direction"] = sort_direction
+            # Add sorting parameters if specified
+            if sort_by:
+                params["sort"] = sort_by
+                params["direction"] = sort_direction
         
-        if isinstance(limit, str):
-            limit = int(limit)
+            if isinstance(limit, str):
+                limit = int(limit)
         
-        # Add limit parameter
-        params["limit"] = limit
-        
-        # Build search conditions
-        search_conditions = []
-        for i, condition in enumerate(conditions):
-            if "field" not in condition or "operation" not in condition or "value" not in condition:
-                logging.error(f"Condition {i+1} is missing required fields (field, operation, value): {condition}")
-                return f"Error: Condition {i+1} is missing required fields (field, operation, value)"
-            
-            # Map common field names to Zotero API fields if needed
-            field = condition["field"]
-            operation = condition["operation"]
-            value = condition["value"]
-            
-            # Handle special fields
-            if field == "author" or field == "creator":
-                field = "creator"
-            elif field == "year":
-                field = "date"
-                # Convert year to partial date format for matching
-                value = str(value)
-            
+            # Add limit parameter
+            params["limit"] = limit
+        
+            # Build search conditions
+            search_conditions = []
+            for i, condition in enumerate(conditions):
+                if "field" not in condition or "operation" not in condition or "value" not in condition:
+                    logging.error(f"Condition {i+1} is missing required fields (field, operation, value): {condition}")
+                    return f"Error: Condition {i+1} is missing required fields (field, operation, value)"
+            
+                # Map common field names to Zotero API fields if needed
+                field = condition["field"]
+                operation = condition["operation"]
+                value = condition["value"]
+            
+                # Handle special fields
+                if field == "author" or field == "creator":
+                    field = "creator"
+                elif field == "year":
+                    field = "date"
+                    # Convert year to partial date format for matching
+                    value = str(value)
+            
+                search_conditions.append({
+                    "condition": field,
+                    "operator": operation,
+                    "value": value
+                })
+        
+            # Add join mode condition
             search_conditions.append({
-                "condition": field,
-                "operator": operation,
-                "value": value
+                "condition": "joinMode",
+                "operator": join_mode,
+                "value": ""
             })
         
-        # Add join mode condition
-        search_conditions.append({
-            "condition": "joinMode",
-            "operator": join_mode,
-            "value": ""
-        })
-        
-        # Create a saved search
-        search_name = f"temp_search_{uuid.uuid4().hex[:8]}"
-        saved_search = zot.saved_search(
-            search_name,
-            search_conditions
-        )
+            # Create a saved search
+            search_name = f"temp_search_{uuid.uuid4().hex[:8]}"
+            saved_search = zot.saved_search(
+                search_name,
+                search_conditions
+            )
         
-        # Extract the search key from the result
-        if not saved_search.get("success"):
-            logging.error(f"Error creating saved search: {saved_search.get('failed', 'Unknown error')}")
-            return f"Error creating saved search: {saved_search.get('failed', 'Unknown error')}"
+            # Extract the search key from the result
+            if not saved_search.get("success"):
+                logging.error(f"Error creating saved search: {saved_search.get('failed', 'Unknown error')}")
+                return f"Error creating saved search: {saved_search.get('failed', 'Unknown error')}"
         
-        search_key = next(iter(saved_search.get("success", {}).values()), None)
+            search_key = next(iter(saved_search.get("success", {}).values()), None)
         
-        # Execute the saved search
-        try:
-            results = zot.collection_items(search_key)
-        finally:
-            # Clean up the temporary saved search
+            # Execute the saved search
             try:
-                zot.delete_saved_search([search_key])
-            except Exception as cleanup_error:
-                ctx.warn(f"Error cleaning up saved search: {str(cleanup_error)}")
-                logging.warning(f"Error cleaning up saved search: {str(cleanup_error)}")
-        
-        # Format the results
-        if not results:
-            logging.warning("No items found matching the search criteria.")
-            return "No items found matching the search criteria."
-        
-        output = ["# Advanced Search Results", ""]
-        output.append(f"Found {len(results)} items matching the search criteria:")
-        output.append("")
+                results = zot.collection_items(search_key)
+            finally:
+                # Clean up the temporary saved search
+                try:
+                    zot.delete_saved_search([search_key])
+                except Exception as cleanup_error:
+                    ctx.warn(f"Error cleaning up saved search: {str(cleanup_error)}")
+                    logging.warning(f"Error cleaning up saved search: {str(cleanup_error)}")
         
-        # Add search criteria summary
-        output.append("## Search Criteria")
-        output.append(f"Join mode: {join_mode.upper()}")
+            # Format the results
+            if not results:
+                logging.warning("No items found matching the search criteria.")
+                return "No items found matching the search criteria."
         
-        for i, condition in enumerate(conditions, 1):
-            output.append(f"{i}. {condition['field']} {condition['operation']} \"{condition['value']}\"")
+            output = ["# Advanced Search Results", ""]
+            output.append(f"Found {len(results)} items matching the search criteria:")
+            output.append("")
         
-        output.append("")
+            # Add search criteria summary
+            output.append("## Search Criteria")
+            output.append(f"Join mode: {join_mode.upper()}")
         
-        # Format results
-        output.append("## Results")
+            for i, condition in enumerate(conditions, 1):
+                output.append(f"{i}. {condition['field']} {condition['operation']} \"{condition['value']}\"")
         
-        for i, item in enumerate(results, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-            
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-            
-            # Build the formatted entry
-            output.append(f"### {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-            
-            # Add abstract snippet if present
-            if abstract := data.get("abstractNote"):
-                # Limit abstract length for search results
-                abstract_snippet = abstract[:150] + "..." if len(abstract) > 150 else abstract
-                output.append(f"**Abstract:** {abstract_snippet}")
-            
-            # Add tags if present
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
-            
-            output.append("")  # Empty line between items
+            output.append("")
         
-        return "\n".join(output)
+            # Format results
+            output.append("## Results")
+        
+            for i, item in enumerate(results, 1):
+                data = item.get("data", {})
+                title = data.get("title", "Untitled")
+                item_type = data.get("itemType", "unknown")
+                date = data.get("date", "No date")
+                key = item.get("key", "")
+            
+                # Format creators
+                creators = data.get("creators", [])
+                creators_str = format_creators(creators)
+            
+                # Build the formatted entry
+                output.append(f"### {i}. {title}")
+                output.append(f"**Type:** {item_type}")
+                output.append(f"**Item Key:** {key}")
+                output.append(f"**Date:** {date}")
+                output.append(f"**Authors:** {creators_str}")
+            
+                # Add abstract snippet if present
+                if abstract := data.get("abstractNote"):
+                    # Limit abstract length for search results
+                    abstract_snippet = abstract[:150] + "..." if len(abstract) > 150 else abstract
+                    output.append(f"**Abstract:** {abstract_snippet}")
+            
+                # Add tags if present
+                if tags := data.get("tags"):
+                    tag_list = [f"`{tag['tag']}`" for tag in tags]
+                    if tag_list:
+                        output.append(f"**Tags:** {' '.join(tag_list)}")
+            
+                output.append("")  # Empty line between items
+        
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error in advanced search: {str(e)}")
@@ -1190,6 +1407,7 @@ def advanced_search(
     name="zotero_get_annotations",
     description="Get all annotations for a specific item or across your entire Zotero library."
 )
+@offloaded("zotero_get_annotations")
 def get_annotations(
     item_key: Optional[str] = None,
     use_pdf_extraction: bool = False,
@@ -1212,293 +1430,293 @@ def get_annotations(
     logging.info(f"Tool 'zotero_get_annotations' called with item_key: {item_key}")
     try:
         # Initialize Zotero client
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        # Prepare annotations list
-        annotations = []
-        parent_title = "Untitled Item"
+            # Prepare annotations list
+            annotations = []
+            parent_title = "Untitled Item"
         
-        # If an item key is provided, use specialized retrieval
-        if item_key:
-            # First, verify the item exists and get its details
-            try:
-                parent = zot.item(item_key)
-                parent_title = parent["data"].get("title", "Untitled Item")
-                ctx.info(f"Fetching annotations for item: {parent_title}")
-                logging.info(f"Fetching annotations for item: {parent_title}")
-            except Exception:
-                logging.warning(f"Error fetching item details for annotation search: {item_key}")
-                return f"Error: No item found with key: {item_key}"
+            # If an item key is provided, use specialized retrieval
+            if item_key:
+                # First, verify the item exists and get its details
+                try:
+                    parent = get_cached_item(zot, item_key)
+                    parent_title = parent["data"].get("title", "Untitled Item")
+                    ctx.info(f"Fetching annotations for item: {parent_title}")
+                    logging.info(f"Fetching annotations for item: {parent_title}")
+                except Exception:
+                    logging.warning(f"Error fetching item details for annotation search: {item_key}")
+                    return f"Error: No item found with key: {item_key}"
             
-            # Initialize annotation sources
-            better_bibtex_annotations = []
-            zotero_api_annotations = []
-            pdf_annotations = []
+                # Initialize annotation sources
+                better_bibtex_annotations = []
+                zotero_api_annotations = []
+                pdf_annotations = []
             
-            # Try Better BibTeX method (local Zotero only)
-            if os.environ.get("ZOTERO_LOCAL", "").lower() in ["true", "yes", "1"]:
-                try:
-                    # Import Better BibTeX dependencies
-                    from zotero_mcp.better_bibtex_client import (
-                        ZoteroBetterBibTexAPI, 
-                        process_annotation, 
-                        get_color_category
-                    )
+                # Try Better BibTeX method (local Zotero only)
+                if os.environ.get("ZOTERO_LOCAL", "").lower() in ["true", "yes", "1"]:
+                    try:
+                        # Import Better BibTeX dependencies
+                        from zotero_mcp.better_bibtex_client import (
+                            ZoteroBetterBibTexAPI, 
+                            process_annotation, 
+                            get_color_category
+                        )
                     
-                    # Initialize Better BibTeX client
-                    bibtex = ZoteroBetterBibTexAPI()
+                        # Initialize Better BibTeX client
+                        bibtex = ZoteroBetterBibTexAPI()
                     
-                    # Check if Zotero with Better BibTeX is running
-                    if bibtex.is_zotero_running():
-                        # Extract citation key
-                        citation_key = None
+                        # Check if Zotero with Better BibTeX is running
+                        if bibtex.is_zotero_running():
+                            # Extract citation key
+                            citation_key = None
                         
-                        # Try to find citation key in Extra field
-                        try:
-                            extra_field = parent["data"].get("extra", "")
-                            for line in extra_field.split("\n"):
-                                if line.lower().startswith("citation key:"):
-                                    citation_key = line.replace("Citation Key:", "").strip()
-                                    break
-                                elif line.lower().startswith("citationkey:"):
-                                    citation_key = line.replace("citationkey:", "").strip()
-                                    break
-                        except Exception as e:
-                            ctx.warn(f"Error extracting citation key from Extra field: {e}")
-                            logging.warning(f"Error extracting citation key from Extra field: {e}")
-                        
-                        # Fallback to searching by title if no citation key found
-                        if not citation_key:
-                            title = parent["data"].get("title", "")
+                            # Try to find citation key in Extra field
                             try:
-                                if title:
-                                    # Use the search_citekeys method
-                                    search_results = bibtex.search_citekeys(title)
+                                extra_field = parent["data"].get("extra", "")
+                                for line in extra_field.split("\n"):
+                                    if line.lower().startswith("citation key:"):
+                                        citation_key = line.replace("Citation Key:", "").strip()
+                                        break
+                                    elif line.lower().startswith("citationkey:"):
+                                        citation_key = line.replace("citationkey:", "").strip()
+                                        break
+                            except Exception as e:
+                                ctx.warn(f"Error extracting citation key from Extra field: {e}")
+                                logging.warning(f"Error extracting citation key from Extra field: {e}")
+                        
+                            # Fallback to searching by title if no citation key found
+                            if not citation_key:
+                                title = parent["data"].get("title", "")
+                                try:
+                                    if title:
+                                        # Use the search_citekeys method
+                                        search_results = bibtex.search_citekeys(title)
                                     
-                                    # Find the matching item
-                                    for result in search_results:
-                                        ctx.info(f"Checking result: {result}")
-                                        logging.info(f"Checking result: {result}")
+                                        # Find the matching item
+                                        for result in search_results:
+                                            ctx.info(f"Checking result: {result}")
+                                            logging.info(f"Checking result: {result}")
                                         
-                                        # Try to match with item key if possible
-                                        if result.get('citekey'):
-                                            citation_key = result['citekey']
-                                            break
-                            except Exception as e:
-                                ctx.warn(f"Error searching for citation key: {e}")
-                                logging.warning(f"Error searching for citation key: {e}")
+                                            # Try to match with item key if possible
+                                            if result.get('citekey'):
+                                                citation_key = result['citekey']
+                                                break
+                                except Exception as e:
+                                    ctx.warn(f"Error searching for citation key: {e}")
+                                    logging.warning(f"Error searching for citation key: {e}")
                         
-                        # Process annotations if citation key found
-                        if citation_key:
-                            try:
-                                # Determine library ID
-                                library_id = 1  # Default to personal library
-                                search_results = bibtex._make_request("item.search", [citation_key])
-                                if search_results:
-                                    matched_item = next((item for item in search_results if item.get('citekey') == citation_key), None)
-                                    if matched_item:
-                                        library_id = matched_item.get('libraryID', 1)
+                            # Process annotations if citation key found
+                            if citation_key:
+                                try:
+                                    # Determine library ID
+                                    library_id = 1  # Default to personal library
+                                    search_results = bibtex._make_request("item.search", [citation_key])
+                                    if search_results:
+                                        matched_item = next((item for item in search_results if item.get('citekey') == citation_key), None)
+                                        if matched_item:
+                                            library_id = matched_item.get('libraryID', 1)
                                 
-                                # Get attachments
-                                attachments = bibtex.get_attachments(citation_key, library_id)
+                                    # Get attachments
+                                    attachments = bibtex.get_attachments(citation_key, library_id)
                                 
-                                # Process annotations from attachments
-                                for attachment in attachments:
-                                    annotations = bibtex.get_annotations_from_attachment(attachment)
+                                    # Process annotations from attachments
+                                    for attachment in attachments:
+                                        annotations = bibtex.get_annotations_from_attachment(attachment)
                                     
-                                    for anno in annotations:
-                                        processed = process_annotation(anno, attachment)
-                                        if processed:
-                                            # Create Zotero-like annotation object
-                                            bibtex_anno = {
-                                                "key": processed.get("id", ""),
-                                                "data": {
-                                                    "itemType": "annotation",
-                                                    "annotationType": processed.get("type", "highlight"),
-                                                    "annotationText": processed.get("annotatedText", ""),
-                                                    "annotationComment": processed.get("comment", ""),
-                                                    "annotationColor": processed.get("color", ""),
-                                                    "parentItem": item_key,
-                                                    "tags": [],
-                                                    "_pdf_page": processed.get("page", 0),
-                                                    "_pageLabel": processed.get("pageLabel", ""),
-                                                    "_attachment_title": attachment.get("title", ""),
-                                                    "_color_category": get_color_category(processed.get("color", "")),
-                                                    "_from_better_bibtex": True
+                                        for anno in annotations:
+                                            processed = process_annotation(anno, attachment)
+                                            if processed:
+                                                # Create Zotero-like annotation object
+                                                bibtex_anno = {
+                                                    "key": processed.get("id", ""),
+                                                    "data": {
+                                                        "itemType": "annotation",
+                                                        "annotationType": processed.get("type", "highlight"),
+                                                        "annotationText": processed.get("annotatedText", ""),
+                                                        "annotationComment": processed.get("comment", ""),
+                                                        "annotationColor": processed.get("color", ""),
+                                                        "parentItem": item_key,
+                                                        "tags": [],
+                                                        "_pdf_page": processed.get("page", 0),
+                                                        "_pageLabel": processed.get("pageLabel", ""),
+                                                        "_attachment_title": attachment.get("title", ""),
+                                                        "_color_category": get_color_category(processed.get("color", "")),
+                                                        "_from_better_bibtex": True
+                                                    }
                                                 }
-                                            }
-                                            better_bibtex_annotations.append(bibtex_anno)
+                                                better_bibtex_annotations.append(bibtex_anno)
                                 
-                                ctx.info(f"Retrieved {len(better_bibtex_annotations)} annotations via Better BibTeX")
-                                logging.info(f"Retrieved {len(better_bibtex_annotations)} annotations via Better BibTeX")
-                            except Exception as e:
-                                ctx.warn(f"Error processing Better BibTeX annotations: {e}")
-                                logging.warning(f"Error processing Better BibTeX annotations: {e}")
-                except Exception as bibtex_error:
-                    ctx.warn(f"Error initializing Better BibTeX: {bibtex_error}")
-                    logging.warning(f"Error initializing Better BibTeX: {bibtex_error}")
-            
-            # Fallback to Zotero API annotations
-            if not better_bibtex_annotations:
-                try:
-                    # Get child annotations via Zotero API
-                    children = zot.children(item_key)
-                    zotero_api_annotations = [
-                        item for item in children 
-                        if item.get("data", {}).get("itemType") == "annotation"
-                    ]
-                    ctx.info(f"Retrieved {len(zotero_api_annotations)} annotations via Zotero API")
-                    logging.info(f"Retrieved {len(zotero_api_annotations)} annotations via Zotero API")
-                except Exception as api_error:
-                    ctx.warn(f"Error retrieving Zotero API annotations: {api_error}")
-                    logging.warning(f"Error retrieving Zotero API annotations: {api_error}")
-            
-            # PDF Extraction fallback
-            if use_pdf_extraction and not (better_bibtex_annotations or zotero_api_annotations):
-                try:
-                    from zotero_mcp.pdfannots_helper import extract_annotations_from_pdf, ensure_pdfannots_installed
-                    import tempfile
-                    import uuid
-                    
-                    # Ensure PDF annotation tool is installed
-                    if ensure_pdfannots_installed():
-                        # Get PDF attachments
+                                    ctx.info(f"Retrieved {len(better_bibtex_annotations)} annotations via Better BibTeX")
+                                    logging.info(f"Retrieved {len(better_bibtex_annotations)} annotations via Better BibTeX")
+                                except Exception as e:
+                                    ctx.warn(f"Error processing Better BibTeX annotations: {e}")
+                                    logging.warning(f"Error processing Better BibTeX annotations: {e}")
+                    except Exception as bibtex_error:
+                        ctx.warn(f"Error initializing Better BibTeX: {bibtex_error}")
+                        logging.warning(f"Error initializing Better BibTeX: {bibtex_error}")
+            
+                # Fallback to Zotero API annotations
+                if not better_bibtex_annotations:
+                    try:
+                        # Get child annotations via Zotero API
                         children = zot.children(item_key)
-                        pdf_attachments = [
+                        zotero_api_annotations = [
                             item for item in children 
-                            if item.get("data", {}).get("contentType") == "application/pdf"
+                            if item.get("data", {}).get("itemType") == "annotation"
                         ]
+                        ctx.info(f"Retrieved {len(zotero_api_annotations)} annotations via Zotero API")
+                        logging.info(f"Retrieved {len(zotero_api_annotations)} annotations via Zotero API")
+                    except Exception as api_error:
+                        ctx.warn(f"Error retrieving Zotero API annotations: {api_error}")
+                        logging.warning(f"Error retrieving Zotero API annotations: {api_error}")
+            
+                # PDF Extraction fallback
+                if use_pdf_extraction and not (better_bibtex_annotations or zotero_api_annotations):
+                    try:
+                        from zotero_mcp.pdfannots_helper import extract_annotations_from_pdf, ensure_pdfannots_installed
+                        import tempfile
+                        import uuid
+                    
+                        # Ensure PDF annotation tool is installed
+                        if ensure_pdfannots_installed():
+                            # Get PDF attachments
+                            children = zot.children(item_key)
+                            pdf_attachments = [
+                                item for item in children 
+                                if item.get("data", {}).get("contentType") == "application/pdf"
+                            ]
                         
-                        # Extract annotations from PDFs
-                        for attachment in pdf_attachments:
-                            with tempfile.TemporaryDirectory() as tmpdir:
-                                att_key = attachment.get("key", "")
-                                file_path = os.path.join(tmpdir, f"{att_key}.pdf")
-                                zot.dump(att_key, file_path)
+                            # Extract annotations from PDFs
+                            for attachment in pdf_attachments:
+                                with tempfile.TemporaryDirectory() as tmpdir:
+                                    att_key = attachment.get("key", "")
+                                    file_path = os.path.join(tmpdir, f"{att_key}.pdf")
+                                    zot.dump(att_key, file_path)
                                 
-                                if os.path.exists(file_path):
-                                    extracted = extract_annotations_from_pdf(file_path, tmpdir)
+                                    if os.path.exists(file_path):
+                                        extracted = extract_annotations_from_pdf(file_path, tmpdir)
                                     
-                                    for ext in extracted:
-                                        # Skip empty annotations
-                                        if not ext.get("annotatedText") and not ext.get("comment"):
-                                            continue
+                                        for ext in extracted:
+                                            # Skip empty annotations
+                                            if not ext.get("annotatedText") and not ext.get("comment"):
+                                                continue
                                         
-                                        # Create Zotero-like annotation object
-                                        pdf_anno = {
-                                            "key": f"pdf_{att_key}_{ext.get('id', uuid.uuid4().hex[:8])}",
-                                            "data": {
-                                                "itemType": "annotation",
-                                                "annotationType": ext.get("type", "highlight"),
-                                                "annotationText": ext.get("annotatedText", ""),
-                                                "annotationComment": ext.get("comment", ""),
-                                                "annotationColor": ext.get("color", ""),
-                                                "parentItem": item_key,
-                                                "tags": [],
-                                                "_pdf_page": ext.get("page", 0),
-                                                "_from_pdf_extraction": True,
-                                                "_attachment_title": attachment.get("data", {}).get("title", "PDF")
+                                            # Create Zotero-like annotation object
+                                            pdf_anno = {
+                                                "key": f"pdf_{att_key}_{ext.get('id', uuid.uuid4().hex[:8])}",
+                                                "data": {
+                                                    "itemType": "annotation",
+                                                    "annotationType": ext.get("type", "highlight"),
+                                                    "annotationText": ext.get("annotatedText", ""),
+                                                    "annotationComment": ext.get("comment", ""),
+                                                    "annotationColor": ext.get("color", ""),
+                                                    "parentItem": item_key,
+                                                    "tags": [],
+                                                    "_pdf_page": ext.get("page", 0),
+                                                    "_from_pdf_extraction": True,
+                                                    "_attachment_title": attachment.get("data", {}).get("title", "PDF")
+                                                }
                                             }
-                                        }
                                         
-                                        # Handle image annotations
-                                        if ext.get("type") == "image" and ext.get("imageRelativePath"):
-                                            pdf_anno["data"]["_image_path"] = os.path.join(tmpdir, ext.get("imageRelativePath"))
+                                            # Handle image annotations
+                                            if ext.get("type") == "image" and ext.get("imageRelativePath"):
+                                                pdf_anno["data"]["_image_path"] = os.path.join(tmpdir, ext.get("imageRelativePath"))
                                         
-                                        pdf_annotations.append(pdf_anno)
+                                            pdf_annotations.append(pdf_anno)
                         
-                        ctx.info(f"Retrieved {len(pdf_annotations)} annotations via PDF extraction")
-                        logging.info(f"Retrieved {len(pdf_annotations)} annotations via PDF extraction")
-                except Exception as pdf_error:
-                    ctx.warn(f"Error during PDF annotation extraction: {pdf_error}")
-                    logging.warning(f"Error during PDF annotation extraction: {pdf_error}")
+                            ctx.info(f"Retrieved {len(pdf_annotations)} annotations via PDF extraction")
+                            logging.info(f"Retrieved {len(pdf_annotations)} annotations via PDF extraction")
+                    except Exception as pdf_error:
+                        ctx.warn(f"Error during PDF annotation extraction: {pdf_error}")
+                        logging.warning(f"Error during PDF annotation extraction: {pdf_error}")
             
-            # Combine annotations from all sources
-            annotations = better_bibtex_annotations + zotero_api_annotations + pdf_annotations
+                # Combine annotations from all sources
+                annotations = better_bibtex_annotations + zotero_api_annotations + pdf_annotations
         
-        else:
-            # Retrieve all annotations in the library
-            if isinstance(limit, str):
-                limit = int(limit)
-            zot.add_parameters(itemType="annotation", limit=limit or 50)
-            annotations = zot.everything(zot.items())
-        
-        # Handle no annotations found
-        if not annotations:
-            logging.warning(f"No annotations found{f' for item: {parent_title}' if item_key else ''}.")
-            return f"No annotations found{f' for item: {parent_title}' if item_key else ''}."
-        
-        # Generate markdown output
-        output = [f"# Annotations{f' for: {parent_title}' if item_key else ''}", ""]
-        
-        for i, anno in enumerate(annotations, 1):
-            data = anno.get("data", {})
-            
-            # Annotation details
-            anno_type = data.get("annotationType", "Unknown type")
-            anno_text = data.get("annotationText", "")
-            anno_comment = data.get("annotationComment", "")
-            anno_color = data.get("annotationColor", "")
-            anno_key = anno.get("key", "")
-            
-            # Parent item context for library-wide retrieval
-            parent_info = ""
-            if not item_key and (parent_key := data.get("parentItem")):
-                try:
-                    parent = zot.item(parent_key)
-                    parent_title = parent["data"].get("title", "Untitled")
-                    parent_info = f" (from \"{parent_title}\")"
-                except Exception:
-                    parent_info = f" (parent key: {parent_key})"
-            
-            # Annotation source details
-            source_info = ""
-            if data.get("_from_better_bibtex", False):
-                source_info = " (extracted via Better BibTeX)"
-            elif data.get("_from_pdf_extraction", False):
-                source_info = " (extracted directly from PDF)"
-            
-            # Attachment context
-            attachment_info = ""
-            if "_attachment_title" in data and data["_attachment_title"]:
-                attachment_info = f" in {data['_attachment_title']}"
-            
-            # Build markdown annotation entry
-            output.append(f"## Annotation {i}{parent_info}{attachment_info}{source_info}")
-            output.append(f"**Type:** {anno_type}")
-            output.append(f"**Key:** {anno_key}")
-            
-            # Color information
-            if anno_color:
-                output.append(f"**Color:** {anno_color}")
-                if "_color_category" in data and data["_color_category"]:
-                    output.append(f"**Color Category:** {data['_color_category']}")
-            
-            # Page information
-            if "_pdf_page" in data:
-                label = data.get("_pageLabel", str(data["_pdf_page"]))
-                output.append(f"**Page:** {data['_pdf_page']} (Label: {label})")
-            
-            # Annotation content
-            if anno_text:
-                output.append(f"**Text:** {anno_text}")
-            
-            if anno_comment:
-                output.append(f"**Comment:** {anno_comment}")
-            
-            # Image annotation
-            if "_image_path" in data and os.path.exists(data["_image_path"]):
-                output.append(f"**Image:** This annotation includes an image (not displayed in this interface)")
-            
-            # Tags
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
-            
-            output.append("")  # Empty line between annotations
+            else:
+                # Retrieve all annotations in the library
+                if isinstance(limit, str):
+                    limit = int(limit)
+                zot.add_parameters(itemType="annotation", limit=limit or 50)
+                annotations = zot.everything(zot.items())
+        
+            # Handle no annotations found
+            if not annotations:
+                logging.warning(f"No annotations found{f' for item: {parent_title}' if item_key else ''}.")
+                return f"No annotations found{f' for item: {parent_title}' if item_key else ''}."
+        
+            # Generate markdown output
+            output = [f"# Annotations{f' for: {parent_title}' if item_key else ''}", ""]
+        
+            for i, anno in enumerate(annotations, 1):
+                data = anno.get("data", {})
+            
+                # Annotation details
+                anno_type = data.get("annotationType", "Unknown type")
+                anno_text = data.get("annotationText", "")
+                anno_comment = data.get("annotationComment", "")
+                anno_color = data.get("annotationColor", "")
+                anno_key = anno.get("key", "")
+            
+                # Parent item context for library-wide retrieval
+                parent_info = ""
+                if not item_key and (parent_key := data.get("parentItem")):
+                    try:
+                        parent = get_cached_item(zot, parent_key)
+                        parent_title = parent["data"].get("title", "Untitled")
+                        parent_info = f" (from \"{parent_title}\")"
+                    except Exception:
+                        parent_info = f" (parent key: {parent_key})"
+            
+                # Annotation source details
+                source_info = ""
+                if data.get("_from_better_bibtex", False):
+                    source_info = " (extracted via Better BibTeX)"
+                elif data.get("_from_pdf_extraction", False):
+                    source_info = " (extracted directly from PDF)"
+            
+                # Attachment context
+                attachment_info = ""
+                if "_attachment_title" in data and data["_attachment_title"]:
+                    attachment_info = f" in {data['_attachment_title']}"
+            
+                # Build markdown annotation entry
+                output.append(f"## Annotation {i}{parent_info}{attachment_info}{source_info}")
+                output.append(f"**Type:** {anno_type}")
+                output.append(f"**Key:** {anno_key}")
+            
+                # Color information
+                if anno_color:
+                    output.append(f"**Color:** {anno_color}")
+                    if "_color_category" in data and data["_color_category"]:
+                        output.append(f"**Color Category:** {data['_color_category']}")
+            
+                # Page information
+                if "_pdf_page" in data:
+                    label = data.get("_pageLabel", str(data["_pdf_page"]))
+                    output.append(f"**Page:** {data['_pdf_page']} (Label: {label})")
+            
+                # Annotation content
+                if anno_text:
+                    output.append(f"**Text:** {anno_text}")
+            
+                if anno_comment:
+                    output.append(f"**Comment:** {anno_comment}")
+            
+                # Image annotation
+                if "_image_path" in data and os.path.exists(data["_image_path"]):
+                    output.append(f"**Image:** This annotation includes an image (not displayed in this interface)")
+            
+                # Tags
+                if tags := data.get("tags"):
+                    tag_list = [f"`{tag['tag']}`" for tag in tags]
+                    if tag_list:
+                        output.append(f"**Tags:** {' '.join(tag_list)}")
+            
+                output.append("")  # Empty line between annotations
         
-        return "\n".join(output)
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error fetching annotations: {str(e)}")
@@ -1510,6 +1728,7 @@ def get_annotations(
     name="zotero_get_notes",
     description="Retrieve notes from your Zotero library, with options to filter by parent item."
 )
+@offloaded("zotero_get_notes")
 def get_notes(
     item_key: Optional[str] = None,
     limit: Optional[Union[int, str]] = 20,
@@ -1531,65 +1750,65 @@ def get_notes(
     try:
         ctx.info(f"Fetching notes{f' for item {item_key}' if item_key else ''}")
         logging.info(f"Fetching notes{f' for item {item_key}' if item_key else ''}")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        # Prepare search parameters
-        params = {"itemType": "note"}
-        if item_key:
-            params["parentItem"] = item_key
+            # Prepare search parameters
+            params = {"itemType": "note"}
+            if item_key:
+                params["parentItem"] = item_key
         
-        if isinstance(limit, str):
-            limit = int(limit)
+            if isinstance(limit, str):
+                limit = int(limit)
         
-        # Get notes
-        notes = zot.items(**params) if not limit else zot.items(limit=limit, **params)
+            # Get notes
+            notes = zot.items(**params) if not limit else zot.items(limit=limit, **params)
         
-        if not notes:
-            logging.warning(f"No notes found{f' for item {item_key}' if item_key else ''}.")
-            return f"No notes found{f' for item {item_key}' if item_key else ''}."
+            if not notes:
+                logging.warning(f"No notes found{f' for item {item_key}' if item_key else ''}.")
+                return f"No notes found{f' for item {item_key}' if item_key else ''}."
         
-        # Generate markdown output
-        output = [f"# Notes{f' for Item: {item_key}' if item_key else ''}", ""]
+            # Generate markdown output
+            output = [f"# Notes{f' for Item: {item_key}' if item_key else ''}", ""]
         
-        for i, note in enumerate(notes, 1):
-            data = note.get("data", {})
-            note_key = note.get("key", "")
+            for i, note in enumerate(notes, 1):
+                data = note.get("data", {})
+                note_key = note.get("key", "")
             
-            # Parent item context
-            parent_info = ""
-            if parent_key := data.get("parentItem"):
-                try:
-                    parent = zot.item(parent_key)
-                    parent_title = parent["data"].get("title", "Untitled")
-                    parent_info = f" (from \"{parent_title}\")"
-                except Exception:
-                    parent_info = f" (parent key: {parent_key})"
+                # Parent item context
+                parent_info = ""
+                if parent_key := data.get("parentItem"):
+                    try:
+                        parent = get_cached_item(zot, parent_key)
+                        parent_title = parent["data"].get("title", "Untitled")
+                        parent_info = f" (from \"{parent_title}\")"
+                    except Exception:
+                        parent_info = f" (parent key: {parent_key})"
             
-            # Prepare note text
-            note_text = data.get("note", "")
+                # Prepare note text
+                note_text = data.get("note", "")
             
-            # Clean up HTML formatting
-            note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
-            note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
+                # Clean up HTML formatting
+                note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
+                note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
             
-            # Limit note length for display
-            if len(note_text) > 500:
-                note_text = note_text[:500] + "..."
+                # Limit note length for display
+                if len(note_text) > 500:
+                    note_text = note_text[:500] + "..."
             
-            # Build markdown entry
-            output.append(f"## Note {i}{parent_info}")
-            output.append(f"**Key:** {note_key}")
+                # Build markdown entry
+                output.append(f"## Note {i}{parent_info}")
+                output.append(f"**Key:** {note_key}")
             
-            # Tags
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
+                # Tags
+                if tags := data.get("tags"):
+                    tag_list = [f"`{tag['tag']}`" for tag in tags]
+                    if tag_list:
+                        output.append(f"**Tags:** {' '.join(tag_list)}")
             
-            output.append(f"**Content:**\n{note_text}")
-            output.append("")  # Empty line between notes
+                output.append(f"**Content:**\n{note_text}")
+                output.append("")  # Empty line between notes
         
-        return "\n".join(output)
+            return "\n".join(output)
     
     except Exception as e:
         ctx.error(f"Error fetching notes: {str(e)}")
@@ -1601,6 +1820,7 @@ def get_notes(
     name="zotero_search_notes",
     description="Search for notes across your Zotero library."
 )
+@offloaded("zotero_search_notes")
 def search_notes(
     query: str,
     limit: Optional[Union[int, str]] = 20,
@@ -1626,128 +1846,133 @@ def search_notes(
         
         ctx.info(f"Searching Zotero notes for '{query}'")
         logging.info(f"Searching Zotero notes for '{query}'")
-        zot = get_zotero_client()
-        
-        # Search for notes and annotations
-        results = []
-        
         if isinstance(limit, str):
             limit = int(limit)
         
-        # First search notes
-        zot.add_parameters(q=query, itemType="note", limit=limit or 20)
-        notes = zot.items()
-        
-        # Then search annotations (reusing the get_annotations function)
-        annotation_results = get_annotations(
-            item_key=None,  # Search all annotations
-            use_pdf_extraction=True,
-            limit=limit or 20,
-            ctx=ctx
-        )
-        
-        # Parse the annotation results to extract annotation items
-        # This is a bit hacky and depends on the exact formatting of get_annotations
-        # You might want to modify get_annotations to return a more structured result
-        annotation_lines = annotation_results.split("\n")
-        current_annotation = None
-        annotations = []
-        
-        for line in annotation_lines:
-            if line.startswith("## "):
-                if current_annotation:
-                    annotations.append(current_annotation)
-                current_annotation = {"lines": [line], "type": "annotation"}
-            elif current_annotation is not None:
-                current_annotation["lines"].append(line)
-        
-        if current_annotation:
-            annotations.append(current_annotation)
-        
-        # Format results
-        output = [f"# Search Results for '{query}'", ""]
-        
-        # Filter and highlight notes
-        query_lower = query.lower()
-        note_results = []
-        
-        for note in notes:
-            data = note.get("data", {})
-            note_text = data.get("note", "").lower()
-            
-            if query_lower in note_text:
-                # Prepare full note details
-                note_result = {
-                    "type": "note",
-                    "key": note.get("key", ""),
-                    "data": data
-                }
-                note_results.append(note_result)
-        
-        # Combine and sort results
-        all_results = note_results + annotations
-        
-        for i, result in enumerate(all_results, 1):
-            if result["type"] == "note":
-                # Note formatting
-                data = result["data"]
-                key = result["key"]
+        # In local mode, answer from the keyword index without the HTTP server
+        local_output = _search_notes_locally(query, limit)
+        if local_output is not None:
+            return local_output
+        
+        with zotero_client() as zot:
+        
+            # Search for notes and annotations
+            results = []
+        
+            # First search notes
+            zot.add_parameters(q=query, itemType="note", limit=limit or 20)
+            notes = zot.items()
+        
+            # Then search annotations (reusing the get_annotations function)
+            annotation_results = get_annotations(
+                item_key=None,  # Search all annotations
+                use_pdf_extraction=True,
+                limit=limit or 20,
+                ctx=ctx
+            )
+        
+            # Parse the annotation results to extract annotation items
+            # This is a bit hacky and depends on the exact formatting of get_annotations
+            # You might want to modify get_annotations to return a more structured result
+            annotation_lines = annotation_results.split("\n")
+            current_annotation = None
+            annotations = []
+        
+            for line in annotation_lines:
+                if line.startswith("## "):
+                    if current_annotation:
+                        annotations.append(current_annotation)
+                    current_annotation = {"lines": [line], "type": "annotation"}
+                elif current_annotation is not None:
+                    current_annotation["lines"].append(line)
+        
+            if current_annotation:
+                annotations.append(current_annotation)
+        
+            # Format results
+            output = [f"# Search Results for '{query}'", ""]
+        
+            # Filter and highlight notes
+            query_lower = query.lower()
+            note_results = []
+        
+            for note in notes:
+                data = note.get("data", {})
+                note_text = data.get("note", "").lower()
+            
+                if query_lower in note_text:
+                    # Prepare full note details
+                    note_result = {
+                        "type": "note",
+                        "key": note.get("key", ""),
+                        "data": data
+                    }
+                    note_results.append(note_result)
+        
+            # Combine and sort results
+            all_results = note_results + annotations
+        
+            for i, result in enumerate(all_results, 1):
+                if result["type"] == "note":
+                    # Note formatting
+                    data = result["data"]
+                    key = result["key"]
                 
-                # Parent item context
-                parent_info = ""
-                if parent_key := data.get("parentItem"):
-                    try:
-                        parent = zot.item(parent_key)
-                        parent_title = parent["data"].get("title", "Untitled")
-                        parent_info = f" (from \"{parent_title}\")"
-                    except Exception:
-                        parent_info = f" (parent key: {parent_key})"
+                    # Parent item context
+                    parent_info = ""
+                    if parent_key := data.get("parentItem"):
+                        try:
+                            parent = get_cached_item(zot, parent_key)
+                            parent_title = parent["data"].get("title", "Untitled")
+                            parent_info = f" (from \"{parent_title}\")"
+                        except Exception:
+                            parent_info = f" (parent key: {parent_key})"
                 
-                # Note text with query highlight
-                note_text = data.get("note", "")
-                note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
-                note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
+                    # Note text with query highlight
+                    note_text = data.get("note", "")
+                    note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
+                    note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
                 
-                # Highlight query in note text
-                try:
-                    # Find first occurrence of query and extract context
-                    text_lower = note_text.lower()
-                    pos = text_lower.find(query_lower)
-                    if pos >= 0:
-                        # Extract context around the query
-                        start = max(0, pos - 100)
-                        end = min(len(note_text), pos + 200)
-                        context = note_text[start:end]
+                    # Highlight query in note text
+                    try:
+                        # Find first occurrence of query and extract context
+                        text_lower = note_text.lower()
+                        pos = text_lower.find(query_lower)
+                        if pos >= 0:
+                            # Extract context around the query
+                            start = max(0, pos - 100)
+                            end = min(len(note_text), pos + 200)
+                            context = note_text[start:end]
                         
-                        # Highlight the query in the context
-                        highlighted = context.replace(
-                            context[context.lower().find(query_lower):context.lower().find(query_lower)+len(query)], 
-                            f"**{context[context.lower().find(query_lower):context.lower().find(query_lower)+len(query)]}**"
-                        )
+                            # Highlight the query in the context
+                            highlighted = context.replace(
+                                context[context.lower().find(query_lower):context.lower().find(query_lower)+len(query)], 
+                                f"**{context[context.lower().find(query_lower):context.lower().find(query_lower)+len(query)]}**"
+                            )
                         
-                        note_text = highlighted + "..."
-                except Exception:
-                    # Fallback to first 500 characters if highlighting fails
-                    note_text = note_text[:500] + "..."
+                            note_text = highlighted + "..."
+                    except Exception:
+                        # Fallback to first 500 characters if highlighting fails
+                        note_text = note_text[:500] + "..."
                 
-                output.append(f"## Note {i}{parent_info}")
-                output.append(f"**Key:** {key}")
+                    output.append(f"## Note {i}{parent_info}")
+                    output.append(f"**Key:** {key}")
                 
-                # Tags
-                if tags := data.get("tags"):
-                    tag_list = [f"`{tag['tag']}`" for tag in tags]
-                    if tag_list:
-                        output.append(f"**Tags:** {' '.join(tag_list)}")
+                    # Tags
+                    if tags := data.get("tags"):
+                        tag_list = [f"`{tag['tag']}`" for tag in tags]
+                        if tag_list:
+                            output.append(f"**Tags:** {' '.join(tag_list)}")
                 
-                output.append(f"**Content:**\n{note_text}")
-                output.append("")
+                    output.append(f"**Content:**\n{note_text}")
+                    output.append("")
             
-            elif result["type"] == "annotation":
-                # Add the entire annotation block
-                output.extend(result["lines"])
-                output.append("")
+                elif result["type"] == "annotation":
+                    # Add the entire annotation block
+                    output.extend(result["lines"])
+                    output.append("")
         
-        return "\n".join(output) if output else f"No results found for '{query}'"
+            return "\n".join(output) if output else f"No results found for '{query}'"
     
     except Exception as e:
         ctx.error(f"Error searching notes: {str(e)}")
@@ -1759,6 +1984,7 @@ def search_notes(
     name="zotero_create_note",
     description="Create a new note for a Zotero item."
 )
+@offloaded("zotero_create_note")
 def create_note(
     item_key: str,
     note_title: str,
@@ -1784,54 +2010,56 @@ def create_note(
     try:
         ctx.info(f"Creating note for item {item_key}")
         logging.info(f"Creating note for item {item_key}")
-        zot = get_zotero_client()
+        with zotero_client() as zot:
         
-        # First verify the parent item exists
-        try:
-            parent = zot.item(item_key)
-            parent_title = parent["data"].get("title", "Untitled Item")
-        except Exception:
-            logging.warning(f"Error verifying parent item for note creation: {item_key}")
-            return f"Error: No item found with key: {item_key}"
-        
-        # Format the note content with proper HTML
-        # If the note_text already has HTML, use it directly
-        if "<p>" in note_text or "<div>" in note_text:
-            html_content = note_text
-        else:
-            # Convert plain text to HTML paragraphs - avoiding f-strings with replacements
-            paragraphs = note_text.split("\n\n")
-            html_parts = []
-            for p in paragraphs:
-                # Replace newlines with <br/> tags
-                p_with_br = p.replace("\n", "<br/>")
-                html_parts.append("<p>" + p_with_br + "</p>")
-            html_content = "".join(html_parts)
-        
-        # Prepare the note data
-        note_data = {
-            "itemType": "note",
-            "parentItem": item_key,
-            "note": html_content,
-            "tags": [{"tag": tag} for tag in (tags or [])]
-        }
-        
-        # Create the note
-        result = zot.create_items([note_data])
-        
-        # Check if creation was successful
-        if "success" in result and result["success"]:
-            successful = result["success"]
-            if len(successful) > 0:
-                note_key = next(iter(successful.keys()))
-                logging.info(f"Successfully created note for \"{parent_title}\" with key: {note_key}")
-                return f"Successfully created note for \"{parent_title}\"\n\nNote key: {note_key}"
+            # First verify the parent item exists
+            try:
+                parent = get_cached_item(zot, item_key)
+                parent_title = parent["data"].get("title", "Untitled Item")
+            except Exception:
+                logging.warning(f"Error verifying parent item for note creation: {item_key}")
+                return f"Error: No item found with key: {item_key}"
+        
+            # Format the note content with proper HTML
+            # If the note_text already has HTML, use it directly
+            if "<p>" in note_text or "<div>" in note_text:
+                html_content = note_text
             else:
-                logging.warning(f"Note creation response was successful but no key was returned: {result}")
-                return f"Note creation response was successful but no key was returned: {result}"
-        else:
-            logging.error(f"Failed to create note: {result.get('failed', 'Unknown error')}")
-            return f"Failed to create note: {result.get('failed', 'Unknown error')}"
+                # Convert plain text to HTML paragraphs - avoiding f-strings with replacements
+                paragraphs = note_text.split("\n\n")
+                html_parts = []
+                for p in paragraphs:
+                    # Replace newlines with <br/> tags
+                    p_with_br = p.replace("\n", "<br/>")
+                    html_parts.append("<p>" + p_with_br + "</p>")
+                html_content = "".join(html_parts)
+        
+            # Prepare the note data
+            note_data = {
+                "itemType": "note",
+                "parentItem": item_key,
+                "note": html_content,
+                "tags": [{"tag": tag} for tag in (tags or [])]
+            }
+        
+            # Create the note
+            result = zot.create_items([note_data])
+            # The parent's child count changed
+            get_item_cache().invalidate(zot, item_key)
+        
+            # Check if creation was successful
+            if "success" in result and result["success"]:
+                successful = result["success"]
+                if len(successful) > 0:
+                    note_key = next(iter(successful.keys()))
+                    logging.info(f"Successfully created note for \"{parent_title}\" with key: {note_key}")
+                    return f"Successfully created note for \"{parent_title}\"\n\nNote key: {note_key}"
+                else:
+                    logging.warning(f"Note creation response was successful but no key was returned: {result}")
+                    return f"Note creation response was successful but no key was returned: {result}"
+            else:
+                logging.error(f"Failed to create note: {result.get('failed', 'Unknown error')}")
+                return f"Failed to create note: {result.get('failed', 'Unknown error')}"
     
     except Exception as e:
         ctx.error(f"Error creating note: {str(e)}")
@@ -1843,10 +2071,13 @@ def create_note(
     name="zotero_semantic_search",
     description="Prioritized search tool. Perform semantic search over your Zotero library using AI-powered embeddings."
 )
+@offloaded("zotero_semantic_search", limit=4)
 def semantic_search(
     query: str,
     limit: int = 10,
     filters: Optional[Union[Dict[str, str], str]] = None,
+    mode: Optional[Literal["vector", "keyword", "hybrid"]] = None,
+    rerank: Optional[bool] = None,
     *,
     ctx: Context
 ) -> str:
@@ -1857,6 +2088,10 @@ def semantic_search(
         query: Search query text - can be concepts, topics, or natural language descriptions
         limit: Maximum number of results to return (default: 10)
         filters: Optional metadata filters as dict or JSON string. Example: {"item_type": "note"}
+        mode: "vector" (embeddings), "keyword" (BM25 ranking of exact terms) or
+            "hybrid" (both, fused by rank); default from the config file, else "vector"
+        rerank: Reorder over-fetched candidates with a local cross-encoder within
+            its latency budget; default from the config file, else off
         ctx: MCP context
     
     Returns:
@@ -1899,17 +2134,17 @@ def semantic_search(
         logging.info(f"Performing semantic search for: '{query}'")
         
         # Import semantic search module
-        from zotero_mcp.semantic_search import create_semantic_search
+        from zotero_mcp.semantic_search import get_semantic_search
         from pathlib import Path
         
         # Determine config path
         config_path = Path.home() / ".config" / "zotero-mcp" / "config.json"
         
-        # Create semantic search instance
-        search = create_semantic_search(str(config_path))
+        # Reuse the shared semantic search instance
+        search = get_semantic_search(str(config_path))
         
         # Perform search
-        results = search.search(query=query, limit=limit, filters=filters)
+        results = search.search(query=query, limit=limit, filters=filters, mode=mode, rerank=rerank)
         
         if results.get("error"):
             logging.error(f"Semantic search error: {results['error']}")
@@ -1923,11 +2158,23 @@ def semantic_search(
         
         # Format results as markdown
         output = [f"# Semantic Search Results for '{query}'", ""]
-        output.append(f"Found {len(search_results)} similar items:")
+        output.append(f"Found {len(search_results)} similar items ({results.get('mode', 'vector')} search):")
+        if warning := results.get("warning"):
+            output.append(f"_{warning}_")
+        rerank_report = results.get("rerank") or {}
+        if rerank_report and not rerank_report.get("applied"):
+            output.append(f"_Reranking skipped: {rerank_report.get('reason')}_")
         output.append("")
         
         for i, result in enumerate(search_results, 1):
             similarity_score = result.get("similarity_score", 0)
+            if ranks := result.get("ranks"):
+                score_line = f"**Score:** {similarity_score:.4f} (" + ", ".join(
+                    f"{name} #{rank}" for name, rank in ranks.items()) + ")"
+            else:
+                score_line = f"**Similarity Score:** {similarity_score:.3f}"
+            if "rerank_score" in result:
+                score_line += f" | **Rerank Score:** {result['rerank_score']:.3f}"
             metadata = result.get("metadata", {})
             zotero_item = result.get("zotero_item", {})
             
@@ -1942,7 +2189,7 @@ def semantic_search(
                 creators_str = format_creators(creators)
                 
                 output.append(f"## {i}. {title}")
-                output.append(f"**Similarity Score:** {similarity_score:.3f}")
+                output.append(score_line)
                 output.append(f"**Type:** {item_type}")
                 output.append(f"**Item Key:** {key}")
                 output.append(f"**Authors:** {creators_str}")
@@ -1972,11 +2219,15 @@ def semantic_search(
             else:
                 # Fallback if full Zotero item not available
                 output.append(f"## {i}. Item {result.get('item_key', 'Unknown')}")
-                output.append(f"**Similarity Score:** {similarity_score:.3f}")
+                output.append(score_line)
                 if error := result.get("error"):
                     output.append(f"**Error:** {error}")
                 output.append("")
         
+        if timings := results.get("timings"):
+            output.append("**Timings:** " + ", ".join(
+                f"{stage.replace('_ms', '')} {ms:.1f} ms" for stage, ms in timings.items()))
+        
         return "\n".join(output)
     
     except Exception as e:
@@ -1985,13 +2236,122 @@ def semantic_search(
         return f"Error in semantic search: {str(e)}"
 
 
+def _start_index_job(search: Any, force_rebuild: bool = False, limit: Optional[int] = None,
+                     extract_fulltext: bool = False, resume: bool = False) -> Job:
+    """
+    Run update_database as a background job.
+    
+    Returns:
+        The new job, or the index build that is already queued or running
+    """
+    def run(report, cancel):
+        def progress(done: int, total: int, stats: Dict[str, Any]) -> None:
+            report(done, total, f"added: {stats.get('added_items', 0)}, skipped: {stats.get('skipped_items', 0)}, "
+                                f"errors: {stats.get('errors', 0)}")
+        return search.update_database(
+            force_full_rebuild=force_rebuild,
+            limit=limit,
+            extract_fulltext=extract_fulltext,
+            resume=resume,
+            progress=progress,
+            cancel=cancel,
+        )
+    
+    options = [name for name, enabled in (("force rebuild", force_rebuild), ("fulltext", extract_fulltext),
+                                          ("resume", resume)) if enabled]
+    if limit:
+        options.append(f"limit {limit}")
+    description = "Update semantic search database" + (f" ({', '.join(options)})" if options else "")
+    return get_job_manager().submit(INDEX_JOB, description, run)
+
+
+def _format_update_stats(stats: Dict[str, Any]) -> List[str]:
+    """Markdown lines describing the statistics of an update_database run."""
+    output = []
+    if stats.get("error"):
+        output.append(f"**Error:** {stats['error']}")
+        return output
+    
+    output.append(f"**Sync mode:** {stats.get('sync_mode', 'full')}")
+    if stats.get("rebuild_reason"):
+        output.append(f"**Rebuilt:** {stats['rebuild_reason']}")
+    output.append(f"**Total items:** {stats.get('total_items', 0)}")
+    output.append(f"**Processed:** {stats.get('processed_items', 0)}")
+    output.append(f"**Added:** {stats.get('added_items', 0)}")
+    output.append(f"**Updated:** {stats.get('updated_items', 0)}")
+    output.append(f"**Skipped:** {stats.get('skipped_items', 0)}")
+    output.append(f"**Deleted:** {stats.get('deleted_items', 0)}")
+    output.append(f"**Errors:** {stats.get('errors', 0)}")
+    if stats.get("cancelled"):
+        output.append(f"**Cancelled after:** {stats.get('processed_items_before_cancel', 0)} items "
+                      "(call zotero_update_search_database with resume=true to continue)")
+    if stats.get("resumed_from"):
+        output.append(f"**Resumed after:** {stats['resumed_from']} items")
+    if stats.get("retried_items"):
+        output.append(f"**Retried:** {stats['retried_items']}")
+    if stats.get("failed_items"):
+        output.append(f"**Still failing:** {stats['failed_items']} (call again with resume=true to retry)")
+    if stats.get("fulltext_sources"):
+        sources = ", ".join(f"{k}: {v}" for k, v in sorted(stats["fulltext_sources"].items()))
+        output.append(f"**Fulltext sources:** {sources}")
+    if stats.get("embedding_tokens"):
+        output.append(f"**Embedding:** {stats['embedding_tokens']} tokens at {stats.get('embedding_tokens_per_second', 0)} tokens/s")
+    output.append(f"**Duration:** {stats.get('duration', 'Unknown')}")
+    
+    if stats.get('start_time'):
+        output.append(f"**Started:** {stats['start_time']}")
+    if stats.get('end_time'):
+        output.append(f"**Completed:** {stats['end_time']}")
+    return output
+
+
+def _format_job(job: Job) -> str:
+    """Markdown status report of a background job."""
+    output = [f"# Job {job.job_id}", ""]
+    output.append(f"**Task:** {job.description}")
+    output.append(f"**State:** {job.state}" + (" (cancellation requested)"
+                                                if job.cancel_event.is_set() and not job.finished else ""))
+    if job.total:
+        output.append(f"**Progress:** {job.progress}/{job.total} items ({job.progress / job.total:.0%})")
+    if job.message:
+        output.append(f"**Status:** {job.message}")
+    output.append(f"**Elapsed:** {job.elapsed:.1f}s")
+    if job.error:
+        output.append(f"**Error:** {job.error}")
+    if job.result and job.finished:
+        output.append("")
+        output.append("## Results")
+        output.extend(_format_update_stats(job.result))
+    if not job.finished:
+        output.append("")
+        output.append(f"Check progress with zotero_get_indexing_job(job_id=\"{job.job_id}\") "
+                      f"or stop it with zotero_cancel_indexing_job.")
+    return "\n".join(output)
+
+
+def _follow_job(job: Job, ctx: Context, wait_seconds: Optional[float] = None) -> None:
+    """Report a job's progress to the client until it finishes or `wait_seconds` pass."""
+    deadline = time.monotonic() + wait_seconds if wait_seconds is not None else None
+    while not job.finished:
+        ctx.report_progress(job.progress, job.total or None, job.message)
+        remaining = deadline - time.monotonic() if deadline is not None else JOB_PROGRESS_INTERVAL
+        if remaining <= 0:
+            break
+        job.done_event.wait(min(JOB_PROGRESS_INTERVAL, remaining))
+    if job.finished:
+        ctx.report_progress(job.progress, job.total or None, job.state)
+
+
 @mcp.tool(
     name="zotero_update_search_database",
-    description="Update the semantic search database with latest Zotero items."
+    description="Update the semantic search database with latest Zotero items. Runs as a background job and returns its id; pass wait=true to follow it to completion."
 )
+@offloaded("zotero_update_search_database", limit=1)
 def update_search_database(
     force_rebuild: bool = False,
     limit: Optional[int] = None,
+    resume: bool = False,
+    wait: bool = False,
     *,
     ctx: Context
 ) -> str:
@@ -2001,10 +2361,12 @@ def update_search_database(
     Args:
         force_rebuild: Whether to rebuild the entire database from scratch
         limit: Limit number of items to process (useful for testing)
+        resume: Continue an interrupted update from its checkpoint
+        wait: Stay in the call, reporting progress, until the update finishes
         ctx: MCP context
     
     Returns:
-        Update status and statistics
+        Job status, with update statistics once it has finished
     """
     logging.info("Tool 'zotero_update_search_database' called.")
     try:
@@ -2012,44 +2374,23 @@ def update_search_database(
         logging.info("Starting semantic search database update...")
         
         # Import semantic search module
-        from zotero_mcp.semantic_search import create_semantic_search
+        from zotero_mcp.semantic_search import get_semantic_search
         from pathlib import Path
         
         # Determine config path
         config_path = Path.home() / ".config" / "zotero-mcp" / "config.json"
         
-        # Create semantic search instance
-        search = create_semantic_search(str(config_path))
+        # Reuse the shared semantic search instance
+        search = get_semantic_search(str(config_path))
         
         # Perform update with no fulltext extraction (for speed)
-        stats = search.update_database(
-            force_full_rebuild=force_rebuild,
-            limit=limit,
-            extract_fulltext=False
-        )
+        job = _start_index_job(search, force_rebuild=force_rebuild, limit=limit, resume=resume)
+        if wait:
+            _follow_job(job, ctx)
+            if job.result and not job.error:
+                logging.info(f"Semantic search database update completed. Stats: {job.result}")
         
-        # Format results
-        output = ["# Database Update Results", ""]
-        
-        if stats.get("error"):
-            output.append(f"**Error:** {stats['error']}")
-            logging.error(f"Semantic search database update failed: {stats['error']}")
-        else:
-            output.append(f"**Total items:** {stats.get('total_items', 0)}")
-            output.append(f"**Processed:** {stats.get('processed_items', 0)}")
-            output.append(f"**Added:** {stats.get('added_items', 0)}")
-            output.append(f"**Updated:** {stats.get('updated_items', 0)}")
-            output.append(f"**Skipped:** {stats.get('skipped_items', 0)}")
-            output.append(f"**Errors:** {stats.get('errors', 0)}")
-            output.append(f"**Duration:** {stats.get('duration', 'Unknown')}")
-            
-            if stats.get('start_time'):
-                output.append(f"**Started:** {stats['start_time']}")
-            if stats.get('end_time'):
-                output.append(f"**Completed:** {stats['end_time']}")
-            logging.info(f"Semantic search database update completed. Stats: {stats}")
-        
-        return "\n".join(output)
+        return _format_job(job)
     
     except Exception as e:
         ctx.error(f"Error updating search database: {str(e)}")
@@ -2057,10 +2398,82 @@ def update_search_database(
         return f"Error updating search database: {str(e)}"
 
 
+@mcp.tool(
+    name="zotero_get_indexing_job",
+    description="Get the status of a semantic search database update job, or list recent jobs."
+)
+@offloaded("zotero_get_indexing_job")
+def get_indexing_job(
+    job_id: Optional[str] = None,
+    wait_seconds: float = 0,
+    *,
+    ctx: Context
+) -> str:
+    """
+    Get the status of an indexing job.
+    
+    Args:
+        job_id: Job id returned by zotero_update_search_database; omit to list recent jobs
+        wait_seconds: Report progress for up to this many seconds before answering
+        ctx: MCP context
+    
+    Returns:
+        Markdown-formatted job status
+    """
+    manager = get_job_manager()
+    if not job_id:
+        jobs = manager.list(INDEX_JOB)
+        if not jobs:
+            return "No indexing jobs have run since the server started."
+        output = ["# Indexing Jobs", ""]
+        for job in jobs:
+            progress = f", {job.progress}/{job.total} items" if job.total else ""
+            output.append(f"- `{job.job_id}` {job.state}{progress}: {job.description}")
+        return "\n".join(output)
+    
+    job = manager.get(job_id)
+    if job is None:
+        return f"No job found with id '{job_id}'"
+    if wait_seconds and wait_seconds > 0:
+        _follow_job(job, ctx, wait_seconds)
+    return _format_job(job)
+
+
+@mcp.tool(
+    name="zotero_cancel_indexing_job",
+    description="Cancel a running semantic search database update job."
+)
+@offloaded("zotero_cancel_indexing_job")
+def cancel_indexing_job(job_id: str, *, ctx: Context) -> str:
+    """
+    Cancel an indexing job.
+    
+    A cancelled full update keeps its checkpoint and can be continued with
+    zotero_update_search_database(resume=true).
+    
+    Args:
+        job_id: Job id returned by zotero_update_search_database
+        ctx: MCP context
+    
+    Returns:
+        Job status after the cancellation request
+    """
+    job = get_job_manager().cancel(job_id)
+    if job is None:
+        return f"No job found with id '{job_id}'"
+    if job.finished and not job.cancel_event.is_set():
+        return f"Job {job_id} already {job.state}.\n\n" + _format_job(job)
+    ctx.info(f"Cancellation requested for job {job_id}")
+    # The update stops after its current batch
+    job.done_event.wait(JOB_PROGRESS_INTERVAL)
+    return _format_job(job)
+
+
 @mcp.tool(
     name="zotero_get_search_database_status",
     description="Get status information about the semantic search database."
 )
+@offloaded("zotero_get_search_database_status")
 def get_search_database_status(*, ctx: Context) -> str:
     """
     Get semantic search database status.
@@ -2077,14 +2490,14 @@ def get_search_database_status(*, ctx: Context) -> str:
         logging.info("Getting semantic search database status...")
         
         # Import semantic search module
-        from zotero_mcp.semantic_search import create_semantic_search
+        from zotero_mcp.semantic_search import get_semantic_search
         from pathlib import Path
         
         # Determine config path
         config_path = Path.home() / ".config" / "zotero-mcp" / "config.json"
         
-        # Create semantic search instance
-        search = create_semantic_search(str(config_path))
+        # Reuse the shared semantic search instance
+        search = get_semantic_search(str(config_path))
         
         # Get status
         status = search.get_database_status()
@@ -2098,6 +2511,9 @@ def get_search_database_status(*, ctx: Context) -> str:
         output.append(f"**Document Count:** {collection_info.get('count', 0)}")
         output.append(f"**Embedding Model:** {collection_info.get('embedding_model', 'Unknown')}")
         output.append(f"**Database Path:** {collection_info.get('persist_directory', 'Unknown')}")
+        if status.get("pending_rebuild"):
+            output.append("**Pending Rebuild:** an interrupted rebuild can be continued with "
+                          "zotero_update_search_database(resume=true)")
         
         if collection_info.get('error'):
             output.append(f"**Error:** {collection_info['error']}")
@@ -2122,3 +2538,94 @@ def get_search_database_status(*, ctx: Context) -> str:
         ctx.error(f"Error getting database status: {str(e)}")
         logging.error(f"Error getting database status: {str(e)}")
         return f"Error getting database status: {str(e)}"
+
+
+@mcp.tool(
+    name="zotero_get_server_status",
+    description="Get connection pool and item cache statistics for the Zotero MCP server."
+)
+@offloaded("zotero_get_server_status")
+def get_server_status(*, ctx: Context) -> str:
+    """
+    Get server runtime statistics.
+    
+    Args:
+        ctx: MCP context
+    
+    Returns:
+        Markdown-formatted server status
+    """
+    logging.info("Tool 'zotero_get_server_status' called.")
+    try:
+        ctx.info("Getting server status...")
+        logging.info("Getting server status...")
+        
+        pool_stats = get_client_registry().get_stats()
+        
+        output = ["# Zotero MCP Server Status", ""]
+        output.append("## Client Pool")
+        output.append(f"**Pool Size (per library):** {pool_stats['pool_size']}")
+        output.append(f"**Clients Created:** {pool_stats['created']}")
+        output.append(f"**Clients Reused:** {pool_stats['reused']}")
+        output.append(f"**Reuse Ratio:** {pool_stats['reuse_ratio']:.1%}")
+        output.append(f"**In Use:** {pool_stats['in_use']}")
+        output.append(f"**Idle:** {pool_stats['idle']}")
+        output.append(f"**Discarded:** {pool_stats['discarded']}")
+        if pool_stats["libraries"]:
+            output.append(f"**Libraries:** {', '.join(pool_stats['libraries'])}")
+        
+        output.append("")
+        output.append("## Tool Executor")
+        executor_stats = get_tool_executor().get_stats()
+        output.append(f"**Worker Threads:** {executor_stats['max_workers']}")
+        output.append(f"**Default Concurrency per Tool:** {executor_stats['default_limit']}")
+        if executor_stats["overrides"]:
+            output.append("**Limit Overrides:** " + ", ".join(
+                f"{tool}={limit}" for tool, limit in executor_stats["overrides"].items()))
+        for tool, counts in sorted(executor_stats["tools"].items()):
+            output.append(f"- {tool}: {counts['calls']} calls, {counts['active']} running, {counts['waiting']} waiting")
+        
+        output.append("")
+        output.append("## Item Cache")
+        try:
+            cache_stats = get_item_cache().get_stats()
+            output.append(f"**Memory Hits:** {cache_stats['memory_hits']}")
+            output.append(f"**Disk Hits:** {cache_stats['disk_hits']}")
+            output.append(f"**Misses:** {cache_stats['misses']}")
+            output.append(f"**Hit Ratio:** {cache_stats['hit_ratio']:.1%}")
+            output.append(f"**Revalidations:** {cache_stats['revalidations']}")
+            output.append(f"**Invalidated:** {cache_stats['invalidated']}")
+            output.append(f"**Cached Items:** {cache_stats['memory_items']} in memory, {cache_stats['disk_items']} on disk")
+            output.append(f"**Cache Path:** {cache_stats['db_path']}")
+        except Exception as cache_error:
+            cache_stats = {"error": str(cache_error)}
+            output.append(f"**Error:** {cache_error}")
+        
+        fulltext_cache = get_fulltext_cache()
+        if fulltext_cache is not None:
+            ft_stats = fulltext_cache.get_stats()
+            output.append("")
+            output.append("## Fulltext Cache")
+            output.append(f"**Cached Extractions:** {ft_stats['entries']}")
+            output.append(f"**Size:** {ft_stats['stored_bytes'] / 1024 / 1024:.1f} MB of {ft_stats['max_bytes'] / 1024 / 1024:.0f} MB")
+            output.append(f"**Cache Path:** {ft_stats['db_path']}")
+        
+        embedding_cache = get_embedding_cache()
+        if embedding_cache is not None:
+            emb_stats = embedding_cache.get_stats()
+            output.append("")
+            output.append("## Embedding Cache")
+            output.append(f"**Hits:** {emb_stats['hits']}")
+            output.append(f"**Misses:** {emb_stats['misses']}")
+            output.append(f"**Hit Ratio:** {emb_stats['hit_ratio']:.1%}")
+            output.append(f"**Cached Vectors:** {emb_stats['entries']}")
+            output.append(f"**Size:** {emb_stats['stored_bytes'] / 1024 / 1024:.1f} MB of {emb_stats['max_bytes'] / 1024 / 1024:.0f} MB")
+            output.append(f"**Cache Path:** {emb_stats['db_path']}")
+        
+        logging.info(f"Server status retrieved. Client pool: {pool_stats}, item cache: {cache_stats}")
+        return "\n".join(output)
+    
+    except Exception as e:
+        ctx.error(f"Error getting server status: {str(e)}")
+        logging.error(f"Error getting server status: {str(e)}")
+        return f"Error getting server status: {str(e)}"
@@ -0,0 +1,232 @@
+"""
+Thread offloading for MCP tool handlers.
+
+The tools are written against the synchronous pyzotero/requests stack. Run
+directly on the event loop, one slow call (a large fulltext download, a
+saved-search round trip, an index build) would stall every other session
+on the streamable-http/sse transports. `offloaded` turns such a handler
+into a coroutine that runs it on a bounded, process-wide thread pool,
+behind a per-tool concurrency limit, so the loop stays free to serve
+other requests.
+
+Limits are configured with environment variables:
+
+- ZOTERO_TOOL_WORKERS: threads shared by all tools (default 16)
+- ZOTERO_TOOL_CONCURRENCY: concurrent calls allowed per tool (default 8)
+- ZOTERO_TOOL_LIMITS: per-tool overrides, e.g.
+  "zotero_get_item_fulltext=2,zotero_semantic_search=4"
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 16
+DEFAULT_CONCURRENCY = 8
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _limit_overrides() -> Dict[str, int]:
+    """Parse ZOTERO_TOOL_LIMITS into {tool name: limit}."""
+    overrides = {}
+    for entry in os.getenv("ZOTERO_TOOL_LIMITS", "").split(","):
+        name, _, value = entry.partition("=")
+        if not name.strip() or not value.strip():
+            continue
+        try:
+            overrides[name.strip()] = max(1, int(value))
+        except ValueError:
+            logger.warning(f"Ignoring invalid tool limit '{entry}'")
+    return overrides
+
+
+class ThreadSafeContext:
+    """
+    Proxy letting a handler running in a worker thread use the MCP Context.
+
+    The Context logging and progress methods are coroutines bound to the
+    event loop; here they are scheduled on that loop and return immediately,
+    so handlers can keep calling them as plain functions. Other attributes
+    are passed through.
+    """
+
+    def __init__(self, ctx: Any, loop: asyncio.AbstractEventLoop):
+        self._ctx = ctx
+        self._loop = loop
+
+    def _submit(self, method: str, *args: Any, **kwargs: Any) -> None:
+        try:
+            coro = getattr(self._ctx, method)(*args, **kwargs)
+            if asyncio.iscoroutine(coro):
+                asyncio.run_coroutine_threadsafe(coro, self._loop)
+        except Exception as e:
+            logger.debug(f"Could not forward ctx.{method}: {e}")
+
+    def debug(self, message: str, **kwargs: Any) -> None:
+        self._submit("debug", message, **kwargs)
+
+    def info(self, message: str, **kwargs: Any) -> None:
+        self._submit("info", message, **kwargs)
+
+    def warning(self, message: str, **kwargs: Any) -> None:
+        self._submit("warning", message, **kwargs)
+
+    warn = warning
+
+    def error(self, message: str, **kwargs: Any) -> None:
+        self._submit("error", message, **kwargs)
+
+    def report_progress(self, progress: float, total: Optional[float] = None,
+                        message: Optional[str] = None) -> None:
+        kwargs = {"total": total}
+        if message is not None:
+            kwargs["message"] = message
+        self._submit("report_progress", progress, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._ctx, name)
+
+
+class ToolExecutor:
+    """Bounded thread pool plus one semaphore per tool."""
+
+    def __init__(self, max_workers: Optional[int] = None, default_limit: Optional[int] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Threads shared by all tools (default: ZOTERO_TOOL_WORKERS or 16)
+            default_limit: Concurrent calls per tool (default: ZOTERO_TOOL_CONCURRENCY or 8)
+        """
+        self.max_workers = max(1, max_workers or _env_int("ZOTERO_TOOL_WORKERS", DEFAULT_WORKERS))
+        self.default_limit = max(1, default_limit or _env_int("ZOTERO_TOOL_CONCURRENCY", DEFAULT_CONCURRENCY))
+        self.overrides = _limit_overrides()
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Semaphores belong to an event loop, so they are keyed by loop too
+        self._semaphores: Dict[Tuple[int, str], asyncio.Semaphore] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def limit_for(self, tool: str, default: Optional[int] = None) -> int:
+        """Concurrency limit of a tool: env override, else the tool's default, else the global one."""
+        return self.overrides.get(tool, default or self.default_limit)
+
+    def _semaphore(self, tool: str, default: Optional[int]) -> asyncio.Semaphore:
+        key = (id(asyncio.get_running_loop()), tool)
+        with self._lock:
+            semaphore = self._semaphores.get(key)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.limit_for(tool, default))
+                self._semaphores[key] = semaphore
+            return semaphore
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="zotero-tool")
+            return self._pool
+
+    async def run(self, tool: str, fn: Callable[..., Any], args: Tuple[Any, ...] = (),
+                  kwargs: Optional[Dict[str, Any]] = None, limit: Optional[int] = None) -> Any:
+        """
+        Run a blocking function in the pool under the tool's concurrency limit.
+
+        Args:
+            tool: Tool name the limit and statistics are tracked under
+            fn: Blocking callable
+            args: Positional arguments for `fn`
+            kwargs: Keyword arguments for `fn` (kept apart so they cannot
+                clash with the parameters of this method)
+            limit: The tool's default limit (overridden by ZOTERO_TOOL_LIMITS)
+
+        Returns:
+            Whatever `fn` returns
+        """
+        loop = asyncio.get_running_loop()
+        stats = self._stats.setdefault(tool, {"calls": 0, "active": 0, "waiting": 0})
+        stats["waiting"] += 1
+        async with self._semaphore(tool, limit):
+            stats["waiting"] -= 1
+            stats["active"] += 1
+            stats["calls"] += 1
+            try:
+                call = functools.partial(fn, *args, **(kwargs or {}))
+                # Keep contextvars (request context, logging state) in the worker
+                return await loop.run_in_executor(self._get_pool(), contextvars.copy_context().run, call)
+            finally:
+                stats["active"] -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool size, limits and per-tool call counters."""
+        return {
+            "max_workers": self.max_workers,
+            "default_limit": self.default_limit,
+            "overrides": dict(self.overrides),
+            "tools": {tool: dict(counts) for tool, counts in self._stats.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Stop the thread pool once running calls have finished."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._semaphores.clear()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_executor: Optional[ToolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ToolExecutor:
+    """Get the process-wide tool executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ToolExecutor()
+        return _executor
+
+
+def close_tool_executor() -> None:
+    """Shut down and discard the process-wide tool executor."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+def offloaded(tool: str, limit: Optional[int] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator running a synchronous tool handler off the event loop.
+
+    The returned coroutine function keeps the handler's signature (so MCP
+    derives the same input schema) and hands a `ctx` argument to the
+    handler as a ThreadSafeContext.
+
+    Args:
+        tool: Tool name, used for the concurrency limit and statistics
+        limit: Default concurrent calls for this tool
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if kwargs.get("ctx") is not None:
+                kwargs["ctx"] = ThreadSafeContext(kwargs["ctx"], asyncio.get_running_loop())
+            return await get_tool_executor().run(tool, fn, args, kwargs, limit=limit)
+        return wrapper
+    return decorator